@@ -0,0 +1,65 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Compares bytes on the wire and CPU per request for request body compression.
+
+python -m benchmarks.compression
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+from zstandard import ZstdCompressor
+
+from lightspark.objects.all_entities import ALL_QUERIES, _get_entity_query
+from lightspark.requests.compression import RequestCompressor, load_default_dictionary
+from lightspark.requests.persisted_queries import known_documents
+from lightspark.requests.requester import Requester
+
+ROUNDS = 20
+
+
+def payloads() -> List[bytes]:
+    requester = Requester("", "")
+    documents = list(known_documents().values())
+    documents += [_get_entity_query(entity_class) for entity_class in ALL_QUERIES]
+    return [
+        requester.encode_payload(document, {"entity_id": "Account:0189a572"})
+        for document in documents
+    ]
+
+
+def fresh_context(payload: bytes) -> bytes:
+    # What Requester did before compression contexts were reused.
+    if len(payload) > 1024:
+        return ZstdCompressor().compress(payload)
+    return payload
+
+
+def run(name: str, compress: Callable[[bytes], bytes], bodies: List[bytes]) -> Tuple:
+    wire = sum(len(compress(body)) for body in bodies)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for body in bodies:
+            compress(body)
+    elapsed = time.perf_counter() - start
+    per_request_us = elapsed / (ROUNDS * len(bodies)) * 1e6
+    return name, wire, per_request_us
+
+
+def main() -> None:
+    bodies = payloads()
+    reused = RequestCompressor()
+    dictionary = RequestCompressor(dictionary=load_default_dictionary())
+    results = [
+        run("fresh context per request", fresh_context, bodies),
+        run("reused per-thread context", lambda b: reused.compress(b)[0], bodies),
+        run("reused context + dictionary", lambda b: dictionary.compress(b)[0], bodies),
+    ]
+    raw = sum(len(body) for body in bodies)
+    print(f"{len(bodies)} request bodies, {raw} bytes uncompressed")
+    print(f"{'strategy':<30}{'bytes on wire':>15}{'ratio':>8}{'us/request':>12}")
+    for name, wire, per_request_us in results:
+        print(f"{name:<30}{wire:>15}{wire / raw:>8.3f}{per_request_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures how many objects per second are decoded from API responses.
+
+Decodes pages of transactions through `Transaction.from_json` and reads only
+their `id` and `status`, as when listing transactions, eagerly and within
+`lazy_decoding()`.
+
+python -m benchmarks.decoding
+"""
+
+import json
+import timeit
+from typing import Any, Callable, List, Mapping
+
+from benchmarks import samples
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.requests.requester import Requester
+from lightspark.utils.lazy import lazy_decoding
+
+PAGE_SIZE = 500
+REPEAT = 5
+
+
+def transactions_page() -> List[Mapping[str, Any]]:
+    page = [
+        samples.outgoing_payment(i) if i % 2 else samples.incoming_payment(i)
+        for i in range(PAGE_SIZE)
+    ]
+    return json.loads(json.dumps(page))
+
+
+def objects_per_sec(decode: Callable[[], Any]) -> float:
+    number = 10
+    best = min(timeit.repeat(decode, number=number, repeat=REPEAT))
+    return PAGE_SIZE * number / best
+
+
+def main() -> None:
+    requester = Requester("", "")
+    page = transactions_page()
+
+    def list_statuses() -> None:
+        for obj in page:
+            transaction = Transaction_from_json(requester, obj)
+            _ = transaction.id, transaction.status
+
+    def list_statuses_lazily() -> None:
+        with lazy_decoding():
+            list_statuses()
+
+    eager = objects_per_sec(list_statuses)
+    lazy = objects_per_sec(list_statuses_lazily)
+    print(f"{'decoding':<10}{'objects/s':>12}")
+    print(f"{'eager':<10}{eager:>12.0f}")
+    print(f"{'lazy':<10}{lazy:>12.0f}{lazy / eager:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures the cost of decoding transactions through their interface.
+
+Decodes a page mixing all the concrete types of `Transaction` through
+`Transaction.from_json`, which dispatches on `__typename`, and through the
+concrete types' own `from_json`, which is the floor for the dispatch.
+
+python -m benchmarks.dispatch
+"""
+
+import json
+import sys
+import timeit
+from typing import Any, Callable, List, Mapping
+
+from benchmarks import samples
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.requests.requester import Requester
+
+PAGE_SIZE = 600
+NUMBER = 20
+REPEAT = 10
+
+
+def rows_per_sec(decode: Callable[[], Any]) -> float:
+    best = min(timeit.repeat(decode, number=NUMBER, repeat=REPEAT))
+    return PAGE_SIZE * NUMBER / best
+
+
+def main() -> None:
+    requester = Requester("", "")
+    page: List[Mapping[str, Any]] = json.loads(
+        json.dumps(samples.transactions_page(PAGE_SIZE))
+    )
+    loaders = [
+        sys.modules[f"lightspark.objects.{obj['__typename']}"].from_json  # type: ignore[attr-defined]
+        for obj in page
+    ]
+
+    def through_interface() -> None:
+        for obj in page:
+            Transaction_from_json(requester, obj)
+
+    def direct() -> None:
+        for loader, obj in zip(loaders, page):
+            loader(requester, obj)
+
+    dispatched = rows_per_sec(through_interface)
+    floor = rows_per_sec(direct)
+    print(f"{'decoding':<20}{'rows/s':>10}")
+    print(f"{'Transaction':<20}{dispatched:>10.0f}")
+    print(f"{'concrete types':<20}{floor:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
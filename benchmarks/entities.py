@@ -0,0 +1,59 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures how many objects per second `from_json` decodes, per entity type.
+
+Covers the concrete types of `ALL_JSON_LOADERS` and the connection types, with
+responses setting all their fields (see `samples.from_field_specs`).
+
+python -m benchmarks.entities [type ...]
+"""
+
+import importlib
+import json
+import pkgutil
+import sys
+import timeit
+from typing import Any, Callable, List, Tuple
+
+import lightspark.objects
+from benchmarks import samples
+from lightspark.objects.all_entities import ALL_JSON_LOADERS
+from lightspark.requests.requester import Requester
+from lightspark.utils.dispatch import is_interface
+
+COUNT = 200
+REPEAT = 5
+
+
+def entity_types() -> List[Tuple[type, Callable[..., Any]]]:
+    types = list(ALL_JSON_LOADERS.items())
+    for module in pkgutil.iter_modules(lightspark.objects.__path__):
+        if module.name.endswith("Connection"):
+            namespace = importlib.import_module(f"lightspark.objects.{module.name}")
+            if hasattr(namespace, "from_json"):
+                types.append((getattr(namespace, module.name), namespace.from_json))
+    return [(cls, loader) for cls, loader in types if not is_interface(cls)]
+
+
+def objects_per_sec(cls: type, loader: Callable[..., Any]) -> float:
+    requester = Requester("", "")
+    responses = json.loads(
+        json.dumps([samples.from_field_specs(cls, i) for i in range(COUNT)])
+    )
+
+    def decode() -> None:
+        for response in responses:
+            loader(requester, response)
+
+    return COUNT / min(timeit.repeat(decode, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    names = set(sys.argv[1:])
+    print(f"{'type':<56}{'objects/s':>10}")
+    for cls, loader in entity_types():
+        if not names or cls.__name__ in names:
+            print(f"{cls.__name__:<56}{objects_per_sec(cls, loader):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
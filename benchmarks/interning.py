@@ -0,0 +1,122 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures the memory saved by decoding pages of entities with an `InternPool`.
+
+The pages are shaped like real ones: payments of a few common amounts, mostly
+without fees, to and from a handful of nodes; channels whose unsettled
+balances and fees are mostly zero; API tokens with the same permissions. The
+dedup ratio is the share of the values looked up in the pool that were shared
+with an earlier one.
+
+python -m benchmarks.interning
+"""
+
+import gc
+import json
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from benchmarks import samples
+from lightspark.objects.AccountToApiTokensConnection import (
+    from_json as AccountToApiTokensConnection_from_json,
+)
+from lightspark.objects.AccountToChannelsConnection import (
+    from_json as AccountToChannelsConnection_from_json,
+)
+from lightspark.objects.AccountToTransactionsConnection import (
+    from_json as AccountToTransactionsConnection_from_json,
+)
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.requests.requester import Requester
+from lightspark.utils.interning import InternPool, interning
+
+PAGE_SIZE = 500
+
+AMOUNTS_MSATS = [1_000_000, 5_000_000, 10_000_000, 21_000_000, 100_000_000]
+NODE_IDS = [f"LightsparkNodeWithRemoteSigning:{i}" for i in range(5)]
+
+
+def _with_amounts(obj: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    for key in list(obj):
+        if key.endswith("_amount"):
+            obj[key] = samples.currency_amount(rng.choice(AMOUNTS_MSATS))
+        elif key.endswith("_fees") and obj[key] is not None:
+            obj[key] = samples.currency_amount(0 if rng.random() < 0.9 else 1000)
+        elif key.endswith(("_origin", "_destination")) and obj[key] is not None:
+            obj[key] = {"id": rng.choice(NODE_IDS)}
+    data = obj.get("outgoing_payment_payment_request_data")
+    if data is not None:
+        data["invoice_data_amount"] = samples.currency_amount(rng.choice(AMOUNTS_MSATS))
+    return obj
+
+
+def transactions_page() -> Mapping[str, Any]:
+    rng = random.Random(0)
+    page = samples.transactions_connection(PAGE_SIZE)
+    key = "account_to_transactions_connection_entities"
+    page[key] = [_with_amounts(obj, rng) for obj in page[key]]
+    return page
+
+
+def channels_page() -> Mapping[str, Any]:
+    rng = random.Random(0)
+    channels = []
+    for i in range(PAGE_SIZE):
+        channel = samples.channel(i)
+        local = rng.randrange(0, 100_000_000, 1000)
+        channel["channel_local_balance"] = samples.currency_amount(local)
+        channel["channel_remote_balance"] = samples.currency_amount(100_000_000 - local)
+        channel["channel_remote_node"] = {"id": f"GraphNode:{rng.randrange(50)}"}
+        channels.append(channel)
+    return {
+        "__typename": "AccountToChannelsConnection",
+        "account_to_channels_connection_count": PAGE_SIZE,
+        "account_to_channels_connection_page_info": samples.page_info(PAGE_SIZE),
+        "account_to_channels_connection_entities": channels,
+    }
+
+
+def api_tokens_page() -> Mapping[str, Any]:
+    return {
+        "__typename": "AccountToApiTokensConnection",
+        "account_to_api_tokens_connection_count": PAGE_SIZE,
+        "account_to_api_tokens_connection_page_info": samples.page_info(PAGE_SIZE),
+        "account_to_api_tokens_connection_entities": [
+            samples.from_field_specs(ApiToken, i) for i in range(PAGE_SIZE)
+        ],
+    }
+
+
+PAGES: List[Tuple[str, Callable[[], Mapping[str, Any]], Callable[..., Any]]] = [
+    ("transactions", transactions_page, AccountToTransactionsConnection_from_json),
+    ("channels", channels_page, AccountToChannelsConnection_from_json),
+    ("api tokens", api_tokens_page, AccountToApiTokensConnection_from_json),
+]
+
+
+def bytes_held(from_json: Callable[..., Any], response: Mapping[str, Any]) -> int:
+    requester = Requester("", "")
+    gc.collect()
+    tracemalloc.start()
+    page = from_json(requester, response)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del page
+    return held
+
+
+def main() -> None:
+    print(f"{'page':<14}{'bytes':>10}{'interned':>10}{'saved':>8}{'dedup':>8}")
+    for name, page, from_json in PAGES:
+        response = json.loads(json.dumps(page()))
+        before = bytes_held(from_json, response)
+        with interning(InternPool()) as pool:
+            after = bytes_held(from_json, response)
+        print(
+            f"{name:<14}{before:>10}{after:>10}{1 - after / before:>8.0%}"
+            f"{pool.dedup_ratio:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures the memory held by decoded objects, per object.
+
+Compares the slotted object model with the same classes backed by a per-instance
+`__dict__`, which is what the objects were before they were slotted. Both are
+decoded by the same `from_json` functions from the same responses; the memory
+of the responses themselves isn't counted.
+
+python -m benchmarks.memory
+"""
+
+import gc
+import importlib
+import json
+import pkgutil
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass, make_dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
+
+import lightspark.objects
+from benchmarks import samples
+from lightspark.utils import decoders
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.objects.Channel import from_json as Channel_from_json
+from lightspark.objects.IncomingPayment import from_json as IncomingPayment_from_json
+from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
+from lightspark.requests.requester import Requester
+
+COUNT = 2000
+
+CASES: List[Tuple[str, Callable[[int], Mapping[str, Any]], Callable[..., Any]]] = [
+    ("OutgoingPayment", samples.outgoing_payment, OutgoingPayment_from_json),
+    ("IncomingPayment", samples.incoming_payment, IncomingPayment_from_json),
+    ("Channel", samples.channel, Channel_from_json),
+]
+
+
+@contextmanager
+def dict_backed_objects() -> Iterator[None]:
+    """Swaps every object class for a dataclass with the same fields but no
+    `__slots__`, in all the modules of `lightspark.objects`.
+
+    The compiled decoders hold the classes they construct, so they're compiled
+    again for the twins, and the decoders of the slotted classes are restored
+    afterwards.
+    """
+    modules = [
+        importlib.import_module(f"lightspark.objects.{module.name}")
+        for module in pkgutil.iter_modules(lightspark.objects.__path__)
+    ]
+    twins: Dict[type, type] = {}
+    patched: List[Tuple[Any, str, type]] = []
+    compiled_decoders: List[CompiledDecoder] = []
+    for module in modules:
+        for name, value in list(vars(module).items()):
+            if isinstance(value, CompiledDecoder):
+                compiled_decoders.append(value)
+            if not isinstance(value, type) or not is_dataclass(value):
+                continue
+            if value not in twins:
+                twin = make_dataclass(
+                    value.__name__, [(f.name, f.type) for f in fields(value)]
+                )
+                # Its fields are decoded like the original's, see `field_specs`.
+                twin.__module__ = value.__module__
+                twins[value] = twin
+            patched.append((module, name, value))
+            setattr(module, name, twins[value])
+
+    compile_slotted = decoders._compile  # pylint: disable=protected-access
+    compiled = dict(decoders._compiled)  # pylint: disable=protected-access
+    decoders._compiled.clear()  # pylint: disable=protected-access
+    decoders._compile = lambda cls: compile_slotted(twins.get(cls, cls))
+    for decoder in compiled_decoders:
+        decoder._decode = None  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        decoders._compile = compile_slotted
+        decoders._compiled.clear()  # pylint: disable=protected-access
+        decoders._compiled.update(compiled)  # pylint: disable=protected-access
+        for decoder in compiled_decoders:
+            decoder._decode = None  # pylint: disable=protected-access
+        for module, name, value in patched:
+            setattr(module, name, value)
+
+
+def bytes_per_object(
+    sample: Callable[[int], Mapping[str, Any]], from_json: Callable[..., Any]
+) -> float:
+    requester = Requester("", "")
+    responses = [json.loads(json.dumps(sample(i))) for i in range(COUNT)]
+    gc.collect()
+    tracemalloc.start()
+    objects = [from_json(requester, response) for response in responses]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return held / COUNT
+
+
+def main() -> None:
+    print(f"{'object':<20}{'dict bytes':>12}{'slots bytes':>13}{'saved':>8}")
+    for name, sample, from_json in CASES:
+        with dict_backed_objects():
+            before = bytes_per_object(sample, from_json)
+        after = bytes_per_object(sample, from_json)
+        print(f"{name:<20}{before:>12.0f}{after:>13.0f}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""GraphQL response objects shaped like the API's, for the benchmarks."""
+
+import importlib
+import pkgutil
+import typing
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import lightspark.objects
+from lightspark.utils.dispatch import is_interface
+from lightspark.utils.field_specs import (
+    DATETIME,
+    ENUM,
+    ENUM_LIST,
+    OBJECT,
+    OBJECT_LIST,
+    REFERENCE,
+    field_specs,
+)
+
+CREATED_AT = "2023-11-04T12:17:57.162759+00:00"
+UPDATED_AT = "2023-11-04T12:18:03.015414+00:00"
+NODE_ID = "LightsparkNodeWithRemoteSigning:0189a572-6dba-cf00-0000-ac0908d34ea6"
+
+
+def currency_amount(msats: int) -> Dict[str, Any]:
+    return {
+        "__typename": "CurrencyAmount",
+        "currency_amount_original_value": msats,
+        "currency_amount_original_unit": "MILLISATOSHI",
+        "currency_amount_preferred_currency_unit": "USD",
+        "currency_amount_preferred_currency_value_rounded": msats // 30000,
+        "currency_amount_preferred_currency_value_approx": msats / 30000,
+    }
+
+
+def invoice_data(i: int) -> Dict[str, Any]:
+    return {
+        "__typename": "InvoiceData",
+        "invoice_data_encoded_payment_request": f"lnbcrt{i}n1pj5vdn4pp5" + "q" * 300,
+        "invoice_data_bitcoin_network": "REGTEST",
+        "invoice_data_payment_hash": f"{i:064x}",
+        "invoice_data_amount": currency_amount(1000 * i),
+        "invoice_data_created_at": CREATED_AT,
+        "invoice_data_expires_at": "2023-11-05T12:17:57+00:00",
+        "invoice_data_memo": None,
+        "invoice_data_destination": {
+            "__typename": "GraphNode",
+            "graph_node_id": "GraphNode:0189a572-6dba-cf00-0000-ac0908d34ea6",
+            "graph_node_created_at": "2023-07-30T06:18:07.162759+00:00",
+            "graph_node_updated_at": UPDATED_AT,
+            "graph_node_alias": "ls_test_vSViIQitob_SE",
+            "graph_node_bitcoin_network": "REGTEST",
+            "graph_node_color": "#3399ff",
+            "graph_node_conductivity": None,
+            "graph_node_display_name": "ls_test_vSViIQitob_SE",
+            "graph_node_public_key": "02253935a5703a6f0429081e08d2defce0faa15f4d75305302284751d53a4e0608",
+        },
+    }
+
+
+def outgoing_payment(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    return {
+        "__typename": "OutgoingPayment",
+        "outgoing_payment_id": f"OutgoingPayment:0189a572-6dba-cf00-0000-{i:012x}",
+        "outgoing_payment_created_at": CREATED_AT,
+        "outgoing_payment_updated_at": UPDATED_AT,
+        "outgoing_payment_status": status,
+        "outgoing_payment_resolved_at": UPDATED_AT,
+        "outgoing_payment_amount": currency_amount(1000 * i),
+        "outgoing_payment_transaction_hash": f"{i:064x}",
+        "outgoing_payment_is_uma": False,
+        "outgoing_payment_origin": {"id": NODE_ID},
+        "outgoing_payment_destination": {"id": "GraphNode:0189a572"},
+        "outgoing_payment_fees": currency_amount(i),
+        "outgoing_payment_payment_request_data": invoice_data(i),
+        "outgoing_payment_failure_reason": None,
+        "outgoing_payment_failure_message": None,
+        "outgoing_payment_uma_post_transaction_data": None,
+        "outgoing_payment_payment_preimage": f"{i:064x}",
+        "outgoing_payment_is_internal_payment": False,
+        "outgoing_payment_idempotency_key": None,
+    }
+
+
+def incoming_payment(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    return {
+        "__typename": "IncomingPayment",
+        "incoming_payment_id": f"IncomingPayment:0189a572-6dba-cf00-0000-{i:012x}",
+        "incoming_payment_created_at": CREATED_AT,
+        "incoming_payment_updated_at": UPDATED_AT,
+        "incoming_payment_status": status,
+        "incoming_payment_resolved_at": UPDATED_AT,
+        "incoming_payment_amount": currency_amount(1000 * i),
+        "incoming_payment_transaction_hash": f"{i:064x}",
+        "incoming_payment_is_uma": False,
+        "incoming_payment_destination": {"id": NODE_ID},
+        "incoming_payment_payment_request": {"id": f"Invoice:{i}"},
+        "incoming_payment_uma_post_transaction_data": None,
+        "incoming_payment_is_internal_payment": False,
+    }
+
+
+def channel(i: int, status: Optional[str] = "OK") -> Dict[str, Any]:
+    return {
+        "__typename": "Channel",
+        "channel_id": f"Channel:0189a572-6dba-cf00-0000-{i:012x}",
+        "channel_created_at": CREATED_AT,
+        "channel_updated_at": UPDATED_AT,
+        "channel_funding_transaction": {"id": f"ChannelOpeningTransaction:{i}"},
+        "channel_capacity": currency_amount(100_000_000),
+        "channel_local_balance": currency_amount(60_000_000),
+        "channel_local_unsettled_balance": currency_amount(0),
+        "channel_remote_balance": currency_amount(40_000_000),
+        "channel_remote_unsettled_balance": currency_amount(0),
+        "channel_unsettled_balance": currency_amount(0),
+        "channel_total_balance": currency_amount(100_000_000),
+        "channel_status": status,
+        "channel_estimated_force_closure_wait_minutes": 2016,
+        "channel_commit_fee": currency_amount(2_000),
+        "channel_fees": {
+            "__typename": "ChannelFees",
+            "channel_fees_base_fee": currency_amount(1_000),
+            "channel_fees_fee_rate_per_mil": 1,
+        },
+        "channel_remote_node": {"id": "GraphNode:0189a572"},
+        "channel_local_node": {"id": NODE_ID},
+        "channel_short_channel_id": f"{i}x1x0",
+    }
+
+
+def _on_chain_transaction(prefix: str, i: int, status: str) -> Dict[str, Any]:
+    return {
+        f"{prefix}_id": f"{prefix}:0189a572-6dba-cf00-0000-{i:012x}",
+        f"{prefix}_created_at": CREATED_AT,
+        f"{prefix}_updated_at": UPDATED_AT,
+        f"{prefix}_status": status,
+        f"{prefix}_resolved_at": UPDATED_AT,
+        f"{prefix}_amount": currency_amount(1000 * i),
+        f"{prefix}_transaction_hash": f"{i:064x}",
+        f"{prefix}_fees": currency_amount(i),
+        f"{prefix}_block_hash": f"{i + 1:064x}",
+        f"{prefix}_block_height": 800_000 + i,
+        f"{prefix}_destination_addresses": [
+            "bcrt1qjw6qlyeuyxs5hmf4k5d5glsquhzgwf3ep6tpa9"
+        ],
+        f"{prefix}_num_confirmations": 6,
+    }
+
+
+def channel_closing_transaction(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    obj = _on_chain_transaction("channel_closing_transaction", i, status)
+    obj["__typename"] = "ChannelClosingTransaction"
+    obj["channel_closing_transaction_channel"] = {"id": f"Channel:{i}"}
+    return obj
+
+
+def deposit(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    obj = _on_chain_transaction("deposit", i, status)
+    obj["__typename"] = "Deposit"
+    obj["deposit_destination"] = {"id": NODE_ID}
+    return obj
+
+
+def withdrawal(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    obj = _on_chain_transaction("withdrawal", i, status)
+    obj["__typename"] = "Withdrawal"
+    obj["withdrawal_origin"] = {"id": NODE_ID}
+    return obj
+
+
+def routing_transaction(i: int, status: str = "SUCCESS") -> Dict[str, Any]:
+    return {
+        "__typename": "RoutingTransaction",
+        "routing_transaction_id": f"RoutingTransaction:0189a572-6dba-cf00-0000-{i:012x}",
+        "routing_transaction_created_at": CREATED_AT,
+        "routing_transaction_updated_at": UPDATED_AT,
+        "routing_transaction_status": status,
+        "routing_transaction_resolved_at": UPDATED_AT,
+        "routing_transaction_amount": currency_amount(1000 * i),
+        "routing_transaction_transaction_hash": f"{i:064x}",
+        "routing_transaction_incoming_channel": {"id": f"Channel:{i}"},
+        "routing_transaction_outgoing_channel": {"id": f"Channel:{i + 1}"},
+        "routing_transaction_fees": currency_amount(i),
+        "routing_transaction_failure_message": None,
+        "routing_transaction_failure_reason": None,
+    }
+
+
+def transactions_page(size: int) -> List[Dict[str, Any]]:
+    """A page of transactions of all the kinds a node sees, in turn."""
+    kinds = [
+        channel_closing_transaction,
+        deposit,
+        incoming_payment,
+        outgoing_payment,
+        routing_transaction,
+        withdrawal,
+    ]
+    return [kinds[i % len(kinds)](i) for i in range(size)]
+
+
+def page_info(size: int) -> Dict[str, Any]:
+    return {
+        "__typename": "PageInfo",
+        "page_info_has_next_page": True,
+        "page_info_has_previous_page": False,
+        "page_info_start_cursor": "0",
+        "page_info_end_cursor": str(size),
+    }
+
+
+def transactions_connection(size: int) -> Dict[str, Any]:
+    return {
+        "__typename": "AccountToTransactionsConnection",
+        "account_to_transactions_connection_count": 10 * size,
+        "account_to_transactions_connection_page_info": page_info(size),
+        "account_to_transactions_connection_profit_loss": None,
+        "account_to_transactions_connection_average_fee_earned": currency_amount(12),
+        "account_to_transactions_connection_total_amount_transacted": currency_amount(
+            1000 * size
+        ),
+        "account_to_transactions_connection_entities": transactions_page(size),
+    }
+
+
+def _scalar(annotation: Any, name: str, i: int) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = typing.get_args(annotation)[0]
+    if annotation is bool:
+        return False
+    if annotation is int:
+        return i
+    if annotation is float:
+        return i / 3
+    if typing.get_origin(annotation) is list:
+        return []
+    if name.endswith("date"):
+        return CREATED_AT[:10]
+    return f"{name}-{i}"
+
+
+@lru_cache(maxsize=None)
+def _implementations(interface: type) -> List[type]:
+    for module in pkgutil.iter_modules(lightspark.objects.__path__):
+        importlib.import_module(f"lightspark.objects.{module.name}")
+    return sorted(interface.__subclasses__(), key=lambda cls: cls.__name__)
+
+
+def from_field_specs(cls: type, i: int) -> Dict[str, Any]:
+    """A response object for any type, with all of its fields set."""
+    while is_interface(cls):
+        cls = _implementations(cls)[0]
+    annotations = {field.name: field.type for field in fields(cls)}
+    obj: Dict[str, Any] = {"__typename": cls.__name__}
+    for spec in field_specs(cls):
+        if spec.kind == DATETIME:
+            value: Any = CREATED_AT
+        elif spec.kind in (ENUM, ENUM_LIST):
+            assert spec.type is not None
+            value = next(iter(spec.type.__members__))
+            value = [value] if spec.kind == ENUM_LIST else value
+        elif spec.kind == REFERENCE:
+            value = {"id": f"{spec.name[:-3]}:{i}"}
+        elif spec.kind in (OBJECT, OBJECT_LIST):
+            assert spec.type is not None
+            value = from_field_specs(spec.type, i)
+            value = [value] if spec.kind == OBJECT_LIST else value
+        else:
+            value = _scalar(annotations[spec.name], spec.name, i)
+        obj[spec.key] = value
+    return obj
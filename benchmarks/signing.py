@@ -0,0 +1,86 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Measures request signatures per second for each kind of signing key.
+
+python -m benchmarks.signing
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from lightspark_crypto import sign_ecdsa
+
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.requests.requester import Requester
+from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
+from lightspark.utils.crypto import sign_payload, signing_envelope
+from lightspark.utils.signing_key import RSASigningKey, Secp256k1SigningKey
+
+DURATION_SECS = 1.0
+
+
+def payload() -> bytes:
+    return Requester("", "").encode_payload(
+        PAY_INVOICE_MUTATION,
+        {
+            "node_id": "LightsparkNodeWithRemoteSigning:0189a572",
+            "encoded_invoice": "lnbcrt1" + "q" * 300,
+            "timeout_secs": 60,
+            "maximum_fees_msats": 1000,
+        },
+    )
+
+
+def rsa_der(key_size: int) -> bytes:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def run(name: str, sign: Callable[[bytes], str], body: bytes) -> Tuple[str, float]:
+    signatures = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION_SECS:
+        sign(body)
+        signatures += 1
+    return name, signatures / (time.perf_counter() - start)
+
+
+def main() -> None:
+    body = payload()
+    results: List[Tuple[str, float]] = []
+    for key_size in (2048, 4096):
+        der = rsa_der(key_size)
+        signing_key = RSASigningKey(der)
+        results += [
+            # What RSASigningKey did before keys were parsed once.
+            run(
+                f"RSA-{key_size}, parsed per request",
+                lambda b, der=der: sign_payload(b, der),
+                body,
+            ),
+            run(f"RSA-{key_size}, pre-parsed", signing_key.sign_payload, body),
+        ]
+    secp256k1 = Secp256k1SigningKey(bytes(32), BitcoinNetwork.REGTEST)
+    results += [
+        # What Secp256k1SigningKey did before payloads were hashed in Python.
+        run(
+            "secp256k1, whole payload",
+            lambda b: signing_envelope(bytes(sign_ecdsa(b, secp256k1.key))),
+            body,
+        ),
+        run("secp256k1, digest", secp256k1.sign_payload, body),
+    ]
+
+    print(f"{len(body)} byte request body")
+    print(f"{'key':<32}{'signatures/s':>14}")
+    for name, per_second in results:
+        print(f"{name:<32}{per_second:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
 import lightspark.utils
+from lightspark.lightspark_async_client import LightsparkAsyncClient
 from lightspark.lightspark_client import *
 from lightspark.objects.Account import Account
 from lightspark.objects.AccountToApiTokensConnection import AccountToApiTokensConnection
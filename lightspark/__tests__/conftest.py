@@ -0,0 +1,125 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import threading
+import zlib
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
+
+import pytest
+import zstandard
+
+Response = Tuple[int, Mapping[str, Any], Mapping[str, str]]
+
+
+def data_response(data: Mapping[str, Any]) -> Response:
+    return 200, {"data": data}, {}
+
+
+def api_token_json(entity_id: str) -> Mapping[str, Any]:
+    """The JSON of an `ApiToken`, a small entity to fetch in tests."""
+    return {
+        "__typename": "ApiToken",
+        "api_token_id": entity_id,
+        "api_token_created_at": "2023-01-01T00:00:00+00:00",
+        "api_token_updated_at": "2023-01-01T00:00:00+00:00",
+        "api_token_client_id": f"client-{entity_id}",
+        "api_token_name": entity_id,
+        "api_token_permissions": ["ALL"],
+        "api_token_is_deleted": False,
+    }
+
+
+class GraphQLStandInServer:
+    """A minimal local GraphQL endpoint for exercising the requester end to end.
+
+    Request bodies are decompressed and recorded in `requests`. Automatic
+    persisted queries are emulated: a request carrying only a document id gets a
+    `PersistedQueryNotFound` error until the full document has been sent once.
+    The response is produced by `responder`, which receives the decoded body
+    (with the document filled in) and can be swapped by each test.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.headers: List[Mapping[str, str]] = []
+        self.documents: Dict[str, str] = {}
+        self.responder: Callable[[Dict[str, Any]], Response] = lambda body: (
+            data_response({})
+        )
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/graphql"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, raw: bytes, headers: Mapping[str, str]) -> Response:
+        encoding = headers.get("Content-Encoding")
+        if encoding == "zstd":
+            raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        elif encoding == "deflate":
+            raw = zlib.decompress(raw)
+        body = json.loads(raw)
+        with self._lock:
+            self.requests.append(body)
+            self.headers.append(headers)
+
+        persisted = (body.get("extensions") or {}).get("persistedQuery")
+        if persisted:
+            document_id = persisted["sha256Hash"]
+            if "query" in body:
+                if sha256(body["query"].encode("utf8")).hexdigest() != document_id:
+                    return (
+                        200,
+                        {"errors": [{"message": "provided sha does not match query"}]},
+                        {},
+                    )
+                self.documents[document_id] = body["query"]
+            elif document_id in self.documents:
+                body = dict(body, query=self.documents[document_id])
+            else:
+                return 200, {"errors": [{"message": "PersistedQueryNotFound"}]}, {}
+        return self.responder(body)
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                length = int(self.headers.get("Content-Length", 0))
+                status, payload, extra_headers = server.handle(
+                    self.rfile.read(length), dict(self.headers)
+                )
+                encoded = json.dumps(payload).encode("utf8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def graphql_server() -> Iterator[GraphQLStandInServer]:
+    server = GraphQLStandInServer()
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
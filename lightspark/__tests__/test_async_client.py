@@ -0,0 +1,97 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+import zstandard
+
+from lightspark import LightsparkAsyncClient
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+
+web = pytest.importorskip("aiohttp.web")
+
+FEE_ESTIMATE = {
+    "__typename": "FeeEstimate",
+    "fee_estimate_fee_fast": {
+        "currency_amount_original_value": 10,
+        "currency_amount_original_unit": "SATOSHI",
+        "currency_amount_preferred_currency_unit": "USD",
+        "currency_amount_preferred_currency_value_rounded": 1,
+        "currency_amount_preferred_currency_value_approx": 0.5,
+    },
+    "fee_estimate_fee_min": {
+        "currency_amount_original_value": 1,
+        "currency_amount_original_unit": "SATOSHI",
+        "currency_amount_preferred_currency_unit": "USD",
+        "currency_amount_preferred_currency_value_rounded": 0,
+        "currency_amount_preferred_currency_value_approx": 0.05,
+    },
+}
+
+
+async def _run_with_server(received: List[Dict[str, Any]], fn) -> Any:
+    async def handle(request: web.Request) -> web.Response:
+        body = await request.read()
+        if request.headers.get("Content-Encoding") == "zstd":
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        received.append(json.loads(body))
+        await asyncio.sleep(0.05)
+        return web.json_response({"data": {"bitcoin_fee_estimate": FEE_ESTIMATE}})
+
+    app = web.Application(handler_args={"auto_decompress": False})
+    app.router.add_post("/graphql", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    try:
+        async with LightsparkAsyncClient(
+            "id", "secret", base_url=f"http://127.0.0.1:{port}/graphql"
+        ) as client:
+            return await fn(client)
+    finally:
+        await runner.cleanup()
+
+
+class TestAsyncClient:
+    def test_get_bitcoin_fee_estimate(self) -> None:
+        received: List[Dict[str, Any]] = []
+        estimate = asyncio.run(
+            _run_with_server(
+                received,
+                lambda client: client.get_bitcoin_fee_estimate(BitcoinNetwork.REGTEST),
+            )
+        )
+        assert estimate.fee_fast.original_value == 10
+        assert received[0]["operationName"] == "BitcoinFeeEstimate"
+        assert received[0]["variables"] == {"bitcoin_network": "REGTEST"}
+
+    def test_requests_run_concurrently(self) -> None:
+        received: List[Dict[str, Any]] = []
+
+        async def fan_out(client: LightsparkAsyncClient) -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(
+                *[
+                    client.get_bitcoin_fee_estimate(BitcoinNetwork.REGTEST)
+                    for _ in range(20)
+                ]
+            )
+            return loop.time() - start
+
+        elapsed = asyncio.run(_run_with_server(received, fan_out))
+        assert len(received) == 20
+        # Each response is delayed by 50ms; sequential calls would take a second.
+        assert elapsed < 0.5
+
+    def test_payload_matches_sync_requester(self) -> None:
+        client = LightsparkAsyncClient("id", "secret")
+        payload, headers = client._requester.build_request(  # pylint: disable=protected-access
+            "query Foo { bar }", {"a": 1}
+        )
+        assert json.loads(payload)["operationName"] == "Foo"
+        assert headers["X-GraphQL-Operation"] == "Foo"
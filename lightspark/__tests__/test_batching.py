@@ -0,0 +1,235 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from conftest import GraphQLStandInServer, Response, api_token_json, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.all_entities import (
+    _get_entity_query,
+    get_entity,
+    get_entity_async,
+)
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.requests.batching import (
+    AsyncQueryBatcher,
+    merge_queries,
+    split_result,
+)
+from lightspark.requests.requester import Requester
+from lightspark.scripts.bitcoin_fee_estimate import BITCOIN_FEE_ESTIMATE_QUERY
+
+ENTITY_FIELD = re.compile(r"(b\d+_entity): entity\(id: \$(\w+)\)")
+
+
+def _batched_entities_responder(body: Dict[str, Any]) -> Response:
+    data: Dict[str, Any] = {}
+    errors: List[Dict[str, Any]] = []
+    for alias, variable in ENTITY_FIELD.findall(body["query"]):
+        entity_id = body["variables"][variable]
+        if entity_id == "broken":
+            data[alias] = None
+            errors.append({"message": "boom", "path": [alias]})
+        else:
+            data[alias] = api_token_json(entity_id)
+    return 200, {"data": data, **({"errors": errors} if errors else {})}, {}
+
+
+def _get_entities_concurrently(
+    client: LightsparkSyncClient, ids: List[str]
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    barrier = threading.Barrier(len(ids))
+
+    def fetch(entity_id: str) -> None:
+        barrier.wait()
+        try:
+            results[entity_id] = client.get_entity(entity_id, ApiToken)
+        except LightsparkException as e:
+            results[entity_id] = e
+
+    threads = [threading.Thread(target=fetch, args=(i,)) for i in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestMergeQueries:
+    def test_aliases_fields_renames_variables_and_dedupes_fragments(self) -> None:
+        entity_query = _get_entity_query(ApiToken)
+        merged = merge_queries(
+            [
+                (entity_query, {"id": "a"}),
+                (BITCOIN_FEE_ESTIMATE_QUERY, {"bitcoin_network": "MAINNET"}),
+                (entity_query, {"id": "b"}),
+            ]
+        )
+        assert merged is not None
+        document, variables, keys = merged
+
+        assert document.startswith("query Batched(")
+        assert "b0_entity: entity(id: $b0_id)" in document
+        assert "b2_entity: entity(id: $b2_id)" in document
+        assert "b1_bitcoin_fee_estimate: bitcoin_fee_estimate" in document
+        assert document.count("fragment ApiTokenFragment on ApiToken") == 1
+        assert variables == {
+            "b0_id": "a",
+            "b1_bitcoin_network": "MAINNET",
+            "b2_id": "b",
+        }
+        assert keys == [["b0_entity"], ["b1_bitcoin_fee_estimate"], ["b2_entity"]]
+
+    def test_mutations_are_not_merged(self) -> None:
+        assert merge_queries([("mutation Pay { pay }", None)]) is None
+
+    def test_split_result_routes_data_and_errors(self) -> None:
+        results = split_result(
+            {
+                "data": {"b0_entity": {"id": 1}, "b1_entity": None},
+                "errors": [{"message": "boom", "path": ["b1_entity"]}],
+            },
+            [["b0_entity"], ["b1_entity"]],
+        )
+        assert results[0] == {"data": {"entity": {"id": 1}}}
+        assert results[1]["data"] == {"entity": None}
+        assert results[1]["errors"][0]["message"] == "boom"
+
+
+class TestRequesterBatching:
+    def test_concurrent_queries_share_one_request(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _batched_entities_responder
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, batch_window_secs=0.2
+        )
+        ids = [f"token-{i}" for i in range(6)]
+
+        results = _get_entities_concurrently(client, ids)
+
+        assert {entity_id: r.id for entity_id, r in results.items()} == {
+            i: i for i in ids
+        }
+        assert len(graphql_server.requests) == 1
+        assert graphql_server.requests[0]["operationName"] == "Batched"
+
+    def test_errors_only_fail_their_own_call(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _batched_entities_responder
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, batch_window_secs=0.2
+        )
+
+        results = _get_entities_concurrently(client, ["a", "broken", "b"])
+
+        assert isinstance(results["broken"], LightsparkException)
+        assert results["a"].id == "a" and results["b"].id == "b"
+
+    def test_a_lone_query_is_sent_unchanged(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response(
+            {"entity": api_token_json(body["variables"]["id"])}
+        )
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, batch_window_secs=0.01
+        )
+
+        entity: Optional[ApiToken] = client.get_entity("a", ApiToken)
+
+        assert entity is not None and entity.id == "a"
+        assert graphql_server.requests[0]["operationName"] == "GetEntity"
+
+    def test_full_batches_are_sent_without_waiting_for_the_window(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _batched_entities_responder
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            batch_window_secs=30,
+            max_batch_size=2,
+        )
+        results: List[Any] = []
+        threads = [
+            threading.Thread(
+                target=lambda i=i: results.append(get_entity(requester, i, ApiToken))
+            )
+            for i in ("a", "b")
+        ]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - started < 5
+        assert {r.id for r in results} == {"a", "b"}
+        assert len(graphql_server.requests) == 1
+
+    def test_async_requester_batches_concurrent_coroutines(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        from lightspark.requests.async_requester import (  # pylint: disable=import-outside-toplevel
+            AsyncRequester,
+        )
+
+        graphql_server.responder = _batched_entities_responder
+        requester = AsyncRequester(
+            "id", "secret", base_url=graphql_server.url, batch_window_secs=0.05
+        )
+
+        async def fetch_all() -> List[Any]:
+            try:
+                return await asyncio.gather(
+                    *(get_entity_async(requester, i, ApiToken) for i in "abc")
+                )
+            finally:
+                await requester.close()
+
+        results = asyncio.run(fetch_all())
+
+        assert [r.id for r in results] == ["a", "b", "c"]
+        assert len(graphql_server.requests) == 1
+
+    def test_cancelling_the_first_coroutine_still_sends_the_batch(self) -> None:
+        sent: List[Any] = []
+
+        async def execute(query: str, variables: Any) -> Dict[str, Any]:
+            sent.append(variables)
+            if not ENTITY_FIELD.search(query):
+                return {"data": {"entity": api_token_json(variables["id"])}}
+            return _batched_entities_responder(
+                {"query": query, "variables": variables}
+            )[1]
+
+        batcher = AsyncQueryBatcher(execute, window_secs=0.05)
+        query = _get_entity_query(ApiToken)
+
+        async def run() -> List[Any]:
+            first = asyncio.ensure_future(batcher.submit(query, {"id": "a"}))
+            second = asyncio.ensure_future(batcher.submit(query, {"id": "b"}))
+            await asyncio.sleep(0)
+            first.cancel()
+            result = await asyncio.wait_for(second, timeout=5)
+            later = await asyncio.wait_for(batcher.submit(query, {"id": "c"}), 5)
+            return [first.cancelled(), result, later]
+
+        first_cancelled, result, later = asyncio.run(run())
+
+        assert first_cancelled
+        assert result["data"]["entity"]["api_token_id"] == "b"
+        assert later["data"]["entity"]["api_token_id"] == "c"
+        assert len(sent) == 2
@@ -0,0 +1,173 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import time
+from typing import Any
+from datetime import datetime, timezone
+
+from conftest import GraphQLStandInServer, api_token_json, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.objects.WebhookEventType import WebhookEventType
+from lightspark.requests.cache import ResponseCache
+from lightspark.webhooks import WebhookEvent
+
+QUERY = "query GetThing($id: ID!) { thing(id: $id) { id } }"
+ENTITY_TTLS = {"ApiToken": 60}
+
+
+def _entity_client(
+    graphql_server: GraphQLStandInServer, cache: ResponseCache
+) -> LightsparkSyncClient:
+    graphql_server.responder = lambda body: data_response(
+        {"entity": api_token_json(body["variables"]["id"])}
+    )
+    return LightsparkSyncClient(
+        "id", "secret", base_url=graphql_server.url, cache=cache
+    )
+
+
+class TestResponseCache:
+    def test_ttls_are_per_operation_and_mutations_are_never_cached(self) -> None:
+        cache = ResponseCache(ttls={"GetThing": 5})
+        assert cache.ttl_secs(QUERY, "GetThing") == 5
+        assert cache.ttl_secs("query Other { x }", "Other") is None
+        assert cache.ttl_secs("mutation GetThing { x }", "GetThing") is None
+        assert ResponseCache(default_ttl_secs=1).ttl_secs("{ x }", None) == 1
+
+    def test_variables_are_canonicalised_in_keys(self) -> None:
+        assert ResponseCache.key(QUERY, {"a": 1, "b": 2}) == ResponseCache.key(
+            QUERY, {"b": 2, "a": 1}
+        )
+
+    def test_entries_expire(self) -> None:
+        cache = ResponseCache()
+        key = ResponseCache.key(QUERY, {"id": "a"})
+        cache.put(key, {"id": "a"}, {"thing": {"id": "a"}}, ttl_secs=0.01)
+        assert cache.get(key) == {"thing": {"id": "a"}}
+        time.sleep(0.02)
+        assert cache.get(key) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        keys = [ResponseCache.key(QUERY, {"id": i}) for i in "abc"]
+        cache.put(keys[0], None, {}, 60)
+        cache.put(keys[1], None, {}, 60)
+        cache.get(keys[0])
+        cache.put(keys[2], None, {}, 60)
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert len(cache) == 2 and cache.evictions == 1
+
+    def test_entity_ttls_depend_on_the_typename(self) -> None:
+        cache = ResponseCache()
+        payment = {"entity": {"__typename": "OutgoingPayment", "id": "p"}}
+        node = {"entity": {"__typename": "LightsparkNodeWithOSK", "id": "n"}}
+        assert cache.ttl_secs("query GetEntity { x }", "GetEntity") == 30
+        assert cache.response_ttl_secs("GetEntity", payment) is None
+        assert cache.response_ttl_secs("GetEntity", node) == 30
+        assert cache.response_ttl_secs("GetEntity", {"entity": None}) is None
+        assert (
+            ResponseCache(ttls={"GetEntity": 5}).response_ttl_secs("GetEntity", payment)
+            == 5
+        )
+
+    def test_entries_are_evicted_past_max_bytes(self) -> None:
+        cache = ResponseCache(max_bytes=40)
+        keys = [ResponseCache.key(QUERY, {"id": i}) for i in "abc"]
+        cache.put(keys[0], None, {"thing": "a" * 10}, 60)
+        cache.put(keys[1], None, {"thing": "b" * 10}, 60)
+        cache.put(keys[2], None, {"thing": "c" * 100}, 60)
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) is not None
+        assert cache.get(keys[2]) is None
+        assert cache.size_bytes == 22 and cache.evictions == 1
+
+    def test_invalidates_entries_referencing_an_entity(self) -> None:
+        cache = ResponseCache()
+        by_variable = ResponseCache.key(QUERY, {"id": "a"})
+        by_response = ResponseCache.key("query Other { x }", None)
+        other = ResponseCache.key(QUERY, {"id": "b"})
+        cache.put(by_variable, {"id": "a"}, {}, 60)
+        cache.put(by_response, None, {"x": [{"node": {"payment_id": "a"}}]}, 60)
+        cache.put(other, {"id": "b"}, {}, 60)
+
+        assert cache.invalidate("a") == 2
+        assert cache.get(by_variable) is None and cache.get(by_response) is None
+        assert cache.get(other) is not None
+
+
+class TestRequesterCache:
+    def test_cached_queries_skip_the_network(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        cache = ResponseCache(entity_ttls=ENTITY_TTLS)
+        client = _entity_client(graphql_server, cache)
+
+        first = client.get_entity("a", ApiToken)
+        second = client.get_entity("a", ApiToken)
+        client.get_entity("b", ApiToken)
+
+        assert first == second
+        assert len(graphql_server.requests) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_entities_of_types_without_a_ttl_are_not_cached(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        cache = ResponseCache()
+        client = _entity_client(graphql_server, cache)
+
+        client.get_entity("a", ApiToken)
+        client.get_entity("a", ApiToken)
+
+        assert len(graphql_server.requests) == 2
+        assert len(cache) == 0
+
+    def test_webhook_invalidates_its_entity(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        cache = ResponseCache(entity_ttls=ENTITY_TTLS)
+        client = _entity_client(graphql_server, cache)
+        client.get_entity("a", ApiToken)
+        client.get_entity("b", ApiToken)
+
+        evicted = cache.invalidate_webhook(
+            WebhookEvent(
+                event_type=WebhookEventType.NODE_STATUS,
+                event_id="event",
+                timestamp=datetime.now(timezone.utc),
+                entity_id="a",
+            )
+        )
+        client.get_entity("a", ApiToken)
+        client.get_entity("b", ApiToken)
+
+        assert evicted == 1
+        assert [r["variables"]["id"] for r in graphql_server.requests] == [
+            "a",
+            "b",
+            "a",
+        ]
+
+    def test_invalidations_during_a_fetch_arent_undone(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        cache = ResponseCache(entity_ttls=ENTITY_TTLS)
+        client = _entity_client(graphql_server, cache)
+        respond = graphql_server.responder
+
+        def invalidating_responder(body: Any) -> Any:
+            # The webhook arrives while the response is on its way.
+            cache.invalidate(body["variables"]["id"])
+            return respond(body)
+
+        graphql_server.responder = invalidating_responder
+        client.get_entity("a", ApiToken)
+        graphql_server.responder = respond
+        client.get_entity("a", ApiToken)
+        client.get_entity("a", ApiToken)
+
+        assert len(graphql_server.requests) == 2
+        assert cache.hits == 1
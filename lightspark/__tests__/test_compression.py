@@ -0,0 +1,50 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import os
+import threading
+
+from zstandard import ZstdDecompressor
+
+from lightspark.requests.compression import RequestCompressor, load_default_dictionary
+from lightspark.requests.requester import Requester
+from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
+
+
+class TestRequestCompressor:
+    def test_small_payloads_are_not_compressed(self) -> None:
+        payload = b'{"query": "query Foo { bar }"}'
+        assert RequestCompressor().compress(payload) == (payload, None)
+
+    def test_threshold_is_configurable(self) -> None:
+        payload = b'{"query": "' + b"a" * 200 + b'"}'
+        body, encoding = RequestCompressor(min_size=100).compress(payload)
+        assert encoding == "zstd"
+        assert ZstdDecompressor().decompress(body) == payload
+
+    def test_incompressible_payloads_are_sent_as_is(self) -> None:
+        payload = os.urandom(2048)
+        assert RequestCompressor(max_ratio=0.5).compress(payload) == (payload, None)
+
+    def test_context_is_reused_per_thread(self) -> None:
+        compressor = RequestCompressor()
+        # pylint: disable=protected-access
+        main_context = compressor._zstd_compressor()
+        assert compressor._zstd_compressor() is main_context
+
+        other_contexts = []
+        thread = threading.Thread(
+            target=lambda: other_contexts.append(compressor._zstd_compressor())
+        )
+        thread.start()
+        thread.join()
+        assert other_contexts[0] is not main_context
+
+    def test_dictionary_round_trip(self) -> None:
+        dictionary = load_default_dictionary()
+        payload = Requester("", "").encode_payload(PAY_INVOICE_MUTATION, {})
+        plain, _ = RequestCompressor().compress(payload)
+        body, encoding = RequestCompressor(dictionary=dictionary).compress(payload)
+
+        assert encoding == "zstd"
+        assert len(body) < len(plain)
+        assert ZstdDecompressor(dict_data=dictionary).decompress(body) == payload
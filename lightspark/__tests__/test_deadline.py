@@ -0,0 +1,187 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from conftest import GraphQLStandInServer, Response, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.async_requester import AsyncRequester
+from lightspark.requests.batching import _Batch
+from lightspark.requests.deadline import (
+    current_deadline,
+    deadline,
+    remaining_secs,
+    with_current_deadline,
+)
+from lightspark.requests.requester import Requester
+from lightspark.requests.retry import RetryPolicy
+from lightspark.utils.signing_key import RSASigningKey
+
+QUERY = "query GetThing($id: ID!) { thing(id: $id) { id } }"
+
+
+def _slow(secs: float):
+    def responder(body: Dict[str, Any]) -> Response:
+        time.sleep(secs)
+        return data_response({"thing": None})
+
+    return responder
+
+
+class TestDeadline:
+    def test_read_timeout(self, graphql_server: GraphQLStandInServer) -> None:
+        graphql_server.responder = _slow(0.5)
+        requester = Requester(
+            "id", "secret", base_url=graphql_server.url, read_timeout_secs=0.05
+        )
+        with pytest.raises(requests.Timeout):
+            requester.execute_graphql(QUERY, {"id": "a"})
+
+    def test_deadline_caps_the_timeouts(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _slow(0.5)
+        requester = Requester("id", "secret", base_url=graphql_server.url)
+
+        started = time.monotonic()
+        with pytest.raises(requests.Timeout), deadline(0.1):
+            requester.execute_graphql(QUERY, {"id": "a"})
+        assert time.monotonic() - started < 0.4
+
+    def test_passed_deadlines_fail_without_sending(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        requester = Requester("id", "secret", base_url=graphql_server.url)
+        with pytest.raises(LightsparkException) as e, deadline(0):
+            requester.execute_graphql(QUERY, {"id": "a"})
+        assert e.value.code == "DEADLINE_EXCEEDED"
+        assert not graphql_server.requests
+
+    def test_retries_stop_at_the_deadline(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: (503, {}, {})
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            retry_policy=RetryPolicy(
+                max_attempts=100, initial_backoff_secs=0.05, max_backoff_secs=0.05
+            ),
+        )
+
+        started = time.monotonic()
+        with pytest.raises(LightsparkException), deadline(0.2):
+            requester.execute_graphql(QUERY, {"id": "a"})
+        assert time.monotonic() - started < 0.3
+        assert 1 < len(graphql_server.requests) < 100
+
+    def test_deadlines_nest_and_follow_thread_pools(self) -> None:
+        assert current_deadline() is None
+        with deadline(10):
+            outer = current_deadline()
+            with deadline(1):
+                inner = current_deadline()
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    assert pool.submit(current_deadline).result() is None
+                    propagated = pool.submit(with_current_deadline(current_deadline))
+                    assert propagated.result() == inner
+            with deadline(20):
+                assert current_deadline() == outer
+        assert outer is not None and inner is not None and inner < outer
+        assert remaining_secs() is None
+
+    def test_batches_are_sent_under_the_earliest_deadline(self) -> None:
+        batch = _Batch()
+        with deadline(10):
+            batch.add(QUERY, {"id": "a"}, None)
+        with deadline(1):
+            batch.add(QUERY, {"id": "b"}, None)
+            earliest = current_deadline()
+        batch.add(QUERY, {"id": "c"}, None)
+        assert batch.deadline == earliest
+
+    def test_coalesced_callers_wait_within_their_deadline(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _slow(0.5)
+        requester = Requester(
+            "id", "secret", base_url=graphql_server.url, coalesce_queries=True
+        )
+        leader = threading.Thread(
+            target=requester.execute_graphql, args=(QUERY, {"id": "a"})
+        )
+        leader.start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        with pytest.raises(LightsparkException) as e, deadline(0.1):
+            requester.execute_graphql(QUERY, {"id": "a"})
+        assert e.value.code == "DEADLINE_EXCEEDED"
+        assert time.monotonic() - started < 0.3
+        leader.join()
+        assert len(graphql_server.requests) == 1
+
+    def test_payments_read_for_their_timeout(
+        self, graphql_server: GraphQLStandInServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        graphql_server.responder = lambda body: (500, {}, {})
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, connect_timeout_secs=3
+        )
+        client.load_node_signing_key(
+            "node",
+            RSASigningKey(
+                rsa.generate_private_key(
+                    public_exponent=65537, key_size=2048
+                ).private_bytes(
+                    serialization.Encoding.DER,
+                    serialization.PrivateFormat.PKCS8,
+                    serialization.NoEncryption(),
+                )
+            ),
+        )
+        session = client._requester.graphql_session
+        timeouts: List[Any] = []
+        post = session.post
+
+        def recording_post(*args: Any, **kwargs: Any) -> requests.Response:
+            timeouts.append(kwargs["timeout"])
+            return post(*args, **kwargs)
+
+        monkeypatch.setattr(session, "post", recording_post)
+
+        with pytest.raises(LightsparkException):
+            client.pay_invoice(
+                "node", "lnbcrt1", timeout_secs=120, maximum_fees_msats=1
+            )
+        with pytest.raises(LightsparkException):
+            client.execute_graphql_request(QUERY, {"id": "a"})
+
+        assert timeouts == [(3, 135), (3, 60)]
+
+    def test_async_deadline(self, graphql_server: GraphQLStandInServer) -> None:
+        graphql_server.responder = _slow(0.5)
+
+        async def run() -> None:
+            requester = AsyncRequester("id", "secret", base_url=graphql_server.url)
+            try:
+                with deadline(0.1):
+                    await requester.execute_graphql_async(QUERY, {"id": "a"})
+            finally:
+                await requester.close()
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+        assert time.monotonic() - started < 0.4
@@ -0,0 +1,68 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import re
+from typing import Any, Dict, Mapping, Optional
+
+from conftest import GraphQLStandInServer, Response, api_token_json, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.objects.all_entities import get_entities_async
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.requests.requester import Requester
+
+
+def _entities_responder(body: Dict[str, Any]) -> Response:
+    data: Dict[str, Optional[Mapping[str, Any]]] = {}
+    for alias, variable in re.findall(
+        r"(e\d+): entity\(id: \$(id\d+)\)", body["query"]
+    ):
+        entity_id = body["variables"][variable]
+        data[alias] = (
+            None if entity_id.startswith("missing") else api_token_json(entity_id)
+        )
+    return data_response(data)
+
+
+class TestGetEntities:
+    def test_fetches_entities_in_chunks_and_keeps_order(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _entities_responder
+        client = LightsparkSyncClient("id", "secret", base_url=graphql_server.url)
+        ids = [f"token-{i}" for i in range(7)] + ["missing-1", "token-0"]
+
+        entities = client.get_entities(ids, ApiToken, chunk_size=3, parallelism=2)
+
+        assert [e.id if e else None for e in entities] == [
+            *ids[:7],
+            None,
+            "token-0",
+        ]
+        assert all(isinstance(e, ApiToken) for e in entities if e)
+        # 8 distinct ids in chunks of 3.
+        assert len(graphql_server.requests) == 3
+        assert {r["operationName"] for r in graphql_server.requests} == {"GetEntities"}
+        assert sorted(len(r["variables"]) for r in graphql_server.requests) == [2, 3, 3]
+
+    def test_single_chunk_is_one_request(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _entities_responder
+        client = LightsparkSyncClient("id", "secret", base_url=graphql_server.url)
+
+        entities = client.get_entities(["a", "b"], ApiToken)
+
+        assert [e.id for e in entities if e] == ["a", "b"]
+        assert len(graphql_server.requests) == 1
+
+    def test_async(self, graphql_server: GraphQLStandInServer) -> None:
+        graphql_server.responder = _entities_responder
+        requester = Requester("id", "secret", base_url=graphql_server.url)
+
+        entities = asyncio.run(
+            get_entities_async(requester, ["a", "missing", "b"], ApiToken, chunk_size=2)
+        )
+
+        assert [e.id if e else None for e in entities] == ["a", None, "b"]
+        assert len(graphql_server.requests) == 2
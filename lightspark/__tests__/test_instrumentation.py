@@ -0,0 +1,201 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+from typing import List
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from conftest import GraphQLStandInServer, api_token_json, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.all_entities import get_entity_async
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.requests.async_requester import AsyncRequester
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.instrumentation import (
+    NO_CALL_EVENT,
+    CallEvent,
+    Histogram,
+    HistogramAggregator,
+)
+from lightspark.requests.requester import Requester
+from lightspark.utils.signing_key import RSASigningKey
+
+QUERY = "query GetThing($id: ID!) { thing(id: $id) { id } }"
+MUTATION = "mutation PayThing($id: ID!) { pay_thing(id: $id) { id } }"
+
+
+class TestInstrumentation:
+    def test_events_carry_phase_timings_and_sizes(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response({"thing": {"id": "a"}})
+        events: List[CallEvent] = []
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            compressor=RequestCompressor(min_size=0),
+            call_listeners=[events.append],
+        )
+
+        requester.execute_graphql(QUERY, {"id": "a" * 2000})
+
+        (event,) = events
+        assert event.operation == "GetThing"
+        assert set(event.phases) == {"encode", "compress", "http", "decode"}
+        assert event.duration_secs == pytest.approx(sum(event.phases.values()))
+        assert event.status == 200
+        assert event.error is None
+        assert event.request_bytes > 2000
+        assert event.compression_ratio < 0.1
+        assert event.response_bytes == len(b'{"data": {"thing": {"id": "a"}}}')
+
+    def test_signed_calls_time_the_signature(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        signing_key = RSASigningKey(
+            rsa.generate_private_key(
+                public_exponent=65537, key_size=2048
+            ).private_bytes(
+                serialization.Encoding.DER,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        events: List[CallEvent] = []
+        requester = Requester("id", "secret", base_url=graphql_server.url)
+        requester.add_call_listener(events.append)
+
+        requester.execute_graphql(MUTATION, {"id": "a"}, signing_key)
+        requester.remove_call_listener(events.append)
+        requester.execute_graphql(MUTATION, {"id": "a"}, signing_key)
+
+        (event,) = events
+        assert event.phases["sign"] > 0
+        assert event.compression_ratio == 1.0
+
+    def test_failed_calls_report_their_status(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: (503, {}, {})
+        aggregator = HistogramAggregator()
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, call_listeners=[aggregator]
+        )
+
+        with pytest.raises(LightsparkException):
+            client.execute_graphql_request(QUERY, {"id": "a"})
+
+        metrics = aggregator.snapshot()["GetThing"]
+        assert metrics["statuses"] == {"503": 1}
+        assert metrics["phases"]["total"]["count"] == 1
+        assert "decode" not in metrics["phases"]
+
+    def test_failing_listeners_dont_fail_calls(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        def listener(event: CallEvent) -> None:
+            raise RuntimeError("boom")
+
+        requester = Requester(
+            "id", "secret", base_url=graphql_server.url, call_listeners=[listener]
+        )
+        assert requester.execute_graphql(QUERY, {"id": "a"}) == {}
+
+    def test_async_requester_emits_events(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        aggregator = HistogramAggregator()
+
+        async def run() -> None:
+            requester = AsyncRequester(
+                "id", "secret", base_url=graphql_server.url, call_listeners=[aggregator]
+            )
+            try:
+                await requester.execute_graphql_async(QUERY, {"id": "a"})
+            finally:
+                await requester.close()
+
+        asyncio.run(run())
+
+        metrics = aggregator.snapshot()["GetThing"]
+        assert metrics["statuses"] == {"200": 1}
+        assert set(metrics["phases"]) == {
+            "encode",
+            "compress",
+            "http",
+            "decode",
+            "total",
+        }
+
+    def test_client_methods_time_the_construction_of_objects(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response(
+            {"entity": api_token_json(body["variables"]["id"])}
+        )
+        events: List[CallEvent] = []
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, call_listeners=[events.append]
+        )
+
+        client.get_entity("a", ApiToken)
+        client.execute_graphql_request(QUERY, {"id": "a"})
+
+        construct, raw = events
+        assert construct.operation == "GetEntity"
+        assert construct.phases["construct"] > 0
+        assert construct.duration_secs == pytest.approx(sum(construct.phases.values()))
+        assert "construct" not in raw.phases
+
+    def test_async_get_entity_times_the_construction(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response(
+            {"entity": api_token_json(body["variables"]["id"])}
+        )
+        events: List[CallEvent] = []
+
+        async def run() -> None:
+            requester = AsyncRequester(
+                "id",
+                "secret",
+                base_url=graphql_server.url,
+                call_listeners=[events.append],
+            )
+            try:
+                await get_entity_async(requester, "a", ApiToken)
+            finally:
+                await requester.close()
+
+        asyncio.run(run())
+
+        (event,) = events
+        assert event.phases["construct"] > 0
+
+    def test_calls_without_listeners_record_nothing(self) -> None:
+        requester = Requester("id", "secret")
+        assert requester.new_call_event() is NO_CALL_EVENT
+        NO_CALL_EVENT.mark("encode")
+        NO_CALL_EVENT.status = 200
+        assert NO_CALL_EVENT.status is None
+
+
+class TestHistogram:
+    def test_buckets_and_quantiles(self) -> None:
+        histogram = Histogram(bounds=(0.01, 0.1, 1))
+        for value in (0.005, 0.05, 0.05, 0.5, 5):
+            histogram.observe(value)
+
+        assert histogram.to_json() == {
+            "count": 5,
+            "sum": pytest.approx(5.605),
+            "buckets": [(0.01, 1), (0.1, 3), (1, 4), (float("inf"), 5)],
+        }
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.8) == 1
+        assert histogram.quantile(0.99) == float("inf")
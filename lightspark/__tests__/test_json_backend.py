@@ -0,0 +1,81 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.requests.json_backend import (
+    JsonBackend,
+    MsgspecJsonBackend,
+    OrjsonJsonBackend,
+    StdlibJsonBackend,
+    default_json_backend,
+)
+
+
+def available_backends() -> List[JsonBackend]:
+    backends: List[JsonBackend] = [StdlibJsonBackend()]
+    for backend_class in (OrjsonJsonBackend, MsgspecJsonBackend):
+        try:
+            backends.append(backend_class())
+        except ImportError:
+            pass
+    return backends
+
+
+BACKENDS = available_backends()
+
+VARIABLES = {
+    "bitcoin_network": BitcoinNetwork.REGTEST,
+    "statuses": [TransactionStatus.SUCCESS, TransactionStatus.PENDING],
+    "after_date": datetime(2023, 5, 17, 23, 56, 47, 874449),
+    "before_date": datetime(2023, 5, 18, tzinfo=timezone.utc),
+    "expiry_date": datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+    "nonce": 2**64 - 1,
+    "first": None,
+}
+
+
+class TestJsonBackend:
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    def test_encoding_matches_encoder(self, backend: JsonBackend) -> None:
+        assert json.loads(backend.dumps(VARIABLES)) == {
+            "bitcoin_network": "REGTEST",
+            "statuses": ["SUCCESS", "PENDING"],
+            "after_date": "2023-05-17T23:56:47.874449+00:00",
+            "before_date": "2023-05-18T00:00:00+00:00",
+            "expiry_date": "2024-01-01T12:00:00+00:00",
+            "nonce": 2**64 - 1,
+            "first": None,
+        }
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2023, 5, 17, 23, 56, 47, 874449),
+            datetime(2023, 5, 18, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+            TransactionStatus.SUCCESS,
+        ],
+    )
+    def test_values_encode_to_the_same_bytes(
+        self, backend: JsonBackend, value: object
+    ) -> None:
+        # Datetimes aren't encoded natively by orjson and msgspec because their
+        # encodings differ from `Encoder`'s.
+        assert backend.dumps([value]) == StdlibJsonBackend().dumps([value])
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    def test_decodes_bytes(self, backend: JsonBackend) -> None:
+        data = '{"data": {"name": "Zoë", "value": 1.5}}'.encode("utf8")
+        assert backend.loads(data) == {"data": {"name": "Zoë", "value": 1.5}}
+
+    def test_default_prefers_native_backends(self) -> None:
+        expected = BACKENDS[1].name if len(BACKENDS) > 1 else "json"
+        assert default_json_backend().name == expected
@@ -1,10 +1,14 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
+from datetime import timedelta
+from typing import Any, Dict
 from uuid import uuid4
 
 import jwt
+import pytest
 
 from lightspark import LightsparkSyncClient
+from lightspark.utils.wallet_jwt import WalletJwtMinter
 
 PUBLIC_KEY = """
 -----BEGIN PUBLIC KEY-----
@@ -21,6 +25,16 @@ MEcCAQAwBQYDK2VxBDsEOaHk7Bad3cUQvHFZH3W8GHEMLcUnWIl/HD7qgndZnHfe
 """
 
 
+def _decode(token: str) -> Dict[str, Any]:
+    return jwt.decode(
+        token,
+        PUBLIC_KEY,
+        algorithms=["EdDSA"],
+        audience="https://api.lightspark.com",
+        options={"require": ["exp", "iat", "sub"], "verify_exp": False},
+    )
+
+
 class TestJWT:
     def test_generate_key(self):
         client = LightsparkSyncClient("", "")
@@ -41,3 +55,45 @@ class TestJWT:
         )
         assert payload["sub"] == user_id
         assert payload["exp"] > payload["iat"]
+
+
+class TestWalletJwtMinter:
+    def test_reuses_tokens_until_the_refresh_margin(self) -> None:
+        now = [1_700_000_000.0]
+        minter = WalletJwtMinter(
+            PRIVATE_KEY,
+            test_mode=True,
+            duration=timedelta(minutes=1),
+            refresh_margin=timedelta(seconds=10),
+            clock=lambda: now[0],
+        )
+        token = minter.mint("wallet")
+        payload = _decode(token)
+        assert payload["sub"] == "wallet"
+        assert payload["test"] is True
+        assert payload["exp"] - payload["iat"] == 60
+
+        now[0] += 49
+        assert minter.mint("wallet") == token
+        now[0] += 1
+        refreshed = minter.mint("wallet")
+        assert refreshed != token
+        assert _decode(refreshed)["iat"] == payload["iat"] + 50
+        assert (minter.minted, minter.reused) == (2, 1)
+
+    def test_mints_many_in_order(self) -> None:
+        minter = WalletJwtMinter(PRIVATE_KEY, max_tokens=2)
+        tokens = minter.mint_many(["a", "b", "a", "c"])
+        assert [_decode(token)["sub"] for token in tokens] == ["a", "b", "a", "c"]
+        assert tokens[0] == tokens[2]
+        assert (minter.minted, minter.reused) == (3, 1)
+        # "b" was the least recently used token when "c" was minted.
+        minter.mint_many(["a", "b"])
+        assert (minter.minted, minter.reused) == (4, 2)
+        minter.invalidate("b")
+        minter.mint("b")
+        assert minter.minted == 5
+
+    def test_rejects_a_margin_longer_than_the_tokens(self) -> None:
+        with pytest.raises(ValueError):
+            WalletJwtMinter(PRIVATE_KEY, refresh_margin=timedelta(minutes=5))
@@ -0,0 +1,140 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from typing import Any, Dict, Tuple
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from conftest import GraphQLStandInServer, Response, data_response
+
+import lightspark.utils.node_key_cache
+from lightspark import LightsparkSyncClient
+from lightspark.utils import crypto
+from lightspark.utils.node_key_cache import NodeKeyCache
+
+NODES = ("node-1", "node-2", "node-3")
+
+
+@pytest.fixture(scope="module")
+def private_keys() -> Dict[str, bytes]:
+    return {
+        node_id: rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        ).private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        for node_id in NODES
+    }
+
+
+@pytest.fixture
+def encrypted_keys(
+    private_keys: Dict[str, bytes], monkeypatch: pytest.MonkeyPatch
+) -> Dict[str, Tuple[str, str]]:
+    # The iteration count is part of the cipher header, so decryption follows it.
+    monkeypatch.setattr(crypto, "ITERATIONS", 1000)
+    return {
+        node_id: crypto.encrypt(key, f"password-{node_id}")
+        for node_id, key in private_keys.items()
+    }
+
+
+def _client(
+    graphql_server: GraphQLStandInServer,
+    encrypted_keys: Dict[str, Tuple[str, str]],
+    **kwargs: Any,
+) -> LightsparkSyncClient:
+    def responder(body: Dict[str, Any]) -> Response:
+        cipher, encrypted_value = encrypted_keys[body["variables"]["node_id"]]
+        return data_response(
+            {
+                "entity": {
+                    "encrypted_signing_private_key": {
+                        "encrypted_value": encrypted_value,
+                        "cipher": cipher,
+                    }
+                }
+            }
+        )
+
+    graphql_server.responder = responder
+    return LightsparkSyncClient("id", "secret", base_url=graphql_server.url, **kwargs)
+
+
+class TestKeyRecovery:
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_recovers_many_nodes(
+        self,
+        graphql_server: GraphQLStandInServer,
+        encrypted_keys: Dict[str, Tuple[str, str]],
+        private_keys: Dict[str, bytes],
+        max_workers: int,
+    ) -> None:
+        client = _client(graphql_server, encrypted_keys)
+
+        signing_keys = client.recover_node_signing_keys(
+            list(NODES), [f"password-{n}" for n in NODES], max_workers=max_workers
+        )
+
+        assert {n: k.key for n, k in signing_keys.items()} == private_keys
+        assert client.get_signing_key("node-2") is signing_keys["node-2"]
+        assert len(graphql_server.requests) == 3
+
+    def test_requires_one_password_per_node(
+        self,
+        graphql_server: GraphQLStandInServer,
+        encrypted_keys: Dict[str, Tuple[str, str]],
+    ) -> None:
+        with pytest.raises(ValueError):
+            _client(graphql_server, encrypted_keys).recover_node_signing_keys(
+                ["node-1"], []
+            )
+
+    def test_cache_skips_the_kdf_on_warm_restarts(
+        self,
+        graphql_server: GraphQLStandInServer,
+        encrypted_keys: Dict[str, Tuple[str, str]],
+        private_keys: Dict[str, bytes],
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Any,
+    ) -> None:
+        secret = NodeKeyCache.generate_secret()
+        cold = _client(
+            graphql_server,
+            encrypted_keys,
+            node_key_cache=NodeKeyCache(str(tmp_path), secret),
+        )
+        cold.recover_node_signing_key("node-1", "password-node-1")
+
+        def no_kdf(*args: Any) -> bytes:
+            raise AssertionError("The key should have come from the cache")
+
+        monkeypatch.setattr(
+            lightspark.utils.node_key_cache, "decrypt_private_key", no_kdf
+        )
+        warm = _client(
+            graphql_server,
+            encrypted_keys,
+            node_key_cache=NodeKeyCache(str(tmp_path), secret),
+        )
+        signing_key = warm.recover_node_signing_key("node-1", "password-node-1")
+
+        assert signing_key.key == private_keys["node-1"]
+
+    def test_cache_entries_are_bound_to_the_password_and_secret(
+        self, tmp_path: Any
+    ) -> None:
+        secret = NodeKeyCache.generate_secret()
+        cache = NodeKeyCache(str(tmp_path), secret)
+        cache.put("node", "cipher", "value", "password", b"key")
+
+        assert cache.get("node", "cipher", "value", "password") == b"key"
+        assert cache.get("node", "cipher", "value", "other") is None
+        assert cache.get("node", "cipher", "rotated", "password") is None
+        other_secret = NodeKeyCache(str(tmp_path), NodeKeyCache.generate_secret())
+        assert other_secret.get("node", "cipher", "value", "password") is None
+        cache.evict("node")
+        assert cache.get("node", "cipher", "value", "password") is None
@@ -0,0 +1,97 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import copy
+import pickle
+from datetime import datetime
+
+import pytest
+
+from benchmarks import samples
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Channel import Channel
+from lightspark.objects.Channel import from_json as Channel_from_json
+from lightspark.objects.ChannelStatus import ChannelStatus
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.OutgoingPayment import OutgoingPayment
+from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.requests.requester import Requester
+from lightspark.utils.lazy import decoding_lazily, lazy_decoding
+
+
+@pytest.fixture
+def requester() -> Requester:
+    return Requester("", "")
+
+
+class TestLazyDecoding:
+    def test_disabled_by_default(self) -> None:
+        assert not decoding_lazily()
+        with lazy_decoding():
+            assert decoding_lazily()
+            with lazy_decoding(False):
+                assert not decoding_lazily()
+            assert decoding_lazily()
+        assert not decoding_lazily()
+
+    def test_decodes_fields_on_access(self, requester: Requester) -> None:
+        with lazy_decoding():
+            payment = OutgoingPayment_from_json(requester, samples.outgoing_payment(7))
+        assert isinstance(payment, OutgoingPayment)
+        assert payment.id == samples.outgoing_payment(7)["outgoing_payment_id"]
+        assert payment.typename == "OutgoingPayment"
+        assert payment.status == TransactionStatus.SUCCESS
+        assert isinstance(payment.created_at, datetime)
+        assert isinstance(payment.amount, CurrencyAmount)
+        assert payment.amount.original_value == 7000
+        assert payment.origin_id == samples.NODE_ID
+        assert payment.failure_reason is None
+        assert payment.amount is payment.amount
+
+    def test_equals_eagerly_decoded(self, requester: Requester) -> None:
+        eager = Channel_from_json(requester, samples.channel(3))
+        with lazy_decoding():
+            lazy = Channel_from_json(requester, samples.channel(3))
+            other = Channel_from_json(requester, samples.channel(4))
+        assert lazy == eager
+        assert eager == lazy
+        assert lazy != other
+        assert repr(lazy) == repr(eager)
+        assert lazy.to_json() == eager.to_json()
+
+    def test_fields_can_be_set(self, requester: Requester) -> None:
+        with lazy_decoding():
+            channel = Channel_from_json(requester, samples.channel(3))
+        channel.status = ChannelStatus.OFFLINE
+        assert channel.status == ChannelStatus.OFFLINE
+
+    def test_interfaces_decode_the_concrete_type(self, requester: Requester) -> None:
+        with lazy_decoding():
+            payment = Transaction_from_json(requester, samples.outgoing_payment(1))
+        assert isinstance(payment, OutgoingPayment)
+        assert payment == OutgoingPayment_from_json(
+            requester, samples.outgoing_payment(1)
+        )
+
+    def test_unknown_typename(self, requester: Requester) -> None:
+        obj = dict(samples.outgoing_payment(1), __typename="Channel")
+        with lazy_decoding(), pytest.raises(LightsparkException) as excinfo:
+            Transaction_from_json(requester, obj)
+        assert excinfo.value.code == "UNKNOWN_INTERFACE"
+
+    def test_copies_are_eager(self) -> None:
+        with lazy_decoding():
+            channel = Channel_from_json(None, samples.channel(3))
+        for duplicate in (copy.copy(channel), pickle.loads(pickle.dumps(channel))):
+            assert type(duplicate) is Channel
+            assert duplicate == channel
+
+    def test_malformed_fields_fail_on_access(self, requester: Requester) -> None:
+        with lazy_decoding():
+            channel = Channel_from_json(
+                requester, dict(samples.channel(3), channel_created_at="yesterday")
+            )
+        assert channel.short_channel_id == "3x1x0"
+        with pytest.raises(ValueError):
+            _ = channel.created_at
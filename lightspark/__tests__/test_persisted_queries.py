@@ -0,0 +1,63 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from conftest import GraphQLStandInServer, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.objects.Account import FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY
+from lightspark.requests.persisted_queries import document_id, known_documents
+from lightspark.scripts.current_account import CURRENT_ACCOUNT_QUERY
+from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": "2023-05-17T23:56:47.874449+00:00",
+    "account_updated_at": "2023-05-17T23:56:47.874449+00:00",
+    "account_name": "Test",
+}
+
+
+class TestPersistedQueries:
+    def test_known_documents_cover_scripts_and_objects(self) -> None:
+        documents = known_documents()
+        assert documents[document_id(CURRENT_ACCOUNT_QUERY)] == CURRENT_ACCOUNT_QUERY
+        assert documents[document_id(PAY_INVOICE_MUTATION)] == PAY_INVOICE_MUTATION
+        assert (
+            documents[document_id(FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY)]
+            == FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY
+        )
+
+    def test_falls_back_to_full_document_once(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response(
+            {"current_account": ACCOUNT}
+        )
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, persisted_queries=True
+        )
+
+        assert client.get_current_account().id == "Account:1"
+        assert client.get_current_account().id == "Account:1"
+
+        first_miss, registration, hit = graphql_server.requests
+        expected_hash = document_id(CURRENT_ACCOUNT_QUERY)
+        assert "query" not in first_miss
+        assert first_miss["extensions"]["persistedQuery"]["sha256Hash"] == expected_hash
+        assert registration["query"] == CURRENT_ACCOUNT_QUERY
+        assert "query" not in hit
+
+    def test_disabled_by_default(self, graphql_server: GraphQLStandInServer) -> None:
+        graphql_server.responder = lambda body: data_response(
+            {"bitcoin_fee_estimate": None}
+        )
+        client = LightsparkSyncClient("id", "secret", base_url=graphql_server.url)
+        client.execute_graphql_request(
+            "query Test($bitcoin_network: BitcoinNetwork!) { test }",
+            {"bitcoin_network": BitcoinNetwork.REGTEST},
+        )
+
+        (request,) = graphql_server.requests
+        assert "extensions" not in request
+        assert request["query"].startswith("query Test")
@@ -0,0 +1,269 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from conftest import GraphQLStandInServer, Response, data_response
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.deadline import deadline
+from lightspark.requests.rate_limit import (
+    MUTATION,
+    READ,
+    SIGNED_MUTATION,
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    operation_kind,
+    retry_after_secs,
+)
+from lightspark.requests.requester import Requester
+from lightspark.requests.retry import RetryPolicy
+
+QUERY = "query GetThing($id: ID!) { thing(id: $id) { id } }"
+MUTATION_DOCUMENT = "mutation PayThing($id: ID!) { pay_thing(id: $id) { id } }"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _http_error(status: int, headers: Dict[str, str]) -> LightsparkException:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    try:
+        raise requests.HTTPError(f"{status}", response=response)
+    except requests.HTTPError as e:
+        try:
+            raise LightsparkException("HTTP_ERROR", str(e)) from e
+        except LightsparkException as error:
+            return error
+
+
+class TestTokenBucket:
+    def test_bursts_then_paces(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+        clock.now += 1
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_cancel_and_pause(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=1, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1)
+        bucket.cancel()
+        assert bucket.reserve() == pytest.approx(0.1)
+
+        bucket.pause(2)
+        assert bucket.reserve() == pytest.approx(2)
+        assert bucket.reserve() == pytest.approx(2.1)
+
+    def test_rejects_invalid_rates(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestRateLimiter:
+    def test_operation_kinds(self) -> None:
+        assert operation_kind(QUERY, signed=False) == READ
+        assert operation_kind(MUTATION_DOCUMENT, signed=False) == MUTATION
+        assert operation_kind(MUTATION_DOCUMENT, signed=True) == SIGNED_MUTATION
+
+    def test_kinds_are_limited_separately(self) -> None:
+        limiter = RateLimiter(reads=TokenBucket(20, burst=1))
+
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire(READ)
+        assert time.monotonic() - started >= 0.09
+        assert limiter.throttled == 2
+
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire(MUTATION)
+        assert time.monotonic() - started < 0.05
+
+    def test_waits_within_the_deadline(self) -> None:
+        limiter = RateLimiter(reads=TokenBucket(1, burst=1))
+        limiter.acquire(READ)
+        with pytest.raises(LightsparkException) as e, deadline(0.5):
+            limiter.acquire(READ)
+        assert e.value.code == "DEADLINE_EXCEEDED"
+        # The token that wasn't used went back to the bucket.
+        assert limiter.buckets[READ].reserve() == pytest.approx(1, abs=0.05)
+
+    def test_429s_pause_their_kind(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+
+        limiter.observe(READ, _http_error(503, {"Retry-After": "5"}))
+        assert limiter._reserve(READ) == 0
+        limiter.observe(READ, _http_error(429, {"Retry-After": "5"}))
+        assert limiter._reserve(READ) == 5
+        assert limiter._reserve(MUTATION) == 0
+
+    def test_retry_after(self) -> None:
+        assert retry_after_secs(_http_error(429, {"Retry-After": "1.5"})) == 1.5
+        assert retry_after_secs(_http_error(429, {})) is None
+        assert retry_after_secs(_http_error(429, {"Retry-After": "soon"})) is None
+        later = retry_after_secs(
+            _http_error(429, {"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+        )
+        assert later is not None and 28 < later <= 30
+        assert retry_after_secs(ValueError()) is None
+
+    def test_429s_are_retried_after_their_retry_after(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        responses: List[Response] = [
+            (429, {}, {"Retry-After": "0.2"}),
+            data_response({"pay_thing": None}),
+        ]
+        graphql_server.responder = lambda body: responses.pop(0)
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            retry_policy=RetryPolicy(initial_backoff_secs=0.01),
+            rate_limiter=RateLimiter(),
+        )
+
+        started = time.monotonic()
+        # Mutations without an idempotency key are retried after a 429, which
+        # means the API didn't process them.
+        assert requester.execute_graphql(MUTATION_DOCUMENT, {"id": "a"}) == {
+            "pay_thing": None
+        }
+        assert time.monotonic() - started >= 0.2
+        assert len(graphql_server.requests) == 2
+
+    def test_other_errors_of_mutations_are_not_retried(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: (503, {}, {})
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            retry_policy=RetryPolicy(initial_backoff_secs=0.01),
+        )
+        with pytest.raises(LightsparkException):
+            requester.execute_graphql(MUTATION_DOCUMENT, {"id": "a"})
+        assert len(graphql_server.requests) == 1
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_increases_additively_and_decreases_once_per_round(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=5, clock=clock)
+
+        for _ in range(4):
+            started = [limiter.acquire() for _ in range(4)]
+            for started_at in started:
+                limiter.release(started_at, None)
+        assert limiter.limit == 5
+
+        clock.now += 1
+        started = [limiter.acquire() for _ in range(5)]
+        clock.now += 1
+        overloaded = _http_error(429, {})
+        for started_at in started:
+            limiter.release(started_at, overloaded)
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+        clock.now += 1
+        limiter.release(limiter.acquire(), requests.Timeout())
+        assert limiter.limit == 1
+        limiter.release(limiter.acquire(), ValueError())
+        assert limiter.limit == 1
+
+    def test_idle_limits_do_not_grow(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+        for _ in range(100):
+            limiter.release(limiter.acquire(), None)
+        assert limiter.limit == 10
+
+    def test_waits_for_a_free_slot(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        started_at = limiter.acquire()
+        threading.Timer(0.1, limiter.release, (started_at, None)).start()
+
+        started = time.monotonic()
+        limiter.release(limiter.acquire(), None)
+        assert time.monotonic() - started >= 0.09
+
+        limiter.acquire()
+        with pytest.raises(LightsparkException) as e, deadline(0.1):
+            limiter.acquire()
+        assert e.value.code == "DEADLINE_EXCEEDED"
+
+    def test_async_waiters_are_woken_from_threads(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        started_at = limiter.acquire()
+
+        async def run() -> float:
+            threading.Timer(0.1, limiter.release, (started_at, None)).start()
+            return await limiter.acquire_async()
+
+        started = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - started >= 0.09
+        assert limiter.in_flight == 1
+
+    def test_bounds_requests_in_flight(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        in_flight = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def responder(body: Dict[str, Any]) -> Response:
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return data_response({"thing": None})
+
+        graphql_server.responder = responder
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            concurrency_limiter=AdaptiveConcurrencyLimiter(
+                initial_limit=2, max_limit=2
+            ),
+        )
+        threads = [
+            threading.Thread(
+                target=requester.execute_graphql, args=(QUERY, {"id": str(i)})
+            )
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(graphql_server.requests) == 8
+        assert peak[0] <= 2
@@ -0,0 +1,70 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import socket
+import time
+
+import requests
+
+from conftest import GraphQLStandInServer, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.requests.requester import Requester
+
+
+def _pool(requester: Requester):
+    adapter = requester.graphql_session.get_adapter(requester.base_url)
+    request = requests.Request("POST", requester.base_url).prepare()
+    return adapter.get_connection_with_tls_context(request, verify=True)
+
+
+class TestConnectionPool:
+    def test_pool_size_and_keepalive_are_configurable(self) -> None:
+        requester = Requester(
+            "id",
+            "secret",
+            pool_maxsize=32,
+            pool_block=True,
+            tcp_keepalive_idle_secs=30,
+        )
+        adapter = requester.graphql_session.get_adapter(requester.base_url)
+        assert adapter._pool_maxsize == 32  # pylint: disable=protected-access
+        assert adapter._pool_block  # pylint: disable=protected-access
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_warmup_opens_connections_that_requests_reuse(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response({"ok": True})
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, pool_maxsize=4
+        )
+
+        assert client.warmup(connections=8) == 4
+
+        requester = client._requester  # pylint: disable=protected-access
+        pool = _pool(requester)
+        idle = [conn for conn in list(pool.pool.queue) if conn and conn.sock]
+        assert len(idle) == 4
+        warm_socket = idle[-1].sock
+
+        client.execute_graphql_request("query Test { ok }")
+        idle = [conn for conn in list(pool.pool.queue) if conn and conn.sock]
+        assert len(idle) == 4
+        assert warm_socket in [conn.sock for conn in idle]
+
+    def test_warmup_gives_up_on_unresponsive_hosts(self) -> None:
+        # Accepts connections but never answers the TLS handshake.
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(8)
+            requester = Requester(
+                "id",
+                "secret",
+                base_url=f"https://127.0.0.1:{server.getsockname()[1]}/graphql",
+                connect_timeout_secs=0.2,
+            )
+
+            started = time.monotonic()
+            assert requester.warmup(connections=2) == 0
+            assert time.monotonic() - started < 5
@@ -0,0 +1,132 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from conftest import GraphQLStandInServer, Response, data_response
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.requester import Requester
+from lightspark.requests.retry import RetryBudget, RetryPolicy
+
+QUERY = "query GetThing { thing }"
+MUTATION = "mutation PayInvoice($idempotency_key: String) { pay_invoice }"
+
+
+def _fail_then_succeed(failures: int, status: int = 503):
+    calls: List[int] = []
+
+    def responder(body: Dict[str, Any]) -> Response:
+        calls.append(1)
+        if len(calls) <= failures:
+            return status, {"errors": [{"message": "unavailable"}]}, {}
+        return data_response({"ok": True})
+
+    return responder
+
+
+def _requester(server: GraphQLStandInServer, **kwargs: Any) -> Requester:
+    policy = RetryPolicy(initial_backoff_secs=0, **kwargs)
+    return Requester("id", "secret", base_url=server.url, retry_policy=policy)
+
+
+class TestRetryPolicy:
+    def test_backoff_is_jittered_under_an_exponential_bound(self) -> None:
+        policy = RetryPolicy(initial_backoff_secs=0.1, max_backoff_secs=0.3)
+        delays = [policy.backoff_secs(3) for _ in range(200)]
+        assert all(0 <= delay <= 0.3 for delay in delays)
+        assert len(set(delays)) > 1
+        assert all(0 <= policy.backoff_secs(1) <= 0.1 for _ in range(200))
+
+    def test_only_queries_and_idempotent_mutations_are_replayable(self) -> None:
+        assert RetryPolicy.is_replayable(QUERY, None)
+        assert not RetryPolicy.is_replayable(MUTATION, {})
+        assert not RetryPolicy.is_replayable(MUTATION, {"idempotency_key": None})
+        assert RetryPolicy.is_replayable(MUTATION, {"idempotency_key": "k"})
+
+    def test_classifies_errors(self) -> None:
+        policy = RetryPolicy()
+        response = requests.Response()
+        response.status_code = 503
+        try:
+            raise LightsparkException("HTTP_ERROR", "503") from requests.HTTPError(
+                response=response
+            )
+        except LightsparkException as e:
+            assert policy.is_retryable(e)
+        response.status_code = 400
+        try:
+            raise LightsparkException("HTTP_ERROR", "400") from requests.HTTPError(
+                response=response
+            )
+        except LightsparkException as e:
+            assert not policy.is_retryable(e)
+        assert policy.is_retryable(requests.ConnectionError("reset"))
+        assert not policy.is_retryable(LightsparkException("GRAPHQL_ERROR", "bad"))
+        assert not policy.is_retryable(ValueError())
+
+    def test_budget_limits_retries_across_calls(self) -> None:
+        budget = RetryBudget(ratio=0.5, capacity=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+
+    def test_call_async_retries(self) -> None:
+        policy = RetryPolicy(initial_backoff_secs=0)
+        attempts: List[int] = []
+
+        async def operation() -> str:
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise asyncio.TimeoutError()
+            return "ok"
+
+        assert asyncio.run(policy.call_async(operation)) == "ok"
+        assert len(attempts) == 2
+
+
+class TestRequesterRetries:
+    def test_retries_transient_failures_of_queries(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _fail_then_succeed(2)
+        requester = _requester(graphql_server)
+        assert requester.execute_graphql(QUERY, None) == {"ok": True}
+        assert len(graphql_server.requests) == 3
+
+    def test_gives_up_after_max_attempts(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _fail_then_succeed(5)
+        requester = _requester(graphql_server, max_attempts=2)
+        with pytest.raises(LightsparkException):
+            requester.execute_graphql(QUERY, None)
+        assert len(graphql_server.requests) == 2
+
+    def test_does_not_retry_client_errors(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _fail_then_succeed(1, status=400)
+        with pytest.raises(LightsparkException):
+            _requester(graphql_server).execute_graphql(QUERY, None)
+        assert len(graphql_server.requests) == 1
+
+    def test_mutations_are_retried_only_with_an_idempotency_key(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _fail_then_succeed(1)
+        requester = _requester(graphql_server)
+        with pytest.raises(LightsparkException):
+            requester.execute_graphql(MUTATION, {})
+        assert len(graphql_server.requests) == 1
+
+        graphql_server.responder = _fail_then_succeed(1)
+        result = requester.execute_graphql(MUTATION, {"idempotency_key": "key"})
+        assert result == {"ok": True}
+        assert len(graphql_server.requests) == 3
@@ -0,0 +1,111 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import json
+import pickle
+from base64 import b64decode
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from lightspark.requests.signing_executor import SigningExecutor
+from lightspark.utils.signing_key import RSASigningKey
+
+PAYLOAD = b'{"operationName": "PayInvoice"}'
+
+
+@pytest.fixture(scope="module")
+def rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def signing_key(rsa_key: rsa.RSAPrivateKey) -> RSASigningKey:
+    return RSASigningKey(
+        rsa_key.private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+
+def _verify(key: rsa.RSAPrivateKey, header: str, payload: bytes) -> None:
+    key.public_key().verify(
+        b64decode(json.loads(header)["signature"]),
+        payload,
+        padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH,
+        ),
+        hashes.SHA256(),
+    )
+
+
+class TestSigningExecutor:
+    def test_signs_on_threads_and_reports_metrics(
+        self, rsa_key: rsa.RSAPrivateKey, signing_key: RSASigningKey
+    ) -> None:
+        executor = SigningExecutor(max_workers=2)
+        try:
+            futures = [executor.submit(signing_key, PAYLOAD) for _ in range(4)]
+            for future in futures:
+                _verify(rsa_key, future.result(), PAYLOAD)
+            _verify(rsa_key, executor.sign(signing_key, PAYLOAD), PAYLOAD)
+        finally:
+            executor.shutdown()
+
+        metrics = executor.metrics()
+        assert metrics.queue_depth == 0
+        assert metrics.signed == 5
+        assert 0 < metrics.mean_latency_secs <= metrics.max_latency_secs
+
+    def test_signs_in_processes(
+        self, rsa_key: rsa.RSAPrivateKey, signing_key: RSASigningKey
+    ) -> None:
+        executor = SigningExecutor(max_workers=1, processes=True)
+        try:
+            _verify(rsa_key, executor.sign(signing_key, PAYLOAD), PAYLOAD)
+        finally:
+            executor.shutdown()
+
+    def test_rsa_keys_survive_pickling(
+        self, rsa_key: rsa.RSAPrivateKey, signing_key: RSASigningKey
+    ) -> None:
+        copy = pickle.loads(pickle.dumps(signing_key))
+        assert copy.key == signing_key.key
+        _verify(rsa_key, copy.sign_payload(PAYLOAD), PAYLOAD)
+
+    def test_sign_async(
+        self, rsa_key: rsa.RSAPrivateKey, signing_key: RSASigningKey
+    ) -> None:
+        executor = SigningExecutor(max_workers=1)
+        try:
+            header = asyncio.run(executor.sign_async(signing_key, PAYLOAD))
+        finally:
+            executor.shutdown()
+        _verify(rsa_key, header, PAYLOAD)
+
+    def test_async_requester_signs_with_the_executor(
+        self, rsa_key: rsa.RSAPrivateKey, signing_key: RSASigningKey
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        from lightspark.requests.async_requester import (  # pylint: disable=import-outside-toplevel
+            AsyncRequester,
+        )
+
+        executor = SigningExecutor(max_workers=1)
+        requester = AsyncRequester("id", "secret", signing_executor=executor)
+        try:
+            payload, headers = asyncio.run(
+                requester.build_request_async(
+                    "mutation PayInvoice { pay_invoice }", {}, signing_key
+                )
+            )
+        finally:
+            executor.shutdown()
+
+        assert headers["X-Lightspark-Signing"] is not None
+        _verify(rsa_key, headers["X-Lightspark-Signing"], payload)
+        assert executor.metrics().signed == 1
@@ -0,0 +1,129 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from conftest import GraphQLStandInServer, Response, api_token_json, data_response
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.all_entities import get_entity
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.requests.requester import Requester
+from lightspark.requests.single_flight import AsyncSingleFlight, is_query
+
+
+def _slow_entity_responder(body: Dict[str, Any]) -> Response:
+    time.sleep(0.2)
+    return data_response({"entity": api_token_json(body["variables"]["id"])})
+
+
+def _run_concurrently(requester: Requester, ids: List[str]) -> List[Any]:
+    results: List[Any] = []
+    barrier = threading.Barrier(len(ids))
+
+    def fetch(entity_id: str) -> None:
+        barrier.wait()
+        try:
+            results.append(get_entity(requester, entity_id, ApiToken))
+        except LightsparkException as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=fetch, args=(i,)) for i in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_only_queries_are_coalesced(self) -> None:
+        assert is_query("query GetThing { x }")
+        assert is_query("  { x }")
+        assert not is_query("mutation PayInvoice { x }")
+
+    def test_identical_queries_share_one_request(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = _slow_entity_responder
+        requester = Requester(
+            "id", "secret", base_url=graphql_server.url, coalesce_queries=True
+        )
+
+        results = _run_concurrently(requester, ["a"] * 5 + ["b"])
+
+        assert sorted(r.id for r in results) == ["a"] * 5 + ["b"]
+        assert sorted(r["variables"]["id"] for r in graphql_server.requests) == [
+            "a",
+            "b",
+        ]
+        assert requester.single_flight is not None
+        assert requester.single_flight.calls == 6
+        assert requester.single_flight.coalesced == 4
+
+    def test_errors_are_shared(self, graphql_server: GraphQLStandInServer) -> None:
+        def failing(body: Dict[str, Any]) -> Response:
+            time.sleep(0.2)
+            return 200, {"errors": [{"message": "boom"}]}, {}
+
+        graphql_server.responder = failing
+        requester = Requester(
+            "id", "secret", base_url=graphql_server.url, coalesce_queries=True
+        )
+
+        results = _run_concurrently(requester, ["a"] * 3)
+
+        assert all(isinstance(r, LightsparkException) for r in results)
+        assert len(graphql_server.requests) == 1
+
+    def test_async(self) -> None:
+        single_flight = AsyncSingleFlight()
+        sent: List[int] = []
+
+        async def call() -> Dict[str, Any]:
+            sent.append(1)
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+
+        async def run() -> List[Any]:
+            return await asyncio.gather(
+                *(single_flight.do("key", call) for _ in range(4))
+            )
+
+        assert asyncio.run(run()) == [{"ok": True}] * 4
+        assert len(sent) == 1
+        assert single_flight.coalesced == 3
+
+    def test_cancelling_the_first_caller_only_detaches_it(self) -> None:
+        single_flight = AsyncSingleFlight()
+        sent: List[int] = []
+
+        async def call() -> Dict[str, Any]:
+            sent.append(1)
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+
+        async def run() -> List[Any]:
+            first = asyncio.ensure_future(single_flight.do("key", call))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(single_flight.do("key", call))
+            await asyncio.sleep(0)
+            first.cancel()
+            result = await asyncio.wait_for(second, timeout=5)
+            return [first.cancelled(), second.cancelled(), result]
+
+        assert asyncio.run(run()) == [True, False, {"ok": True}]
+        assert len(sent) == 1
+
+    def test_async_errors_propagate(self) -> None:
+        single_flight = AsyncSingleFlight()
+
+        async def call() -> Dict[str, Any]:
+            raise LightsparkException("HTTP_ERROR", "boom")
+
+        with pytest.raises(LightsparkException):
+            asyncio.run(single_flight.do("key", call))
@@ -0,0 +1,163 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+from itertools import count
+from typing import Any, Dict, List, Optional
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from conftest import GraphQLStandInServer, data_response
+
+from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.async_requester import AsyncRequester
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.requester import Requester
+from lightspark.utils.signing_key import RSASigningKey
+
+QUERY = "query GetThing($id: ID!) { thing(id: $id) { id } }"
+MUTATION = "mutation PayThing($id: ID!) { pay_thing(id: $id) { id } }"
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+
+
+class RecordingSpan:
+    def __init__(self, name: str, span_id: int, parent: Optional["RecordingSpan"]):
+        self.name = name
+        self.span_id = span_id
+        self.parent = parent
+        self.attributes: Dict[str, Any] = {}
+        self.exceptions: List[BaseException] = []
+        self.ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self) -> None:
+        self.ended = True
+
+    def traceparent(self) -> Optional[str]:
+        return f"00-{TRACE_ID}-{self.span_id:016x}-01"
+
+
+class RecordingTracer:
+    def __init__(self) -> None:
+        self.spans: List[RecordingSpan] = []
+        self._ids = count(1)
+
+    def start_span(self, name: str, parent: Optional[RecordingSpan]) -> RecordingSpan:
+        span = RecordingSpan(name, next(self._ids), parent)
+        self.spans.append(span)
+        return span
+
+    def tree(self) -> List[Any]:
+        return [
+            (span.name, span.parent.name if span.parent else None)
+            for span in self.spans
+        ]
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> RSASigningKey:
+    return RSASigningKey(
+        rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+
+class TestTracing:
+    def test_operations_have_spans_for_each_step(
+        self, graphql_server: GraphQLStandInServer, signing_key: RSASigningKey
+    ) -> None:
+        tracer = RecordingTracer()
+        requester = Requester(
+            "id",
+            "secret",
+            base_url=graphql_server.url,
+            compressor=RequestCompressor(min_size=0),
+            tracer=tracer,
+        )
+
+        requester.execute_graphql(MUTATION, {"id": "a" * 2000}, signing_key)
+
+        assert tracer.tree() == [
+            ("PayThing", None),
+            ("lightspark.sign", "PayThing"),
+            ("lightspark.compress", "PayThing"),
+            ("lightspark.http", "PayThing"),
+            ("lightspark.decode", "PayThing"),
+        ]
+        assert all(span.ended for span in tracer.spans)
+        http = tracer.spans[3]
+        assert http.attributes == {"http.status_code": 200}
+        assert graphql_server.headers[0]["traceparent"] == http.traceparent()
+
+    def test_failures_are_recorded_on_the_operation(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: (500, {}, {})
+        tracer = RecordingTracer()
+        client = LightsparkSyncClient(
+            "id", "secret", base_url=graphql_server.url, tracer=tracer
+        )
+
+        with pytest.raises(LightsparkException):
+            client.execute_graphql_request(QUERY, {"id": "a"})
+
+        operation = tracer.spans[0]
+        assert operation.name == "GetThing"
+        assert isinstance(operation.exceptions[0], LightsparkException)
+        (http,) = [span for span in tracer.spans if span.name == "lightspark.http"]
+        assert http.attributes == {"http.status_code": 500}
+        assert all(span.ended for span in tracer.spans)
+
+    def test_nothing_is_traced_or_sent_without_a_tracer(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        Requester("id", "secret", base_url=graphql_server.url).execute_graphql(
+            QUERY, {"id": "a"}
+        )
+        assert "traceparent" not in graphql_server.headers[0]
+
+    def test_async_requester_traces_operations(
+        self, graphql_server: GraphQLStandInServer
+    ) -> None:
+        graphql_server.responder = lambda body: data_response({"thing": None})
+        tracer = RecordingTracer()
+
+        async def run() -> None:
+            requester = AsyncRequester(
+                "id", "secret", base_url=graphql_server.url, tracer=tracer
+            )
+            try:
+                await asyncio.gather(
+                    requester.execute_graphql_async(QUERY, {"id": "a"}),
+                    requester.execute_graphql_async(QUERY, {"id": "b"}),
+                )
+            finally:
+                await requester.close()
+
+        asyncio.run(run())
+
+        operations = [span for span in tracer.spans if span.parent is None]
+        assert len(operations) == 2
+        for operation in operations:
+            children = [span.name for span in tracer.spans if span.parent is operation]
+            assert children == [
+                "lightspark.compress",
+                "lightspark.http",
+                "lightspark.decode",
+            ]
+        traceparents = {headers["traceparent"] for headers in graphql_server.headers}
+        assert traceparents == {
+            span.traceparent()
+            for span in tracer.spans
+            if span.name == "lightspark.http"
+        }
@@ -1,7 +1,12 @@
 import datetime
+import hashlib
 import logging
 from unittest.mock import patch
+
+import pytest
+
 from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
 
 logger = logging.getLogger("lightspark")
 logger.setLevel(logging.DEBUG)
@@ -38,3 +43,30 @@ class TestUmaUtils:
         logger.debug(hashed_uma)
         logger.debug(hashed_uma_diff_month)
         assert hashed_uma_diff_month != hashed_uma
+
+    @patch("lightspark.lightspark_client.datetime")
+    def test_hash_uma_identifiers_matches_single_hashes(self, mock_datetime):
+        client = LightsparkSyncClient("", "")
+        priv_key_bytes = b"xyz"
+        mock_datetime.now.return_value = datetime.datetime(2021, 1, 1, 0, 0, 0)
+        identifiers = ["$alice@vasp.com", "$bob@vasp.com", "$alice@vasp.com"]
+
+        hashes = client.hash_uma_identifiers(iter(identifiers), priv_key_bytes)
+
+        assert hashes == [
+            client.hash_uma_identifier(identifier, priv_key_bytes)
+            for identifier in identifiers
+        ]
+        assert hashes[0] == hashlib.sha256(b"$alice@vasp.com1-202178797a").hexdigest()
+
+    def test_hash_phone_numbers(self):
+        client = LightsparkSyncClient("", "")
+
+        hashes = client.hash_phone_numbers(["+15555550100", "+447700900000"])
+
+        assert hashes == [
+            hashlib.sha256(b"+15555550100").hexdigest(),
+            hashlib.sha256(b"+447700900000").hexdigest(),
+        ]
+        with pytest.raises(LightsparkException):
+            client.hash_phone_numbers(["+15555550100", "555-0100"])
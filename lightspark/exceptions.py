@@ -3,4 +3,6 @@
 
 class LightsparkException(Exception):
     def __init__(self, code: str, message: str) -> None:
-        pass
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
@@ -0,0 +1,1288 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+from lightspark.exceptions import LightsparkException
+from lightspark.lightspark_client import E614_REGEX
+from lightspark.objects.Account import Account
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.objects.all_entities import (
+    DEFAULT_ENTITIES_CHUNK_SIZE,
+    DEFAULT_ENTITIES_PARALLELISM,
+    get_entities_async,
+    get_entity_async,
+)
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.objects.ApiToken import from_json as ApiToken_from_json
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.objects.ComplianceProvider import ComplianceProvider
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.CurrencyAmount import from_json as CurrencyAmount_from_json
+from lightspark.objects.Entity import Entity
+from lightspark.objects.FeeEstimate import FeeEstimate
+from lightspark.objects.FeeEstimate import from_json as FeeEstimate_from_json
+from lightspark.objects.IncomingPayment import IncomingPayment
+from lightspark.objects.IncomingPayment import from_json as IncomingPayment_from_json
+from lightspark.objects.IncomingPaymentsForInvoiceQueryOutput import (
+    from_json as IncomingPaymentsForInvoiceQueryOutput_from_json,
+)
+from lightspark.objects.Invoice import Invoice
+from lightspark.objects.Invoice import from_json as Invoice_from_json
+from lightspark.objects.InvoiceData import InvoiceData
+from lightspark.objects.InvoiceData import from_json as InvoiceData_from_json
+from lightspark.objects.InvoiceType import InvoiceType
+from lightspark.objects.LightningFeeEstimateOutput import (
+    from_json as LightningFeeEstimateOutput_from_json,
+)
+from lightspark.objects.LightningTransaction import LightningTransaction
+from lightspark.objects.LightningTransaction import (
+    from_json as LightningTransaction_from_json,
+)
+from lightspark.objects.OutgoingPayment import OutgoingPayment
+from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
+from lightspark.objects.PaymentDirection import PaymentDirection
+from lightspark.objects.Permission import Permission
+from lightspark.objects.RegionCode import RegionCode
+from lightspark.objects.RiskRating import RiskRating
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.objects.UmaInvitation import UmaInvitation
+from lightspark.objects.UmaInvitation import from_json as UmaInvitation_from_json
+from lightspark.objects.WithdrawalMode import WithdrawalMode
+from lightspark.objects.WithdrawalRequest import WithdrawalRequest
+from lightspark.objects.WithdrawalRequest import (
+    from_json as WithdrawalRequest_from_json,
+)
+from lightspark.requests.cache import ResponseCache
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.deadline import (
+    DEFAULT_CONNECT_TIMEOUT_SECS,
+    DEFAULT_READ_TIMEOUT_SECS,
+    payment_read_timeout,
+)
+from lightspark.requests.instrumentation import CallListener, records_construction
+from lightspark.requests.async_requester import (
+    DEFAULT_CONNECTION_LIMIT,
+    AsyncRequester,
+)
+from lightspark.requests.rate_limit import AdaptiveConcurrencyLimiter, RateLimiter
+from lightspark.requests.retry import RetryPolicy
+from lightspark.requests.signing_executor import SigningExecutor
+from lightspark.requests.tracing import Tracer
+from lightspark.scripts.bitcoin_fee_estimate import BITCOIN_FEE_ESTIMATE_QUERY
+from lightspark.scripts.cancel_invoice import CANCEL_INVOICE_MUTATION
+from lightspark.scripts.claim_uma_invitation import (
+    CLAIM_UMA_INVITATION_MUTATION,
+    CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+)
+from lightspark.scripts.create_api_token import CREATE_API_TOKEN_MUTATION
+from lightspark.scripts.create_invoice import CREATE_INVOICE_MUTATION
+from lightspark.scripts.create_lnurl_invoice import CREATE_LNURL_INVOICE_MUTATION
+from lightspark.scripts.create_node_address import CREATE_NODE_ADDRESS_MUTATION
+from lightspark.scripts.create_test_mode_invoice import (
+    CREATE_TEST_MODE_INVOICE_MUTATION,
+)
+from lightspark.scripts.create_test_mode_payment import (
+    CREATE_TEST_MODE_PAYMENT_MUTATION,
+)
+from lightspark.scripts.create_uma_invitation import (
+    CREATE_UMA_INVITATION_MUTATION,
+    CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+)
+from lightspark.scripts.create_uma_invoice import CREATE_UMA_INVOICE_MUTATION
+from lightspark.scripts.current_account import CURRENT_ACCOUNT_QUERY
+from lightspark.scripts.decoded_payment_request import DECODED_PAYMENT_REQUEST_QUERY
+from lightspark.scripts.delete_api_token import DELETE_API_TOKEN_MUTATION
+from lightspark.scripts.fail_htlcs import FAIL_HTLCS_MUTATION
+from lightspark.scripts.fetch_uma_invitation import FETCH_UMA_INVITATION_QUERY
+from lightspark.scripts.fund_node import FUND_NODE_MUTATION
+from lightspark.scripts.incoming_payments_for_invoice import (
+    INCOMING_PAYMENTS_FOR_INVOICE_QUERY,
+)
+from lightspark.scripts.invoice_for_payment_hash import INVOICE_FOR_PAYMENT_HASH_QUERY
+from lightspark.scripts.lightning_fee_estimate_for_invoice import (
+    LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
+)
+from lightspark.scripts.lightning_fee_estimate_for_node import (
+    LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
+)
+from lightspark.scripts.outgoing_payment_for_idempotency_key import (
+    OUTGOING_PAYMENT_FOR_IDEMPOTENCY_KEY_QUERY,
+)
+from lightspark.scripts.outgoing_payments_for_invoice import (
+    OUTGOING_PAYMENTS_FOR_INVOICE_QUERY,
+)
+from lightspark.scripts.outgoing_payments_for_payment_hash import (
+    OUTGOING_PAYMENTS_FOR_PAYMENT_HASH_QUERY,
+)
+from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
+from lightspark.scripts.pay_uma_invoice import PAY_UMA_INVOICE_MUTATION
+from lightspark.scripts.recover_node_signing_key import RECOVER_NODE_SIGNING_KEY_QUERY
+from lightspark.scripts.register_payment import REGISTER_PAYMENT_MUTATION
+from lightspark.scripts.request_withdrawal import REQUEST_WITHDRAWAL_MUTATION
+from lightspark.scripts.screen_node import SCREEN_NODE_MUTATION
+from lightspark.scripts.send_payment import SEND_PAYMENT_MUTATION
+from lightspark.utils.enums import parse_enum
+from lightspark.utils.interning import InternPool
+from lightspark.utils.node_key_cache import (
+    DEFAULT_KDF_WORKERS,
+    EncryptedNodeKey,
+    NodeKeyCache,
+    decrypt_node_keys,
+)
+from lightspark.utils.signing_key import RSASigningKey, Secp256k1SigningKey, SigningKey
+from lightspark.utils.wallet_jwt import mint_wallet_jwt
+
+logger = logging.getLogger("lightspark")
+
+ENTITY = TypeVar("ENTITY", bound=Entity)
+
+
+@dataclass
+class LightsparkAsyncClient:
+    """Asynchronous counterpart of `LightsparkSyncClient`.
+
+    Every method that talks to the API is a coroutine, and the objects it returns
+    expose `*_async` variants of their connection methods (for example
+    `Account.get_transactions_async`). Requires the `aiohttp` extra.
+    """
+
+    _requester: AsyncRequester
+    _node_private_keys: Dict[str, SigningKey]
+    _node_key_cache: Optional[NodeKeyCache]
+
+    def __init__(
+        self,
+        api_token_client_id: str,
+        api_token_client_secret: str,
+        base_url: Optional[str] = None,
+        http_host: Optional[str] = None,
+        *,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        persisted_queries: bool = False,
+        compressor: Optional[RequestCompressor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        batch_window_secs: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_queries: bool = False,
+        signing_executor: Optional[SigningExecutor] = None,
+        node_key_cache: Optional[NodeKeyCache] = None,
+        call_listeners: Optional[Sequence[CallListener]] = None,
+        tracer: Optional[Tracer] = None,
+        connect_timeout_secs: Optional[float] = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: Optional[float] = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        self._requester = AsyncRequester(
+            api_token_client_id=api_token_client_id,
+            api_token_client_secret=api_token_client_secret,
+            base_url=base_url,
+            http_host=http_host,
+            connection_limit=connection_limit,
+            persisted_queries=persisted_queries,
+            compressor=compressor,
+            retry_policy=retry_policy,
+            batch_window_secs=batch_window_secs,
+            cache=cache,
+            coalesce_queries=coalesce_queries,
+            signing_executor=signing_executor,
+            call_listeners=call_listeners,
+            tracer=tracer,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            intern_pool=intern_pool,
+        )
+        self._node_private_keys = {}
+        self._node_key_cache = node_key_cache
+
+    def add_call_listener(self, listener: CallListener) -> None:
+        """Calls `listener` with the timings of each request sent to the API.
+        See `lightspark.requests.instrumentation`."""
+        self._requester.add_call_listener(listener)
+
+    def remove_call_listener(self, listener: CallListener) -> None:
+        self._requester.remove_call_listener(listener)
+
+    async def close(self) -> None:
+        """Closes the connection pool. The client can't be used afterwards."""
+        await self._requester.close()
+
+    async def __aenter__(self) -> "LightsparkAsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @records_construction
+    async def create_api_token(
+        self,
+        name: str,
+        transact: bool = True,
+        test_mode: bool = False,
+    ) -> Tuple[ApiToken, str]:
+        logger.info('Creating API token "%s".', name)
+        permissions = {
+            (False, False): (Permission.MAINNET_VIEW,),
+            (False, True): (Permission.MAINNET_VIEW, Permission.MAINNET_TRANSACT),
+            (True, False): (Permission.REGTEST_VIEW,),
+            (True, True): (Permission.REGTEST_VIEW, Permission.REGTEST_TRANSACT),
+        }[(test_mode, transact)]
+
+        json = await self._requester.execute_graphql_async(
+            CREATE_API_TOKEN_MUTATION,
+            {"name": name, "permissions": permissions},
+        )
+
+        return (
+            ApiToken_from_json(self._requester, json["create_api_token"]["api_token"]),
+            json["create_api_token"]["client_secret"],
+        )
+
+    @records_construction
+    async def create_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional[InvoiceType] = None,
+        expiry_secs: Optional[int] = None,
+    ) -> Invoice:
+        logger.info("Creating an invoice for node %s.", node_id)
+        variables = {
+            "amount_msats": amount_msats,
+            "node_id": node_id,
+            "memo": memo,
+            "invoice_type": invoice_type,
+        }
+        if expiry_secs is not None:
+            variables["expiry_secs"] = expiry_secs
+        json = await self._requester.execute_graphql_async(
+            CREATE_INVOICE_MUTATION, variables
+        )
+
+        return Invoice_from_json(self._requester, json["create_invoice"]["invoice"])
+
+    @records_construction
+    async def create_lnurl_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        expiry_secs: Optional[int] = None,
+    ) -> Invoice:
+        """Generates a Lightning Invoice (follows the Bolt 11 specification) to request a payment
+        from another Lightning Node. This should only be used for generating invoices for LNURLs,
+        with `create_invoice` preferred in the general case.
+
+        Args:
+            node_id (str): The ID of the node from which to create the invoice.
+            amount_sats (int): The amount for which the invoice should be created, in millisatoshis.
+            will be added.
+            metadata (str): The LNURL metadata payload field in the initial payreq response. This
+            will be hashed and present in the h-tag (SHA256 purpose of payment) of the resulting
+            Bolt 11 invoice.
+            expiry_secs (int, optional): The number of seconds after which the invoice will expire.
+            Defaults to 1 day.
+
+        Returns:
+            Invoice: An `Invoice` object representing the generated invoice.
+        """
+        logger.info("Creating an lnurl invoice for node %s.", node_id)
+        variables = {
+            "amount_msats": amount_msats,
+            "node_id": node_id,
+            "metadata_hash": sha256(metadata.encode("utf-8")).hexdigest(),
+        }
+        if expiry_secs is not None:
+            variables["expiry_secs"] = expiry_secs
+        json = await self._requester.execute_graphql_async(
+            CREATE_LNURL_INVOICE_MUTATION, variables
+        )
+
+        return Invoice_from_json(
+            self._requester, json["create_lnurl_invoice"]["invoice"]
+        )
+
+    @records_construction
+    async def cancel_invoice(
+        self,
+        invoice_id: str,
+    ) -> Invoice:
+        """Cancels an existing unpaid invoice and returns that invoice. Cancelled invoices cannot be paid.
+
+        Args:
+            invoice_id (str): The ID of the invoice to cancel.
+
+        Returns:
+            Invoice: An `Invoice` object representing the cancelled invoice.
+        """
+        logger.info("Canceling an invoice with id %s.", invoice_id)
+        json = await self._requester.execute_graphql_async(
+            CANCEL_INVOICE_MUTATION,
+            {"invoice_id": invoice_id},
+        )
+
+        return Invoice_from_json(self._requester, json["cancel_invoice"]["invoice"])
+
+    async def create_node_wallet_address(
+        self,
+        node_id: str,
+    ) -> str:
+        logger.info("Creating a wallet address for node %s.", node_id)
+        json = await self._requester.execute_graphql_async(
+            CREATE_NODE_ADDRESS_MUTATION,
+            {"node_id": node_id},
+        )
+        return json["create_node_wallet_address"]["wallet_address"]
+
+    async def create_test_mode_invoice(
+        self,
+        local_node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional[InvoiceType] = None,
+    ) -> str:
+        logger.info("Creating a test invoice for node %s.", local_node_id)
+        json = await self._requester.execute_graphql_async(
+            CREATE_TEST_MODE_INVOICE_MUTATION,
+            {
+                "amount_msats": amount_msats,
+                "local_node_id": local_node_id,
+                "memo": memo,
+                "invoice_type": invoice_type,
+            },
+        )
+
+        return json["create_test_mode_invoice"]["encoded_payment_request"]
+
+    @records_construction
+    async def create_test_mode_payment(
+        self,
+        local_node_id: str,
+        encoded_invoice: str,
+        amount_msats: Optional[int] = None,
+    ) -> IncomingPayment:
+        variables: Dict[str, Any] = {
+            "local_node_id": local_node_id,
+            "encoded_invoice": encoded_invoice,
+        }
+        if amount_msats is not None:
+            variables["amount_msats"] = amount_msats
+
+        json = await self._requester.execute_graphql_async(
+            CREATE_TEST_MODE_PAYMENT_MUTATION,
+            variables,
+        )
+        return IncomingPayment_from_json(
+            self._requester, json["create_test_mode_payment"]["incoming_payment"]
+        )
+
+    @records_construction
+    async def create_uma_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        *,
+        expiry_secs: Optional[int] = None,
+        signing_private_key: Optional[bytes] = None,
+        receiver_identifier: Optional[str] = None,
+    ) -> Invoice:
+        """Creates a new invoice for the UMA protocol. The metadata is hashed and included in the invoice. This API
+        generates a Lightning Invoice (follows the Bolt 11 specification) to request a payment from another Lightning Node.
+        This should only be used for generating invoices for UMA, with `create_invoice` preferred in the general case.
+
+        Args:
+            node_id: The node ID for which to create an invoice.
+            amount_msats: The amount of the invoice in msats. You can create a zero-amount invoice to accept any payment amount.
+            metadata: The LNURL metadata payload field in the initial payreq response. This wil be hashed and present in the
+            h-tag (SHA256 purpose of payment) of the resulting Bolt 11 invoice. See
+            [this spec](https://github.com/lnurl/luds/blob/luds/06.md#pay-to-static-qrnfclink) for details.
+            expiry_secs: The number of seconds until the invoice expires. Defaults to 600.
+            signing_private_key: The receiver's signing private key. Used to hash the receiver identifier.
+            receiver_identifier: Optional identifier of the receiver. If provided, this will be hashed using a monthly-rotated
+            seed and used for anonymized analysis.
+        """
+        receiver_hash = None
+        if receiver_identifier is not None:
+            if signing_private_key is None:
+                raise LightsparkException(
+                    "CreateUmaInvoiceError",
+                    "Receiver identifier provided without signing private key",
+                )
+            receiver_hash = self.hash_uma_identifier(
+                receiver_identifier, signing_private_key
+            )
+
+        variables = {
+            "amount_msats": amount_msats,
+            "node_id": node_id,
+            "metadata_hash": sha256(metadata.encode("utf-8")).hexdigest(),
+            "expiry_secs": expiry_secs if expiry_secs is not None else 600,
+        }
+        if receiver_hash is not None:
+            variables["receiver_hash"] = receiver_hash
+        logger.info("Creating an uma invoice for node %s.", node_id)
+        json = await self._requester.execute_graphql_async(
+            CREATE_UMA_INVOICE_MUTATION,
+            variables,
+        )
+
+        return Invoice_from_json(self._requester, json["create_uma_invoice"]["invoice"])
+
+    async def delete_api_token(self, api_token_id: str) -> None:
+        logger.info("Deleting API token %s.", api_token_id)
+        await self._requester.execute_graphql_async(
+            DELETE_API_TOKEN_MUTATION,
+            {"api_token_id": api_token_id},
+        )
+
+    async def execute_graphql_request(
+        self, document: str, variables: Optional[Mapping[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        """This function can be used to execute a custom GraphQL request against
+        the Lightspark public API. It will take care of the authentication automatically.
+
+        To find the Lightspark API documentation, see https://docs.lightspark.com/api/graphql/2023-01-01
+        To learn more about GraphQL, see https://graphql.org/learn/
+
+        Args:
+            document:
+                This is the GraphQL document (query or mutation) that will be
+                executed against the API.
+            variables (optional):
+                A dictionary representing a JSON object containing the variables
+                needed to execute the query or mutation in the document. This is
+                optional if your document does not use any variable.
+
+        Returns:
+            A dictionary representing the JSON response received from the API.
+            This JSON object can then be used to instantiate some of the python
+            objects defined in the lightspark.objects.* modules, using the `from_json`
+            function defined in each module.
+        """
+        logger.info("Executing arbitrary GraphQL request with document=%s", document)
+        return await self._requester.execute_graphql_async(
+            query=document, variables=variables
+        )
+
+    def generate_jwt_key(self) -> Tuple[str, str]:
+        key = Ed448PrivateKey.generate()
+        return (
+            key.public_key()
+            .public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+            .decode(),
+            key.private_bytes(
+                Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+            ).decode(),
+        )
+
+    def generate_wallet_jwt(
+        self,
+        private_key_pem: str,
+        third_party_id: str,
+        test_mode: bool = False,
+        duration: timedelta = timedelta(minutes=1),
+        algorithm: str = "EdDSA",
+    ) -> str:
+        """Mints a JWT authenticating a third-party wallet. The private key is
+        parsed once and reused across calls. To reuse tokens across requests and
+        mint them for many wallets at once, see `WalletJwtMinter`.
+        """
+        return mint_wallet_jwt(
+            private_key_pem,
+            third_party_id,
+            test_mode=test_mode,
+            duration=duration,
+            algorithm=algorithm,
+        )
+
+    @records_construction
+    async def get_current_account(
+        self,
+    ) -> Account:
+        logger.info("Fetching current account.")
+        json = await self._requester.execute_graphql_async(
+            CURRENT_ACCOUNT_QUERY,
+            {},
+        )
+        return Account_from_json(self._requester, json["current_account"])
+
+    @records_construction
+    async def get_decoded_payment_request(
+        self, encoded_payment_request: str
+    ) -> InvoiceData:
+        logger.info(
+            "Decoding payment request starting with %s...",
+            encoded_payment_request[0:10],
+        )
+        json = await self._requester.execute_graphql_async(
+            DECODED_PAYMENT_REQUEST_QUERY,
+            {"encoded_payment_request": encoded_payment_request},
+        )
+        data = json["decoded_payment_request"]
+        typename = data["__typename"]
+        if typename != "InvoiceData":
+            raise LightsparkException(
+                "UNKNOWN_TYPE", f"Unsupported type of payment request: {typename}"
+            )
+        return InvoiceData_from_json(self._requester, data)
+
+    async def get_entity(
+        self, entity_id: str, entity_class: Type[ENTITY]
+    ) -> Optional[ENTITY]:
+        logger.info(
+            "Fetching entity of type %s with id %s", str(entity_class), entity_id
+        )
+        return await get_entity_async(
+            requester=self._requester, entity_id=entity_id, entity_class=entity_class
+        )
+
+    async def get_entities(
+        self,
+        entity_ids: Sequence[str],
+        entity_class: Type[ENTITY],
+        chunk_size: int = DEFAULT_ENTITIES_CHUNK_SIZE,
+        parallelism: int = DEFAULT_ENTITIES_PARALLELISM,
+    ) -> List[Optional[ENTITY]]:
+        """Fetches many entities of the same type in as few requests as possible,
+        e.g. to reconcile the `entity_id`s of a batch of webhooks.
+
+        Args:
+            entity_ids: The ids to fetch. Duplicates are only fetched once.
+            entity_class: The type of the entities.
+            chunk_size: How many entities are fetched by a single request.
+            parallelism: How many requests may be in flight at once.
+
+        Returns:
+            The entities in the order of `entity_ids`, None for ids not found.
+        """
+        logger.info(
+            "Fetching %d entities of type %s", len(entity_ids), str(entity_class)
+        )
+        return await get_entities_async(
+            requester=self._requester,
+            entity_ids=entity_ids,
+            entity_class=entity_class,
+            chunk_size=chunk_size,
+            parallelism=parallelism,
+        )
+
+    @records_construction
+    async def get_bitcoin_fee_estimate(
+        self, bitcoin_network: BitcoinNetwork
+    ) -> FeeEstimate:
+        logger.info("Querying the fee estimate for network %s.", bitcoin_network)
+        json = await self._requester.execute_graphql_async(
+            BITCOIN_FEE_ESTIMATE_QUERY,
+            {"bitcoin_network": bitcoin_network},
+        )
+        return FeeEstimate_from_json(self._requester, json["bitcoin_fee_estimate"])
+
+    @records_construction
+    async def get_lightning_fee_estimate_for_invoice(
+        self,
+        node_id: str,
+        encoded_payment_request: str,
+        amount_msats: Optional[int] = None,
+    ) -> CurrencyAmount:
+        variables: Dict[str, Any] = {
+            "node_id": node_id,
+            "encoded_payment_request": encoded_payment_request,
+        }
+        if amount_msats is not None:
+            variables["amount_msats"] = amount_msats
+        json = await self._requester.execute_graphql_async(
+            LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
+            variables,
+        )
+        return LightningFeeEstimateOutput_from_json(
+            self._requester, json["lightning_fee_estimate_for_invoice"]
+        ).fee_estimate
+
+    @records_construction
+    async def get_lightning_fee_estimate_for_node(
+        self,
+        node_id: str,
+        destination_node_public_key: str,
+        amount_msats: int,
+    ) -> CurrencyAmount:
+        json = await self._requester.execute_graphql_async(
+            LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
+            {
+                "node_id": node_id,
+                "destination_node_public_key": destination_node_public_key,
+                "amount_msats": amount_msats,
+            },
+        )
+        return LightningFeeEstimateOutput_from_json(
+            self._requester, json["lightning_fee_estimate_for_node"]
+        ).fee_estimate
+
+    def load_node_signing_key(self, node_id: str, signing_key: SigningKey) -> None:
+        logger.info("Loading the signing key for node %s", node_id)
+        self._node_private_keys[node_id] = signing_key
+
+    async def _fetch_encrypted_signing_key(self, node_id: str) -> Mapping[str, str]:
+        json = await self._requester.execute_graphql_async(
+            RECOVER_NODE_SIGNING_KEY_QUERY,
+            {"node_id": node_id},
+        )
+        return json["entity"]["encrypted_signing_private_key"]
+
+    async def recover_node_signing_key(
+        self, node_id: str, node_password: str
+    ) -> SigningKey:
+        logger.info("Recovering the signing key for node %s", node_id)
+        encrypted_key = await self._fetch_encrypted_signing_key(node_id)
+        (private_key,) = await asyncio.get_running_loop().run_in_executor(
+            None,
+            decrypt_node_keys,
+            [
+                EncryptedNodeKey(
+                    node_id,
+                    encrypted_key["cipher"],
+                    encrypted_key["encrypted_value"],
+                    node_password,
+                )
+            ],
+            self._node_key_cache,
+        )
+
+        signing_key = RSASigningKey(private_key)
+
+        self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
+        return signing_key
+
+    async def recover_node_signing_keys(
+        self,
+        node_ids: Sequence[str],
+        node_passwords: Sequence[str],
+        max_workers: int = DEFAULT_KDF_WORKERS,
+    ) -> Dict[str, SigningKey]:
+        """Recovers and loads the signing keys of many nodes at once.
+
+        The encrypted keys are fetched concurrently and decrypted in a process
+        pool. Keys found in the client's `node_key_cache` skip the decryption.
+
+        Args:
+            node_ids: The ids of the nodes.
+            node_passwords: The password of each node, in the same order.
+            max_workers: The maximum number of concurrent fetches and of
+                decryption processes.
+
+        Returns:
+            The signing keys, by node id.
+        """
+        if len(node_ids) != len(node_passwords):
+            raise ValueError("Expected one password per node id")
+        if not node_ids:
+            return {}
+        logger.info("Recovering the signing keys of %d nodes", len(node_ids))
+        encrypted_keys = await asyncio.gather(
+            *(self._fetch_encrypted_signing_key(node_id) for node_id in node_ids)
+        )
+        private_keys = await asyncio.get_running_loop().run_in_executor(
+            None,
+            decrypt_node_keys,
+            [
+                EncryptedNodeKey(
+                    node_id, key["cipher"], key["encrypted_value"], password
+                )
+                for node_id, key, password in zip(
+                    node_ids, encrypted_keys, node_passwords
+                )
+            ],
+            self._node_key_cache,
+            max_workers,
+        )
+
+        signing_keys: Dict[str, SigningKey] = {}
+        for node_id, private_key in zip(node_ids, private_keys):
+            signing_keys[node_id] = RSASigningKey(private_key)
+            self.load_node_signing_key(
+                node_id=node_id, signing_key=signing_keys[node_id]
+            )
+        return signing_keys
+
+    def provide_node_master_seed(
+        self, node_id: str, master_seed: bytes, bitcoin_network: BitcoinNetwork
+    ) -> None:
+        signing_key = Secp256k1SigningKey(master_seed, bitcoin_network)
+        self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
+
+    @records_construction
+    async def pay_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        *,
+        amount_msats: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> OutgoingPayment:
+        variables = {
+            "node_id": node_id,
+            "encoded_invoice": encoded_invoice,
+            "timeout_secs": timeout_secs,
+            "maximum_fees_msats": maximum_fees_msats,
+        }
+        if amount_msats is not None:
+            variables["amount_msats"] = amount_msats
+        if idempotency_key is not None:
+            variables["idempotency_key"] = idempotency_key
+        with payment_read_timeout(timeout_secs):
+            json = await self._requester.execute_graphql_async(
+                PAY_INVOICE_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
+        return OutgoingPayment_from_json(
+            self._requester, json["pay_invoice"]["payment"]
+        )
+
+    @records_construction
+    async def pay_uma_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        *,
+        amount_msats: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+        signing_private_key: Optional[bytes] = None,
+        sender_identifier: Optional[str] = None,
+    ) -> OutgoingPayment:
+        """Sends an UMA payment to a node on the Lightning Network, based on the invoice (as defined by the BOLT11
+        specification) that you provide. This should only be used for paying UMA invoices, with `pay_invoice` preferred
+        in the general case.
+
+        Args:
+            node_id: The ID of the node that will pay the invoice.
+            encoded_invoice: The encoded invoice to pay.
+            timeout_secs: A timeout for the payment in seconds.
+            maximum_fees_msats: Maximum fees (in msats) to pay for the payment.
+            amount_msats: The amount to pay in msats for a zero-amount invoice. Defaults to the full amount of the
+            invoice. Note, this parameter can only be passed for a zero-amount invoice. Otherwise, the call will fail.
+            idempotency_key: An optional key to ensure idempotency of the payment.
+            signing_private_key: The sender's signing private key. Used to hash the sender identifier.
+            sender_identifier: Optional identifier of the sender. If provided, this will be hashed using a monthly-rotated
+            seed and used for anonymized analysis.
+        """
+        sender_hash = None
+        if sender_identifier is not None:
+            if signing_private_key is None:
+                raise LightsparkException(
+                    "PayUmaInvoiceError",
+                    "Sender identifier provided without signing private key",
+                )
+            sender_hash = self.hash_uma_identifier(
+                sender_identifier, signing_private_key
+            )
+
+        variables = {
+            "node_id": node_id,
+            "encoded_invoice": encoded_invoice,
+            "timeout_secs": timeout_secs,
+            "maximum_fees_msats": maximum_fees_msats,
+        }
+        if amount_msats is not None:
+            variables["amount_msats"] = amount_msats
+        if idempotency_key is not None:
+            variables["idempotency_key"] = idempotency_key
+        if sender_hash is not None:
+            variables["sender_hash"] = sender_hash
+        with payment_read_timeout(timeout_secs):
+            json = await self._requester.execute_graphql_async(
+                PAY_UMA_INVOICE_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
+        return OutgoingPayment_from_json(
+            self._requester, json["pay_uma_invoice"]["payment"]
+        )
+
+    @records_construction
+    async def send_payment(
+        self,
+        node_id: str,
+        destination_public_key: str,
+        amount_msats: int,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        *,
+        idempotency_key: Optional[str] = None,
+    ) -> OutgoingPayment:
+        variables = {
+            "node_id": node_id,
+            "destination_public_key": destination_public_key,
+            "amount_msats": amount_msats,
+            "timeout_secs": timeout_secs,
+            "maximum_fees_msats": maximum_fees_msats,
+        }
+        if idempotency_key is not None:
+            variables["idempotency_key"] = idempotency_key
+        with payment_read_timeout(timeout_secs):
+            json = await self._requester.execute_graphql_async(
+                SEND_PAYMENT_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
+        return OutgoingPayment_from_json(
+            self._requester, json["send_payment"]["payment"]
+        )
+
+    async def screen_node(
+        self, provider: ComplianceProvider, node_pubkey: str
+    ) -> RiskRating:
+        """
+        Screens a lightning node using its public key. In order to call this API,
+        you need to have the API key stored in your account setting page for the selected compliance provider.
+        """
+        json = await self._requester.execute_graphql_async(
+            SCREEN_NODE_MUTATION,
+            {"provider": provider, "node_pubkey": node_pubkey},
+        )
+        return parse_enum(RiskRating, json["screen_node"]["rating"])
+
+    def get_signing_key(self, node_id: str) -> SigningKey:
+        if node_id not in self._node_private_keys:
+            raise LightsparkException(
+                "SIGNING_ERROR",
+                f"We did not find the signing key for node {node_id}. Please call"
+                + " the `recover_node_signing_key` or `load_node_signing_key` methods.",
+            )
+        return self._node_private_keys[node_id]
+
+    @records_construction
+    async def fund_node(
+        self,
+        node_id: str,
+        amount_sats: int,
+    ) -> CurrencyAmount:
+        """Adds funds to a Lightspark node on the REGTEST network. If the amount is not specified, 10,000,000 SATOSHI
+        will be added. This API only functions for nodes created on the REGTEST network and will return an error when
+        called for any non-REGTEST node.
+
+        Args:
+            node_id (str): The ID of the node to fund. Must be a REGTEST node.
+            amount_sats (int): The amount of funds to add to the node in SATOSHI. If not specified, 10,000,000 SATOSHI
+            will be added.
+
+        Returns:
+            CurrencyAmount: The amount of funds added to the node.
+        """
+        json = await self._requester.execute_graphql_async(
+            FUND_NODE_MUTATION,
+            {
+                "node_id": node_id,
+                "amount_sats": amount_sats,
+            },
+        )
+        return CurrencyAmount_from_json(self._requester, json["fund_node"]["amount"])
+
+    @records_construction
+    async def request_withdrawal(
+        self,
+        node_id: str,
+        amount_sats: int,
+        bitcoin_address: str,
+        withdrawal_mode: WithdrawalMode,
+        idempotency_key: Optional[str] = None,
+    ) -> WithdrawalRequest:
+        """Withdraws funds from the account and sends it to the requested bitcoin address.
+
+        Depending on the chosen mode, it will first take the funds from the wallet, and if applicable, close channels appropriately to recover enough funds and reopen channels with the remaining funds.
+        The process is asynchronous and may take up to a few minutes. You can check the progress by polling the `WithdrawalRequest` that is created, or by subscribing to a webhook.
+        """
+        variables = {
+            "node_id": node_id,
+            "amount_sats": amount_sats,
+            "bitcoin_address": bitcoin_address,
+            "withdrawal_mode": withdrawal_mode,
+        }
+        if idempotency_key is not None:
+            variables["idempotency_key"] = idempotency_key
+        json = await self._requester.execute_graphql_async(
+            REQUEST_WITHDRAWAL_MUTATION,
+            variables,
+            self.get_signing_key(node_id),
+        )
+        return WithdrawalRequest_from_json(
+            self._requester, json["request_withdrawal"]["request"]
+        )
+
+    @records_construction
+    async def register_payment(
+        self,
+        provider: ComplianceProvider,
+        payment_id: str,
+        node_pubkey: str,
+        direction: PaymentDirection,
+    ) -> LightningTransaction:
+        """
+        Register a successful lightning payment with a selected compliance provider.
+        In order to call this API, you need to have the API key stored in your account
+        setting page for the selected compliance provider.
+
+        Args:
+            provider: The external compliance provider you have account with. You need to store the API key in your account seeting.
+            payment_id: The ID of a lightning payment, which can be either an OutgoingPayment or an IncomingPayment.
+            node_pubkey: The public key of the counterparty lightning node, which is the recipient node for an OutgoingPayment or the sender node for an IncomingPayment.
+            direction: Indicates whether this payment is an OutgoingPayment or an IncomingPayment
+        """
+        json = await self._requester.execute_graphql_async(
+            REGISTER_PAYMENT_MUTATION,
+            {
+                "provider": provider,
+                "node_pubkey": node_pubkey,
+                "payment_id": payment_id,
+                "direction": direction,
+            },
+        )
+        return LightningTransaction_from_json(
+            self._requester, json["register_payment"]["payment"]
+        )
+
+    @records_construction
+    async def outgoing_payments_for_invoice(
+        self,
+        encoded_invoice: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List[OutgoingPayment]:
+        """
+        Fetches the outgoing payments (if any) which have been made for a given invoice.
+
+        Args:
+            encoded_invoice: The encoded invoice for which to fetch the outgoing payments.
+            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
+        """
+
+        variables: Dict[str, Any] = {"encoded_invoice": encoded_invoice}
+        if transaction_statuses is not None:
+            variables["transaction_statuses"] = transaction_statuses
+        json = await self._requester.execute_graphql_async(
+            OUTGOING_PAYMENTS_FOR_INVOICE_QUERY, variables
+        )
+        if "outgoing_payments_for_invoice" not in json:
+            return []
+        if "payments" not in json["outgoing_payments_for_invoice"]:
+            return []
+        return [
+            OutgoingPayment_from_json(self._requester, payment)
+            for payment in json["outgoing_payments_for_invoice"]["payments"]
+        ]
+
+    @records_construction
+    async def outgoing_payments_for_payment_hash(
+        self,
+        payment_hash: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List[OutgoingPayment]:
+        """
+        Fetches the outgoing payments (if any) which have been made for a given payment hash.
+
+        Args:
+            payment_hash: The payment hash for which to fetch the outgoing payments.
+            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
+        """
+
+        variables: Dict[str, Any] = {"payment_hash": payment_hash}
+        if transaction_statuses is not None:
+            variables["transaction_statuses"] = transaction_statuses
+        json = await self._requester.execute_graphql_async(
+            OUTGOING_PAYMENTS_FOR_PAYMENT_HASH_QUERY, variables
+        )
+        if "outgoing_payments_for_payment_hash" not in json:
+            return []
+        if "payments" not in json["outgoing_payments_for_payment_hash"]:
+            return []
+        return [
+            OutgoingPayment_from_json(self._requester, payment)
+            for payment in json["outgoing_payments_for_payment_hash"]["payments"]
+        ]
+
+    @records_construction
+    async def outgoing_payment_for_idempotency_key(
+        self,
+        idempotency_key: str,
+    ) -> Optional[OutgoingPayment]:
+        """
+        Fetches the outgoing payment (if any) which have been made for a given idempotency key.
+        """
+
+        json = await self._requester.execute_graphql_async(
+            OUTGOING_PAYMENT_FOR_IDEMPOTENCY_KEY_QUERY,
+            {"idempotency_key": idempotency_key},
+        )
+        if "outgoing_payment_for_idempotency_key" not in json:
+            return None
+        if "payment" not in json["outgoing_payment_for_idempotency_key"]:
+            return None
+        return OutgoingPayment_from_json(
+            self._requester, json["outgoing_payment_for_idempotency_key"]["payment"]
+        )
+
+    @records_construction
+    async def incoming_payments_for_invoice(
+        self,
+        invoice_id: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List[IncomingPayment]:
+        """
+        Fetches the incoming payments (if any) which have been made for a given invoice.
+
+        Args:
+            invoice_id: The encoded invoice for which to fetch the incoming payments.
+            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
+        """
+
+        variables: Dict[str, Any] = {"invoice_id": invoice_id}
+        if transaction_statuses is not None:
+            variables["transaction_statuses"] = transaction_statuses
+        json = await self._requester.execute_graphql_async(
+            INCOMING_PAYMENTS_FOR_INVOICE_QUERY, variables
+        )
+        if "incoming_payments_for_invoice" not in json:
+            return []
+        output = IncomingPaymentsForInvoiceQueryOutput_from_json(
+            self._requester, json["incoming_payments_for_invoice"]
+        )
+        return output.payments
+
+    @records_construction
+    async def invoice_for_payment_hash(
+        self,
+        payment_hash: str,
+    ) -> Optional[Invoice]:
+        """
+        Fetches the invoice (if any) which have been created with a given payment hash.
+        """
+
+        json = await self._requester.execute_graphql_async(
+            INVOICE_FOR_PAYMENT_HASH_QUERY,
+            {"payment_hash": payment_hash},
+        )
+        if "invoice_for_payment_hash" not in json:
+            return None
+        if "invoice" not in json["invoice_for_payment_hash"]:
+            return None
+        return Invoice_from_json(
+            self._requester, json["invoice_for_payment_hash"]["invoice"]
+        )
+
+    @records_construction
+    async def create_uma_invitation(
+        self,
+        inviter_uma: str,
+    ) -> UmaInvitation:
+        """
+        Creates a new UMA invitation. If you are part of the incentive program, you should use the
+        `create_uma_invitation_with_incentives` method instead.
+
+        Args:
+            inviter_uma: The UMA of the inviter.
+        """
+        json = await self._requester.execute_graphql_async(
+            CREATE_UMA_INVITATION_MUTATION,
+            {
+                "inviter_uma": inviter_uma,
+            },
+        )
+        return UmaInvitation_from_json(
+            self._requester, json["create_uma_invitation"]["invitation"]
+        )
+
+    @records_construction
+    async def create_uma_invitation_with_incentives(
+        self,
+        inviter_uma: str,
+        inviter_phone_number_e164: str,
+        inviter_region: RegionCode,
+    ) -> UmaInvitation:
+        """
+        Creates a new UMA invitation with incentives. If you are not part of the incentive program, you should use the
+        `create_uma_invitation` method instead.
+
+        Args:
+            inviter_uma: The UMA of the inviter.
+            inviter_phone_number_e164: The E.164 formatted phone number of the inviter.
+            inviter_region: The region of the inviter.
+        """
+        json = await self._requester.execute_graphql_async(
+            CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+            {
+                "inviter_uma": inviter_uma,
+                "inviter_phone_hash": self._hash_phone_number(
+                    inviter_phone_number_e164
+                ),
+                "inviter_region": inviter_region.name,
+            },
+        )
+        return UmaInvitation_from_json(
+            self._requester, json["create_uma_invitation_with_incentives"]["invitation"]
+        )
+
+    async def claim_uma_invitation(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+    ) -> None:
+        """
+        Claims a UMA invitation. If you are part of the incentive program, you should use the
+        `claim_uma_invitation_with_incentives` method instead.
+
+        Args:
+            invitation_code: The invitation code of the invitation to claim.
+            invitee_uma: The new UMA of the invitee.
+        """
+        await self._requester.execute_graphql_async(
+            CLAIM_UMA_INVITATION_MUTATION,
+            {
+                "invitation_code": invitation_code,
+                "invitee_uma": invitee_uma,
+            },
+        )
+
+    async def claim_uma_invitation_with_incentives(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+        invitee_phone_number_e164: str,
+        invitee_region: RegionCode,
+    ) -> None:
+        """
+        Claims a UMA invitation with incentives. If you are not part of the incentive program, you should use the
+        `claim_uma_invitation` method instead.
+
+        Args:
+            invitation_code: The invitation code of the invitation to claim.
+            invitee_uma: The new UMA of the invitee.
+            invitee_phone_number_e164: The E.164 formatted phone number of the invitee.
+            invitee_region: The region of the invitee.
+        """
+        await self._requester.execute_graphql_async(
+            CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+            {
+                "invitation_code": invitation_code,
+                "invitee_uma": invitee_uma,
+                "invitee_phone_hash": self._hash_phone_number(
+                    invitee_phone_number_e164
+                ),
+                "invitee_region": invitee_region,
+            },
+        )
+
+    @records_construction
+    async def fetch_uma_invitation(
+        self,
+        invitation_code: str,
+    ) -> Optional[UmaInvitation]:
+        """
+        Fetches a UMA invitation by its invitation code.
+
+        Args:
+            invitation_code: The invitation code of the invitation to fetch.
+        """
+        json = await self._requester.execute_graphql_async(
+            FETCH_UMA_INVITATION_QUERY,
+            {
+                "invitation_code": invitation_code,
+            },
+        )
+
+        return (
+            UmaInvitation_from_json(self._requester, json["uma_invitation_by_code"])
+            if json["uma_invitation_by_code"]
+            else None
+        )
+
+    def _hash_phone_number(self, phone_number_e164_format: str) -> str:
+        return self.hash_phone_numbers([phone_number_e164_format])[0]
+
+    def hash_phone_numbers(self, phone_numbers_e164_format: Iterable[str]) -> List[str]:
+        """Hashes phone numbers as sent with UMA invitations, e.g. to precompute
+        the hashes of a whole user directory.
+
+        Args:
+            phone_numbers_e164_format: The phone numbers, in E.164 format.
+
+        Returns:
+            The hashes, in the order of `phone_numbers_e164_format`.
+        """
+        search = E614_REGEX.search
+        hashes = []
+        for phone_number in phone_numbers_e164_format:
+            if not search(phone_number):
+                raise LightsparkException(
+                    "InvalidPhoneNumber",
+                    "The phone number must follow the E.164 format.",
+                )
+            hashes.append(sha256(phone_number.encode()).hexdigest())
+        return hashes
+
+    def hash_uma_identifier(self, identifier: str, signing_private_key: bytes) -> str:
+        return self.hash_uma_identifiers([identifier], signing_private_key)[0]
+
+    def hash_uma_identifiers(
+        self, identifiers: Iterable[str], signing_private_key: bytes
+    ) -> List[str]:
+        """Hashes UMA identifiers with this month's seed, e.g. to precompute the
+        `receiver_hash` of a whole user directory.
+
+        Args:
+            identifiers: The UMA identifiers to hash.
+            signing_private_key: The signing private key seeding the hashes.
+
+        Returns:
+            The hashes, in the order of `identifiers`.
+        """
+        now = datetime.now(timezone.utc)
+        # The monthly seed is appended to every identifier: encode it once.
+        seed = f"{now.month}-{now.year}{signing_private_key.hex()}".encode()
+        return [
+            sha256(identifier.encode() + seed).hexdigest() for identifier in identifiers
+        ]
+
+    async def fail_htlcs(self, invoice_id: str, cancel_invoice: bool = True) -> str:
+        """
+        Fails all pending HTLCs associated with an invoice.
+
+        Args:
+            invoice_id: The ID of the invoice to fail.
+            cancel_invoice: Whether to cancel the invoice after failing the HTLCs.
+        """
+        json = await self._requester.execute_graphql_async(
+            FAIL_HTLCS_MUTATION,
+            {"invoice_id": invoice_id, "cancel_invoice": cancel_invoice},
+        )
+
+        return json["fail_htlcs"]["invoice"]["id"]
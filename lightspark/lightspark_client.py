@@ -2,12 +2,23 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-import jwt
 from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey
 from cryptography.hazmat.primitives.serialization import (
     Encoding,
@@ -18,7 +29,12 @@ from cryptography.hazmat.primitives.serialization import (
 from lightspark.exceptions import LightsparkException
 from lightspark.objects.Account import Account
 from lightspark.objects.Account import from_json as Account_from_json
-from lightspark.objects.all_entities import get_entity
+from lightspark.objects.all_entities import (
+    DEFAULT_ENTITIES_CHUNK_SIZE,
+    DEFAULT_ENTITIES_PARALLELISM,
+    get_entities,
+    get_entity,
+)
 from lightspark.objects.ApiToken import ApiToken
 from lightspark.objects.ApiToken import from_json as ApiToken_from_json
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
@@ -59,7 +75,19 @@ from lightspark.objects.WithdrawalRequest import WithdrawalRequest
 from lightspark.objects.WithdrawalRequest import (
     from_json as WithdrawalRequest_from_json,
 )
-from lightspark.requests.requester import Requester
+from lightspark.requests.cache import ResponseCache
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.deadline import (
+    DEFAULT_CONNECT_TIMEOUT_SECS,
+    DEFAULT_READ_TIMEOUT_SECS,
+    payment_read_timeout,
+    with_current_deadline,
+)
+from lightspark.requests.instrumentation import CallListener, records_construction
+from lightspark.requests.requester import DEFAULT_POOL_MAXSIZE, Requester
+from lightspark.requests.rate_limit import AdaptiveConcurrencyLimiter, RateLimiter
+from lightspark.requests.retry import RetryPolicy
+from lightspark.requests.tracing import Tracer
 from lightspark.scripts.bitcoin_fee_estimate import BITCOIN_FEE_ESTIMATE_QUERY
 from lightspark.scripts.cancel_invoice import CANCEL_INVOICE_MUTATION
 from lightspark.scripts.claim_uma_invitation import (
@@ -113,9 +141,16 @@ from lightspark.scripts.register_payment import REGISTER_PAYMENT_MUTATION
 from lightspark.scripts.request_withdrawal import REQUEST_WITHDRAWAL_MUTATION
 from lightspark.scripts.screen_node import SCREEN_NODE_MUTATION
 from lightspark.scripts.send_payment import SEND_PAYMENT_MUTATION
-from lightspark.utils.crypto import decrypt_private_key
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.interning import InternPool
+from lightspark.utils.node_key_cache import (
+    DEFAULT_KDF_WORKERS,
+    EncryptedNodeKey,
+    NodeKeyCache,
+    decrypt_node_keys,
+)
 from lightspark.utils.signing_key import RSASigningKey, Secp256k1SigningKey, SigningKey
+from lightspark.utils.wallet_jwt import mint_wallet_jwt
 
 logger = logging.getLogger("lightspark")
 
@@ -126,6 +161,7 @@ ENTITY = TypeVar("ENTITY", bound=Entity)
 class LightsparkSyncClient:
     _requester: Requester
     _node_private_keys: Dict[str, SigningKey]
+    _node_key_cache: Optional[NodeKeyCache]
 
     def __init__(
         self,
@@ -133,15 +169,114 @@ class LightsparkSyncClient:
         api_token_client_secret: str,
         base_url: Optional[str] = None,
         http_host: Optional[str] = None,
+        *,
+        persisted_queries: bool = False,
+        compressor: Optional[RequestCompressor] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive_idle_secs: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        batch_window_secs: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_queries: bool = False,
+        node_key_cache: Optional[NodeKeyCache] = None,
+        call_listeners: Optional[Sequence[CallListener]] = None,
+        tracer: Optional[Tracer] = None,
+        connect_timeout_secs: Optional[float] = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: Optional[float] = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        intern_pool: Optional[InternPool] = None,
     ) -> None:
+        """
+        Args:
+            api_token_client_id: The client id of the API token.
+            api_token_client_secret: The client secret of the API token.
+            base_url: Overrides the URL of the Lightspark GraphQL API.
+            http_host: Overrides the `Host` header and the TLS server name.
+            persisted_queries: Sends the id of known GraphQL documents instead of
+                their text. See `lightspark.requests.persisted_queries`.
+            compressor: Configures request body compression.
+            pool_maxsize: The maximum number of connections kept open to the API.
+                Raise it when sharing one client across more threads.
+            pool_block: Whether threads wait for a free connection when the pool
+                is exhausted instead of opening throwaway connections.
+            tcp_keepalive_idle_secs: Enables TCP keep-alive probes on pooled
+                connections after this many idle seconds.
+            retry_policy: Retries transient failures of queries and of mutations
+                sent with an `idempotency_key`. By default nothing is retried.
+            batch_window_secs: Merges the unsigned queries issued by different
+                threads within this many seconds into a single request. See
+                `lightspark.requests.batching`. Disabled by default.
+            cache: Caches the responses of read-only queries. Pass the same
+                cache's `invalidate_webhook` the webhooks you receive to evict
+                the entities they report as changed.
+            coalesce_queries: Makes concurrent identical queries share a single
+                request and its result.
+            node_key_cache: Keeps recovered node signing keys in an encrypted
+                on-disk cache, so restarts don't pay the key derivation again.
+            call_listeners: Called with the phase timings, sizes and status of
+                each request sent to the API, e.g. a `HistogramAggregator`.
+            tracer: Traces each GraphQL operation, and propagates the trace to
+                the API. See `lightspark.requests.tracing`.
+            connect_timeout_secs: How long to wait for a connection to the API.
+                None waits forever.
+            read_timeout_secs: How long to wait for each read of a response.
+                None waits forever. Payments wait for their `timeout_secs`
+                instead. Use `lightspark.requests.deadline` to bound whole calls.
+            rate_limiter: Paces requests per kind of operation, and holds them
+                back when the API answers 429. See `lightspark.requests.rate_limit`.
+            concurrency_limiter: Bounds the requests in flight, adapting the bound
+                to the API's responses. Share one across the clients of a token.
+            intern_pool: Shares the equal amounts, nodes, ids and enum lists of
+                the objects the client decodes. See `lightspark.utils.interning`.
+        """
         self._requester = Requester(
             api_token_client_id=api_token_client_id,
             api_token_client_secret=api_token_client_secret,
             base_url=base_url,
             http_host=http_host,
+            persisted_queries=persisted_queries,
+            compressor=compressor,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive_idle_secs=tcp_keepalive_idle_secs,
+            retry_policy=retry_policy,
+            batch_window_secs=batch_window_secs,
+            cache=cache,
+            coalesce_queries=coalesce_queries,
+            call_listeners=call_listeners,
+            tracer=tracer,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            intern_pool=intern_pool,
         )
         self._node_private_keys = {}
+        self._node_key_cache = node_key_cache
+
+    def add_call_listener(self, listener: CallListener) -> None:
+        """Calls `listener` with the timings of each request sent to the API.
+        See `lightspark.requests.instrumentation`."""
+        self._requester.add_call_listener(listener)
+
+    def remove_call_listener(self, listener: CallListener) -> None:
+        self._requester.remove_call_listener(listener)
+
+    def warmup(self, connections: int = 1) -> int:
+        """Opens connections to the API ahead of time, e.g. right after a deploy,
+        so that the first payments don't pay the TCP and TLS handshake latency.
+
+        Args:
+            connections: How many connections to open, capped at `pool_maxsize`.
 
+        Returns:
+            The number of connections ready in the pool.
+        """
+        return self._requester.warmup(connections)
+
+    @records_construction
     def create_api_token(
         self,
         name: str,
@@ -166,6 +301,7 @@ class LightsparkSyncClient:
             json["create_api_token"]["client_secret"],
         )
 
+    @records_construction
     def create_invoice(
         self,
         node_id: str,
@@ -187,6 +323,7 @@ class LightsparkSyncClient:
 
         return Invoice_from_json(self._requester, json["create_invoice"]["invoice"])
 
+    @records_construction
     def create_lnurl_invoice(
         self,
         node_id: str,
@@ -225,6 +362,7 @@ class LightsparkSyncClient:
             self._requester, json["create_lnurl_invoice"]["invoice"]
         )
 
+    @records_construction
     def cancel_invoice(
         self,
         invoice_id: str,
@@ -276,6 +414,7 @@ class LightsparkSyncClient:
 
         return json["create_test_mode_invoice"]["encoded_payment_request"]
 
+    @records_construction
     def create_test_mode_payment(
         self,
         local_node_id: str,
@@ -297,6 +436,7 @@ class LightsparkSyncClient:
             self._requester, json["create_test_mode_payment"]["incoming_payment"]
         )
 
+    @records_construction
     def create_uma_invoice(
         self,
         node_id: str,
@@ -401,15 +541,19 @@ class LightsparkSyncClient:
         duration: timedelta = timedelta(minutes=1),
         algorithm: str = "EdDSA",
     ) -> str:
-        payload = {
-            "aud": "https://api.lightspark.com",
-            "exp": datetime.now(timezone.utc) + duration,
-            "iat": datetime.now(timezone.utc),
-            "sub": third_party_id,
-            "test": test_mode,
-        }
-        return jwt.encode(payload, private_key_pem, algorithm)
+        """Mints a JWT authenticating a third-party wallet. The private key is
+        parsed once and reused across calls. To reuse tokens across requests and
+        mint them for many wallets at once, see `WalletJwtMinter`.
+        """
+        return mint_wallet_jwt(
+            private_key_pem,
+            third_party_id,
+            test_mode=test_mode,
+            duration=duration,
+            algorithm=algorithm,
+        )
 
+    @records_construction
     def get_current_account(
         self,
     ) -> Account:
@@ -420,6 +564,7 @@ class LightsparkSyncClient:
         )
         return Account_from_json(self._requester, json["current_account"])
 
+    @records_construction
     def get_decoded_payment_request(self, encoded_payment_request: str) -> InvoiceData:
         logger.info(
             "Decoding payment request starting with %s...",
@@ -447,6 +592,37 @@ class LightsparkSyncClient:
             requester=self._requester, entity_id=entity_id, entity_class=entity_class
         )
 
+    def get_entities(
+        self,
+        entity_ids: Sequence[str],
+        entity_class: Type[ENTITY],
+        chunk_size: int = DEFAULT_ENTITIES_CHUNK_SIZE,
+        parallelism: int = DEFAULT_ENTITIES_PARALLELISM,
+    ) -> List[Optional[ENTITY]]:
+        """Fetches many entities of the same type in as few requests as possible,
+        e.g. to reconcile the `entity_id`s of a batch of webhooks.
+
+        Args:
+            entity_ids: The ids to fetch. Duplicates are only fetched once.
+            entity_class: The type of the entities.
+            chunk_size: How many entities are fetched by a single request.
+            parallelism: How many requests may be in flight at once.
+
+        Returns:
+            The entities in the order of `entity_ids`, None for ids not found.
+        """
+        logger.info(
+            "Fetching %d entities of type %s", len(entity_ids), str(entity_class)
+        )
+        return get_entities(
+            requester=self._requester,
+            entity_ids=entity_ids,
+            entity_class=entity_class,
+            chunk_size=chunk_size,
+            parallelism=parallelism,
+        )
+
+    @records_construction
     def get_bitcoin_fee_estimate(self, bitcoin_network: BitcoinNetwork) -> FeeEstimate:
         logger.info("Querying the fee estimate for network %s.", bitcoin_network)
         json = self._requester.execute_graphql(
@@ -455,6 +631,7 @@ class LightsparkSyncClient:
         )
         return FeeEstimate_from_json(self._requester, json["bitcoin_fee_estimate"])
 
+    @records_construction
     def get_lightning_fee_estimate_for_invoice(
         self,
         node_id: str,
@@ -475,6 +652,7 @@ class LightsparkSyncClient:
             self._requester, json["lightning_fee_estimate_for_invoice"]
         ).fee_estimate
 
+    @records_construction
     def get_lightning_fee_estimate_for_node(
         self,
         node_id: str,
@@ -497,34 +675,92 @@ class LightsparkSyncClient:
         logger.info("Loading the signing key for node %s", node_id)
         self._node_private_keys[node_id] = signing_key
 
-    def recover_node_signing_key(self, node_id: str, node_password: str) -> SigningKey:
-        logger.info("Recovering the signing key for node %s", node_id)
+    def _fetch_encrypted_signing_key(self, node_id: str) -> Mapping[str, str]:
         json = self._requester.execute_graphql(
             RECOVER_NODE_SIGNING_KEY_QUERY,
             {"node_id": node_id},
         )
-        encrypted_key = json["entity"]["encrypted_signing_private_key"][
-            "encrypted_value"
-        ]
-        cipher = json["entity"]["encrypted_signing_private_key"]["cipher"]
+        return json["entity"]["encrypted_signing_private_key"]
 
-        decrypted_private_key = decrypt_private_key(
-            cipher_version=cipher,
-            encrypted_value=encrypted_key,
-            password=node_password,
+    def recover_node_signing_key(self, node_id: str, node_password: str) -> SigningKey:
+        logger.info("Recovering the signing key for node %s", node_id)
+        encrypted_key = self._fetch_encrypted_signing_key(node_id)
+        (private_key,) = decrypt_node_keys(
+            [
+                EncryptedNodeKey(
+                    node_id,
+                    encrypted_key["cipher"],
+                    encrypted_key["encrypted_value"],
+                    node_password,
+                )
+            ],
+            self._node_key_cache,
         )
 
-        signing_key = RSASigningKey(decrypted_private_key)
+        signing_key = RSASigningKey(private_key)
 
         self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
         return signing_key
 
+    def recover_node_signing_keys(
+        self,
+        node_ids: Sequence[str],
+        node_passwords: Sequence[str],
+        max_workers: int = DEFAULT_KDF_WORKERS,
+    ) -> Dict[str, SigningKey]:
+        """Recovers and loads the signing keys of many nodes at once.
+
+        The encrypted keys are fetched concurrently and decrypted in a process
+        pool. Keys found in the client's `node_key_cache` skip the decryption.
+
+        Args:
+            node_ids: The ids of the nodes.
+            node_passwords: The password of each node, in the same order.
+            max_workers: The maximum number of concurrent fetches and of
+                decryption processes.
+
+        Returns:
+            The signing keys, by node id.
+        """
+        if len(node_ids) != len(node_passwords):
+            raise ValueError("Expected one password per node id")
+        if not node_ids:
+            return {}
+        logger.info("Recovering the signing keys of %d nodes", len(node_ids))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(node_ids))) as pool:
+            encrypted_keys = list(
+                pool.map(
+                    with_current_deadline(self._fetch_encrypted_signing_key), node_ids
+                )
+            )
+        private_keys = decrypt_node_keys(
+            [
+                EncryptedNodeKey(
+                    node_id, key["cipher"], key["encrypted_value"], password
+                )
+                for node_id, key, password in zip(
+                    node_ids, encrypted_keys, node_passwords
+                )
+            ],
+            self._node_key_cache,
+            max_workers,
+        )
+
+        signing_keys: Dict[str, SigningKey] = {}
+        for node_id, private_key in zip(node_ids, private_keys):
+            signing_keys[node_id] = RSASigningKey(private_key)
+            self.load_node_signing_key(
+                node_id=node_id, signing_key=signing_keys[node_id]
+            )
+        return signing_keys
+
     def provide_node_master_seed(
         self, node_id: str, master_seed: bytes, bitcoin_network: BitcoinNetwork
     ) -> None:
         signing_key = Secp256k1SigningKey(master_seed, bitcoin_network)
         self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
 
+    @records_construction
     def pay_invoice(
         self,
         node_id: str,
@@ -544,15 +780,17 @@ class LightsparkSyncClient:
             variables["amount_msats"] = amount_msats
         if idempotency_key is not None:
             variables["idempotency_key"] = idempotency_key
-        json = self._requester.execute_graphql(
-            PAY_INVOICE_MUTATION,
-            variables,
-            self.get_signing_key(node_id),
-        )
+        with payment_read_timeout(timeout_secs):
+            json = self._requester.execute_graphql(
+                PAY_INVOICE_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
         return OutgoingPayment_from_json(
             self._requester, json["pay_invoice"]["payment"]
         )
 
+    @records_construction
     def pay_uma_invoice(
         self,
         node_id: str,
@@ -603,15 +841,17 @@ class LightsparkSyncClient:
             variables["idempotency_key"] = idempotency_key
         if sender_hash is not None:
             variables["sender_hash"] = sender_hash
-        json = self._requester.execute_graphql(
-            PAY_UMA_INVOICE_MUTATION,
-            variables,
-            self.get_signing_key(node_id),
-        )
+        with payment_read_timeout(timeout_secs):
+            json = self._requester.execute_graphql(
+                PAY_UMA_INVOICE_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
         return OutgoingPayment_from_json(
             self._requester, json["pay_uma_invoice"]["payment"]
         )
 
+    @records_construction
     def send_payment(
         self,
         node_id: str,
@@ -619,18 +859,24 @@ class LightsparkSyncClient:
         amount_msats: int,
         timeout_secs: int,
         maximum_fees_msats: int,
+        *,
+        idempotency_key: Optional[str] = None,
     ) -> OutgoingPayment:
-        json = self._requester.execute_graphql(
-            SEND_PAYMENT_MUTATION,
-            {
-                "node_id": node_id,
-                "destination_public_key": destination_public_key,
-                "amount_msats": amount_msats,
-                "timeout_secs": timeout_secs,
-                "maximum_fees_msats": maximum_fees_msats,
-            },
-            self.get_signing_key(node_id),
-        )
+        variables = {
+            "node_id": node_id,
+            "destination_public_key": destination_public_key,
+            "amount_msats": amount_msats,
+            "timeout_secs": timeout_secs,
+            "maximum_fees_msats": maximum_fees_msats,
+        }
+        if idempotency_key is not None:
+            variables["idempotency_key"] = idempotency_key
+        with payment_read_timeout(timeout_secs):
+            json = self._requester.execute_graphql(
+                SEND_PAYMENT_MUTATION,
+                variables,
+                self.get_signing_key(node_id),
+            )
         return OutgoingPayment_from_json(
             self._requester, json["send_payment"]["payment"]
         )
@@ -655,6 +901,7 @@ class LightsparkSyncClient:
             )
         return self._node_private_keys[node_id]
 
+    @records_construction
     def fund_node(
         self,
         node_id: str,
@@ -681,6 +928,7 @@ class LightsparkSyncClient:
         )
         return CurrencyAmount_from_json(self._requester, json["fund_node"]["amount"])
 
+    @records_construction
     def request_withdrawal(
         self,
         node_id: str,
@@ -711,6 +959,7 @@ class LightsparkSyncClient:
             self._requester, json["request_withdrawal"]["request"]
         )
 
+    @records_construction
     def register_payment(
         self,
         provider: ComplianceProvider,
@@ -742,6 +991,7 @@ class LightsparkSyncClient:
             self._requester, json["register_payment"]["payment"]
         )
 
+    @records_construction
     def outgoing_payments_for_invoice(
         self,
         encoded_invoice: str,
@@ -770,6 +1020,7 @@ class LightsparkSyncClient:
             for payment in json["outgoing_payments_for_invoice"]["payments"]
         ]
 
+    @records_construction
     def outgoing_payments_for_payment_hash(
         self,
         payment_hash: str,
@@ -798,6 +1049,7 @@ class LightsparkSyncClient:
             for payment in json["outgoing_payments_for_payment_hash"]["payments"]
         ]
 
+    @records_construction
     def outgoing_payment_for_idempotency_key(
         self,
         idempotency_key: str,
@@ -818,6 +1070,7 @@ class LightsparkSyncClient:
             self._requester, json["outgoing_payment_for_idempotency_key"]["payment"]
         )
 
+    @records_construction
     def incoming_payments_for_invoice(
         self,
         invoice_id: str,
@@ -844,6 +1097,7 @@ class LightsparkSyncClient:
         )
         return output.payments
 
+    @records_construction
     def invoice_for_payment_hash(
         self,
         payment_hash: str,
@@ -864,6 +1118,7 @@ class LightsparkSyncClient:
             self._requester, json["invoice_for_payment_hash"]["invoice"]
         )
 
+    @records_construction
     def create_uma_invitation(
         self,
         inviter_uma: str,
@@ -885,6 +1140,7 @@ class LightsparkSyncClient:
             self._requester, json["create_uma_invitation"]["invitation"]
         )
 
+    @records_construction
     def create_uma_invitation_with_incentives(
         self,
         inviter_uma: str,
@@ -964,6 +1220,7 @@ class LightsparkSyncClient:
             },
         )
 
+    @records_construction
     def fetch_uma_invitation(
         self,
         invitation_code: str,
@@ -988,17 +1245,51 @@ class LightsparkSyncClient:
         )
 
     def _hash_phone_number(self, phone_number_e164_format: str) -> str:
-        match = E614_REGEX.search(phone_number_e164_format)
-        if not match:
-            raise LightsparkException(
-                "InvalidPhoneNumber", "The phone number must follow the E.164 format."
-            )
-        return sha256(phone_number_e164_format.encode()).hexdigest()
+        return self.hash_phone_numbers([phone_number_e164_format])[0]
+
+    def hash_phone_numbers(self, phone_numbers_e164_format: Iterable[str]) -> List[str]:
+        """Hashes phone numbers as sent with UMA invitations, e.g. to precompute
+        the hashes of a whole user directory.
+
+        Args:
+            phone_numbers_e164_format: The phone numbers, in E.164 format.
+
+        Returns:
+            The hashes, in the order of `phone_numbers_e164_format`.
+        """
+        search = E614_REGEX.search
+        hashes = []
+        for phone_number in phone_numbers_e164_format:
+            if not search(phone_number):
+                raise LightsparkException(
+                    "InvalidPhoneNumber",
+                    "The phone number must follow the E.164 format.",
+                )
+            hashes.append(sha256(phone_number.encode()).hexdigest())
+        return hashes
 
     def hash_uma_identifier(self, identifier: str, signing_private_key: bytes) -> str:
+        return self.hash_uma_identifiers([identifier], signing_private_key)[0]
+
+    def hash_uma_identifiers(
+        self, identifiers: Iterable[str], signing_private_key: bytes
+    ) -> List[str]:
+        """Hashes UMA identifiers with this month's seed, e.g. to precompute the
+        `receiver_hash` of a whole user directory.
+
+        Args:
+            identifiers: The UMA identifiers to hash.
+            signing_private_key: The signing private key seeding the hashes.
+
+        Returns:
+            The hashes, in the order of `identifiers`.
+        """
         now = datetime.now(timezone.utc)
-        input_data = identifier + f"{now.month}-{now.year}" + signing_private_key.hex()
-        return sha256(input_data.encode()).hexdigest()
+        # The monthly seed is appended to every identifier: encode it once.
+        seed = f"{now.month}-{now.year}{signing_private_key.hex()}".encode()
+        return [
+            sha256(identifier.encode() + seed).hexdigest() for identifier in identifiers
+        ]
 
     def fail_htlcs(self, invoice_id: str, cancel_invoice: bool = True) -> str:
         """
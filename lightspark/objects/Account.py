@@ -4,7 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .AccountToApiTokensConnection import AccountToApiTokensConnection
 from .AccountToApiTokensConnection import (
@@ -45,6 +49,7 @@ from .TransactionType import TransactionType
 from .WithdrawalRequestStatus import WithdrawalRequestStatus
 
 
+@with_slots
 @dataclass
 class Account(LightsparkNodeOwner, Entity):
     """This is an object representing the connected Lightspark account. You can retrieve this object to see your account information and objects tied to your account."""
@@ -64,11 +69,537 @@ class Account(LightsparkNodeOwner, Entity):
     """The name of this account."""
     typename: str
 
+    @records_construction
     def get_api_tokens(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> AccountToApiTokensConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_ACCOUNT_TO_API_TOKENS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["api_tokens"]
+        return AccountToApiTokensConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_api_tokens_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> AccountToApiTokensConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_API_TOKENS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["api_tokens"]
+        return AccountToApiTokensConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_blockchain_balance(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[BlockchainBalance]:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_BLOCKCHAIN_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["blockchain_balance"]
+        return (
+            BlockchainBalance_from_json(self.requester, connection)
+            if connection
+            else None
+        )
+
+    @records_construction
+    async def get_blockchain_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[BlockchainBalance]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_BLOCKCHAIN_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["blockchain_balance"]
+        return (
+            BlockchainBalance_from_json(self.requester, connection)
+            if connection
+            else None
+        )
+
+    def get_conductivity(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_CONDUCTIVITY_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["conductivity"]
+        return connection
+
+    async def get_conductivity_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_CONDUCTIVITY_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["conductivity"]
+        return connection
+
+    @records_construction
+    def get_local_balance(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_LOCAL_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["local_balance"]
+        return (
+            CurrencyAmount_from_json(self.requester, connection) if connection else None
+        )
+
+    @records_construction
+    async def get_local_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_LOCAL_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["local_balance"]
+        return (
+            CurrencyAmount_from_json(self.requester, connection) if connection else None
+        )
+
+    @records_construction
+    def get_nodes(
+        self,
+        first: Optional[int] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> AccountToNodesConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_NODES_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["nodes"]
+        return AccountToNodesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_nodes_async(
+        self,
+        first: Optional[int] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> AccountToNodesConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_NODES_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["nodes"]
+        return AccountToNodesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_remote_balance(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_REMOTE_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["remote_balance"]
+        return (
+            CurrencyAmount_from_json(self.requester, connection) if connection else None
+        )
+
+    @records_construction
+    async def get_remote_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_REMOTE_BALANCE_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["remote_balance"]
+        return (
+            CurrencyAmount_from_json(self.requester, connection) if connection else None
+        )
+
+    def get_uptime_percentage(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_UPTIME_PERCENTAGE_QUERY,
+            {
+                "entity_id": self.id,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["uptime_percentage"]
+        return connection
+
+    async def get_uptime_percentage_async(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_UPTIME_PERCENTAGE_QUERY,
+            {
+                "entity_id": self.id,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_networks": bitcoin_networks,
+                "node_ids": node_ids,
+            },
+        )
+        connection = json["entity"]["uptime_percentage"]
+        return connection
+
+    @records_construction
+    def get_channels(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AccountToChannelsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+                "after_date": after_date,
+                "before_date": before_date,
+                "first": first,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return AccountToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_channels_async(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        *,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AccountToChannelsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+                "after_date": after_date,
+                "before_date": before_date,
+                "first": first,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return AccountToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_transactions(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+    ) -> AccountToTransactionsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "types": types,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+                "statuses": statuses,
+                "exclude_failures": exclude_failures,
+            },
+        )
+        connection = json["entity"]["transactions"]
+        return AccountToTransactionsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_transactions_async(
+        self,
+        *,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+    ) -> AccountToTransactionsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "types": types,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+                "statuses": statuses,
+                "exclude_failures": exclude_failures,
+            },
+        )
+        connection = json["entity"]["transactions"]
+        return AccountToTransactionsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_payment_requests(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+    ) -> AccountToPaymentRequestsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_PAYMENT_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+            },
+        )
+        connection = json["entity"]["payment_requests"]
+        return AccountToPaymentRequestsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_payment_requests_async(
+        self,
+        *,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+    ) -> AccountToPaymentRequestsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_PAYMENT_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "after_date": after_date,
+                "before_date": before_date,
+                "bitcoin_network": bitcoin_network,
+                "lightning_node_id": lightning_node_id,
+            },
+        )
+        connection = json["entity"]["payment_requests"]
+        return AccountToPaymentRequestsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_withdrawal_requests(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        idempotency_keys: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> AccountToWithdrawalRequestsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "bitcoin_networks": bitcoin_networks,
+                "statuses": statuses,
+                "node_ids": node_ids,
+                "idempotency_keys": idempotency_keys,
+                "after_date": after_date,
+                "before_date": before_date,
+            },
+        )
+        connection = json["entity"]["withdrawal_requests"]
+        return AccountToWithdrawalRequestsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_withdrawal_requests_async(
+        self,
+        *,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        idempotency_keys: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> AccountToWithdrawalRequestsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "bitcoin_networks": bitcoin_networks,
+                "statuses": statuses,
+                "node_ids": node_ids,
+                "idempotency_keys": idempotency_keys,
+                "after_date": after_date,
+                "before_date": before_date,
+            },
+        )
+        connection = json["entity"]["withdrawal_requests"]
+        return AccountToWithdrawalRequestsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    def get_wallets(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        third_party_ids: Optional[List[str]] = None,
+    ) -> AccountToWalletsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_ACCOUNT_TO_WALLETS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "third_party_ids": third_party_ids,
+            },
+        )
+        connection = json["entity"]["wallets"]
+        return AccountToWalletsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_wallets_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        third_party_ids: Optional[List[str]] = None,
+    ) -> AccountToWalletsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_ACCOUNT_TO_WALLETS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "third_party_ids": third_party_ids,
+            },
+        )
+        connection = json["entity"]["wallets"]
+        return AccountToWalletsConnection_from_json(self.requester, connection)
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "Account",
+            "account_id": self.id,
+            "account_created_at": self.created_at.isoformat(),
+            "account_updated_at": self.updated_at.isoformat(),
+            "account_name": self.name,
+        }
+
+
+FETCH_ACCOUNT_TO_API_TOKENS_CONNECTION_QUERY = """
 query FetchAccountToApiTokensConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on Account {
@@ -96,19 +627,10 @@ query FetchAccountToApiTokensConnection($entity_id: ID!, $first: Int, $after: St
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "after": after},
-        )
-        connection = json["entity"]["api_tokens"]
-        return AccountToApiTokensConnection_from_json(self.requester, connection)
+"""
 
-    def get_blockchain_balance(
-        self,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-    ) -> Optional[BlockchainBalance]:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_BLOCKCHAIN_BALANCE_QUERY = """
 query FetchAccountBlockchainBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -166,27 +688,10 @@ query FetchAccountBlockchainBalance($entity_id: ID!, $bitcoin_networks: [Bitcoin
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-            },
-        )
-        connection = json["entity"]["blockchain_balance"]
-        return (
-            BlockchainBalance_from_json(self.requester, connection)
-            if connection
-            else None
-        )
+"""
 
-    def get_conductivity(
-        self,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-    ) -> Optional[int]:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_CONDUCTIVITY_QUERY = """
 query FetchAccountConductivity($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -194,23 +699,10 @@ query FetchAccountConductivity($entity_id: ID!, $bitcoin_networks: [BitcoinNetwo
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-            },
-        )
-        connection = json["entity"]["conductivity"]
-        return connection
+"""
 
-    def get_local_balance(
-        self,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-    ) -> Optional[CurrencyAmount]:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_LOCAL_BALANCE_QUERY = """
 query FetchAccountLocalBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -225,27 +717,10 @@ query FetchAccountLocalBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwo
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-            },
-        )
-        connection = json["entity"]["local_balance"]
-        return (
-            CurrencyAmount_from_json(self.requester, connection) if connection else None
-        )
+"""
 
-    def get_nodes(
-        self,
-        first: Optional[int] = None,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-        after: Optional[str] = None,
-    ) -> AccountToNodesConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_NODES_CONNECTION_QUERY = """
 query FetchAccountToNodesConnection($entity_id: ID!, $first: Int, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!], $after: String) {
     entity(id: $entity_id) {
         ... on Account {
@@ -525,25 +1000,10 @@ query FetchAccountToNodesConnection($entity_id: ID!, $first: Int, $bitcoin_netwo
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-                "after": after,
-            },
-        )
-        connection = json["entity"]["nodes"]
-        return AccountToNodesConnection_from_json(self.requester, connection)
+"""
 
-    def get_remote_balance(
-        self,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-    ) -> Optional[CurrencyAmount]:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_REMOTE_BALANCE_QUERY = """
 query FetchAccountRemoteBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -558,27 +1018,10 @@ query FetchAccountRemoteBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetw
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-            },
-        )
-        connection = json["entity"]["remote_balance"]
-        return (
-            CurrencyAmount_from_json(self.requester, connection) if connection else None
-        )
+"""
 
-    def get_uptime_percentage(
-        self,
-        after_date: Optional[datetime] = None,
-        before_date: Optional[datetime] = None,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        node_ids: Optional[List[str]] = None,
-    ) -> Optional[int]:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_UPTIME_PERCENTAGE_QUERY = """
 query FetchAccountUptimePercentage($entity_id: ID!, $after_date: DateTime, $before_date: DateTime, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -586,29 +1029,10 @@ query FetchAccountUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "after_date": after_date,
-                "before_date": before_date,
-                "bitcoin_networks": bitcoin_networks,
-                "node_ids": node_ids,
-            },
-        )
-        connection = json["entity"]["uptime_percentage"]
-        return connection
+"""
 
-    def get_channels(
-        self,
-        bitcoin_network: BitcoinNetwork,
-        lightning_node_id: Optional[str] = None,
-        after_date: Optional[datetime] = None,
-        before_date: Optional[datetime] = None,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-    ) -> AccountToChannelsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_CHANNELS_CONNECTION_QUERY = """
 query FetchAccountToChannelsConnection($entity_id: ID!, $bitcoin_network: BitcoinNetwork!, $lightning_node_id: ID, $after_date: DateTime, $before_date: DateTime, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on Account {
@@ -720,34 +1144,10 @@ query FetchAccountToChannelsConnection($entity_id: ID!, $bitcoin_network: Bitcoi
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "bitcoin_network": bitcoin_network,
-                "lightning_node_id": lightning_node_id,
-                "after_date": after_date,
-                "before_date": before_date,
-                "first": first,
-                "after": after,
-            },
-        )
-        connection = json["entity"]["channels"]
-        return AccountToChannelsConnection_from_json(self.requester, connection)
+"""
 
-    def get_transactions(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        types: Optional[List[TransactionType]] = None,
-        after_date: Optional[datetime] = None,
-        before_date: Optional[datetime] = None,
-        bitcoin_network: Optional[BitcoinNetwork] = None,
-        lightning_node_id: Optional[str] = None,
-        statuses: Optional[List[TransactionStatus]] = None,
-        exclude_failures: Optional[TransactionFailures] = None,
-    ) -> AccountToTransactionsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_TRANSACTIONS_CONNECTION_QUERY = """
 query FetchAccountToTransactionsConnection($entity_id: ID!, $first: Int, $after: String, $types: [TransactionType!], $after_date: DateTime, $before_date: DateTime, $bitcoin_network: BitcoinNetwork, $lightning_node_id: ID, $statuses: [TransactionStatus!], $exclude_failures: TransactionFailures) {
     entity(id: $entity_id) {
         ... on Account {
@@ -1339,34 +1739,10 @@ query FetchAccountToTransactionsConnection($entity_id: ID!, $first: Int, $after:
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "types": types,
-                "after_date": after_date,
-                "before_date": before_date,
-                "bitcoin_network": bitcoin_network,
-                "lightning_node_id": lightning_node_id,
-                "statuses": statuses,
-                "exclude_failures": exclude_failures,
-            },
-        )
-        connection = json["entity"]["transactions"]
-        return AccountToTransactionsConnection_from_json(self.requester, connection)
+"""
 
-    def get_payment_requests(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        after_date: Optional[datetime] = None,
-        before_date: Optional[datetime] = None,
-        bitcoin_network: Optional[BitcoinNetwork] = None,
-        lightning_node_id: Optional[str] = None,
-    ) -> AccountToPaymentRequestsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_PAYMENT_REQUESTS_CONNECTION_QUERY = """
 query FetchAccountToPaymentRequestsConnection($entity_id: ID!, $first: Int, $after: String, $after_date: DateTime, $before_date: DateTime, $bitcoin_network: BitcoinNetwork, $lightning_node_id: ID) {
     entity(id: $entity_id) {
         ... on Account {
@@ -1695,33 +2071,10 @@ query FetchAccountToPaymentRequestsConnection($entity_id: ID!, $first: Int, $aft
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "after_date": after_date,
-                "before_date": before_date,
-                "bitcoin_network": bitcoin_network,
-                "lightning_node_id": lightning_node_id,
-            },
-        )
-        connection = json["entity"]["payment_requests"]
-        return AccountToPaymentRequestsConnection_from_json(self.requester, connection)
+"""
 
-    def get_withdrawal_requests(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
-        statuses: Optional[List[WithdrawalRequestStatus]] = None,
-        node_ids: Optional[List[str]] = None,
-        idempotency_keys: Optional[List[str]] = None,
-        after_date: Optional[datetime] = None,
-        before_date: Optional[datetime] = None,
-    ) -> AccountToWithdrawalRequestsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY = """
 query FetchAccountToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $after: String, $bitcoin_networks: [BitcoinNetwork!], $statuses: [WithdrawalRequestStatus!], $node_ids: [ID!], $idempotency_keys: [String!], $after_date: DateTime, $before_date: DateTime) {
     entity(id: $entity_id) {
         ... on Account {
@@ -1794,32 +2147,10 @@ query FetchAccountToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "bitcoin_networks": bitcoin_networks,
-                "statuses": statuses,
-                "node_ids": node_ids,
-                "idempotency_keys": idempotency_keys,
-                "after_date": after_date,
-                "before_date": before_date,
-            },
-        )
-        connection = json["entity"]["withdrawal_requests"]
-        return AccountToWithdrawalRequestsConnection_from_json(
-            self.requester, connection
-        )
+"""
 
-    def get_wallets(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        third_party_ids: Optional[List[str]] = None,
-    ) -> AccountToWalletsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_ACCOUNT_TO_WALLETS_CONNECTION_QUERY = """
 query FetchAccountToWalletsConnection($entity_id: ID!, $first: Int, $after: String, $third_party_ids: [String!]) {
     entity(id: $entity_id) {
         ... on Account {
@@ -1876,25 +2207,7 @@ query FetchAccountToWalletsConnection($entity_id: ID!, $first: Int, $after: Stri
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "third_party_ids": third_party_ids,
-            },
-        )
-        connection = json["entity"]["wallets"]
-        return AccountToWalletsConnection_from_json(self.requester, connection)
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "Account",
-            "account_id": self.id,
-            "account_created_at": self.created_at.isoformat(),
-            "account_updated_at": self.updated_at.isoformat(),
-            "account_name": self.name,
-        }
+"""
 
 
 FRAGMENT = """
@@ -1908,12 +2221,10 @@ fragment AccountFragment on Account {
 """
 
 
+_DECODER: CompiledDecoder[Account] = CompiledDecoder(Account)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Account:
-    return Account(
-        requester=requester,
-        typename="Account",
-        id=obj["account_id"],
-        created_at=datetime.fromisoformat(obj["account_created_at"]),
-        updated_at=datetime.fromisoformat(obj["account_updated_at"]),
-        name=obj["account_name"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Account)
+    return _DECODER(requester, obj)
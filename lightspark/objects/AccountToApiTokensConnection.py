@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .ApiToken import ApiToken
-from .ApiToken import from_json as ApiToken_from_json
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class AccountToApiTokensConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment AccountToApiTokensConnectionFragment on AccountToApiTokensConnection {
 """
 
 
+_DECODER: CompiledDecoder[AccountToApiTokensConnection] = CompiledDecoder(
+    AccountToApiTokensConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> AccountToApiTokensConnection:
-    return AccountToApiTokensConnection(
-        requester=requester,
-        typename="AccountToApiTokensConnection",
-        count=obj["account_to_api_tokens_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_api_tokens_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: ApiToken_from_json(requester, e),
-                obj["account_to_api_tokens_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
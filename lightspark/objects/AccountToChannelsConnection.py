@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Channel import Channel
-from .Channel import from_json as Channel_from_json
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class AccountToChannelsConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment AccountToChannelsConnectionFragment on AccountToChannelsConnection {
 """
 
 
+_DECODER: CompiledDecoder[AccountToChannelsConnection] = CompiledDecoder(
+    AccountToChannelsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> AccountToChannelsConnection:
-    return AccountToChannelsConnection(
-        requester=requester,
-        typename="AccountToChannelsConnection",
-        count=obj["account_to_channels_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_channels_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Channel_from_json(requester, e),
-                obj["account_to_channels_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .LightsparkNode import LightsparkNode
-from .LightsparkNode import from_json as LightsparkNode_from_json
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class AccountToNodesConnection(Connection):
     """A connection between an account and the nodes it manages."""
@@ -57,19 +58,10 @@ fragment AccountToNodesConnectionFragment on AccountToNodesConnection {
 """
 
 
+_DECODER: CompiledDecoder[AccountToNodesConnection] = CompiledDecoder(
+    AccountToNodesConnection
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> AccountToNodesConnection:
-    return AccountToNodesConnection(
-        requester=requester,
-        typename="AccountToNodesConnection",
-        count=obj["account_to_nodes_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_nodes_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: LightsparkNode_from_json(requester, e),
-                obj["account_to_nodes_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
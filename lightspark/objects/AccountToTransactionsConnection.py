@@ -4,16 +4,16 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 from .Transaction import Transaction
-from .Transaction import from_json as Transaction_from_json
 
 
+@with_slots
 @dataclass
 class AccountToTransactionsConnection(Connection):
     requester: Requester
@@ -101,43 +101,12 @@ fragment AccountToTransactionsConnectionFragment on AccountToTransactionsConnect
 """
 
 
+_DECODER: CompiledDecoder[AccountToTransactionsConnection] = CompiledDecoder(
+    AccountToTransactionsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> AccountToTransactionsConnection:
-    return AccountToTransactionsConnection(
-        requester=requester,
-        typename="AccountToTransactionsConnection",
-        count=obj["account_to_transactions_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_transactions_connection_page_info"]
-        ),
-        profit_loss=(
-            CurrencyAmount_from_json(
-                requester, obj["account_to_transactions_connection_profit_loss"]
-            )
-            if obj["account_to_transactions_connection_profit_loss"]
-            else None
-        ),
-        average_fee_earned=(
-            CurrencyAmount_from_json(
-                requester, obj["account_to_transactions_connection_average_fee_earned"]
-            )
-            if obj["account_to_transactions_connection_average_fee_earned"]
-            else None
-        ),
-        total_amount_transacted=(
-            CurrencyAmount_from_json(
-                requester,
-                obj["account_to_transactions_connection_total_amount_transacted"],
-            )
-            if obj["account_to_transactions_connection_total_amount_transacted"]
-            else None
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Transaction_from_json(requester, e),
-                obj["account_to_transactions_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
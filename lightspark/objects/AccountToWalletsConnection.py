@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 from .Wallet import Wallet
-from .Wallet import from_json as Wallet_from_json
 
 
+@with_slots
 @dataclass
 class AccountToWalletsConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment AccountToWalletsConnectionFragment on AccountToWalletsConnection {
 """
 
 
+_DECODER: CompiledDecoder[AccountToWalletsConnection] = CompiledDecoder(
+    AccountToWalletsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> AccountToWalletsConnection:
-    return AccountToWalletsConnection(
-        requester=requester,
-        typename="AccountToWalletsConnection",
-        count=obj["account_to_wallets_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_wallets_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Wallet_from_json(requester, e),
-                obj["account_to_wallets_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
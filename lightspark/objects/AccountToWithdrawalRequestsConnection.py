@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 from .WithdrawalRequest import WithdrawalRequest
-from .WithdrawalRequest import from_json as WithdrawalRequest_from_json
 
 
+@with_slots
 @dataclass
 class AccountToWithdrawalRequestsConnection(Connection):
     """A connection between an account and its past and present withdrawal requests."""
@@ -57,21 +58,12 @@ fragment AccountToWithdrawalRequestsConnectionFragment on AccountToWithdrawalReq
 """
 
 
+_DECODER: CompiledDecoder[AccountToWithdrawalRequestsConnection] = CompiledDecoder(
+    AccountToWithdrawalRequestsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> AccountToWithdrawalRequestsConnection:
-    return AccountToWithdrawalRequestsConnection(
-        requester=requester,
-        typename="AccountToWithdrawalRequestsConnection",
-        count=obj["account_to_withdrawal_requests_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["account_to_withdrawal_requests_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: WithdrawalRequest_from_json(requester, e),
-                obj["account_to_withdrawal_requests_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -5,13 +5,16 @@ from datetime import datetime
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum_list
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .AuditLogActor import AuditLogActor
 from .Entity import Entity
 from .Permission import Permission
 
 
+@with_slots
 @dataclass
 class ApiToken(AuditLogActor, Entity):
     """This is an object representing a Lightspark API token, that can be used to authenticate this account when making API calls or using our SDKs. See the “Authentication” section of our API docs for more details on its usage."""
@@ -67,15 +70,10 @@ fragment ApiTokenFragment on ApiToken {
 """
 
 
+_DECODER: CompiledDecoder[ApiToken] = CompiledDecoder(ApiToken)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> ApiToken:
-    return ApiToken(
-        requester=requester,
-        typename="ApiToken",
-        id=obj["api_token_id"],
-        created_at=datetime.fromisoformat(obj["api_token_created_at"]),
-        updated_at=datetime.fromisoformat(obj["api_token_updated_at"]),
-        client_id=obj["api_token_client_id"],
-        name=obj["api_token_name"],
-        permissions=parse_enum_list(Permission, obj["api_token_permissions"]),
-        is_deleted=obj["api_token_is_deleted"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, ApiToken)
+    return _DECODER(requester, obj)
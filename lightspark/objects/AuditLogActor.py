@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum_list
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Entity import Entity
-from .Permission import Permission
 
 
+@with_slots
 @dataclass
 class AuditLogActor(Entity):
     """Audit log actor who called the GraphQL mutation"""
@@ -54,24 +55,21 @@ fragment AuditLogActorFragment on AuditLogActor {
 """
 
 
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.ApiToken import from_json as ApiToken_from_json
+
+    return {
+        "ApiToken": ApiToken_from_json,
+    }
+
+
+_IMPLEMENTATIONS: TypenameDispatch[AuditLogActor] = TypenameDispatch(
+    "AuditLogActor", _loaders
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> AuditLogActor:
-    if obj["__typename"] == "ApiToken":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ApiToken import ApiToken
-
-        return ApiToken(
-            requester=requester,
-            typename="ApiToken",
-            id=obj["api_token_id"],
-            created_at=datetime.fromisoformat(obj["api_token_created_at"]),
-            updated_at=datetime.fromisoformat(obj["api_token_updated_at"]),
-            client_id=obj["api_token_client_id"],
-            name=obj["api_token_name"],
-            permissions=parse_enum_list(Permission, obj["api_token_permissions"]),
-            is_deleted=obj["api_token_is_deleted"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface AuditLogActor corresponding to the typename={graphql_typename}",
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, AuditLogActor)
+    return _IMPLEMENTATIONS(requester, obj)
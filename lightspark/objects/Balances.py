@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 
+@with_slots
 @dataclass
 class Balances:
     """This is an object representing the balance associated with your Lightspark account. You can retrieve this object to see your balance, which can be broken down into several different categorizations."""
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 
+@with_slots
 @dataclass
 class BlockchainBalance:
     """This is an object representing a detailed breakdown of the balance for a Lightspark Node."""
@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Any, Mapping
 
+from lightspark.utils.slots import with_slots
 
+
+@with_slots
 @dataclass
 class CancelInvoiceInput:
     """The unique identifier of the Invoice that should be cancelled. The invoice is supposed to be open, not settled and not expired."""
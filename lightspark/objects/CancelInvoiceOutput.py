@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 
+@with_slots
 @dataclass
 class CancelInvoiceOutput:
     """The Invoice that was cancelled. If the invoice was already cancelled, the same invoice is returned."""
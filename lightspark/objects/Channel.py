@@ -4,22 +4,24 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .ChannelFees import ChannelFees
-from .ChannelFees import from_json as ChannelFees_from_json
 from .ChannelStatus import ChannelStatus
 from .ChannelToTransactionsConnection import ChannelToTransactionsConnection
 from .ChannelToTransactionsConnection import (
     from_json as ChannelToTransactionsConnection_from_json,
 )
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .TransactionType import TransactionType
 
 
+@with_slots
 @dataclass
 class Channel(Entity):
     """This is an object representing a channel on the Lightning Network. You can retrieve this object to get detailed information on a specific Lightning Network channel."""
@@ -87,15 +89,23 @@ class Channel(Entity):
         before_date: Optional[datetime] = None,
     ) -> Optional[int]:
         json = self.requester.execute_graphql(
-            """
-query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $before_date: DateTime) {
-    entity(id: $entity_id) {
-        ... on Channel {
-            uptime_percentage(, after_date: $after_date, before_date: $before_date)
-        }
-    }
-}
-            """,
+            FETCH_CHANNEL_UPTIME_PERCENTAGE_QUERY,
+            {
+                "entity_id": self.id,
+                "after_date": after_date,
+                "before_date": before_date,
+            },
+        )
+        connection = json["entity"]["uptime_percentage"]
+        return connection
+
+    async def get_uptime_percentage_async(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Optional[int]:
+        json = await self.requester.execute_graphql_async(
+            FETCH_CHANNEL_UPTIME_PERCENTAGE_QUERY,
             {
                 "entity_id": self.id,
                 "after_date": after_date,
@@ -105,6 +115,7 @@ query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
         connection = json["entity"]["uptime_percentage"]
         return connection
 
+    @records_construction
     def get_transactions(
         self,
         types: Optional[List[TransactionType]] = None,
@@ -112,42 +123,26 @@ query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
         before_date: Optional[datetime] = None,
     ) -> ChannelToTransactionsConnection:
         json = self.requester.execute_graphql(
-            """
-query FetchChannelToTransactionsConnection($entity_id: ID!, $types: [TransactionType!], $after_date: DateTime, $before_date: DateTime) {
-    entity(id: $entity_id) {
-        ... on Channel {
-            transactions(, types: $types, after_date: $after_date, before_date: $before_date) {
-                __typename
-                channel_to_transactions_connection_count: count
-                channel_to_transactions_connection_average_fee: average_fee {
-                    __typename
-                    currency_amount_original_value: original_value
-                    currency_amount_original_unit: original_unit
-                    currency_amount_preferred_currency_unit: preferred_currency_unit
-                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
-                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
-                }
-                channel_to_transactions_connection_total_amount_transacted: total_amount_transacted {
-                    __typename
-                    currency_amount_original_value: original_value
-                    currency_amount_original_unit: original_unit
-                    currency_amount_preferred_currency_unit: preferred_currency_unit
-                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
-                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
-                }
-                channel_to_transactions_connection_total_fees: total_fees {
-                    __typename
-                    currency_amount_original_value: original_value
-                    currency_amount_original_unit: original_unit
-                    currency_amount_preferred_currency_unit: preferred_currency_unit
-                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
-                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
-                }
-            }
-        }
-    }
-}
-            """,
+            FETCH_CHANNEL_TO_TRANSACTIONS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "types": types,
+                "after_date": after_date,
+                "before_date": before_date,
+            },
+        )
+        connection = json["entity"]["transactions"]
+        return ChannelToTransactionsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_transactions_async(
+        self,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> ChannelToTransactionsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_CHANNEL_TO_TRANSACTIONS_CONNECTION_QUERY,
             {
                 "entity_id": self.id,
                 "types": types,
@@ -206,6 +201,55 @@ query FetchChannelToTransactionsConnection($entity_id: ID!, $types: [Transaction
         }
 
 
+FETCH_CHANNEL_UPTIME_PERCENTAGE_QUERY = """
+query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $before_date: DateTime) {
+    entity(id: $entity_id) {
+        ... on Channel {
+            uptime_percentage(, after_date: $after_date, before_date: $before_date)
+        }
+    }
+}
+"""
+
+
+FETCH_CHANNEL_TO_TRANSACTIONS_CONNECTION_QUERY = """
+query FetchChannelToTransactionsConnection($entity_id: ID!, $types: [TransactionType!], $after_date: DateTime, $before_date: DateTime) {
+    entity(id: $entity_id) {
+        ... on Channel {
+            transactions(, types: $types, after_date: $after_date, before_date: $before_date) {
+                __typename
+                channel_to_transactions_connection_count: count
+                channel_to_transactions_connection_average_fee: average_fee {
+                    __typename
+                    currency_amount_original_value: original_value
+                    currency_amount_original_unit: original_unit
+                    currency_amount_preferred_currency_unit: preferred_currency_unit
+                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
+                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
+                }
+                channel_to_transactions_connection_total_amount_transacted: total_amount_transacted {
+                    __typename
+                    currency_amount_original_value: original_value
+                    currency_amount_original_unit: original_unit
+                    currency_amount_preferred_currency_unit: preferred_currency_unit
+                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
+                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
+                }
+                channel_to_transactions_connection_total_fees: total_fees {
+                    __typename
+                    currency_amount_original_value: original_value
+                    currency_amount_original_unit: original_unit
+                    currency_amount_preferred_currency_unit: preferred_currency_unit
+                    currency_amount_preferred_currency_value_rounded: preferred_currency_value_rounded
+                    currency_amount_preferred_currency_value_approx: preferred_currency_value_approx
+                }
+            }
+        }
+    }
+}
+"""
+
+
 FRAGMENT = """
 fragment ChannelFragment on Channel {
     __typename
@@ -304,70 +348,10 @@ fragment ChannelFragment on Channel {
 """
 
 
+_DECODER: CompiledDecoder[Channel] = CompiledDecoder(Channel)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Channel:
-    return Channel(
-        requester=requester,
-        typename="Channel",
-        id=obj["channel_id"],
-        created_at=datetime.fromisoformat(obj["channel_created_at"]),
-        updated_at=datetime.fromisoformat(obj["channel_updated_at"]),
-        funding_transaction_id=(
-            obj["channel_funding_transaction"]["id"]
-            if obj["channel_funding_transaction"]
-            else None
-        ),
-        capacity=(
-            CurrencyAmount_from_json(requester, obj["channel_capacity"])
-            if obj["channel_capacity"]
-            else None
-        ),
-        local_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_local_balance"])
-            if obj["channel_local_balance"]
-            else None
-        ),
-        local_unsettled_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_local_unsettled_balance"])
-            if obj["channel_local_unsettled_balance"]
-            else None
-        ),
-        remote_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_remote_balance"])
-            if obj["channel_remote_balance"]
-            else None
-        ),
-        remote_unsettled_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_remote_unsettled_balance"])
-            if obj["channel_remote_unsettled_balance"]
-            else None
-        ),
-        unsettled_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_unsettled_balance"])
-            if obj["channel_unsettled_balance"]
-            else None
-        ),
-        total_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_total_balance"])
-            if obj["channel_total_balance"]
-            else None
-        ),
-        status=parse_enum_optional(ChannelStatus, obj["channel_status"]),
-        estimated_force_closure_wait_minutes=obj[
-            "channel_estimated_force_closure_wait_minutes"
-        ],
-        commit_fee=(
-            CurrencyAmount_from_json(requester, obj["channel_commit_fee"])
-            if obj["channel_commit_fee"]
-            else None
-        ),
-        fees=(
-            ChannelFees_from_json(requester, obj["channel_fees"])
-            if obj["channel_fees"]
-            else None
-        ),
-        remote_node_id=(
-            obj["channel_remote_node"]["id"] if obj["channel_remote_node"] else None
-        ),
-        local_node_id=obj["channel_local_node"]["id"],
-        short_channel_id=obj["channel_short_channel_id"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Channel)
+    return _DECODER(requester, obj)
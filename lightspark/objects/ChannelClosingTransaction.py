@@ -5,16 +5,18 @@ from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .OnChainTransaction import OnChainTransaction
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class ChannelClosingTransaction(OnChainTransaction, Transaction, Entity):
     """This is an object representing a transaction which closes a channel on the Lightning Network. This operation allocates balances back to the local and remote nodes."""
@@ -122,41 +124,14 @@ fragment ChannelClosingTransactionFragment on ChannelClosingTransaction {
 """
 
 
+_DECODER: CompiledDecoder[ChannelClosingTransaction] = CompiledDecoder(
+    ChannelClosingTransaction
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ChannelClosingTransaction:
-    return ChannelClosingTransaction(
-        requester=requester,
-        typename="ChannelClosingTransaction",
-        id=obj["channel_closing_transaction_id"],
-        created_at=datetime.fromisoformat(
-            obj["channel_closing_transaction_created_at"]
-        ),
-        updated_at=datetime.fromisoformat(
-            obj["channel_closing_transaction_updated_at"]
-        ),
-        status=parse_enum(TransactionStatus, obj["channel_closing_transaction_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["channel_closing_transaction_resolved_at"])
-            if obj["channel_closing_transaction_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(
-            requester, obj["channel_closing_transaction_amount"]
-        ),
-        transaction_hash=obj["channel_closing_transaction_transaction_hash"],
-        fees=(
-            CurrencyAmount_from_json(requester, obj["channel_closing_transaction_fees"])
-            if obj["channel_closing_transaction_fees"]
-            else None
-        ),
-        block_hash=obj["channel_closing_transaction_block_hash"],
-        block_height=obj["channel_closing_transaction_block_height"],
-        destination_addresses=obj["channel_closing_transaction_destination_addresses"],
-        num_confirmations=obj["channel_closing_transaction_num_confirmations"],
-        channel_id=(
-            obj["channel_closing_transaction_channel"]["id"]
-            if obj["channel_closing_transaction_channel"]
-            else None
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, ChannelClosingTransaction)
+    return _DECODER(requester, obj)
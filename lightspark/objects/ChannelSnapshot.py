@@ -5,12 +5,15 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 
 
+@with_slots
 @dataclass
 class ChannelSnapshot(Entity):
     requester: Requester
@@ -130,45 +133,10 @@ fragment ChannelSnapshotFragment on ChannelSnapshot {
 """
 
 
+_DECODER: CompiledDecoder[ChannelSnapshot] = CompiledDecoder(ChannelSnapshot)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> ChannelSnapshot:
-    return ChannelSnapshot(
-        requester=requester,
-        typename="ChannelSnapshot",
-        id=obj["channel_snapshot_id"],
-        created_at=datetime.fromisoformat(obj["channel_snapshot_created_at"]),
-        updated_at=datetime.fromisoformat(obj["channel_snapshot_updated_at"]),
-        local_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_snapshot_local_balance"])
-            if obj["channel_snapshot_local_balance"]
-            else None
-        ),
-        local_unsettled_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["channel_snapshot_local_unsettled_balance"]
-            )
-            if obj["channel_snapshot_local_unsettled_balance"]
-            else None
-        ),
-        remote_balance=(
-            CurrencyAmount_from_json(requester, obj["channel_snapshot_remote_balance"])
-            if obj["channel_snapshot_remote_balance"]
-            else None
-        ),
-        remote_unsettled_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["channel_snapshot_remote_unsettled_balance"]
-            )
-            if obj["channel_snapshot_remote_unsettled_balance"]
-            else None
-        ),
-        status=obj["channel_snapshot_status"],
-        channel_id=obj["channel_snapshot_channel"]["id"],
-        local_channel_reserve=(
-            CurrencyAmount_from_json(
-                requester, obj["channel_snapshot_local_channel_reserve"]
-            )
-            if obj["channel_snapshot_local_channel_reserve"]
-            else None
-        ),
-        timestamp=datetime.fromisoformat(obj["channel_snapshot_timestamp"]),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, ChannelSnapshot)
+    return _DECODER(requester, obj)
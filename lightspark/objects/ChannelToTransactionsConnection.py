@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 
+@with_slots
 @dataclass
 class ChannelToTransactionsConnection:
     requester: Requester
@@ -74,32 +76,12 @@ fragment ChannelToTransactionsConnectionFragment on ChannelToTransactionsConnect
 """
 
 
+_DECODER: CompiledDecoder[ChannelToTransactionsConnection] = CompiledDecoder(
+    ChannelToTransactionsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ChannelToTransactionsConnection:
-    return ChannelToTransactionsConnection(
-        requester=requester,
-        count=obj["channel_to_transactions_connection_count"],
-        average_fee=(
-            CurrencyAmount_from_json(
-                requester, obj["channel_to_transactions_connection_average_fee"]
-            )
-            if obj["channel_to_transactions_connection_average_fee"]
-            else None
-        ),
-        total_amount_transacted=(
-            CurrencyAmount_from_json(
-                requester,
-                obj["channel_to_transactions_connection_total_amount_transacted"],
-            )
-            if obj["channel_to_transactions_connection_total_amount_transacted"]
-            else None
-        ),
-        total_fees=(
-            CurrencyAmount_from_json(
-                requester, obj["channel_to_transactions_connection_total_fees"]
-            )
-            if obj["channel_to_transactions_connection_total_fees"]
-            else None
-        ),
-    )
+    return _DECODER(requester, obj)
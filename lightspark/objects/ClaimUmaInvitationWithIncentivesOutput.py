@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 
+@with_slots
 @dataclass
 class ClaimUmaInvitationWithIncentivesOutput:
     requester: Requester
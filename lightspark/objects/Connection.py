@@ -3,10 +3,12 @@
 from dataclasses import dataclass
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .PageInfo import PageInfo
 
 
+@with_slots
 @dataclass
 class Connection:
     requester: Requester
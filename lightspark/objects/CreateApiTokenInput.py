@@ -4,10 +4,12 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.utils.enums import parse_enum_list
+from lightspark.utils.slots import with_slots
 
 from .Permission import Permission
 
 
+@with_slots
 @dataclass
 class CreateApiTokenInput:
     name: str
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .ApiToken import ApiToken
 from .ApiToken import from_json as ApiToken_from_json
 
 
+@with_slots
 @dataclass
 class CreateApiTokenOutput:
     requester: Requester
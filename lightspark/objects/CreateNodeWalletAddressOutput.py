@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .MultiSigAddressValidationParameters import MultiSigAddressValidationParameters
 from .MultiSigAddressValidationParameters import (
@@ -11,6 +12,7 @@ from .MultiSigAddressValidationParameters import (
 )
 
 
+@with_slots
 @dataclass
 class CreateNodeWalletAddressOutput:
     requester: Requester
@@ -4,10 +4,12 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.utils.enums import parse_enum_optional
+from lightspark.utils.slots import with_slots
 
 from .InvoiceType import InvoiceType
 
 
+@with_slots
 @dataclass
 class CreateTestModeInvoiceInput:
     local_node_id: str
@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Any, Mapping
 
+from lightspark.utils.slots import with_slots
 
+
+@with_slots
 @dataclass
 class CreateUmaInvitationInput:
     inviter_uma: str
@@ -5,11 +5,13 @@ from typing import Any, Mapping
 
 from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .CurrencyUnit import CurrencyUnit
 
 
+@with_slots
 @dataclass
 class CurrencyAmount:
     """This object represents the value and unit for an amount of currency."""
@@ -121,18 +123,8 @@ fragment CurrencyAmountFragment on CurrencyAmount {
 """
 
 
+_DECODER: CompiledDecoder[CurrencyAmount] = CompiledDecoder(CurrencyAmount)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> CurrencyAmount:
-    return CurrencyAmount(
-        requester=requester,
-        original_value=obj["currency_amount_original_value"],
-        original_unit=parse_enum(CurrencyUnit, obj["currency_amount_original_unit"]),
-        preferred_currency_unit=parse_enum(
-            CurrencyUnit, obj["currency_amount_preferred_currency_unit"]
-        ),
-        preferred_currency_value_rounded=obj[
-            "currency_amount_preferred_currency_value_rounded"
-        ],
-        preferred_currency_value_approx=obj[
-            "currency_amount_preferred_currency_value_approx"
-        ],
-    )
+    return _DECODER(requester, obj)
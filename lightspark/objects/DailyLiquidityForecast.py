@@ -6,12 +6,14 @@ from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .LightningPaymentDirection import LightningPaymentDirection
 
 
+@with_slots
 @dataclass
 class DailyLiquidityForecast:
     requester: Requester
@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Any, List, Mapping
 
+from lightspark.utils.slots import with_slots
 
+
+@with_slots
 @dataclass
 class DeclineToSignMessagesInput:
     payload_ids: List[str]
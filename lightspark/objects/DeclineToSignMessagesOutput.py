@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .SignablePayload import SignablePayload
 from .SignablePayload import from_json as SignablePayload_from_json
 
 
+@with_slots
 @dataclass
 class DeclineToSignMessagesOutput:
     requester: Requester
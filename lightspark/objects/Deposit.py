@@ -5,16 +5,18 @@ from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .OnChainTransaction import OnChainTransaction
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class Deposit(OnChainTransaction, Transaction, Entity):
     """This object represents a Deposit made to a Lightspark node wallet. This operation occurs for any L1 funding transaction to the wallet. You can retrieve this object to receive detailed information about the deposit."""
@@ -118,29 +120,10 @@ fragment DepositFragment on Deposit {
 """
 
 
+_DECODER: CompiledDecoder[Deposit] = CompiledDecoder(Deposit)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Deposit:
-    return Deposit(
-        requester=requester,
-        typename="Deposit",
-        id=obj["deposit_id"],
-        created_at=datetime.fromisoformat(obj["deposit_created_at"]),
-        updated_at=datetime.fromisoformat(obj["deposit_updated_at"]),
-        status=parse_enum(TransactionStatus, obj["deposit_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["deposit_resolved_at"])
-            if obj["deposit_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["deposit_amount"]),
-        transaction_hash=obj["deposit_transaction_hash"],
-        fees=(
-            CurrencyAmount_from_json(requester, obj["deposit_fees"])
-            if obj["deposit_fees"]
-            else None
-        ),
-        block_hash=obj["deposit_block_hash"],
-        block_height=obj["deposit_block_height"],
-        destination_addresses=obj["deposit_destination_addresses"],
-        num_confirmations=obj["deposit_num_confirmations"],
-        destination_id=obj["deposit_destination"]["id"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Deposit)
+    return _DECODER(requester, obj)
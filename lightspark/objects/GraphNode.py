@@ -4,8 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .BitcoinNetwork import BitcoinNetwork
 from .Entity import Entity
@@ -15,6 +18,7 @@ from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
 
 
+@with_slots
 @dataclass
 class GraphNode(Node, Entity):
     """This object represents a node that exists on the Lightning Network, including nodes not managed by Lightspark. You can retrieve this object to get publicly available information about any node on the Lightning Network."""
@@ -49,27 +53,23 @@ class GraphNode(Node, Entity):
     """The public key of this node. It acts as a unique identifier of this node in the Lightning Network."""
     typename: str
 
+    @records_construction
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
         json = self.requester.execute_graphql(
-            """
-query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
-    entity(id: $entity_id) {
-        ... on GraphNode {
-            addresses(, first: $first, types: $types) {
-                __typename
-                node_to_addresses_connection_count: count
-                node_to_addresses_connection_entities: entities {
-                    __typename
-                    node_address_address: address
-                    node_address_type: type
-                }
-            }
-        }
-    }
-}
-            """,
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
             {"entity_id": self.id, "first": first, "types": types},
         )
         connection = json["entity"]["addresses"]
@@ -90,6 +90,25 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         }
 
 
+FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY = """
+query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
+    entity(id: $entity_id) {
+        ... on GraphNode {
+            addresses(, first: $first, types: $types) {
+                __typename
+                node_to_addresses_connection_count: count
+                node_to_addresses_connection_entities: entities {
+                    __typename
+                    node_address_address: address
+                    node_address_type: type
+                }
+            }
+        }
+    }
+}
+"""
+
+
 FRAGMENT = """
 fragment GraphNodeFragment on GraphNode {
     __typename
@@ -106,17 +125,10 @@ fragment GraphNodeFragment on GraphNode {
 """
 
 
+_DECODER: CompiledDecoder[GraphNode] = CompiledDecoder(GraphNode)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> GraphNode:
-    return GraphNode(
-        requester=requester,
-        typename="GraphNode",
-        id=obj["graph_node_id"],
-        created_at=datetime.fromisoformat(obj["graph_node_created_at"]),
-        updated_at=datetime.fromisoformat(obj["graph_node_updated_at"]),
-        alias=obj["graph_node_alias"],
-        bitcoin_network=parse_enum(BitcoinNetwork, obj["graph_node_bitcoin_network"]),
-        color=obj["graph_node_color"],
-        conductivity=obj["graph_node_conductivity"],
-        display_name=obj["graph_node_display_name"],
-        public_key=obj["graph_node_public_key"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, GraphNode)
+    return _DECODER(requester, obj)
@@ -5,12 +5,15 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 
 
+@with_slots
 @dataclass
 class Hop(Entity):
     """This object represents a specific node that existed on a particular payment route. You can retrieve this object to get information about a node on a particular payment path and all payment-relevant information for that node."""
@@ -96,25 +99,10 @@ fragment HopFragment on Hop {
 """
 
 
+_DECODER: CompiledDecoder[Hop] = CompiledDecoder(Hop)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Hop:
-    return Hop(
-        requester=requester,
-        typename="Hop",
-        id=obj["hop_id"],
-        created_at=datetime.fromisoformat(obj["hop_created_at"]),
-        updated_at=datetime.fromisoformat(obj["hop_updated_at"]),
-        destination_id=obj["hop_destination"]["id"] if obj["hop_destination"] else None,
-        index=obj["hop_index"],
-        public_key=obj["hop_public_key"],
-        amount_to_forward=(
-            CurrencyAmount_from_json(requester, obj["hop_amount_to_forward"])
-            if obj["hop_amount_to_forward"]
-            else None
-        ),
-        fee=(
-            CurrencyAmount_from_json(requester, obj["hop_fee"])
-            if obj["hop_fee"]
-            else None
-        ),
-        expiry_block_height=obj["hop_expiry_block_height"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Hop)
+    return _DECODER(requester, obj)
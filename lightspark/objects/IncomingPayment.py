@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .IncomingPaymentAttemptStatus import IncomingPaymentAttemptStatus
 from .IncomingPaymentToAttemptsConnection import IncomingPaymentToAttemptsConnection
@@ -17,11 +19,11 @@ from .IncomingPaymentToAttemptsConnection import (
 )
 from .LightningTransaction import LightningTransaction
 from .PostTransactionData import PostTransactionData
-from .PostTransactionData import from_json as PostTransactionData_from_json
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class IncomingPayment(LightningTransaction, Transaction, Entity):
     """This object represents any payment sent to a Lightspark node on the Lightning Network. You can retrieve this object to receive payment related information about a specific payment received by a Lightspark node."""
@@ -65,6 +67,7 @@ class IncomingPayment(LightningTransaction, Transaction, Entity):
     """Whether the payment is made from the same node."""
     typename: str
 
+    @records_construction
     def get_attempts(
         self,
         first: Optional[int] = None,
@@ -72,7 +75,63 @@ class IncomingPayment(LightningTransaction, Transaction, Entity):
         after: Optional[str] = None,
     ) -> IncomingPaymentToAttemptsConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_INCOMING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "statuses": statuses,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["attempts"]
+        return IncomingPaymentToAttemptsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_attempts_async(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
+        after: Optional[str] = None,
+    ) -> IncomingPaymentToAttemptsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_INCOMING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "statuses": statuses,
+                "after": after,
+            },
+        )
+        connection = json["entity"]["attempts"]
+        return IncomingPaymentToAttemptsConnection_from_json(self.requester, connection)
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "IncomingPayment",
+            "incoming_payment_id": self.id,
+            "incoming_payment_created_at": self.created_at.isoformat(),
+            "incoming_payment_updated_at": self.updated_at.isoformat(),
+            "incoming_payment_status": self.status.value,
+            "incoming_payment_resolved_at": (
+                self.resolved_at.isoformat() if self.resolved_at else None
+            ),
+            "incoming_payment_amount": self.amount.to_json(),
+            "incoming_payment_transaction_hash": self.transaction_hash,
+            "incoming_payment_is_uma": self.is_uma,
+            "incoming_payment_destination": {"id": self.destination_id},
+            "incoming_payment_payment_request": (
+                {"id": self.payment_request_id} if self.payment_request_id else None
+            ),
+            "incoming_payment_uma_post_transaction_data": (
+                [e.to_json() for e in self.uma_post_transaction_data]
+                if self.uma_post_transaction_data
+                else None
+            ),
+            "incoming_payment_is_internal_payment": self.is_internal_payment,
+        }
+
+
+FETCH_INCOMING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY = """
 query FetchIncomingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $statuses: [IncomingPaymentAttemptStatus!], $after: String) {
     entity(id: $entity_id) {
         ... on IncomingPayment {
@@ -109,41 +168,7 @@ query FetchIncomingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $st
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "statuses": statuses,
-                "after": after,
-            },
-        )
-        connection = json["entity"]["attempts"]
-        return IncomingPaymentToAttemptsConnection_from_json(self.requester, connection)
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "IncomingPayment",
-            "incoming_payment_id": self.id,
-            "incoming_payment_created_at": self.created_at.isoformat(),
-            "incoming_payment_updated_at": self.updated_at.isoformat(),
-            "incoming_payment_status": self.status.value,
-            "incoming_payment_resolved_at": (
-                self.resolved_at.isoformat() if self.resolved_at else None
-            ),
-            "incoming_payment_amount": self.amount.to_json(),
-            "incoming_payment_transaction_hash": self.transaction_hash,
-            "incoming_payment_is_uma": self.is_uma,
-            "incoming_payment_destination": {"id": self.destination_id},
-            "incoming_payment_payment_request": (
-                {"id": self.payment_request_id} if self.payment_request_id else None
-            ),
-            "incoming_payment_uma_post_transaction_data": (
-                [e.to_json() for e in self.uma_post_transaction_data]
-                if self.uma_post_transaction_data
-                else None
-            ),
-            "incoming_payment_is_internal_payment": self.is_internal_payment,
-        }
+"""
 
 
 FRAGMENT = """
@@ -187,38 +212,10 @@ fragment IncomingPaymentFragment on IncomingPayment {
 """
 
 
+_DECODER: CompiledDecoder[IncomingPayment] = CompiledDecoder(IncomingPayment)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> IncomingPayment:
-    return IncomingPayment(
-        requester=requester,
-        typename="IncomingPayment",
-        id=obj["incoming_payment_id"],
-        created_at=datetime.fromisoformat(obj["incoming_payment_created_at"]),
-        updated_at=datetime.fromisoformat(obj["incoming_payment_updated_at"]),
-        status=parse_enum(TransactionStatus, obj["incoming_payment_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["incoming_payment_resolved_at"])
-            if obj["incoming_payment_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["incoming_payment_amount"]),
-        transaction_hash=obj["incoming_payment_transaction_hash"],
-        is_uma=obj["incoming_payment_is_uma"],
-        destination_id=obj["incoming_payment_destination"]["id"],
-        payment_request_id=(
-            obj["incoming_payment_payment_request"]["id"]
-            if obj["incoming_payment_payment_request"]
-            else None
-        ),
-        uma_post_transaction_data=(
-            list(
-                map(
-                    # pylint: disable=unnecessary-lambda
-                    lambda e: PostTransactionData_from_json(requester, e),
-                    obj["incoming_payment_uma_post_transaction_data"],
-                )
-            )
-            if obj["incoming_payment_uma_post_transaction_data"]
-            else None
-        ),
-        is_internal_payment=obj["incoming_payment_is_internal_payment"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, IncomingPayment)
+    return _DECODER(requester, obj)
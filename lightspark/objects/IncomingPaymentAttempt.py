@@ -5,14 +5,16 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .IncomingPaymentAttemptStatus import IncomingPaymentAttemptStatus
 
 
+@with_slots
 @dataclass
 class IncomingPaymentAttempt(Entity):
     """This object represents any attempted payment sent to a Lightspark node on the Lightning Network. You can retrieve this object to receive payment related information about a specific incoming payment attempt."""
@@ -79,23 +81,12 @@ fragment IncomingPaymentAttemptFragment on IncomingPaymentAttempt {
 """
 
 
+_DECODER: CompiledDecoder[IncomingPaymentAttempt] = CompiledDecoder(
+    IncomingPaymentAttempt
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> IncomingPaymentAttempt:
-    return IncomingPaymentAttempt(
-        requester=requester,
-        typename="IncomingPaymentAttempt",
-        id=obj["incoming_payment_attempt_id"],
-        created_at=datetime.fromisoformat(obj["incoming_payment_attempt_created_at"]),
-        updated_at=datetime.fromisoformat(obj["incoming_payment_attempt_updated_at"]),
-        status=parse_enum(
-            IncomingPaymentAttemptStatus, obj["incoming_payment_attempt_status"]
-        ),
-        resolved_at=(
-            datetime.fromisoformat(obj["incoming_payment_attempt_resolved_at"])
-            if obj["incoming_payment_attempt_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(
-            requester, obj["incoming_payment_attempt_amount"]
-        ),
-        channel_id=obj["incoming_payment_attempt_channel"]["id"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, IncomingPaymentAttempt)
+    return _DECODER(requester, obj)
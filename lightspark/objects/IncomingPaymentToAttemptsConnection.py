@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .IncomingPaymentAttempt import IncomingPaymentAttempt
-from .IncomingPaymentAttempt import from_json as IncomingPaymentAttempt_from_json
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class IncomingPaymentToAttemptsConnection(Connection):
     """The connection from incoming payment to all attempts."""
@@ -57,21 +58,12 @@ fragment IncomingPaymentToAttemptsConnectionFragment on IncomingPaymentToAttempt
 """
 
 
+_DECODER: CompiledDecoder[IncomingPaymentToAttemptsConnection] = CompiledDecoder(
+    IncomingPaymentToAttemptsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> IncomingPaymentToAttemptsConnection:
-    return IncomingPaymentToAttemptsConnection(
-        requester=requester,
-        typename="IncomingPaymentToAttemptsConnection",
-        count=obj["incoming_payment_to_attempts_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["incoming_payment_to_attempts_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: IncomingPaymentAttempt_from_json(requester, e),
-                obj["incoming_payment_to_attempts_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -5,17 +5,18 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .InvoiceData import InvoiceData
-from .InvoiceData import from_json as InvoiceData_from_json
 from .PaymentRequest import PaymentRequest
 from .PaymentRequestStatus import PaymentRequestStatus
 
 
+@with_slots
 @dataclass
 class Invoice(PaymentRequest, Entity):
     """This object represents a BOLT #11 invoice (https://github.com/lightning/bolts/blob/master/11-payment-encoding.md) created by a Lightspark Node. You can retrieve this object to receive relevant payment information for a specific invoice generated by a Lightspark node."""
@@ -375,20 +376,10 @@ fragment InvoiceFragment on Invoice {
 """
 
 
+_DECODER: CompiledDecoder[Invoice] = CompiledDecoder(Invoice)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Invoice:
-    return Invoice(
-        requester=requester,
-        typename="Invoice",
-        id=obj["invoice_id"],
-        created_at=datetime.fromisoformat(obj["invoice_created_at"]),
-        updated_at=datetime.fromisoformat(obj["invoice_updated_at"]),
-        data=InvoiceData_from_json(requester, obj["invoice_data"]),
-        status=parse_enum(PaymentRequestStatus, obj["invoice_status"]),
-        amount_paid=(
-            CurrencyAmount_from_json(requester, obj["invoice_amount_paid"])
-            if obj["invoice_amount_paid"]
-            else None
-        ),
-        is_uma=obj["invoice_is_uma"],
-        is_lnurl=obj["invoice_is_lnurl"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Invoice)
+    return _DECODER(requester, obj)
@@ -6,6 +6,7 @@ from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.slots import with_slots
 
 from .BitcoinNetwork import BitcoinNetwork
 from .CurrencyAmount import CurrencyAmount
@@ -15,6 +16,7 @@ from .Node import from_json as Node_from_json
 from .PaymentRequestData import PaymentRequestData
 
 
+@with_slots
 @dataclass
 class InvoiceData(PaymentRequestData):
     """This object represents the data associated with a BOLT #11 invoice. You can retrieve this object to receive the relevant data associated with a specific invoice."""
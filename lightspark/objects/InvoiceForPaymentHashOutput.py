@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 
+@with_slots
 @dataclass
 class InvoiceForPaymentHashOutput:
     requester: Requester
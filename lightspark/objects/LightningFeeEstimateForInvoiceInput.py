@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
+from lightspark.utils.slots import with_slots
 
+
+@with_slots
 @dataclass
 class LightningFeeEstimateForInvoiceInput:
     node_id: str
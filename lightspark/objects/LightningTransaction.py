@@ -4,22 +4,18 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
-from .PaymentFailureReason import PaymentFailureReason
-from .PaymentRequestData import from_json as PaymentRequestData_from_json
-from .PostTransactionData import from_json as PostTransactionData_from_json
-from .RichText import from_json as RichText_from_json
-from .RoutingTransactionFailureReason import RoutingTransactionFailureReason
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class LightningTransaction(Transaction, Entity):
     """This is an object representing a transaction made over the Lightning Network. You can retrieve this object to receive information about a specific transaction made over Lightning for a Lightspark node."""
@@ -489,154 +485,31 @@ fragment LightningTransactionFragment on LightningTransaction {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightningTransaction:
-    if obj["__typename"] == "IncomingPayment":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.IncomingPayment import IncomingPayment
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.IncomingPayment import (
+        from_json as IncomingPayment_from_json,
+    )
+    from lightspark.objects.OutgoingPayment import (
+        from_json as OutgoingPayment_from_json,
+    )
+    from lightspark.objects.RoutingTransaction import (
+        from_json as RoutingTransaction_from_json,
+    )
 
-        return IncomingPayment(
-            requester=requester,
-            typename="IncomingPayment",
-            id=obj["incoming_payment_id"],
-            created_at=datetime.fromisoformat(obj["incoming_payment_created_at"]),
-            updated_at=datetime.fromisoformat(obj["incoming_payment_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["incoming_payment_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["incoming_payment_resolved_at"])
-                if obj["incoming_payment_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["incoming_payment_amount"]),
-            transaction_hash=obj["incoming_payment_transaction_hash"],
-            is_uma=obj["incoming_payment_is_uma"],
-            destination_id=obj["incoming_payment_destination"]["id"],
-            payment_request_id=(
-                obj["incoming_payment_payment_request"]["id"]
-                if obj["incoming_payment_payment_request"]
-                else None
-            ),
-            uma_post_transaction_data=(
-                list(
-                    map(
-                        # pylint: disable=unnecessary-lambda
-                        lambda e: PostTransactionData_from_json(requester, e),
-                        obj["incoming_payment_uma_post_transaction_data"],
-                    )
-                )
-                if obj["incoming_payment_uma_post_transaction_data"]
-                else None
-            ),
-            is_internal_payment=obj["incoming_payment_is_internal_payment"],
-        )
-    if obj["__typename"] == "OutgoingPayment":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.OutgoingPayment import OutgoingPayment
+    return {
+        "IncomingPayment": IncomingPayment_from_json,
+        "OutgoingPayment": OutgoingPayment_from_json,
+        "RoutingTransaction": RoutingTransaction_from_json,
+    }
 
-        return OutgoingPayment(
-            requester=requester,
-            typename="OutgoingPayment",
-            id=obj["outgoing_payment_id"],
-            created_at=datetime.fromisoformat(obj["outgoing_payment_created_at"]),
-            updated_at=datetime.fromisoformat(obj["outgoing_payment_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["outgoing_payment_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["outgoing_payment_resolved_at"])
-                if obj["outgoing_payment_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["outgoing_payment_amount"]),
-            transaction_hash=obj["outgoing_payment_transaction_hash"],
-            is_uma=obj["outgoing_payment_is_uma"],
-            origin_id=obj["outgoing_payment_origin"]["id"],
-            destination_id=(
-                obj["outgoing_payment_destination"]["id"]
-                if obj["outgoing_payment_destination"]
-                else None
-            ),
-            fees=(
-                CurrencyAmount_from_json(requester, obj["outgoing_payment_fees"])
-                if obj["outgoing_payment_fees"]
-                else None
-            ),
-            payment_request_data=(
-                PaymentRequestData_from_json(
-                    requester, obj["outgoing_payment_payment_request_data"]
-                )
-                if obj["outgoing_payment_payment_request_data"]
-                else None
-            ),
-            failure_reason=parse_enum_optional(
-                PaymentFailureReason, obj["outgoing_payment_failure_reason"]
-            ),
-            failure_message=(
-                RichText_from_json(requester, obj["outgoing_payment_failure_message"])
-                if obj["outgoing_payment_failure_message"]
-                else None
-            ),
-            uma_post_transaction_data=(
-                list(
-                    map(
-                        # pylint: disable=unnecessary-lambda
-                        lambda e: PostTransactionData_from_json(requester, e),
-                        obj["outgoing_payment_uma_post_transaction_data"],
-                    )
-                )
-                if obj["outgoing_payment_uma_post_transaction_data"]
-                else None
-            ),
-            payment_preimage=obj["outgoing_payment_payment_preimage"],
-            is_internal_payment=obj["outgoing_payment_is_internal_payment"],
-            idempotency_key=obj["outgoing_payment_idempotency_key"],
-        )
-    if obj["__typename"] == "RoutingTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.RoutingTransaction import RoutingTransaction
 
-        return RoutingTransaction(
-            requester=requester,
-            typename="RoutingTransaction",
-            id=obj["routing_transaction_id"],
-            created_at=datetime.fromisoformat(obj["routing_transaction_created_at"]),
-            updated_at=datetime.fromisoformat(obj["routing_transaction_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["routing_transaction_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["routing_transaction_resolved_at"])
-                if obj["routing_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["routing_transaction_amount"]
-            ),
-            transaction_hash=obj["routing_transaction_transaction_hash"],
-            incoming_channel_id=(
-                obj["routing_transaction_incoming_channel"]["id"]
-                if obj["routing_transaction_incoming_channel"]
-                else None
-            ),
-            outgoing_channel_id=(
-                obj["routing_transaction_outgoing_channel"]["id"]
-                if obj["routing_transaction_outgoing_channel"]
-                else None
-            ),
-            fees=(
-                CurrencyAmount_from_json(requester, obj["routing_transaction_fees"])
-                if obj["routing_transaction_fees"]
-                else None
-            ),
-            failure_message=(
-                RichText_from_json(
-                    requester, obj["routing_transaction_failure_message"]
-                )
-                if obj["routing_transaction_failure_message"]
-                else None
-            ),
-            failure_reason=parse_enum_optional(
-                RoutingTransactionFailureReason,
-                obj["routing_transaction_failure_reason"],
-            ),
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface LightningTransaction corresponding to the typename={graphql_typename}",
-    )
+_IMPLEMENTATIONS: TypenameDispatch[LightningTransaction] = TypenameDispatch(
+    "LightningTransaction", _loaders
+)
+
+
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightningTransaction:
+    if decoding_lazily():
+        return decode_lazily(requester, obj, LightningTransaction)
+    return _IMPLEMENTATIONS(requester, obj)
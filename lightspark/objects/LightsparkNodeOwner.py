@@ -4,15 +4,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
-from .Balances import from_json as Balances_from_json
 from .Entity import Entity
-from .WalletStatus import WalletStatus
 
 
+@with_slots
 @dataclass
 class LightsparkNodeOwner(Entity):
     """This is an object representing the owner of a LightsparkNode."""
@@ -91,45 +91,23 @@ fragment LightsparkNodeOwnerFragment on LightsparkNodeOwner {
 """
 
 
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.Account import from_json as Account_from_json
+    from lightspark.objects.Wallet import from_json as Wallet_from_json
+
+    return {
+        "Account": Account_from_json,
+        "Wallet": Wallet_from_json,
+    }
+
+
+_IMPLEMENTATIONS: TypenameDispatch[LightsparkNodeOwner] = TypenameDispatch(
+    "LightsparkNodeOwner", _loaders
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightsparkNodeOwner:
-    if obj["__typename"] == "Account":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Account import Account
-
-        return Account(
-            requester=requester,
-            typename="Account",
-            id=obj["account_id"],
-            created_at=datetime.fromisoformat(obj["account_created_at"]),
-            updated_at=datetime.fromisoformat(obj["account_updated_at"]),
-            name=obj["account_name"],
-        )
-    if obj["__typename"] == "Wallet":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Wallet import Wallet
-
-        return Wallet(
-            requester=requester,
-            typename="Wallet",
-            id=obj["wallet_id"],
-            created_at=datetime.fromisoformat(obj["wallet_created_at"]),
-            updated_at=datetime.fromisoformat(obj["wallet_updated_at"]),
-            last_login_at=(
-                datetime.fromisoformat(obj["wallet_last_login_at"])
-                if obj["wallet_last_login_at"]
-                else None
-            ),
-            balances=(
-                Balances_from_json(requester, obj["wallet_balances"])
-                if obj["wallet_balances"]
-                else None
-            ),
-            third_party_identifier=obj["wallet_third_party_identifier"],
-            account_id=obj["wallet_account"]["id"] if obj["wallet_account"] else None,
-            status=parse_enum(WalletStatus, obj["wallet_status"]),
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface LightsparkNodeOwner corresponding to the typename={graphql_typename}",
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, LightsparkNodeOwner)
+    return _IMPLEMENTATIONS(requester, obj)
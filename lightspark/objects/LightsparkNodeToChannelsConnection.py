@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Channel import Channel
-from .Channel import from_json as Channel_from_json
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class LightsparkNodeToChannelsConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment LightsparkNodeToChannelsConnectionFragment on LightsparkNodeToChannelsC
 """
 
 
+_DECODER: CompiledDecoder[LightsparkNodeToChannelsConnection] = CompiledDecoder(
+    LightsparkNodeToChannelsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> LightsparkNodeToChannelsConnection:
-    return LightsparkNodeToChannelsConnection(
-        requester=requester,
-        typename="LightsparkNodeToChannelsConnection",
-        count=obj["lightspark_node_to_channels_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["lightspark_node_to_channels_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Channel_from_json(requester, e),
-                obj["lightspark_node_to_channels_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -5,13 +5,14 @@ from datetime import datetime
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .DailyLiquidityForecast import DailyLiquidityForecast
-from .DailyLiquidityForecast import from_json as DailyLiquidityForecast_from_json
 from .LightningPaymentDirection import LightningPaymentDirection
 
 
+@with_slots
 @dataclass
 class LightsparkNodeToDailyLiquidityForecastsConnection:
     requester: Requester
@@ -59,24 +60,12 @@ fragment LightsparkNodeToDailyLiquidityForecastsConnectionFragment on Lightspark
 """
 
 
+_DECODER: CompiledDecoder[LightsparkNodeToDailyLiquidityForecastsConnection] = (
+    CompiledDecoder(LightsparkNodeToDailyLiquidityForecastsConnection)
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
-    return LightsparkNodeToDailyLiquidityForecastsConnection(
-        requester=requester,
-        from_date=obj[
-            "lightspark_node_to_daily_liquidity_forecasts_connection_from_date"
-        ],
-        to_date=obj["lightspark_node_to_daily_liquidity_forecasts_connection_to_date"],
-        direction=parse_enum(
-            LightningPaymentDirection,
-            obj["lightspark_node_to_daily_liquidity_forecasts_connection_direction"],
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: DailyLiquidityForecast_from_json(requester, e),
-                obj["lightspark_node_to_daily_liquidity_forecasts_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
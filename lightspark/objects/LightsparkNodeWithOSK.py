@@ -4,17 +4,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Balances import Balances
-from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
 from .BlockchainBalance import BlockchainBalance
-from .BlockchainBalance import from_json as BlockchainBalance_from_json
 from .ChannelStatus import ChannelStatus
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningPaymentDirection import LightningPaymentDirection
 from .LightsparkNode import LightsparkNode
@@ -34,9 +34,9 @@ from .NodeAddressType import NodeAddressType
 from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
 from .Secret import Secret
-from .Secret import from_json as Secret_from_json
 
 
+@with_slots
 @dataclass
 class LightsparkNodeWithOSK(LightsparkNode, Node, Entity):
     """This is a Lightspark node with OSK."""
@@ -101,11 +101,160 @@ class LightsparkNodeWithOSK(LightsparkNode, Node, Entity):
     """The private key client is using to sign a GraphQL request which will be verified at server side."""
     typename: str
 
+    @records_construction
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_channels(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "before_date": before_date,
+                "after_date": after_date,
+                "statuses": statuses,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_channels_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "before_date": before_date,
+                "after_date": after_date,
+                "statuses": statuses,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_daily_liquidity_forecasts(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "from_date": from_date,
+                "to_date": to_date,
+                "direction": direction,
+            },
+        )
+        connection = json["entity"]["daily_liquidity_forecasts"]
+        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_daily_liquidity_forecasts_async(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "from_date": from_date,
+                "to_date": to_date,
+                "direction": direction,
+            },
+        )
+        connection = json["entity"]["daily_liquidity_forecasts"]
+        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+            self.requester, connection
+        )
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "LightsparkNodeWithOSK",
+            "lightspark_node_with_o_s_k_id": self.id,
+            "lightspark_node_with_o_s_k_created_at": self.created_at.isoformat(),
+            "lightspark_node_with_o_s_k_updated_at": self.updated_at.isoformat(),
+            "lightspark_node_with_o_s_k_alias": self.alias,
+            "lightspark_node_with_o_s_k_bitcoin_network": self.bitcoin_network.value,
+            "lightspark_node_with_o_s_k_color": self.color,
+            "lightspark_node_with_o_s_k_conductivity": self.conductivity,
+            "lightspark_node_with_o_s_k_display_name": self.display_name,
+            "lightspark_node_with_o_s_k_public_key": self.public_key,
+            "lightspark_node_with_o_s_k_owner": {"id": self.owner_id},
+            "lightspark_node_with_o_s_k_status": (
+                self.status.value if self.status else None
+            ),
+            "lightspark_node_with_o_s_k_total_balance": (
+                self.total_balance.to_json() if self.total_balance else None
+            ),
+            "lightspark_node_with_o_s_k_total_local_balance": (
+                self.total_local_balance.to_json() if self.total_local_balance else None
+            ),
+            "lightspark_node_with_o_s_k_local_balance": (
+                self.local_balance.to_json() if self.local_balance else None
+            ),
+            "lightspark_node_with_o_s_k_remote_balance": (
+                self.remote_balance.to_json() if self.remote_balance else None
+            ),
+            "lightspark_node_with_o_s_k_blockchain_balance": (
+                self.blockchain_balance.to_json() if self.blockchain_balance else None
+            ),
+            "lightspark_node_with_o_s_k_uma_prescreening_utxos": self.uma_prescreening_utxos,
+            "lightspark_node_with_o_s_k_balances": (
+                self.balances.to_json() if self.balances else None
+            ),
+            "lightspark_node_with_o_s_k_encrypted_signing_private_key": (
+                self.encrypted_signing_private_key.to_json()
+                if self.encrypted_signing_private_key
+                else None
+            ),
+        }
+
+
+FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY = """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithOSK {
@@ -121,22 +270,10 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "types": types},
-        )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
+"""
 
-    def get_channels(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        before_date: Optional[datetime] = None,
-        after_date: Optional[datetime] = None,
-        statuses: Optional[List[ChannelStatus]] = None,
-    ) -> LightsparkNodeToChannelsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY = """
 query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $after: String, $before_date: DateTime, $after_date: DateTime, $statuses: [ChannelStatus!]) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithOSK {
@@ -248,27 +385,10 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $aft
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "before_date": before_date,
-                "after_date": after_date,
-                "statuses": statuses,
-            },
-        )
-        connection = json["entity"]["channels"]
-        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+"""
 
-    def get_daily_liquidity_forecasts(
-        self,
-        from_date: datetime,
-        to_date: datetime,
-        direction: LightningPaymentDirection,
-    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY = """
 query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $from_date: Date!, $to_date: Date!, $direction: LightningPaymentDirection!) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithOSK {
@@ -294,60 +414,7 @@ query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $f
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "from_date": from_date,
-                "to_date": to_date,
-                "direction": direction,
-            },
-        )
-        connection = json["entity"]["daily_liquidity_forecasts"]
-        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
-            self.requester, connection
-        )
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "LightsparkNodeWithOSK",
-            "lightspark_node_with_o_s_k_id": self.id,
-            "lightspark_node_with_o_s_k_created_at": self.created_at.isoformat(),
-            "lightspark_node_with_o_s_k_updated_at": self.updated_at.isoformat(),
-            "lightspark_node_with_o_s_k_alias": self.alias,
-            "lightspark_node_with_o_s_k_bitcoin_network": self.bitcoin_network.value,
-            "lightspark_node_with_o_s_k_color": self.color,
-            "lightspark_node_with_o_s_k_conductivity": self.conductivity,
-            "lightspark_node_with_o_s_k_display_name": self.display_name,
-            "lightspark_node_with_o_s_k_public_key": self.public_key,
-            "lightspark_node_with_o_s_k_owner": {"id": self.owner_id},
-            "lightspark_node_with_o_s_k_status": (
-                self.status.value if self.status else None
-            ),
-            "lightspark_node_with_o_s_k_total_balance": (
-                self.total_balance.to_json() if self.total_balance else None
-            ),
-            "lightspark_node_with_o_s_k_total_local_balance": (
-                self.total_local_balance.to_json() if self.total_local_balance else None
-            ),
-            "lightspark_node_with_o_s_k_local_balance": (
-                self.local_balance.to_json() if self.local_balance else None
-            ),
-            "lightspark_node_with_o_s_k_remote_balance": (
-                self.remote_balance.to_json() if self.remote_balance else None
-            ),
-            "lightspark_node_with_o_s_k_blockchain_balance": (
-                self.blockchain_balance.to_json() if self.blockchain_balance else None
-            ),
-            "lightspark_node_with_o_s_k_uma_prescreening_utxos": self.uma_prescreening_utxos,
-            "lightspark_node_with_o_s_k_balances": (
-                self.balances.to_json() if self.balances else None
-            ),
-            "lightspark_node_with_o_s_k_encrypted_signing_private_key": (
-                self.encrypted_signing_private_key.to_json()
-                if self.encrypted_signing_private_key
-                else None
-            ),
-        }
+"""
 
 
 FRAGMENT = """
@@ -486,72 +553,12 @@ fragment LightsparkNodeWithOSKFragment on LightsparkNodeWithOSK {
 """
 
 
+_DECODER: CompiledDecoder[LightsparkNodeWithOSK] = CompiledDecoder(
+    LightsparkNodeWithOSK
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightsparkNodeWithOSK:
-    return LightsparkNodeWithOSK(
-        requester=requester,
-        typename="LightsparkNodeWithOSK",
-        id=obj["lightspark_node_with_o_s_k_id"],
-        created_at=datetime.fromisoformat(obj["lightspark_node_with_o_s_k_created_at"]),
-        updated_at=datetime.fromisoformat(obj["lightspark_node_with_o_s_k_updated_at"]),
-        alias=obj["lightspark_node_with_o_s_k_alias"],
-        bitcoin_network=parse_enum(
-            BitcoinNetwork, obj["lightspark_node_with_o_s_k_bitcoin_network"]
-        ),
-        color=obj["lightspark_node_with_o_s_k_color"],
-        conductivity=obj["lightspark_node_with_o_s_k_conductivity"],
-        display_name=obj["lightspark_node_with_o_s_k_display_name"],
-        public_key=obj["lightspark_node_with_o_s_k_public_key"],
-        owner_id=obj["lightspark_node_with_o_s_k_owner"]["id"],
-        status=parse_enum_optional(
-            LightsparkNodeStatus, obj["lightspark_node_with_o_s_k_status"]
-        ),
-        total_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_balance"]
-            else None
-        ),
-        total_local_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_local_balance"]
-            else None
-        ),
-        local_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_local_balance"]
-            else None
-        ),
-        remote_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_remote_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_remote_balance"]
-            else None
-        ),
-        blockchain_balance=(
-            BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            else None
-        ),
-        uma_prescreening_utxos=obj["lightspark_node_with_o_s_k_uma_prescreening_utxos"],
-        balances=(
-            Balances_from_json(requester, obj["lightspark_node_with_o_s_k_balances"])
-            if obj["lightspark_node_with_o_s_k_balances"]
-            else None
-        ),
-        encrypted_signing_private_key=(
-            Secret_from_json(
-                requester,
-                obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"],
-            )
-            if obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"]
-            else None
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, LightsparkNodeWithOSK)
+    return _DECODER(requester, obj)
@@ -4,17 +4,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Balances import Balances
-from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
 from .BlockchainBalance import BlockchainBalance
-from .BlockchainBalance import from_json as BlockchainBalance_from_json
 from .ChannelStatus import ChannelStatus
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningPaymentDirection import LightningPaymentDirection
 from .LightsparkNode import LightsparkNode
@@ -35,6 +35,7 @@ from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
 
 
+@with_slots
 @dataclass
 class LightsparkNodeWithRemoteSigning(LightsparkNode, Node, Entity):
     """This is a Lightspark node with remote signing."""
@@ -96,11 +97,155 @@ class LightsparkNodeWithRemoteSigning(LightsparkNode, Node, Entity):
     """The balances that describe the funds in this node."""
     typename: str
 
+    @records_construction
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_channels(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "before_date": before_date,
+                "after_date": after_date,
+                "statuses": statuses,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_channels_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        before_date: Optional[datetime] = None,
+        after_date: Optional[datetime] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "before_date": before_date,
+                "after_date": after_date,
+                "statuses": statuses,
+            },
+        )
+        connection = json["entity"]["channels"]
+        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_daily_liquidity_forecasts(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "from_date": from_date,
+                "to_date": to_date,
+                "direction": direction,
+            },
+        )
+        connection = json["entity"]["daily_liquidity_forecasts"]
+        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_daily_liquidity_forecasts_async(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "from_date": from_date,
+                "to_date": to_date,
+                "direction": direction,
+            },
+        )
+        connection = json["entity"]["daily_liquidity_forecasts"]
+        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+            self.requester, connection
+        )
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "LightsparkNodeWithRemoteSigning",
+            "lightspark_node_with_remote_signing_id": self.id,
+            "lightspark_node_with_remote_signing_created_at": self.created_at.isoformat(),
+            "lightspark_node_with_remote_signing_updated_at": self.updated_at.isoformat(),
+            "lightspark_node_with_remote_signing_alias": self.alias,
+            "lightspark_node_with_remote_signing_bitcoin_network": self.bitcoin_network.value,
+            "lightspark_node_with_remote_signing_color": self.color,
+            "lightspark_node_with_remote_signing_conductivity": self.conductivity,
+            "lightspark_node_with_remote_signing_display_name": self.display_name,
+            "lightspark_node_with_remote_signing_public_key": self.public_key,
+            "lightspark_node_with_remote_signing_owner": {"id": self.owner_id},
+            "lightspark_node_with_remote_signing_status": (
+                self.status.value if self.status else None
+            ),
+            "lightspark_node_with_remote_signing_total_balance": (
+                self.total_balance.to_json() if self.total_balance else None
+            ),
+            "lightspark_node_with_remote_signing_total_local_balance": (
+                self.total_local_balance.to_json() if self.total_local_balance else None
+            ),
+            "lightspark_node_with_remote_signing_local_balance": (
+                self.local_balance.to_json() if self.local_balance else None
+            ),
+            "lightspark_node_with_remote_signing_remote_balance": (
+                self.remote_balance.to_json() if self.remote_balance else None
+            ),
+            "lightspark_node_with_remote_signing_blockchain_balance": (
+                self.blockchain_balance.to_json() if self.blockchain_balance else None
+            ),
+            "lightspark_node_with_remote_signing_uma_prescreening_utxos": self.uma_prescreening_utxos,
+            "lightspark_node_with_remote_signing_balances": (
+                self.balances.to_json() if self.balances else None
+            ),
+        }
+
+
+FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY = """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithRemoteSigning {
@@ -116,22 +261,10 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "types": types},
-        )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
+"""
 
-    def get_channels(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        before_date: Optional[datetime] = None,
-        after_date: Optional[datetime] = None,
-        statuses: Optional[List[ChannelStatus]] = None,
-    ) -> LightsparkNodeToChannelsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_LIGHTSPARK_NODE_TO_CHANNELS_CONNECTION_QUERY = """
 query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $after: String, $before_date: DateTime, $after_date: DateTime, $statuses: [ChannelStatus!]) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithRemoteSigning {
@@ -243,27 +376,10 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $aft
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "before_date": before_date,
-                "after_date": after_date,
-                "statuses": statuses,
-            },
-        )
-        connection = json["entity"]["channels"]
-        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
+"""
 
-    def get_daily_liquidity_forecasts(
-        self,
-        from_date: datetime,
-        to_date: datetime,
-        direction: LightningPaymentDirection,
-    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_LIGHTSPARK_NODE_TO_DAILY_LIQUIDITY_FORECASTS_CONNECTION_QUERY = """
 query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $from_date: Date!, $to_date: Date!, $direction: LightningPaymentDirection!) {
     entity(id: $entity_id) {
         ... on LightsparkNodeWithRemoteSigning {
@@ -289,55 +405,7 @@ query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $f
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "from_date": from_date,
-                "to_date": to_date,
-                "direction": direction,
-            },
-        )
-        connection = json["entity"]["daily_liquidity_forecasts"]
-        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
-            self.requester, connection
-        )
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "LightsparkNodeWithRemoteSigning",
-            "lightspark_node_with_remote_signing_id": self.id,
-            "lightspark_node_with_remote_signing_created_at": self.created_at.isoformat(),
-            "lightspark_node_with_remote_signing_updated_at": self.updated_at.isoformat(),
-            "lightspark_node_with_remote_signing_alias": self.alias,
-            "lightspark_node_with_remote_signing_bitcoin_network": self.bitcoin_network.value,
-            "lightspark_node_with_remote_signing_color": self.color,
-            "lightspark_node_with_remote_signing_conductivity": self.conductivity,
-            "lightspark_node_with_remote_signing_display_name": self.display_name,
-            "lightspark_node_with_remote_signing_public_key": self.public_key,
-            "lightspark_node_with_remote_signing_owner": {"id": self.owner_id},
-            "lightspark_node_with_remote_signing_status": (
-                self.status.value if self.status else None
-            ),
-            "lightspark_node_with_remote_signing_total_balance": (
-                self.total_balance.to_json() if self.total_balance else None
-            ),
-            "lightspark_node_with_remote_signing_total_local_balance": (
-                self.total_local_balance.to_json() if self.total_local_balance else None
-            ),
-            "lightspark_node_with_remote_signing_local_balance": (
-                self.local_balance.to_json() if self.local_balance else None
-            ),
-            "lightspark_node_with_remote_signing_remote_balance": (
-                self.remote_balance.to_json() if self.remote_balance else None
-            ),
-            "lightspark_node_with_remote_signing_blockchain_balance": (
-                self.blockchain_balance.to_json() if self.blockchain_balance else None
-            ),
-            "lightspark_node_with_remote_signing_uma_prescreening_utxos": self.uma_prescreening_utxos,
-            "lightspark_node_with_remote_signing_balances": (
-                self.balances.to_json() if self.balances else None
-            ),
-        }
+"""
 
 
 FRAGMENT = """
@@ -471,75 +539,14 @@ fragment LightsparkNodeWithRemoteSigningFragment on LightsparkNodeWithRemoteSign
 """
 
 
+_DECODER: CompiledDecoder[LightsparkNodeWithRemoteSigning] = CompiledDecoder(
+    LightsparkNodeWithRemoteSigning
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> LightsparkNodeWithRemoteSigning:
-    return LightsparkNodeWithRemoteSigning(
-        requester=requester,
-        typename="LightsparkNodeWithRemoteSigning",
-        id=obj["lightspark_node_with_remote_signing_id"],
-        created_at=datetime.fromisoformat(
-            obj["lightspark_node_with_remote_signing_created_at"]
-        ),
-        updated_at=datetime.fromisoformat(
-            obj["lightspark_node_with_remote_signing_updated_at"]
-        ),
-        alias=obj["lightspark_node_with_remote_signing_alias"],
-        bitcoin_network=parse_enum(
-            BitcoinNetwork, obj["lightspark_node_with_remote_signing_bitcoin_network"]
-        ),
-        color=obj["lightspark_node_with_remote_signing_color"],
-        conductivity=obj["lightspark_node_with_remote_signing_conductivity"],
-        display_name=obj["lightspark_node_with_remote_signing_display_name"],
-        public_key=obj["lightspark_node_with_remote_signing_public_key"],
-        owner_id=obj["lightspark_node_with_remote_signing_owner"]["id"],
-        status=parse_enum_optional(
-            LightsparkNodeStatus, obj["lightspark_node_with_remote_signing_status"]
-        ),
-        total_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_total_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_total_balance"]
-            else None
-        ),
-        total_local_balance=(
-            CurrencyAmount_from_json(
-                requester,
-                obj["lightspark_node_with_remote_signing_total_local_balance"],
-            )
-            if obj["lightspark_node_with_remote_signing_total_local_balance"]
-            else None
-        ),
-        local_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_local_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_local_balance"]
-            else None
-        ),
-        remote_balance=(
-            CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_remote_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_remote_balance"]
-            else None
-        ),
-        blockchain_balance=(
-            BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            else None
-        ),
-        uma_prescreening_utxos=obj[
-            "lightspark_node_with_remote_signing_uma_prescreening_utxos"
-        ],
-        balances=(
-            Balances_from_json(
-                requester, obj["lightspark_node_with_remote_signing_balances"]
-            )
-            if obj["lightspark_node_with_remote_signing_balances"]
-            else None
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, LightsparkNodeWithRemoteSigning)
+    return _DECODER(requester, obj)
@@ -4,22 +4,20 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
-from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
-from .BlockchainBalance import from_json as BlockchainBalance_from_json
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
-from .LightsparkNodeStatus import LightsparkNodeStatus
 from .NodeAddressType import NodeAddressType
 from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
-from .Secret import from_json as Secret_from_json
 
 
+@with_slots
 @dataclass
 class Node(Entity):
     """This object is an interface representing a Lightning Node on the Lightning Network, and could either be a Lightspark node or a node managed by a third party."""
@@ -54,27 +52,23 @@ class Node(Entity):
     """The public key of this node. It acts as a unique identifier of this node in the Lightning Network."""
     typename: str
 
+    @records_construction
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
         json = self.requester.execute_graphql(
-            """
-query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
-    entity(id: $entity_id) {
-        ... on Node {
-            addresses(, first: $first, types: $types) {
-                __typename
-                node_to_addresses_connection_count: count
-                node_to_addresses_connection_entities: entities {
-                    __typename
-                    node_address_address: address
-                    node_address_type: type
-                }
-            }
-        }
-    }
-}
-            """,
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "types": types},
+        )
+        connection = json["entity"]["addresses"]
+        return NodeToAddressesConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY,
             {"entity_id": self.id, "first": first, "types": types},
         )
         connection = json["entity"]["addresses"]
@@ -95,6 +89,25 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         }
 
 
+FETCH_NODE_TO_ADDRESSES_CONNECTION_QUERY = """
+query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
+    entity(id: $entity_id) {
+        ... on Node {
+            addresses(, first: $first, types: $types) {
+                __typename
+                node_to_addresses_connection_count: count
+                node_to_addresses_connection_entities: entities {
+                    __typename
+                    node_address_address: address
+                    node_address_type: type
+                }
+            }
+        }
+    }
+}
+"""
+
+
 FRAGMENT = """
 fragment NodeFragment on Node {
     __typename
@@ -373,185 +386,27 @@ fragment NodeFragment on Node {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> Node:
-    if obj["__typename"] == "GraphNode":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.GraphNode import GraphNode
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.GraphNode import from_json as GraphNode_from_json
+    from lightspark.objects.LightsparkNodeWithOSK import (
+        from_json as LightsparkNodeWithOSK_from_json,
+    )
+    from lightspark.objects.LightsparkNodeWithRemoteSigning import (
+        from_json as LightsparkNodeWithRemoteSigning_from_json,
+    )
 
-        return GraphNode(
-            requester=requester,
-            typename="GraphNode",
-            id=obj["graph_node_id"],
-            created_at=datetime.fromisoformat(obj["graph_node_created_at"]),
-            updated_at=datetime.fromisoformat(obj["graph_node_updated_at"]),
-            alias=obj["graph_node_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["graph_node_bitcoin_network"]
-            ),
-            color=obj["graph_node_color"],
-            conductivity=obj["graph_node_conductivity"],
-            display_name=obj["graph_node_display_name"],
-            public_key=obj["graph_node_public_key"],
-        )
-    if obj["__typename"] == "LightsparkNodeWithOSK":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
+    return {
+        "GraphNode": GraphNode_from_json,
+        "LightsparkNodeWithOSK": LightsparkNodeWithOSK_from_json,
+        "LightsparkNodeWithRemoteSigning": LightsparkNodeWithRemoteSigning_from_json,
+    }
 
-        return LightsparkNodeWithOSK(
-            requester=requester,
-            typename="LightsparkNodeWithOSK",
-            id=obj["lightspark_node_with_o_s_k_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_o_s_k_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["lightspark_node_with_o_s_k_bitcoin_network"]
-            ),
-            color=obj["lightspark_node_with_o_s_k_color"],
-            conductivity=obj["lightspark_node_with_o_s_k_conductivity"],
-            display_name=obj["lightspark_node_with_o_s_k_display_name"],
-            public_key=obj["lightspark_node_with_o_s_k_public_key"],
-            owner_id=obj["lightspark_node_with_o_s_k_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_o_s_k_status"]
-            ),
-            total_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_total_balance"]
-                )
-                if obj["lightspark_node_with_o_s_k_total_balance"]
-                else None
-            ),
-            total_local_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_total_local_balance"]
-                )
-                if obj["lightspark_node_with_o_s_k_total_local_balance"]
-                else None
-            ),
-            local_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_local_balance"]
-                )
-                if obj["lightspark_node_with_o_s_k_local_balance"]
-                else None
-            ),
-            remote_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_remote_balance"]
-                )
-                if obj["lightspark_node_with_o_s_k_remote_balance"]
-                else None
-            ),
-            blockchain_balance=(
-                BlockchainBalance_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_blockchain_balance"]
-                )
-                if obj["lightspark_node_with_o_s_k_blockchain_balance"]
-                else None
-            ),
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_o_s_k_uma_prescreening_utxos"
-            ],
-            balances=(
-                Balances_from_json(
-                    requester, obj["lightspark_node_with_o_s_k_balances"]
-                )
-                if obj["lightspark_node_with_o_s_k_balances"]
-                else None
-            ),
-            encrypted_signing_private_key=(
-                Secret_from_json(
-                    requester,
-                    obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"],
-                )
-                if obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"]
-                else None
-            ),
-        )
-    if obj["__typename"] == "LightsparkNodeWithRemoteSigning":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithRemoteSigning import (
-            LightsparkNodeWithRemoteSigning,
-        )
 
-        return LightsparkNodeWithRemoteSigning(
-            requester=requester,
-            typename="LightsparkNodeWithRemoteSigning",
-            id=obj["lightspark_node_with_remote_signing_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_remote_signing_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork,
-                obj["lightspark_node_with_remote_signing_bitcoin_network"],
-            ),
-            color=obj["lightspark_node_with_remote_signing_color"],
-            conductivity=obj["lightspark_node_with_remote_signing_conductivity"],
-            display_name=obj["lightspark_node_with_remote_signing_display_name"],
-            public_key=obj["lightspark_node_with_remote_signing_public_key"],
-            owner_id=obj["lightspark_node_with_remote_signing_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_remote_signing_status"]
-            ),
-            total_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_remote_signing_total_balance"]
-                )
-                if obj["lightspark_node_with_remote_signing_total_balance"]
-                else None
-            ),
-            total_local_balance=(
-                CurrencyAmount_from_json(
-                    requester,
-                    obj["lightspark_node_with_remote_signing_total_local_balance"],
-                )
-                if obj["lightspark_node_with_remote_signing_total_local_balance"]
-                else None
-            ),
-            local_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_remote_signing_local_balance"]
-                )
-                if obj["lightspark_node_with_remote_signing_local_balance"]
-                else None
-            ),
-            remote_balance=(
-                CurrencyAmount_from_json(
-                    requester, obj["lightspark_node_with_remote_signing_remote_balance"]
-                )
-                if obj["lightspark_node_with_remote_signing_remote_balance"]
-                else None
-            ),
-            blockchain_balance=(
-                BlockchainBalance_from_json(
-                    requester,
-                    obj["lightspark_node_with_remote_signing_blockchain_balance"],
-                )
-                if obj["lightspark_node_with_remote_signing_blockchain_balance"]
-                else None
-            ),
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_remote_signing_uma_prescreening_utxos"
-            ],
-            balances=(
-                Balances_from_json(
-                    requester, obj["lightspark_node_with_remote_signing_balances"]
-                )
-                if obj["lightspark_node_with_remote_signing_balances"]
-                else None
-            ),
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface Node corresponding to the typename={graphql_typename}",
-    )
+_IMPLEMENTATIONS: TypenameDispatch[Node] = TypenameDispatch("Node", _loaders)
+
+
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> Node:
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Node)
+    return _IMPLEMENTATIONS(requester, obj)
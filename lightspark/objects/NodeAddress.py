@@ -5,10 +5,12 @@ from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.slots import with_slots
 
 from .NodeAddressType import NodeAddressType
 
 
+@with_slots
 @dataclass
 class NodeAddress:
     """This object represents the address of a node on the Lightning Network."""
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .NodeAddress import NodeAddress
-from .NodeAddress import from_json as NodeAddress_from_json
 
 
+@with_slots
 @dataclass
 class NodeToAddressesConnection:
     """A connection between a node and the addresses it has announced for itself on Lightning Network."""
@@ -43,17 +45,12 @@ fragment NodeToAddressesConnectionFragment on NodeToAddressesConnection {
 """
 
 
+_DECODER: CompiledDecoder[NodeToAddressesConnection] = CompiledDecoder(
+    NodeToAddressesConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> NodeToAddressesConnection:
-    return NodeToAddressesConnection(
-        requester=requester,
-        count=obj["node_to_addresses_connection_count"],
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: NodeAddress_from_json(requester, e),
-                obj["node_to_addresses_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
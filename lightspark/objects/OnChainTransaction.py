@@ -4,17 +4,18 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class OnChainTransaction(Transaction, Entity):
     """This object represents an L1 transaction that occurred on the Bitcoin Network. You can retrieve this object to receive information about a specific on-chain transaction made on the Lightning Network associated with your Lightspark Node."""
@@ -213,161 +214,31 @@ fragment OnChainTransactionFragment on OnChainTransaction {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> OnChainTransaction:
-    if obj["__typename"] == "ChannelClosingTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelClosingTransaction import (
-            ChannelClosingTransaction,
-        )
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.ChannelClosingTransaction import (
+        from_json as ChannelClosingTransaction_from_json,
+    )
+    from lightspark.objects.ChannelOpeningTransaction import (
+        from_json as ChannelOpeningTransaction_from_json,
+    )
+    from lightspark.objects.Deposit import from_json as Deposit_from_json
+    from lightspark.objects.Withdrawal import from_json as Withdrawal_from_json
+
+    return {
+        "ChannelClosingTransaction": ChannelClosingTransaction_from_json,
+        "ChannelOpeningTransaction": ChannelOpeningTransaction_from_json,
+        "Deposit": Deposit_from_json,
+        "Withdrawal": Withdrawal_from_json,
+    }
 
-        return ChannelClosingTransaction(
-            requester=requester,
-            typename="ChannelClosingTransaction",
-            id=obj["channel_closing_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_closing_transaction_status"]
-            ),
-            resolved_at=(
-                datetime.fromisoformat(obj["channel_closing_transaction_resolved_at"])
-                if obj["channel_closing_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_closing_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_closing_transaction_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(
-                    requester, obj["channel_closing_transaction_fees"]
-                )
-                if obj["channel_closing_transaction_fees"]
-                else None
-            ),
-            block_hash=obj["channel_closing_transaction_block_hash"],
-            block_height=obj["channel_closing_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_closing_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_closing_transaction_num_confirmations"],
-            channel_id=(
-                obj["channel_closing_transaction_channel"]["id"]
-                if obj["channel_closing_transaction_channel"]
-                else None
-            ),
-        )
-    if obj["__typename"] == "ChannelOpeningTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelOpeningTransaction import (
-            ChannelOpeningTransaction,
-        )
 
-        return ChannelOpeningTransaction(
-            requester=requester,
-            typename="ChannelOpeningTransaction",
-            id=obj["channel_opening_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_opening_transaction_status"]
-            ),
-            resolved_at=(
-                datetime.fromisoformat(obj["channel_opening_transaction_resolved_at"])
-                if obj["channel_opening_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_opening_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_opening_transaction_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(
-                    requester, obj["channel_opening_transaction_fees"]
-                )
-                if obj["channel_opening_transaction_fees"]
-                else None
-            ),
-            block_hash=obj["channel_opening_transaction_block_hash"],
-            block_height=obj["channel_opening_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_opening_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_opening_transaction_num_confirmations"],
-            channel_id=(
-                obj["channel_opening_transaction_channel"]["id"]
-                if obj["channel_opening_transaction_channel"]
-                else None
-            ),
-        )
-    if obj["__typename"] == "Deposit":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Deposit import Deposit
+_IMPLEMENTATIONS: TypenameDispatch[OnChainTransaction] = TypenameDispatch(
+    "OnChainTransaction", _loaders
+)
 
-        return Deposit(
-            requester=requester,
-            typename="Deposit",
-            id=obj["deposit_id"],
-            created_at=datetime.fromisoformat(obj["deposit_created_at"]),
-            updated_at=datetime.fromisoformat(obj["deposit_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["deposit_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["deposit_resolved_at"])
-                if obj["deposit_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["deposit_amount"]),
-            transaction_hash=obj["deposit_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(requester, obj["deposit_fees"])
-                if obj["deposit_fees"]
-                else None
-            ),
-            block_hash=obj["deposit_block_hash"],
-            block_height=obj["deposit_block_height"],
-            destination_addresses=obj["deposit_destination_addresses"],
-            num_confirmations=obj["deposit_num_confirmations"],
-            destination_id=obj["deposit_destination"]["id"],
-        )
-    if obj["__typename"] == "Withdrawal":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Withdrawal import Withdrawal
 
-        return Withdrawal(
-            requester=requester,
-            typename="Withdrawal",
-            id=obj["withdrawal_id"],
-            created_at=datetime.fromisoformat(obj["withdrawal_created_at"]),
-            updated_at=datetime.fromisoformat(obj["withdrawal_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["withdrawal_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["withdrawal_resolved_at"])
-                if obj["withdrawal_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["withdrawal_amount"]),
-            transaction_hash=obj["withdrawal_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(requester, obj["withdrawal_fees"])
-                if obj["withdrawal_fees"]
-                else None
-            ),
-            block_hash=obj["withdrawal_block_hash"],
-            block_height=obj["withdrawal_block_height"],
-            destination_addresses=obj["withdrawal_destination_addresses"],
-            num_confirmations=obj["withdrawal_num_confirmations"],
-            origin_id=obj["withdrawal_origin"]["id"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface OnChainTransaction corresponding to the typename={graphql_typename}",
-    )
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> OnChainTransaction:
+    if decoding_lazily():
+        return decode_lazily(requester, obj, OnChainTransaction)
+    return _IMPLEMENTATIONS(requester, obj)
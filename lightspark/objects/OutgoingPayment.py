@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningTransaction import LightningTransaction
 from .OutgoingPaymentToAttemptsConnection import OutgoingPaymentToAttemptsConnection
@@ -17,15 +19,13 @@ from .OutgoingPaymentToAttemptsConnection import (
 )
 from .PaymentFailureReason import PaymentFailureReason
 from .PaymentRequestData import PaymentRequestData
-from .PaymentRequestData import from_json as PaymentRequestData_from_json
 from .PostTransactionData import PostTransactionData
-from .PostTransactionData import from_json as PostTransactionData_from_json
 from .RichText import RichText
-from .RichText import from_json as RichText_from_json
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class OutgoingPayment(LightningTransaction, Transaction, Entity):
     """This object represents a Lightning Network payment sent from a Lightspark Node. You can retrieve this object to receive payment related information about any payment sent from your Lightspark Node on the Lightning Network."""
@@ -87,11 +87,69 @@ class OutgoingPayment(LightningTransaction, Transaction, Entity):
     """The idempotency key of the payment."""
     typename: str
 
+    @records_construction
     def get_attempts(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> OutgoingPaymentToAttemptsConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_OUTGOING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["attempts"]
+        return OutgoingPaymentToAttemptsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_attempts_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> OutgoingPaymentToAttemptsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_OUTGOING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["attempts"]
+        return OutgoingPaymentToAttemptsConnection_from_json(self.requester, connection)
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "OutgoingPayment",
+            "outgoing_payment_id": self.id,
+            "outgoing_payment_created_at": self.created_at.isoformat(),
+            "outgoing_payment_updated_at": self.updated_at.isoformat(),
+            "outgoing_payment_status": self.status.value,
+            "outgoing_payment_resolved_at": (
+                self.resolved_at.isoformat() if self.resolved_at else None
+            ),
+            "outgoing_payment_amount": self.amount.to_json(),
+            "outgoing_payment_transaction_hash": self.transaction_hash,
+            "outgoing_payment_is_uma": self.is_uma,
+            "outgoing_payment_origin": {"id": self.origin_id},
+            "outgoing_payment_destination": (
+                {"id": self.destination_id} if self.destination_id else None
+            ),
+            "outgoing_payment_fees": self.fees.to_json() if self.fees else None,
+            "outgoing_payment_payment_request_data": (
+                self.payment_request_data.to_json()
+                if self.payment_request_data
+                else None
+            ),
+            "outgoing_payment_failure_reason": (
+                self.failure_reason.value if self.failure_reason else None
+            ),
+            "outgoing_payment_failure_message": (
+                self.failure_message.to_json() if self.failure_message else None
+            ),
+            "outgoing_payment_uma_post_transaction_data": (
+                [e.to_json() for e in self.uma_post_transaction_data]
+                if self.uma_post_transaction_data
+                else None
+            ),
+            "outgoing_payment_payment_preimage": self.payment_preimage,
+            "outgoing_payment_is_internal_payment": self.is_internal_payment,
+            "outgoing_payment_idempotency_key": self.idempotency_key,
+        }
+
+
+FETCH_OUTGOING_PAYMENT_TO_ATTEMPTS_CONNECTION_QUERY = """
 query FetchOutgoingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on OutgoingPayment {
@@ -142,50 +200,7 @@ query FetchOutgoingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $af
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "after": after},
-        )
-        connection = json["entity"]["attempts"]
-        return OutgoingPaymentToAttemptsConnection_from_json(self.requester, connection)
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "OutgoingPayment",
-            "outgoing_payment_id": self.id,
-            "outgoing_payment_created_at": self.created_at.isoformat(),
-            "outgoing_payment_updated_at": self.updated_at.isoformat(),
-            "outgoing_payment_status": self.status.value,
-            "outgoing_payment_resolved_at": (
-                self.resolved_at.isoformat() if self.resolved_at else None
-            ),
-            "outgoing_payment_amount": self.amount.to_json(),
-            "outgoing_payment_transaction_hash": self.transaction_hash,
-            "outgoing_payment_is_uma": self.is_uma,
-            "outgoing_payment_origin": {"id": self.origin_id},
-            "outgoing_payment_destination": (
-                {"id": self.destination_id} if self.destination_id else None
-            ),
-            "outgoing_payment_fees": self.fees.to_json() if self.fees else None,
-            "outgoing_payment_payment_request_data": (
-                self.payment_request_data.to_json()
-                if self.payment_request_data
-                else None
-            ),
-            "outgoing_payment_failure_reason": (
-                self.failure_reason.value if self.failure_reason else None
-            ),
-            "outgoing_payment_failure_message": (
-                self.failure_message.to_json() if self.failure_message else None
-            ),
-            "outgoing_payment_uma_post_transaction_data": (
-                [e.to_json() for e in self.uma_post_transaction_data]
-                if self.uma_post_transaction_data
-                else None
-            ),
-            "outgoing_payment_payment_preimage": self.payment_preimage,
-            "outgoing_payment_is_internal_payment": self.is_internal_payment,
-            "outgoing_payment_idempotency_key": self.idempotency_key,
-        }
+"""
 
 
 FRAGMENT = """
@@ -538,60 +553,10 @@ fragment OutgoingPaymentFragment on OutgoingPayment {
 """
 
 
+_DECODER: CompiledDecoder[OutgoingPayment] = CompiledDecoder(OutgoingPayment)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> OutgoingPayment:
-    return OutgoingPayment(
-        requester=requester,
-        typename="OutgoingPayment",
-        id=obj["outgoing_payment_id"],
-        created_at=datetime.fromisoformat(obj["outgoing_payment_created_at"]),
-        updated_at=datetime.fromisoformat(obj["outgoing_payment_updated_at"]),
-        status=parse_enum(TransactionStatus, obj["outgoing_payment_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["outgoing_payment_resolved_at"])
-            if obj["outgoing_payment_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["outgoing_payment_amount"]),
-        transaction_hash=obj["outgoing_payment_transaction_hash"],
-        is_uma=obj["outgoing_payment_is_uma"],
-        origin_id=obj["outgoing_payment_origin"]["id"],
-        destination_id=(
-            obj["outgoing_payment_destination"]["id"]
-            if obj["outgoing_payment_destination"]
-            else None
-        ),
-        fees=(
-            CurrencyAmount_from_json(requester, obj["outgoing_payment_fees"])
-            if obj["outgoing_payment_fees"]
-            else None
-        ),
-        payment_request_data=(
-            PaymentRequestData_from_json(
-                requester, obj["outgoing_payment_payment_request_data"]
-            )
-            if obj["outgoing_payment_payment_request_data"]
-            else None
-        ),
-        failure_reason=parse_enum_optional(
-            PaymentFailureReason, obj["outgoing_payment_failure_reason"]
-        ),
-        failure_message=(
-            RichText_from_json(requester, obj["outgoing_payment_failure_message"])
-            if obj["outgoing_payment_failure_message"]
-            else None
-        ),
-        uma_post_transaction_data=(
-            list(
-                map(
-                    # pylint: disable=unnecessary-lambda
-                    lambda e: PostTransactionData_from_json(requester, e),
-                    obj["outgoing_payment_uma_post_transaction_data"],
-                )
-            )
-            if obj["outgoing_payment_uma_post_transaction_data"]
-            else None
-        ),
-        payment_preimage=obj["outgoing_payment_payment_preimage"],
-        is_internal_payment=obj["outgoing_payment_is_internal_payment"],
-        idempotency_key=obj["outgoing_payment_idempotency_key"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, OutgoingPayment)
+    return _DECODER(requester, obj)
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .HtlcAttemptFailureCode import HtlcAttemptFailureCode
 from .OutgoingPaymentAttemptStatus import OutgoingPaymentAttemptStatus
@@ -20,6 +22,7 @@ from .OutgoingPaymentAttemptToHopsConnection import (
 )
 
 
+@with_slots
 @dataclass
 class OutgoingPaymentAttempt(Entity):
     """This object represents an attempted Lightning Network payment sent from a Lightspark Node. You can retrieve this object to receive payment related information about any payment attempt sent from your Lightspark Node on the Lightning Network, including any potential reasons the payment may have failed."""
@@ -63,11 +66,61 @@ class OutgoingPaymentAttempt(Entity):
     """The channel snapshot at the time the outgoing payment attempt was made."""
     typename: str
 
+    @records_construction
     def get_hops(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> OutgoingPaymentAttemptToHopsConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_OUTGOING_PAYMENT_ATTEMPT_TO_HOPS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["hops"]
+        return OutgoingPaymentAttemptToHopsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_hops_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> OutgoingPaymentAttemptToHopsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_OUTGOING_PAYMENT_ATTEMPT_TO_HOPS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["hops"]
+        return OutgoingPaymentAttemptToHopsConnection_from_json(
+            self.requester, connection
+        )
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "OutgoingPaymentAttempt",
+            "outgoing_payment_attempt_id": self.id,
+            "outgoing_payment_attempt_created_at": self.created_at.isoformat(),
+            "outgoing_payment_attempt_updated_at": self.updated_at.isoformat(),
+            "outgoing_payment_attempt_status": self.status.value,
+            "outgoing_payment_attempt_failure_code": (
+                self.failure_code.value if self.failure_code else None
+            ),
+            "outgoing_payment_attempt_failure_source_index": self.failure_source_index,
+            "outgoing_payment_attempt_attempted_at": self.attempted_at.isoformat(),
+            "outgoing_payment_attempt_resolved_at": (
+                self.resolved_at.isoformat() if self.resolved_at else None
+            ),
+            "outgoing_payment_attempt_amount": (
+                self.amount.to_json() if self.amount else None
+            ),
+            "outgoing_payment_attempt_fees": self.fees.to_json() if self.fees else None,
+            "outgoing_payment_attempt_outgoing_payment": {
+                "id": self.outgoing_payment_id
+            },
+            "outgoing_payment_attempt_channel_snapshot": (
+                {"id": self.channel_snapshot_id} if self.channel_snapshot_id else None
+            ),
+        }
+
+
+FETCH_OUTGOING_PAYMENT_ATTEMPT_TO_HOPS_CONNECTION_QUERY = """
 query FetchOutgoingPaymentAttemptToHopsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on OutgoingPaymentAttempt {
@@ -113,40 +166,7 @@ query FetchOutgoingPaymentAttemptToHopsConnection($entity_id: ID!, $first: Int,
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "after": after},
-        )
-        connection = json["entity"]["hops"]
-        return OutgoingPaymentAttemptToHopsConnection_from_json(
-            self.requester, connection
-        )
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "OutgoingPaymentAttempt",
-            "outgoing_payment_attempt_id": self.id,
-            "outgoing_payment_attempt_created_at": self.created_at.isoformat(),
-            "outgoing_payment_attempt_updated_at": self.updated_at.isoformat(),
-            "outgoing_payment_attempt_status": self.status.value,
-            "outgoing_payment_attempt_failure_code": (
-                self.failure_code.value if self.failure_code else None
-            ),
-            "outgoing_payment_attempt_failure_source_index": self.failure_source_index,
-            "outgoing_payment_attempt_attempted_at": self.attempted_at.isoformat(),
-            "outgoing_payment_attempt_resolved_at": (
-                self.resolved_at.isoformat() if self.resolved_at else None
-            ),
-            "outgoing_payment_attempt_amount": (
-                self.amount.to_json() if self.amount else None
-            ),
-            "outgoing_payment_attempt_fees": self.fees.to_json() if self.fees else None,
-            "outgoing_payment_attempt_outgoing_payment": {
-                "id": self.outgoing_payment_id
-            },
-            "outgoing_payment_attempt_channel_snapshot": (
-                {"id": self.channel_snapshot_id} if self.channel_snapshot_id else None
-            ),
-        }
+"""
 
 
 FRAGMENT = """
@@ -186,42 +206,12 @@ fragment OutgoingPaymentAttemptFragment on OutgoingPaymentAttempt {
 """
 
 
+_DECODER: CompiledDecoder[OutgoingPaymentAttempt] = CompiledDecoder(
+    OutgoingPaymentAttempt
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> OutgoingPaymentAttempt:
-    return OutgoingPaymentAttempt(
-        requester=requester,
-        typename="OutgoingPaymentAttempt",
-        id=obj["outgoing_payment_attempt_id"],
-        created_at=datetime.fromisoformat(obj["outgoing_payment_attempt_created_at"]),
-        updated_at=datetime.fromisoformat(obj["outgoing_payment_attempt_updated_at"]),
-        status=parse_enum(
-            OutgoingPaymentAttemptStatus, obj["outgoing_payment_attempt_status"]
-        ),
-        failure_code=parse_enum_optional(
-            HtlcAttemptFailureCode, obj["outgoing_payment_attempt_failure_code"]
-        ),
-        failure_source_index=obj["outgoing_payment_attempt_failure_source_index"],
-        attempted_at=datetime.fromisoformat(
-            obj["outgoing_payment_attempt_attempted_at"]
-        ),
-        resolved_at=(
-            datetime.fromisoformat(obj["outgoing_payment_attempt_resolved_at"])
-            if obj["outgoing_payment_attempt_resolved_at"]
-            else None
-        ),
-        amount=(
-            CurrencyAmount_from_json(requester, obj["outgoing_payment_attempt_amount"])
-            if obj["outgoing_payment_attempt_amount"]
-            else None
-        ),
-        fees=(
-            CurrencyAmount_from_json(requester, obj["outgoing_payment_attempt_fees"])
-            if obj["outgoing_payment_attempt_fees"]
-            else None
-        ),
-        outgoing_payment_id=obj["outgoing_payment_attempt_outgoing_payment"]["id"],
-        channel_snapshot_id=(
-            obj["outgoing_payment_attempt_channel_snapshot"]["id"]
-            if obj["outgoing_payment_attempt_channel_snapshot"]
-            else None
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, OutgoingPaymentAttempt)
+    return _DECODER(requester, obj)
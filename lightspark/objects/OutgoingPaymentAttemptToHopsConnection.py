@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .Hop import Hop
-from .Hop import from_json as Hop_from_json
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class OutgoingPaymentAttemptToHopsConnection(Connection):
     """The connection from an outgoing payment attempt to the list of sequential hops that define the path from sender node to recipient node."""
@@ -57,21 +58,12 @@ fragment OutgoingPaymentAttemptToHopsConnectionFragment on OutgoingPaymentAttemp
 """
 
 
+_DECODER: CompiledDecoder[OutgoingPaymentAttemptToHopsConnection] = CompiledDecoder(
+    OutgoingPaymentAttemptToHopsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> OutgoingPaymentAttemptToHopsConnection:
-    return OutgoingPaymentAttemptToHopsConnection(
-        requester=requester,
-        typename="OutgoingPaymentAttemptToHopsConnection",
-        count=obj["outgoing_payment_attempt_to_hops_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["outgoing_payment_attempt_to_hops_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Hop_from_json(requester, e),
-                obj["outgoing_payment_attempt_to_hops_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
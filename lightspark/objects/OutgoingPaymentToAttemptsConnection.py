@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .OutgoingPaymentAttempt import OutgoingPaymentAttempt
-from .OutgoingPaymentAttempt import from_json as OutgoingPaymentAttempt_from_json
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class OutgoingPaymentToAttemptsConnection(Connection):
     """The connection from outgoing payment to all attempts."""
@@ -57,21 +58,12 @@ fragment OutgoingPaymentToAttemptsConnectionFragment on OutgoingPaymentToAttempt
 """
 
 
+_DECODER: CompiledDecoder[OutgoingPaymentToAttemptsConnection] = CompiledDecoder(
+    OutgoingPaymentToAttemptsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> OutgoingPaymentToAttemptsConnection:
-    return OutgoingPaymentToAttemptsConnection(
-        requester=requester,
-        typename="OutgoingPaymentToAttemptsConnection",
-        count=obj["outgoing_payment_to_attempts_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["outgoing_payment_to_attempts_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: OutgoingPaymentAttempt_from_json(requester, e),
-                obj["outgoing_payment_to_attempts_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -4,10 +4,12 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping, Optional
 
 from lightspark.utils.enums import parse_optional_list_of_enums
+from lightspark.utils.slots import with_slots
 
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class OutgoingPaymentsForInvoiceQueryInput:
     encoded_invoice: str
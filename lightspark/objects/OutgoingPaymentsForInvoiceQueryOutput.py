@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.slots import with_slots
 
 from .OutgoingPayment import OutgoingPayment
 from .OutgoingPayment import from_json as OutgoingPayment_from_json
 
 
+@with_slots
 @dataclass
 class OutgoingPaymentsForInvoiceQueryOutput:
     requester: Requester
@@ -4,17 +4,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
-from .InvoiceData import from_json as InvoiceData_from_json
 from .PaymentRequestData import PaymentRequestData
 from .PaymentRequestStatus import PaymentRequestStatus
 
 
+@with_slots
 @dataclass
 class PaymentRequest(Entity):
     """This object contains information related to a payment request generated or received by a LightsparkNode. You can retrieve this object to receive payment information about a specific invoice."""
@@ -363,29 +363,21 @@ fragment PaymentRequestFragment on PaymentRequest {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequest:
-    if obj["__typename"] == "Invoice":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Invoice import Invoice
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.Invoice import from_json as Invoice_from_json
+
+    return {
+        "Invoice": Invoice_from_json,
+    }
+
 
-        return Invoice(
-            requester=requester,
-            typename="Invoice",
-            id=obj["invoice_id"],
-            created_at=datetime.fromisoformat(obj["invoice_created_at"]),
-            updated_at=datetime.fromisoformat(obj["invoice_updated_at"]),
-            data=InvoiceData_from_json(requester, obj["invoice_data"]),
-            status=parse_enum(PaymentRequestStatus, obj["invoice_status"]),
-            amount_paid=(
-                CurrencyAmount_from_json(requester, obj["invoice_amount_paid"])
-                if obj["invoice_amount_paid"]
-                else None
-            ),
-            is_uma=obj["invoice_is_uma"],
-            is_lnurl=obj["invoice_is_lnurl"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface PaymentRequest corresponding to the typename={graphql_typename}",
-    )
+_IMPLEMENTATIONS: TypenameDispatch[PaymentRequest] = TypenameDispatch(
+    "PaymentRequest", _loaders
+)
+
+
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequest:
+    if decoding_lazily():
+        return decode_lazily(requester, obj, PaymentRequest)
+    return _IMPLEMENTATIONS(requester, obj)
@@ -1,18 +1,16 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.slots import with_slots
 
 from .BitcoinNetwork import BitcoinNetwork
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
-from .Node import from_json as Node_from_json
 
 
+@with_slots
 @dataclass
 class PaymentRequestData:
     """This object is an interface of a payment request on the Lightning Network (i.e., a Lightning Invoice). It contains data related to parsing the payment details of a Lightning Invoice."""
@@ -331,27 +329,19 @@ fragment PaymentRequestDataFragment on PaymentRequestData {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequestData:
-    if obj["__typename"] == "InvoiceData":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.InvoiceData import InvoiceData
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.InvoiceData import from_json as InvoiceData_from_json
+
+    return {
+        "InvoiceData": InvoiceData_from_json,
+    }
+
 
-        return InvoiceData(
-            requester=requester,
-            typename="InvoiceData",
-            encoded_payment_request=obj["invoice_data_encoded_payment_request"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["invoice_data_bitcoin_network"]
-            ),
-            payment_hash=obj["invoice_data_payment_hash"],
-            amount=CurrencyAmount_from_json(requester, obj["invoice_data_amount"]),
-            created_at=datetime.fromisoformat(obj["invoice_data_created_at"]),
-            expires_at=datetime.fromisoformat(obj["invoice_data_expires_at"]),
-            memo=obj["invoice_data_memo"],
-            destination=Node_from_json(requester, obj["invoice_data_destination"]),
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface PaymentRequestData corresponding to the typename={graphql_typename}",
-    )
+_IMPLEMENTATIONS: TypenameDispatch[PaymentRequestData] = TypenameDispatch(
+    "PaymentRequestData", _loaders
+)
+
+
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequestData:
+    return _IMPLEMENTATIONS(requester, obj)
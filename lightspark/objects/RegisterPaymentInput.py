@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.slots import with_slots
 
 from .ComplianceProvider import ComplianceProvider
 from .PaymentDirection import PaymentDirection
 
 
+@with_slots
 @dataclass
 class RegisterPaymentInput:
     provider: ComplianceProvider
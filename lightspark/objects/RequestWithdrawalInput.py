@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Optional
 
 from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.slots import with_slots
 
 from .OnChainFeeTarget import OnChainFeeTarget
 from .WithdrawalMode import WithdrawalMode
 
 
+@with_slots
 @dataclass
 class RequestWithdrawalInput:
     node_id: str
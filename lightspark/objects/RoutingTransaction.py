@@ -5,19 +5,20 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningTransaction import LightningTransaction
 from .RichText import RichText
-from .RichText import from_json as RichText_from_json
 from .RoutingTransactionFailureReason import RoutingTransactionFailureReason
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class RoutingTransaction(LightningTransaction, Transaction, Entity):
     """This object represents a transaction that was forwarded through a Lightspark node on the Lightning Network, i.e., a routed transaction. You can retrieve this object to receive information about any transaction routed through your Lightspark Node."""
@@ -129,42 +130,10 @@ fragment RoutingTransactionFragment on RoutingTransaction {
 """
 
 
+_DECODER: CompiledDecoder[RoutingTransaction] = CompiledDecoder(RoutingTransaction)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> RoutingTransaction:
-    return RoutingTransaction(
-        requester=requester,
-        typename="RoutingTransaction",
-        id=obj["routing_transaction_id"],
-        created_at=datetime.fromisoformat(obj["routing_transaction_created_at"]),
-        updated_at=datetime.fromisoformat(obj["routing_transaction_updated_at"]),
-        status=parse_enum(TransactionStatus, obj["routing_transaction_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["routing_transaction_resolved_at"])
-            if obj["routing_transaction_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["routing_transaction_amount"]),
-        transaction_hash=obj["routing_transaction_transaction_hash"],
-        incoming_channel_id=(
-            obj["routing_transaction_incoming_channel"]["id"]
-            if obj["routing_transaction_incoming_channel"]
-            else None
-        ),
-        outgoing_channel_id=(
-            obj["routing_transaction_outgoing_channel"]["id"]
-            if obj["routing_transaction_outgoing_channel"]
-            else None
-        ),
-        fees=(
-            CurrencyAmount_from_json(requester, obj["routing_transaction_fees"])
-            if obj["routing_transaction_fees"]
-            else None
-        ),
-        failure_message=(
-            RichText_from_json(requester, obj["routing_transaction_failure_message"])
-            if obj["routing_transaction_failure_message"]
-            else None
-        ),
-        failure_reason=parse_enum_optional(
-            RoutingTransactionFailureReason, obj["routing_transaction_failure_reason"]
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, RoutingTransaction)
+    return _DECODER(requester, obj)
@@ -4,10 +4,12 @@ from dataclasses import dataclass
 from typing import Any, Mapping
 
 from lightspark.utils.enums import parse_enum
+from lightspark.utils.slots import with_slots
 
 from .ComplianceProvider import ComplianceProvider
 
 
+@with_slots
 @dataclass
 class ScreenNodeInput:
     provider: ComplianceProvider
@@ -3,10 +3,13 @@
 from dataclasses import dataclass
 from typing import Any, List, Mapping
 
+from lightspark.utils.slots import with_slots
+
 from .IdAndSignature import IdAndSignature
 from .IdAndSignature import from_json as IdAndSignature_from_json
 
 
+@with_slots
 @dataclass
 class SignMessagesInput:
     signatures: List[IdAndSignature]
@@ -5,10 +5,14 @@ from datetime import datetime
 from typing import Any, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Entity import Entity
 
 
+@with_slots
 @dataclass
 class Signable(Entity):
     requester: Requester
@@ -42,11 +46,10 @@ fragment SignableFragment on Signable {
 """
 
 
+_DECODER: CompiledDecoder[Signable] = CompiledDecoder(Signable)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Signable:
-    return Signable(
-        requester=requester,
-        typename="Signable",
-        id=obj["signable_id"],
-        created_at=datetime.fromisoformat(obj["signable_created_at"]),
-        updated_at=datetime.fromisoformat(obj["signable_updated_at"]),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Signable)
+    return _DECODER(requester, obj)
@@ -5,12 +5,15 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Entity import Entity
 from .SignablePayloadStatus import SignablePayloadStatus
 
 
+@with_slots
 @dataclass
 class SignablePayload(Entity):
     requester: Requester
@@ -76,17 +79,10 @@ fragment SignablePayloadFragment on SignablePayload {
 """
 
 
+_DECODER: CompiledDecoder[SignablePayload] = CompiledDecoder(SignablePayload)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> SignablePayload:
-    return SignablePayload(
-        requester=requester,
-        typename="SignablePayload",
-        id=obj["signable_payload_id"],
-        created_at=datetime.fromisoformat(obj["signable_payload_created_at"]),
-        updated_at=datetime.fromisoformat(obj["signable_payload_updated_at"]),
-        payload=obj["signable_payload_payload"],
-        derivation_path=obj["signable_payload_derivation_path"],
-        status=parse_enum(SignablePayloadStatus, obj["signable_payload_status"]),
-        add_tweak=obj["signable_payload_add_tweak"],
-        mul_tweak=obj["signable_payload_mul_tweak"],
-        signable_id=obj["signable_payload_signable"]["id"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, SignablePayload)
+    return _DECODER(requester, obj)
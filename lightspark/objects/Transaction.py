@@ -4,21 +4,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.dispatch import Loader, TypenameDispatch
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
-from .PaymentFailureReason import PaymentFailureReason
-from .PaymentRequestData import from_json as PaymentRequestData_from_json
-from .PostTransactionData import from_json as PostTransactionData_from_json
-from .RichText import from_json as RichText_from_json
-from .RoutingTransactionFailureReason import RoutingTransactionFailureReason
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class Transaction(Entity):
     """This object represents a payment transaction. The transaction can occur either on a Bitcoin Network, or over the Lightning Network. You can retrieve this object to receive specific information about a particular transaction tied to your Lightspark Node."""
@@ -616,307 +612,43 @@ fragment TransactionFragment on Transaction {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> Transaction:
-    # pylint: disable=too-many-return-statements
-    if obj["__typename"] == "ChannelClosingTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelClosingTransaction import (
-            ChannelClosingTransaction,
-        )
-
-        return ChannelClosingTransaction(
-            requester=requester,
-            typename="ChannelClosingTransaction",
-            id=obj["channel_closing_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_closing_transaction_status"]
-            ),
-            resolved_at=(
-                datetime.fromisoformat(obj["channel_closing_transaction_resolved_at"])
-                if obj["channel_closing_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_closing_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_closing_transaction_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(
-                    requester, obj["channel_closing_transaction_fees"]
-                )
-                if obj["channel_closing_transaction_fees"]
-                else None
-            ),
-            block_hash=obj["channel_closing_transaction_block_hash"],
-            block_height=obj["channel_closing_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_closing_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_closing_transaction_num_confirmations"],
-            channel_id=(
-                obj["channel_closing_transaction_channel"]["id"]
-                if obj["channel_closing_transaction_channel"]
-                else None
-            ),
-        )
-    if obj["__typename"] == "ChannelOpeningTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelOpeningTransaction import (
-            ChannelOpeningTransaction,
-        )
-
-        return ChannelOpeningTransaction(
-            requester=requester,
-            typename="ChannelOpeningTransaction",
-            id=obj["channel_opening_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_opening_transaction_status"]
-            ),
-            resolved_at=(
-                datetime.fromisoformat(obj["channel_opening_transaction_resolved_at"])
-                if obj["channel_opening_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_opening_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_opening_transaction_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(
-                    requester, obj["channel_opening_transaction_fees"]
-                )
-                if obj["channel_opening_transaction_fees"]
-                else None
-            ),
-            block_hash=obj["channel_opening_transaction_block_hash"],
-            block_height=obj["channel_opening_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_opening_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_opening_transaction_num_confirmations"],
-            channel_id=(
-                obj["channel_opening_transaction_channel"]["id"]
-                if obj["channel_opening_transaction_channel"]
-                else None
-            ),
-        )
-    if obj["__typename"] == "Deposit":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Deposit import Deposit
+def _loaders() -> Mapping[str, Loader]:
+    # pylint: disable=import-outside-toplevel
+    from lightspark.objects.ChannelClosingTransaction import (
+        from_json as ChannelClosingTransaction_from_json,
+    )
+    from lightspark.objects.ChannelOpeningTransaction import (
+        from_json as ChannelOpeningTransaction_from_json,
+    )
+    from lightspark.objects.Deposit import from_json as Deposit_from_json
+    from lightspark.objects.IncomingPayment import (
+        from_json as IncomingPayment_from_json,
+    )
+    from lightspark.objects.OutgoingPayment import (
+        from_json as OutgoingPayment_from_json,
+    )
+    from lightspark.objects.RoutingTransaction import (
+        from_json as RoutingTransaction_from_json,
+    )
+    from lightspark.objects.Withdrawal import from_json as Withdrawal_from_json
 
-        return Deposit(
-            requester=requester,
-            typename="Deposit",
-            id=obj["deposit_id"],
-            created_at=datetime.fromisoformat(obj["deposit_created_at"]),
-            updated_at=datetime.fromisoformat(obj["deposit_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["deposit_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["deposit_resolved_at"])
-                if obj["deposit_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["deposit_amount"]),
-            transaction_hash=obj["deposit_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(requester, obj["deposit_fees"])
-                if obj["deposit_fees"]
-                else None
-            ),
-            block_hash=obj["deposit_block_hash"],
-            block_height=obj["deposit_block_height"],
-            destination_addresses=obj["deposit_destination_addresses"],
-            num_confirmations=obj["deposit_num_confirmations"],
-            destination_id=obj["deposit_destination"]["id"],
-        )
-    if obj["__typename"] == "IncomingPayment":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.IncomingPayment import IncomingPayment
+    return {
+        "ChannelClosingTransaction": ChannelClosingTransaction_from_json,
+        "ChannelOpeningTransaction": ChannelOpeningTransaction_from_json,
+        "Deposit": Deposit_from_json,
+        "IncomingPayment": IncomingPayment_from_json,
+        "OutgoingPayment": OutgoingPayment_from_json,
+        "RoutingTransaction": RoutingTransaction_from_json,
+        "Withdrawal": Withdrawal_from_json,
+    }
 
-        return IncomingPayment(
-            requester=requester,
-            typename="IncomingPayment",
-            id=obj["incoming_payment_id"],
-            created_at=datetime.fromisoformat(obj["incoming_payment_created_at"]),
-            updated_at=datetime.fromisoformat(obj["incoming_payment_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["incoming_payment_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["incoming_payment_resolved_at"])
-                if obj["incoming_payment_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["incoming_payment_amount"]),
-            transaction_hash=obj["incoming_payment_transaction_hash"],
-            is_uma=obj["incoming_payment_is_uma"],
-            destination_id=obj["incoming_payment_destination"]["id"],
-            payment_request_id=(
-                obj["incoming_payment_payment_request"]["id"]
-                if obj["incoming_payment_payment_request"]
-                else None
-            ),
-            uma_post_transaction_data=(
-                list(
-                    map(
-                        # pylint: disable=unnecessary-lambda
-                        lambda e: PostTransactionData_from_json(requester, e),
-                        obj["incoming_payment_uma_post_transaction_data"],
-                    )
-                )
-                if obj["incoming_payment_uma_post_transaction_data"]
-                else None
-            ),
-            is_internal_payment=obj["incoming_payment_is_internal_payment"],
-        )
-    if obj["__typename"] == "OutgoingPayment":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.OutgoingPayment import OutgoingPayment
 
-        return OutgoingPayment(
-            requester=requester,
-            typename="OutgoingPayment",
-            id=obj["outgoing_payment_id"],
-            created_at=datetime.fromisoformat(obj["outgoing_payment_created_at"]),
-            updated_at=datetime.fromisoformat(obj["outgoing_payment_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["outgoing_payment_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["outgoing_payment_resolved_at"])
-                if obj["outgoing_payment_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["outgoing_payment_amount"]),
-            transaction_hash=obj["outgoing_payment_transaction_hash"],
-            is_uma=obj["outgoing_payment_is_uma"],
-            origin_id=obj["outgoing_payment_origin"]["id"],
-            destination_id=(
-                obj["outgoing_payment_destination"]["id"]
-                if obj["outgoing_payment_destination"]
-                else None
-            ),
-            fees=(
-                CurrencyAmount_from_json(requester, obj["outgoing_payment_fees"])
-                if obj["outgoing_payment_fees"]
-                else None
-            ),
-            payment_request_data=(
-                PaymentRequestData_from_json(
-                    requester, obj["outgoing_payment_payment_request_data"]
-                )
-                if obj["outgoing_payment_payment_request_data"]
-                else None
-            ),
-            failure_reason=parse_enum_optional(
-                PaymentFailureReason, obj["outgoing_payment_failure_reason"]
-            ),
-            failure_message=(
-                RichText_from_json(requester, obj["outgoing_payment_failure_message"])
-                if obj["outgoing_payment_failure_message"]
-                else None
-            ),
-            uma_post_transaction_data=(
-                list(
-                    map(
-                        # pylint: disable=unnecessary-lambda
-                        lambda e: PostTransactionData_from_json(requester, e),
-                        obj["outgoing_payment_uma_post_transaction_data"],
-                    )
-                )
-                if obj["outgoing_payment_uma_post_transaction_data"]
-                else None
-            ),
-            payment_preimage=obj["outgoing_payment_payment_preimage"],
-            is_internal_payment=obj["outgoing_payment_is_internal_payment"],
-            idempotency_key=obj["outgoing_payment_idempotency_key"],
-        )
-    if obj["__typename"] == "RoutingTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.RoutingTransaction import RoutingTransaction
+_IMPLEMENTATIONS: TypenameDispatch[Transaction] = TypenameDispatch(
+    "Transaction", _loaders
+)
 
-        return RoutingTransaction(
-            requester=requester,
-            typename="RoutingTransaction",
-            id=obj["routing_transaction_id"],
-            created_at=datetime.fromisoformat(obj["routing_transaction_created_at"]),
-            updated_at=datetime.fromisoformat(obj["routing_transaction_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["routing_transaction_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["routing_transaction_resolved_at"])
-                if obj["routing_transaction_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(
-                requester, obj["routing_transaction_amount"]
-            ),
-            transaction_hash=obj["routing_transaction_transaction_hash"],
-            incoming_channel_id=(
-                obj["routing_transaction_incoming_channel"]["id"]
-                if obj["routing_transaction_incoming_channel"]
-                else None
-            ),
-            outgoing_channel_id=(
-                obj["routing_transaction_outgoing_channel"]["id"]
-                if obj["routing_transaction_outgoing_channel"]
-                else None
-            ),
-            fees=(
-                CurrencyAmount_from_json(requester, obj["routing_transaction_fees"])
-                if obj["routing_transaction_fees"]
-                else None
-            ),
-            failure_message=(
-                RichText_from_json(
-                    requester, obj["routing_transaction_failure_message"]
-                )
-                if obj["routing_transaction_failure_message"]
-                else None
-            ),
-            failure_reason=parse_enum_optional(
-                RoutingTransactionFailureReason,
-                obj["routing_transaction_failure_reason"],
-            ),
-        )
-    if obj["__typename"] == "Withdrawal":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Withdrawal import Withdrawal
 
-        return Withdrawal(
-            requester=requester,
-            typename="Withdrawal",
-            id=obj["withdrawal_id"],
-            created_at=datetime.fromisoformat(obj["withdrawal_created_at"]),
-            updated_at=datetime.fromisoformat(obj["withdrawal_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["withdrawal_status"]),
-            resolved_at=(
-                datetime.fromisoformat(obj["withdrawal_resolved_at"])
-                if obj["withdrawal_resolved_at"]
-                else None
-            ),
-            amount=CurrencyAmount_from_json(requester, obj["withdrawal_amount"]),
-            transaction_hash=obj["withdrawal_transaction_hash"],
-            fees=(
-                CurrencyAmount_from_json(requester, obj["withdrawal_fees"])
-                if obj["withdrawal_fees"]
-                else None
-            ),
-            block_hash=obj["withdrawal_block_hash"],
-            block_height=obj["withdrawal_block_height"],
-            destination_addresses=obj["withdrawal_destination_addresses"],
-            num_confirmations=obj["withdrawal_num_confirmations"],
-            origin_id=obj["withdrawal_origin"]["id"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface Transaction corresponding to the typename={graphql_typename}",
-    )
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> Transaction:
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Transaction)
+    return _IMPLEMENTATIONS(requester, obj)
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping, Optional
 
 from lightspark.utils.enums import parse_optional_list_of_enums
+from lightspark.utils.slots import with_slots
 
 from .PaymentFailureReason import PaymentFailureReason
 from .RoutingTransactionFailureReason import RoutingTransactionFailureReason
 
 
+@with_slots
 @dataclass
 class TransactionFailures:
     """This object represents payment failures associated with your Lightspark Node."""
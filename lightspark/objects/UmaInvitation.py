@@ -5,13 +5,16 @@ from datetime import datetime
 from typing import Any, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Entity import Entity
 from .IncentivesIneligibilityReason import IncentivesIneligibilityReason
 from .IncentivesStatus import IncentivesStatus
 
 
+@with_slots
 @dataclass
 class UmaInvitation(Entity):
     """This is an object representing an UMA.ME invitation."""
@@ -81,22 +84,10 @@ fragment UmaInvitationFragment on UmaInvitation {
 """
 
 
+_DECODER: CompiledDecoder[UmaInvitation] = CompiledDecoder(UmaInvitation)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> UmaInvitation:
-    return UmaInvitation(
-        requester=requester,
-        typename="UmaInvitation",
-        id=obj["uma_invitation_id"],
-        created_at=datetime.fromisoformat(obj["uma_invitation_created_at"]),
-        updated_at=datetime.fromisoformat(obj["uma_invitation_updated_at"]),
-        code=obj["uma_invitation_code"],
-        url=obj["uma_invitation_url"],
-        inviter_uma=obj["uma_invitation_inviter_uma"],
-        invitee_uma=obj["uma_invitation_invitee_uma"],
-        incentives_status=parse_enum(
-            IncentivesStatus, obj["uma_invitation_incentives_status"]
-        ),
-        incentives_ineligibility_reason=parse_enum_optional(
-            IncentivesIneligibilityReason,
-            obj["uma_invitation_incentives_ineligibility_reason"],
-        ),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, UmaInvitation)
+    return _DECODER(requester, obj)
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .Balances import Balances
-from .Balances import from_json as Balances_from_json
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
@@ -31,6 +33,7 @@ from .WalletToWithdrawalRequestsConnection import (
 from .WithdrawalRequestStatus import WithdrawalRequestStatus
 
 
+@with_slots
 @dataclass
 class Wallet(LightsparkNodeOwner, Entity):
     """This object represents a Lightspark Wallet, tied to your Lightspark account. Wallets can be used to send or receive funds over the Lightning Network. You can retrieve this object to receive information about a specific wallet tied to your Lightspark account."""
@@ -62,6 +65,7 @@ class Wallet(LightsparkNodeOwner, Entity):
     """The status of this wallet."""
     typename: str
 
+    @records_construction
     def get_transactions(
         self,
         first: Optional[int] = None,
@@ -72,7 +76,223 @@ class Wallet(LightsparkNodeOwner, Entity):
         types: Optional[List[TransactionType]] = None,
     ) -> WalletToTransactionsConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_WALLET_TO_TRANSACTIONS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+                "statuses": statuses,
+                "types": types,
+            },
+        )
+        connection = json["entity"]["transactions"]
+        return WalletToTransactionsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_transactions_async(
+        self,
+        *,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        types: Optional[List[TransactionType]] = None,
+    ) -> WalletToTransactionsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WALLET_TO_TRANSACTIONS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+                "statuses": statuses,
+                "types": types,
+            },
+        )
+        connection = json["entity"]["transactions"]
+        return WalletToTransactionsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_payment_requests(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToPaymentRequestsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_WALLET_TO_PAYMENT_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["payment_requests"]
+        return WalletToPaymentRequestsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_payment_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToPaymentRequestsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WALLET_TO_PAYMENT_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["payment_requests"]
+        return WalletToPaymentRequestsConnection_from_json(self.requester, connection)
+
+    @records_construction
+    def get_total_amount_received(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        json = self.requester.execute_graphql(
+            FETCH_WALLET_TOTAL_AMOUNT_RECEIVED_QUERY,
+            {
+                "entity_id": self.id,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["total_amount_received"]
+        return CurrencyAmount_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_total_amount_received_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WALLET_TOTAL_AMOUNT_RECEIVED_QUERY,
+            {
+                "entity_id": self.id,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["total_amount_received"]
+        return CurrencyAmount_from_json(self.requester, connection)
+
+    @records_construction
+    def get_withdrawal_requests(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToWithdrawalRequestsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_WALLET_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "statuses": statuses,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["withdrawal_requests"]
+        return WalletToWithdrawalRequestsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_withdrawal_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToWithdrawalRequestsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WALLET_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY,
+            {
+                "entity_id": self.id,
+                "first": first,
+                "after": after,
+                "statuses": statuses,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["withdrawal_requests"]
+        return WalletToWithdrawalRequestsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    def get_total_amount_sent(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        json = self.requester.execute_graphql(
+            FETCH_WALLET_TOTAL_AMOUNT_SENT_QUERY,
+            {
+                "entity_id": self.id,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["total_amount_sent"]
+        return CurrencyAmount_from_json(self.requester, connection)
+
+    @records_construction
+    async def get_total_amount_sent_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WALLET_TOTAL_AMOUNT_SENT_QUERY,
+            {
+                "entity_id": self.id,
+                "created_after_date": created_after_date,
+                "created_before_date": created_before_date,
+            },
+        )
+        connection = json["entity"]["total_amount_sent"]
+        return CurrencyAmount_from_json(self.requester, connection)
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "Wallet",
+            "wallet_id": self.id,
+            "wallet_created_at": self.created_at.isoformat(),
+            "wallet_updated_at": self.updated_at.isoformat(),
+            "wallet_last_login_at": (
+                self.last_login_at.isoformat() if self.last_login_at else None
+            ),
+            "wallet_balances": self.balances.to_json() if self.balances else None,
+            "wallet_third_party_identifier": self.third_party_identifier,
+            "wallet_account": {"id": self.account_id} if self.account_id else None,
+            "wallet_status": self.status.value,
+        }
+
+
+FETCH_WALLET_TO_TRANSACTIONS_CONNECTION_QUERY = """
 query FetchWalletToTransactionsConnection($entity_id: ID!, $first: Int, $after: ID, $created_after_date: DateTime, $created_before_date: DateTime, $statuses: [TransactionStatus!], $types: [TransactionType!]) {
     entity(id: $entity_id) {
         ... on Wallet {
@@ -640,29 +860,10 @@ query FetchWalletToTransactionsConnection($entity_id: ID!, $first: Int, $after:
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "created_after_date": created_after_date,
-                "created_before_date": created_before_date,
-                "statuses": statuses,
-                "types": types,
-            },
-        )
-        connection = json["entity"]["transactions"]
-        return WalletToTransactionsConnection_from_json(self.requester, connection)
+"""
 
-    def get_payment_requests(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        created_after_date: Optional[datetime] = None,
-        created_before_date: Optional[datetime] = None,
-    ) -> WalletToPaymentRequestsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WALLET_TO_PAYMENT_REQUESTS_CONNECTION_QUERY = """
 query FetchWalletToPaymentRequestsConnection($entity_id: ID!, $first: Int, $after: ID, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
         ... on Wallet {
@@ -991,25 +1192,10 @@ query FetchWalletToPaymentRequestsConnection($entity_id: ID!, $first: Int, $afte
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "created_after_date": created_after_date,
-                "created_before_date": created_before_date,
-            },
-        )
-        connection = json["entity"]["payment_requests"]
-        return WalletToPaymentRequestsConnection_from_json(self.requester, connection)
+"""
 
-    def get_total_amount_received(
-        self,
-        created_after_date: Optional[datetime] = None,
-        created_before_date: Optional[datetime] = None,
-    ) -> CurrencyAmount:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WALLET_TOTAL_AMOUNT_RECEIVED_QUERY = """
 query FetchWalletTotalAmountReceived($entity_id: ID!, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
         ... on Wallet {
@@ -1024,26 +1210,10 @@ query FetchWalletTotalAmountReceived($entity_id: ID!, $created_after_date: DateT
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "created_after_date": created_after_date,
-                "created_before_date": created_before_date,
-            },
-        )
-        connection = json["entity"]["total_amount_received"]
-        return CurrencyAmount_from_json(self.requester, connection)
+"""
 
-    def get_withdrawal_requests(
-        self,
-        first: Optional[int] = None,
-        after: Optional[str] = None,
-        statuses: Optional[List[WithdrawalRequestStatus]] = None,
-        created_after_date: Optional[datetime] = None,
-        created_before_date: Optional[datetime] = None,
-    ) -> WalletToWithdrawalRequestsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WALLET_TO_WITHDRAWAL_REQUESTS_CONNECTION_QUERY = """
 query FetchWalletToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $after: ID, $statuses: [WithdrawalRequestStatus!], $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
         ... on Wallet {
@@ -1116,28 +1286,10 @@ query FetchWalletToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $a
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "first": first,
-                "after": after,
-                "statuses": statuses,
-                "created_after_date": created_after_date,
-                "created_before_date": created_before_date,
-            },
-        )
-        connection = json["entity"]["withdrawal_requests"]
-        return WalletToWithdrawalRequestsConnection_from_json(
-            self.requester, connection
-        )
+"""
 
-    def get_total_amount_sent(
-        self,
-        created_after_date: Optional[datetime] = None,
-        created_before_date: Optional[datetime] = None,
-    ) -> CurrencyAmount:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WALLET_TOTAL_AMOUNT_SENT_QUERY = """
 query FetchWalletTotalAmountSent($entity_id: ID!, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
         ... on Wallet {
@@ -1152,30 +1304,7 @@ query FetchWalletTotalAmountSent($entity_id: ID!, $created_after_date: DateTime,
         }
     }
 }
-            """,
-            {
-                "entity_id": self.id,
-                "created_after_date": created_after_date,
-                "created_before_date": created_before_date,
-            },
-        )
-        connection = json["entity"]["total_amount_sent"]
-        return CurrencyAmount_from_json(self.requester, connection)
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "Wallet",
-            "wallet_id": self.id,
-            "wallet_created_at": self.created_at.isoformat(),
-            "wallet_updated_at": self.updated_at.isoformat(),
-            "wallet_last_login_at": (
-                self.last_login_at.isoformat() if self.last_login_at else None
-            ),
-            "wallet_balances": self.balances.to_json() if self.balances else None,
-            "wallet_third_party_identifier": self.third_party_identifier,
-            "wallet_account": {"id": self.account_id} if self.account_id else None,
-            "wallet_status": self.status.value,
-        }
+"""
 
 
 FRAGMENT = """
@@ -1221,24 +1350,10 @@ fragment WalletFragment on Wallet {
 """
 
 
+_DECODER: CompiledDecoder[Wallet] = CompiledDecoder(Wallet)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Wallet:
-    return Wallet(
-        requester=requester,
-        typename="Wallet",
-        id=obj["wallet_id"],
-        created_at=datetime.fromisoformat(obj["wallet_created_at"]),
-        updated_at=datetime.fromisoformat(obj["wallet_updated_at"]),
-        last_login_at=(
-            datetime.fromisoformat(obj["wallet_last_login_at"])
-            if obj["wallet_last_login_at"]
-            else None
-        ),
-        balances=(
-            Balances_from_json(requester, obj["wallet_balances"])
-            if obj["wallet_balances"]
-            else None
-        ),
-        third_party_identifier=obj["wallet_third_party_identifier"],
-        account_id=obj["wallet_account"]["id"] if obj["wallet_account"] else None,
-        status=parse_enum(WalletStatus, obj["wallet_status"]),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Wallet)
+    return _DECODER(requester, obj)
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 from .PaymentRequest import PaymentRequest
-from .PaymentRequest import from_json as PaymentRequest_from_json
 
 
+@with_slots
 @dataclass
 class WalletToPaymentRequestsConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment WalletToPaymentRequestsConnectionFragment on WalletToPaymentRequestsCon
 """
 
 
+_DECODER: CompiledDecoder[WalletToPaymentRequestsConnection] = CompiledDecoder(
+    WalletToPaymentRequestsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> WalletToPaymentRequestsConnection:
-    return WalletToPaymentRequestsConnection(
-        requester=requester,
-        typename="WalletToPaymentRequestsConnection",
-        count=obj["wallet_to_payment_requests_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["wallet_to_payment_requests_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: PaymentRequest_from_json(requester, e),
-                obj["wallet_to_payment_requests_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 from .Transaction import Transaction
-from .Transaction import from_json as Transaction_from_json
 
 
+@with_slots
 @dataclass
 class WalletToTransactionsConnection(Connection):
     requester: Requester
@@ -55,21 +56,12 @@ fragment WalletToTransactionsConnectionFragment on WalletToTransactionsConnectio
 """
 
 
+_DECODER: CompiledDecoder[WalletToTransactionsConnection] = CompiledDecoder(
+    WalletToTransactionsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> WalletToTransactionsConnection:
-    return WalletToTransactionsConnection(
-        requester=requester,
-        typename="WalletToTransactionsConnection",
-        count=obj["wallet_to_transactions_connection_count"],
-        page_info=PageInfo_from_json(
-            requester, obj["wallet_to_transactions_connection_page_info"]
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Transaction_from_json(requester, e),
-                obj["wallet_to_transactions_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -5,16 +5,18 @@ from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .OnChainTransaction import OnChainTransaction
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 
 
+@with_slots
 @dataclass
 class Withdrawal(OnChainTransaction, Transaction, Entity):
     """This object represents an L1 withdrawal from your Lightspark Node to any Bitcoin wallet. You can retrieve this object to receive detailed information about any L1 withdrawal associated with your Lightspark Node or account."""
@@ -118,29 +120,10 @@ fragment WithdrawalFragment on Withdrawal {
 """
 
 
+_DECODER: CompiledDecoder[Withdrawal] = CompiledDecoder(Withdrawal)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Withdrawal:
-    return Withdrawal(
-        requester=requester,
-        typename="Withdrawal",
-        id=obj["withdrawal_id"],
-        created_at=datetime.fromisoformat(obj["withdrawal_created_at"]),
-        updated_at=datetime.fromisoformat(obj["withdrawal_updated_at"]),
-        status=parse_enum(TransactionStatus, obj["withdrawal_status"]),
-        resolved_at=(
-            datetime.fromisoformat(obj["withdrawal_resolved_at"])
-            if obj["withdrawal_resolved_at"]
-            else None
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["withdrawal_amount"]),
-        transaction_hash=obj["withdrawal_transaction_hash"],
-        fees=(
-            CurrencyAmount_from_json(requester, obj["withdrawal_fees"])
-            if obj["withdrawal_fees"]
-            else None
-        ),
-        block_hash=obj["withdrawal_block_hash"],
-        block_height=obj["withdrawal_block_height"],
-        destination_addresses=obj["withdrawal_destination_addresses"],
-        num_confirmations=obj["withdrawal_num_confirmations"],
-        origin_id=obj["withdrawal_origin"]["id"],
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, Withdrawal)
+    return _DECODER(requester, obj)
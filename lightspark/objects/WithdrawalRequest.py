@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping, Optional
 
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.lazy import decode_lazily, decoding_lazily
+from lightspark.utils.slots import with_slots
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .RequestInitiator import RequestInitiator
 from .WithdrawalMode import WithdrawalMode
@@ -33,6 +35,7 @@ from .WithdrawalRequestToWithdrawalsConnection import (
 )
 
 
+@with_slots
 @dataclass
 class WithdrawalRequest(Entity):
     """This object represents a request made for an L1 withdrawal from your Lightspark Node to any Bitcoin wallet. You can retrieve this object to receive detailed information about any withdrawal request made from your Lightspark account."""
@@ -85,11 +88,116 @@ class WithdrawalRequest(Entity):
     """The initiator of the withdrawal."""
     typename: str
 
+    @records_construction
     def get_channel_closing_transactions(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
         json = self.requester.execute_graphql(
-            """
+            FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_CLOSING_TRANSACTIONS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["channel_closing_transactions"]
+        return WithdrawalRequestToChannelClosingTransactionsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_channel_closing_transactions_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_CLOSING_TRANSACTIONS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["channel_closing_transactions"]
+        return WithdrawalRequestToChannelClosingTransactionsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    def get_channel_opening_transactions(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_OPENING_TRANSACTIONS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["channel_opening_transactions"]
+        return WithdrawalRequestToChannelOpeningTransactionsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_channel_opening_transactions_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_OPENING_TRANSACTIONS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first, "after": after},
+        )
+        connection = json["entity"]["channel_opening_transactions"]
+        return WithdrawalRequestToChannelOpeningTransactionsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    def get_withdrawals(
+        self, first: Optional[int] = None
+    ) -> WithdrawalRequestToWithdrawalsConnection:
+        json = self.requester.execute_graphql(
+            FETCH_WITHDRAWAL_REQUEST_TO_WITHDRAWALS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first},
+        )
+        connection = json["entity"]["withdrawals"]
+        return WithdrawalRequestToWithdrawalsConnection_from_json(
+            self.requester, connection
+        )
+
+    @records_construction
+    async def get_withdrawals_async(
+        self, first: Optional[int] = None
+    ) -> WithdrawalRequestToWithdrawalsConnection:
+        json = await self.requester.execute_graphql_async(
+            FETCH_WITHDRAWAL_REQUEST_TO_WITHDRAWALS_CONNECTION_QUERY,
+            {"entity_id": self.id, "first": first},
+        )
+        connection = json["entity"]["withdrawals"]
+        return WithdrawalRequestToWithdrawalsConnection_from_json(
+            self.requester, connection
+        )
+
+    def to_json(self) -> Mapping[str, Any]:
+        return {
+            "__typename": "WithdrawalRequest",
+            "withdrawal_request_id": self.id,
+            "withdrawal_request_created_at": self.created_at.isoformat(),
+            "withdrawal_request_updated_at": self.updated_at.isoformat(),
+            "withdrawal_request_requested_amount": self.requested_amount.to_json(),
+            "withdrawal_request_amount": self.amount.to_json(),
+            "withdrawal_request_estimated_amount": (
+                self.estimated_amount.to_json() if self.estimated_amount else None
+            ),
+            "withdrawal_request_amount_withdrawn": (
+                self.amount_withdrawn.to_json() if self.amount_withdrawn else None
+            ),
+            "withdrawal_request_total_fees": (
+                self.total_fees.to_json() if self.total_fees else None
+            ),
+            "withdrawal_request_bitcoin_address": self.bitcoin_address,
+            "withdrawal_request_withdrawal_mode": self.withdrawal_mode.value,
+            "withdrawal_request_status": self.status.value,
+            "withdrawal_request_completed_at": (
+                self.completed_at.isoformat() if self.completed_at else None
+            ),
+            "withdrawal_request_withdrawal": (
+                {"id": self.withdrawal_id} if self.withdrawal_id else None
+            ),
+            "withdrawal_request_idempotency_key": self.idempotency_key,
+            "withdrawal_request_initiator": self.initiator.value,
+        }
+
+
+FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_CLOSING_TRANSACTIONS_CONNECTION_QUERY = """
 query FetchWithdrawalRequestToChannelClosingTransactionsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on WithdrawalRequest {
@@ -139,19 +247,10 @@ query FetchWithdrawalRequestToChannelClosingTransactionsConnection($entity_id: I
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "after": after},
-        )
-        connection = json["entity"]["channel_closing_transactions"]
-        return WithdrawalRequestToChannelClosingTransactionsConnection_from_json(
-            self.requester, connection
-        )
+"""
 
-    def get_channel_opening_transactions(
-        self, first: Optional[int] = None, after: Optional[str] = None
-    ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WITHDRAWAL_REQUEST_TO_CHANNEL_OPENING_TRANSACTIONS_CONNECTION_QUERY = """
 query FetchWithdrawalRequestToChannelOpeningTransactionsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
         ... on WithdrawalRequest {
@@ -201,19 +300,10 @@ query FetchWithdrawalRequestToChannelOpeningTransactionsConnection($entity_id: I
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first, "after": after},
-        )
-        connection = json["entity"]["channel_opening_transactions"]
-        return WithdrawalRequestToChannelOpeningTransactionsConnection_from_json(
-            self.requester, connection
-        )
+"""
 
-    def get_withdrawals(
-        self, first: Optional[int] = None
-    ) -> WithdrawalRequestToWithdrawalsConnection:
-        json = self.requester.execute_graphql(
-            """
+
+FETCH_WITHDRAWAL_REQUEST_TO_WITHDRAWALS_CONNECTION_QUERY = """
 query FetchWithdrawalRequestToWithdrawalsConnection($entity_id: ID!, $first: Int) {
     entity(id: $entity_id) {
         ... on WithdrawalRequest {
@@ -256,43 +346,7 @@ query FetchWithdrawalRequestToWithdrawalsConnection($entity_id: ID!, $first: Int
         }
     }
 }
-            """,
-            {"entity_id": self.id, "first": first},
-        )
-        connection = json["entity"]["withdrawals"]
-        return WithdrawalRequestToWithdrawalsConnection_from_json(
-            self.requester, connection
-        )
-
-    def to_json(self) -> Mapping[str, Any]:
-        return {
-            "__typename": "WithdrawalRequest",
-            "withdrawal_request_id": self.id,
-            "withdrawal_request_created_at": self.created_at.isoformat(),
-            "withdrawal_request_updated_at": self.updated_at.isoformat(),
-            "withdrawal_request_requested_amount": self.requested_amount.to_json(),
-            "withdrawal_request_amount": self.amount.to_json(),
-            "withdrawal_request_estimated_amount": (
-                self.estimated_amount.to_json() if self.estimated_amount else None
-            ),
-            "withdrawal_request_amount_withdrawn": (
-                self.amount_withdrawn.to_json() if self.amount_withdrawn else None
-            ),
-            "withdrawal_request_total_fees": (
-                self.total_fees.to_json() if self.total_fees else None
-            ),
-            "withdrawal_request_bitcoin_address": self.bitcoin_address,
-            "withdrawal_request_withdrawal_mode": self.withdrawal_mode.value,
-            "withdrawal_request_status": self.status.value,
-            "withdrawal_request_completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "withdrawal_request_withdrawal": (
-                {"id": self.withdrawal_id} if self.withdrawal_id else None
-            ),
-            "withdrawal_request_idempotency_key": self.idempotency_key,
-            "withdrawal_request_initiator": self.initiator.value,
-        }
+"""
 
 
 FRAGMENT = """
@@ -354,51 +408,10 @@ fragment WithdrawalRequestFragment on WithdrawalRequest {
 """
 
 
+_DECODER: CompiledDecoder[WithdrawalRequest] = CompiledDecoder(WithdrawalRequest)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> WithdrawalRequest:
-    return WithdrawalRequest(
-        requester=requester,
-        typename="WithdrawalRequest",
-        id=obj["withdrawal_request_id"],
-        created_at=datetime.fromisoformat(obj["withdrawal_request_created_at"]),
-        updated_at=datetime.fromisoformat(obj["withdrawal_request_updated_at"]),
-        requested_amount=CurrencyAmount_from_json(
-            requester, obj["withdrawal_request_requested_amount"]
-        ),
-        amount=CurrencyAmount_from_json(requester, obj["withdrawal_request_amount"]),
-        estimated_amount=(
-            CurrencyAmount_from_json(
-                requester, obj["withdrawal_request_estimated_amount"]
-            )
-            if obj["withdrawal_request_estimated_amount"]
-            else None
-        ),
-        amount_withdrawn=(
-            CurrencyAmount_from_json(
-                requester, obj["withdrawal_request_amount_withdrawn"]
-            )
-            if obj["withdrawal_request_amount_withdrawn"]
-            else None
-        ),
-        total_fees=(
-            CurrencyAmount_from_json(requester, obj["withdrawal_request_total_fees"])
-            if obj["withdrawal_request_total_fees"]
-            else None
-        ),
-        bitcoin_address=obj["withdrawal_request_bitcoin_address"],
-        withdrawal_mode=parse_enum(
-            WithdrawalMode, obj["withdrawal_request_withdrawal_mode"]
-        ),
-        status=parse_enum(WithdrawalRequestStatus, obj["withdrawal_request_status"]),
-        completed_at=(
-            datetime.fromisoformat(obj["withdrawal_request_completed_at"])
-            if obj["withdrawal_request_completed_at"]
-            else None
-        ),
-        withdrawal_id=(
-            obj["withdrawal_request_withdrawal"]["id"]
-            if obj["withdrawal_request_withdrawal"]
-            else None
-        ),
-        idempotency_key=obj["withdrawal_request_idempotency_key"],
-        initiator=parse_enum(RequestInitiator, obj["withdrawal_request_initiator"]),
-    )
+    if decoding_lazily():
+        return decode_lazily(requester, obj, WithdrawalRequest)
+    return _DECODER(requester, obj)
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .ChannelClosingTransaction import ChannelClosingTransaction
-from .ChannelClosingTransaction import from_json as ChannelClosingTransaction_from_json
 from .Connection import Connection
 from .PageInfo import PageInfo
-from .PageInfo import from_json as PageInfo_from_json
 
 
+@with_slots
 @dataclass
 class WithdrawalRequestToChannelClosingTransactionsConnection(Connection):
     requester: Requester
@@ -55,28 +56,12 @@ fragment WithdrawalRequestToChannelClosingTransactionsConnectionFragment on With
 """
 
 
+_DECODER: CompiledDecoder[WithdrawalRequestToChannelClosingTransactionsConnection] = (
+    CompiledDecoder(WithdrawalRequestToChannelClosingTransactionsConnection)
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
-    return WithdrawalRequestToChannelClosingTransactionsConnection(
-        requester=requester,
-        typename="WithdrawalRequestToChannelClosingTransactionsConnection",
-        count=obj[
-            "withdrawal_request_to_channel_closing_transactions_connection_count"
-        ],
-        page_info=PageInfo_from_json(
-            requester,
-            obj[
-                "withdrawal_request_to_channel_closing_transactions_connection_page_info"
-            ],
-        ),
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: ChannelClosingTransaction_from_json(requester, e),
-                obj[
-                    "withdrawal_request_to_channel_closing_transactions_connection_entities"
-                ],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from typing import Any, List, Mapping
 
 from lightspark.requests.requester import Requester
+from lightspark.utils.decoders import CompiledDecoder
+from lightspark.utils.slots import with_slots
 
 from .Withdrawal import Withdrawal
-from .Withdrawal import from_json as Withdrawal_from_json
 
 
+@with_slots
 @dataclass
 class WithdrawalRequestToWithdrawalsConnection:
     requester: Requester
@@ -39,17 +41,12 @@ fragment WithdrawalRequestToWithdrawalsConnectionFragment on WithdrawalRequestTo
 """
 
 
+_DECODER: CompiledDecoder[WithdrawalRequestToWithdrawalsConnection] = CompiledDecoder(
+    WithdrawalRequestToWithdrawalsConnection
+)
+
+
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> WithdrawalRequestToWithdrawalsConnection:
-    return WithdrawalRequestToWithdrawalsConnection(
-        requester=requester,
-        count=obj["withdrawal_request_to_withdrawals_connection_count"],
-        entities=list(
-            map(
-                # pylint: disable=unnecessary-lambda
-                lambda e: Withdrawal_from_json(requester, e),
-                obj["withdrawal_request_to_withdrawals_connection_entities"],
-            )
-        ),
-    )
+    return _DECODER(requester, obj)
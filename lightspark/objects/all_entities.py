@@ -1,6 +1,9 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
-from typing import Callable, Mapping, Optional, Type, TypeVar
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Type, TypeVar
 
 from lightspark.objects.Account import FRAGMENT as AccountFragment
 from lightspark.objects.Account import Account
@@ -137,10 +140,15 @@ from lightspark.objects.WithdrawalRequest import WithdrawalRequest
 from lightspark.objects.WithdrawalRequest import (
     from_json as WithdrawalRequest_from_json,
 )
+from lightspark.requests.deadline import with_current_deadline
+from lightspark.requests.instrumentation import records_construction
 from lightspark.requests.requester import Requester
 
 ENTITY = TypeVar("ENTITY", bound=Entity)
 
+DEFAULT_ENTITIES_CHUNK_SIZE = 100
+DEFAULT_ENTITIES_PARALLELISM = 4
+
 ALL_QUERIES: Mapping[Type, str] = {
     Account: """        ... on Account {
             ...AccountFragment
@@ -340,11 +348,8 @@ ALL_JSON_LOADERS: Mapping[Type, Callable] = {
 }
 
 
-def get_entity(
-    requester: Requester, entity_id: str, entity_class: Type[ENTITY]
-) -> Optional[ENTITY]:
-    json = requester.execute_graphql(
-        f"""
+def _get_entity_query(entity_class: Type[ENTITY]) -> str:
+    return f"""
 query GetEntity($id: ID!) {{
     entity(id: $id) {{
 {ALL_QUERIES[entity_class]}
@@ -352,9 +357,132 @@ query GetEntity($id: ID!) {{
 }}
 
 {ALL_FRAGMENTS[entity_class]}
-""",
+"""
+
+
+@records_construction
+def get_entity(
+    requester: Requester, entity_id: str, entity_class: Type[ENTITY]
+) -> Optional[ENTITY]:
+    json = requester.execute_graphql(
+        _get_entity_query(entity_class),
+        {"id": entity_id},
+    )
+    if not json["entity"]:
+        return None
+    return ALL_JSON_LOADERS[entity_class](requester, json["entity"])
+
+
+@records_construction
+async def get_entity_async(
+    requester: Requester, entity_id: str, entity_class: Type[ENTITY]
+) -> Optional[ENTITY]:
+    json = await requester.execute_graphql_async(
+        _get_entity_query(entity_class),
         {"id": entity_id},
     )
     if not json["entity"]:
         return None
     return ALL_JSON_LOADERS[entity_class](requester, json["entity"])
+
+
+@lru_cache(maxsize=256)
+def _get_entities_query(entity_class: Type[ENTITY], count: int) -> str:
+    variables = "\n".join(f"    $id{i}: ID!" for i in range(count))
+    fields = "".join(
+        f"""    e{i}: entity(id: $id{i}) {{
+{ALL_QUERIES[entity_class]}
+    }}
+"""
+        for i in range(count)
+    )
+    return f"""
+query GetEntities(
+{variables}
+) {{
+{fields}}}
+
+{ALL_FRAGMENTS[entity_class]}
+"""
+
+
+def _entities_chunks(entity_ids: Sequence[str], chunk_size: int) -> List[List[str]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    unique_ids = list(dict.fromkeys(entity_ids))
+    return [
+        unique_ids[i : i + chunk_size] for i in range(0, len(unique_ids), chunk_size)
+    ]
+
+
+def _load_entities_chunk(
+    requester: Requester,
+    chunk: Sequence[str],
+    entity_class: Type[ENTITY],
+    json: Mapping,
+) -> Dict[str, Optional[ENTITY]]:
+    loader = ALL_JSON_LOADERS[entity_class]
+    return {
+        entity_id: loader(requester, json[f"e{i}"]) if json[f"e{i}"] else None
+        for i, entity_id in enumerate(chunk)
+    }
+
+
+def get_entities(
+    requester: Requester,
+    entity_ids: Sequence[str],
+    entity_class: Type[ENTITY],
+    chunk_size: int = DEFAULT_ENTITIES_CHUNK_SIZE,
+    parallelism: int = DEFAULT_ENTITIES_PARALLELISM,
+) -> List[Optional[ENTITY]]:
+    """Fetches many entities of the same type with one aliased query per
+    `chunk_size` ids, sending up to `parallelism` chunks at once.
+
+    Returns the entities in the order of `entity_ids`, with None for ids that
+    were not found.
+    """
+
+    @records_construction
+    def fetch(chunk: List[str]) -> Dict[str, Optional[ENTITY]]:
+        json = requester.execute_graphql(
+            _get_entities_query(entity_class, len(chunk)),
+            {f"id{i}": entity_id for i, entity_id in enumerate(chunk)},
+        )
+        return _load_entities_chunk(requester, chunk, entity_class, json)
+
+    chunks = _entities_chunks(entity_ids, chunk_size)
+    entities: Dict[str, Optional[ENTITY]] = {}
+    if len(chunks) <= 1 or parallelism <= 1:
+        for chunk in chunks:
+            entities.update(fetch(chunk))
+    else:
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(chunks))) as executor:
+            for loaded in executor.map(with_current_deadline(fetch), chunks):
+                entities.update(loaded)
+    return [entities[entity_id] for entity_id in entity_ids]
+
+
+async def get_entities_async(
+    requester: Requester,
+    entity_ids: Sequence[str],
+    entity_class: Type[ENTITY],
+    chunk_size: int = DEFAULT_ENTITIES_CHUNK_SIZE,
+    parallelism: int = DEFAULT_ENTITIES_PARALLELISM,
+) -> List[Optional[ENTITY]]:
+    semaphore = asyncio.Semaphore(max(parallelism, 1))
+
+    @records_construction
+    async def fetch(chunk: List[str]) -> Dict[str, Optional[ENTITY]]:
+        async with semaphore:
+            json = await requester.execute_graphql_async(
+                _get_entities_query(entity_class, len(chunk)),
+                {f"id{i}": entity_id for i, entity_id in enumerate(chunk)},
+            )
+        return _load_entities_chunk(requester, chunk, entity_class, json)
+
+    entities: Dict[str, Optional[ENTITY]] = {}
+    for loaded in await asyncio.gather(
+        *(fetch(chunk) for chunk in _entities_chunks(entity_ids, chunk_size))
+    ):
+        entities.update(loaded)
+    return [entities[entity_id] for entity_id in entity_ids]
@@ -0,0 +1,356 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+from __future__ import annotations
+
+import asyncio
+import logging
+from base64 import b64encode
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp: None = None
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.batching import (
+    DEFAULT_MAX_BATCH_SIZE,
+    AsyncQueryBatcher,
+    is_batchable,
+)
+from lightspark.requests.cache import CacheKey, ResponseCache, call_key
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.deadline import (
+    DEFAULT_CONNECT_TIMEOUT_SECS,
+    DEFAULT_READ_TIMEOUT_SECS,
+    remaining_secs,
+    request_timeouts,
+)
+from lightspark.requests.instrumentation import (
+    DECODE,
+    ENCODE,
+    HTTP,
+    NO_CALL_EVENT,
+    SIGN,
+    CallEvent,
+    CallListener,
+    emit,
+)
+from lightspark.requests.json_backend import JsonBackend
+from lightspark.requests.persisted_queries import is_persisted_query_not_found
+from lightspark.requests.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    limited_async,
+    operation_kind,
+)
+from lightspark.requests.requester import Requester
+from lightspark.requests.retry import RetryPolicy
+from lightspark.requests.signing_executor import SigningExecutor
+from lightspark.requests.single_flight import AsyncSingleFlight, is_query
+from lightspark.requests.tracing import (
+    DECODE_SPAN,
+    HTTP_SPAN,
+    SIGN_SPAN,
+    TRACEPARENT_HEADER,
+    Tracer,
+    child_span,
+)
+from lightspark.utils.interning import InternPool
+from lightspark.utils.signing_key import SigningKey
+
+logger = logging.getLogger("lightspark")
+
+DEFAULT_CONNECTION_LIMIT = 100
+
+
+class AsyncRequester(Requester):
+    """A `Requester` whose `execute_graphql_async` uses a non-blocking aiohttp
+    connection pool instead of the requests session.
+
+    Payload construction, signing and compression are shared with the blocking
+    `Requester`, only the transport differs. Requires the `aiohttp` extra:
+    `pip install lightspark[async]`.
+    """
+
+    def __init__(
+        self,
+        api_token_client_id: str,
+        api_token_client_secret: str,
+        base_url: Optional[str] = None,
+        http_host: Optional[str] = None,
+        *,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        persisted_queries: bool = False,
+        compressor: Optional[RequestCompressor] = None,
+        json_backend: Optional[JsonBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        batch_window_secs: Optional[float] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        cache: Optional[ResponseCache] = None,
+        coalesce_queries: bool = False,
+        signing_executor: Optional[SigningExecutor] = None,
+        call_listeners: Optional[Sequence[CallListener]] = None,
+        tracer: Optional[Tracer] = None,
+        connect_timeout_secs: Optional[float] = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: Optional[float] = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        if aiohttp is None:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                "aiohttp is required for the async client. Install it with `pip install lightspark[async]`.",
+            )
+        super().__init__(
+            api_token_client_id=api_token_client_id,
+            api_token_client_secret=api_token_client_secret,
+            base_url=base_url,
+            http_host=http_host,
+            persisted_queries=persisted_queries,
+            compressor=compressor,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            cache=cache,
+            call_listeners=call_listeners,
+            tracer=tracer,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            intern_pool=intern_pool,
+        )
+        self.signing_executor = signing_executor
+        self.async_single_flight = AsyncSingleFlight() if coalesce_queries else None
+        self.async_batcher = (
+            AsyncQueryBatcher(
+                self._execute_graphql_raw_async, batch_window_secs, max_batch_size
+            )
+            if batch_window_secs is not None
+            else None
+        )
+        credentials = f"{api_token_client_id}:{api_token_client_secret}"
+        self._authorization = "Basic " + b64encode(credentials.encode("utf8")).decode(
+            "ascii"
+        )
+        self._http_host = http_host
+        self._connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions are bound to the loop they were created on.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop != loop:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit,
+            )
+            headers = {"Authorization": self._authorization}
+            if self._http_host:
+                headers["Host"] = self._http_host
+            self._session = aiohttp.ClientSession(connector=connector, headers=headers)
+            self._session_loop = loop
+        return self._session
+
+    async def execute_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        with self.operation_span(query):
+            return await self._execute_graphql_async(query, variables, signing_key)
+
+    async def _execute_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        slot = self._cache_slot(query, variables, signing_key)
+        if slot is not None:
+            cached = self.cache.get(slot[0])
+            if cached is not None:
+                return cached
+        if (
+            self.async_single_flight is not None
+            and signing_key is None
+            and is_query(query)
+        ):
+            # Only the caller sending the request caches its result.
+            return await self.async_single_flight.do(
+                call_key(query, variables),
+                lambda: self._execute_graphql_and_cache_async(query, variables, slot),
+            )
+        return await self._execute_graphql_and_cache_async(
+            query, variables, slot, signing_key
+        )
+
+    async def _execute_graphql_and_cache_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        slot: Optional[Tuple[CacheKey, Optional[str]]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if slot is None:
+            return await self._execute_graphql_uncached_async(
+                query, variables, signing_key
+            )
+        generation = self.cache.generation
+        result = await self._execute_graphql_uncached_async(
+            query, variables, signing_key
+        )
+        self._cache_result(slot, variables, result, generation)
+        return result
+
+    async def _execute_graphql_uncached_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if (
+            self.async_batcher is not None
+            and signing_key is None
+            and is_batchable(query)
+        ):
+            return self.parse_response(
+                await self.async_batcher.submit(query, variables)
+            )
+        return self.parse_response(
+            await self._execute_graphql_raw_async(query, variables, signing_key)
+        )
+
+    async def _execute_graphql_raw_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.retry_policy is None:
+            return await self._send_graphql_async(query, variables, signing_key)
+        return await self.retry_policy.call_async(
+            lambda: self._send_graphql_async(query, variables, signing_key),
+            replayable=RetryPolicy.is_replayable(query, variables),
+        )
+
+    async def _send_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.rate_limiter is None and self.concurrency_limiter is None:
+            return await self._send_graphql_now_async(query, variables, signing_key)
+        async with limited_async(
+            self.rate_limiter,
+            self.concurrency_limiter,
+            operation_kind(query, signing_key is not None),
+        ):
+            return await self._send_graphql_now_async(query, variables, signing_key)
+
+    async def _send_graphql_now_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.persisted_queries:
+            event = self.new_call_event()
+            payload, headers = await self.build_request_async(
+                query, variables, signing_key, include_query=False, event=event
+            )
+            result = await self._post_async(payload, headers, event)
+            if not is_persisted_query_not_found(result):
+                return result
+            logger.debug("Persisted query not found, sending the full document.")
+
+        event = self.new_call_event()
+        payload, headers = await self.build_request_async(
+            query, variables, signing_key, event=event
+        )
+        return await self._post_async(payload, headers, event)
+
+    async def build_request_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+        include_query: bool = True,
+        event: CallEvent = NO_CALL_EVENT,
+    ) -> Tuple[bytes, Dict[str, Optional[str]]]:
+        """`build_request` that doesn't block the event loop while a signing
+        executor signs the payload."""
+        if signing_key is None or self.signing_executor is None:
+            return self.build_request(
+                query, variables, signing_key, include_query, event
+            )
+        payload = self.encode_payload(query, variables, signing_key, include_query)
+        event.mark(ENCODE)
+        with child_span(self.tracer, SIGN_SPAN):
+            signing = await self.signing_executor.sign_async(signing_key, payload)
+        event.mark(SIGN)
+        return self.finish_request(query, payload, signing, event)
+
+    async def _post_async(
+        self,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        event: CallEvent = NO_CALL_EVENT,
+    ) -> Mapping[str, Any]:
+        request_headers = {k: v for k, v in headers.items() if v is not None}
+        session = self._get_session()
+        server_hostname = self._http_host if self._http_host else None
+
+        try:
+            connect_secs, read_secs = request_timeouts(
+                self.connect_timeout_secs, self.read_timeout_secs
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=remaining_secs(), sock_connect=connect_secs, sock_read=read_secs
+            )
+            with child_span(self.tracer, HTTP_SPAN) as span:
+                traceparent = span.traceparent()  # pylint: disable=assignment-from-none
+                if traceparent:
+                    request_headers[TRACEPARENT_HEADER] = traceparent
+                async with session.post(
+                    self.base_url,
+                    data=payload,
+                    headers=request_headers,
+                    server_hostname=server_hostname,
+                    timeout=timeout,
+                ) as r:
+                    body = await r.read()
+                span.set_attribute("http.status_code", r.status)
+            event.mark(HTTP)
+            event.status = r.status
+            event.response_bytes = len(body)
+            try:
+                r.raise_for_status()
+                with child_span(self.tracer, DECODE_SPAN):
+                    result = self.json_backend.loads(body)
+                event.mark(DECODE)
+                return result
+            except aiohttp.ClientResponseError as e:
+                logger.error("HTTP request error. Status code: %d", r.status)
+                raise LightsparkException("HTTP_ERROR", str(e)) from e
+            except Exception as e:
+                logger.exception(e)
+                logger.error(body.decode("utf8", errors="replace"))
+                raise e
+        except BaseException as e:
+            if event.status is None:
+                event.mark(HTTP)
+            event.error = e
+            raise
+        finally:
+            emit(self.call_listeners, event)
+
+    async def close(self) -> None:
+        """Closes the pooled connections held by this requester."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.graphql_session.close()
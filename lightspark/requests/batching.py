@@ -0,0 +1,378 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Automatic batching of independent queries (DataLoader style).
+
+Queries issued within a short window are merged into a single GraphQL document:
+the root fields of call `i` are aliased `b<i>_<field>`, its variables renamed to
+`$b<i>_<name>`, and the fragments are deduplicated. The combined response is
+then split back to each caller, together with the errors whose path points at
+its fields. This collapses the N+1 patterns that appear when walking objects
+from several threads, e.g. resolving the destination of every payment on a page.
+
+Only unsigned queries are batched. Mutations always go out on their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+from concurrent.futures import Future, wait
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from lightspark.requests.deadline import current_deadline, deadline_at
+
+DEFAULT_BATCH_WINDOW_SECS = 0.002
+DEFAULT_MAX_BATCH_SIZE = 25
+BATCH_OPERATION_NAME = "Batched"
+
+_QUERY_HEADER = re.compile(r"\s*query\s+\w+\s*(?:\(([^)]*)\))?\s*\{")
+_FRAGMENT_HEADER = re.compile(r"fragment\s+(\w+)\s+on\s+\w+\s*\{")
+_FIELD = re.compile(r"(\w+)(?:\s*:\s*(\w+))?")
+_VARIABLE = re.compile(r"\$(\w+)")
+
+Call = Tuple[str, Optional[Mapping[str, Any]]]
+
+
+def _closing_brace(text: str, start: int) -> int:
+    """Returns the index of the brace closing the one at `start`."""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError("Unbalanced braces in GraphQL document")
+
+
+def _alias_root_fields(selection: str, prefix: str) -> Optional[Tuple[str, List[str]]]:
+    """Prefixes the response key of every root field of a selection set.
+
+    Returns the rewritten selection and the original response keys, or None if
+    the selection can't be rewritten (e.g. it spreads a fragment at the root).
+    """
+    out: List[str] = []
+    keys: List[str] = []
+    i = 0
+    while i < len(selection):
+        char = selection[i]
+        if char.isspace() or char == ",":
+            out.append(char)
+            i += 1
+            continue
+        field = _FIELD.match(selection, i)
+        if field is None:
+            return None
+        key = field.group(1)
+        name = field.group(2) or key
+        keys.append(key)
+        out.append(f"{prefix}{key}: {name}")
+        i = field.end()
+        # Copy the arguments and the sub-selection of the field untouched.
+        while i < len(selection) and selection[i].isspace():
+            out.append(selection[i])
+            i += 1
+        if i < len(selection) and selection[i] == "(":
+            end = selection.index(")", i)
+            out.append(selection[i : end + 1])
+            i = end + 1
+        while i < len(selection) and selection[i].isspace():
+            out.append(selection[i])
+            i += 1
+        if i < len(selection) and selection[i] == "{":
+            end = _closing_brace(selection, i)
+            out.append(selection[i : end + 1])
+            i = end + 1
+    return "".join(out), keys
+
+
+def merge_queries(
+    calls: Sequence[Call],
+) -> Optional[Tuple[str, Dict[str, Any], List[List[str]]]]:
+    """Merges queries into one document.
+
+    Returns the document, its variables and, for each call, the response keys of
+    its root fields. Returns None when the documents can't be merged.
+    """
+    variable_definitions: List[str] = []
+    selections: List[str] = []
+    merged_variables: Dict[str, Any] = {}
+    fragments: Dict[str, str] = {}
+    keys: List[List[str]] = []
+    for index, (query, variables) in enumerate(calls):
+        prefix = f"b{index}_"
+        header = _QUERY_HEADER.match(query)
+        if header is None:
+            return None
+        end = _closing_brace(query, header.end() - 1)
+        renamed = f"${prefix}\\1"
+        if header.group(1):
+            variable_definitions.append(_VARIABLE.sub(renamed, header.group(1)))
+        aliased = _alias_root_fields(
+            _VARIABLE.sub(renamed, query[header.end() : end]), prefix
+        )
+        if aliased is None:
+            return None
+        selections.append(aliased[0])
+        keys.append([prefix + key for key in aliased[1]])
+        for name, value in (variables or {}).items():
+            merged_variables[prefix + name] = value
+
+        rest = query[end + 1 :]
+        for fragment in _FRAGMENT_HEADER.finditer(rest):
+            text = rest[fragment.start() : _closing_brace(rest, fragment.end() - 1) + 1]
+            if "$" in text or fragments.setdefault(fragment.group(1), text) != text:
+                return None
+
+    definitions = (
+        "(\n" + "\n".join(d.strip("\n") for d in variable_definitions) + "\n)"
+        if variable_definitions
+        else ""
+    )
+    document = (
+        f"query {BATCH_OPERATION_NAME}{definitions} {{"
+        + "".join(selections)
+        + "}\n\n"
+        + "\n\n".join(fragments.values())
+        + "\n"
+    )
+    return document, merged_variables, keys
+
+
+def split_result(
+    result: Mapping[str, Any], keys: Sequence[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """Splits the response of a merged document into one response per call,
+    with the aliases removed again."""
+    data = result.get("data") or {}
+    errors = result.get("errors") or []
+    results: List[Dict[str, Any]] = []
+    for index, call_keys in enumerate(keys):
+        prefix = f"b{index}_"
+        call_result: Dict[str, Any] = {
+            "data": {key[len(prefix) :]: data.get(key) for key in call_keys}
+        }
+        call_errors = [
+            error
+            for error in errors
+            if not isinstance(error, Mapping)
+            or not error.get("path")
+            or error["path"][0] in call_keys
+        ]
+        if call_errors:
+            call_result["errors"] = call_errors
+        results.append(call_result)
+    return results
+
+
+def is_batchable(query: str) -> bool:
+    return _QUERY_HEADER.match(query) is not None
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.calls: List[Call] = []
+        self.futures: List[Any] = []
+        self.deadline: Optional[float] = None
+        """The earliest deadline of the calls, which the batch is sent under."""
+
+    def add(self, query: str, variables: Optional[Mapping[str, Any]], future: Any):
+        self.calls.append((query, variables))
+        self.futures.append(future)
+        at = current_deadline()
+        if at is not None and (self.deadline is None or at < self.deadline):
+            self.deadline = at
+
+
+class QueryBatcher:
+    """Collects the queries issued within `window_secs` from any thread and
+    executes them as one request.
+
+    The first caller of a batch waits for the window to elapse and then sends
+    it; the others block until their part of the response is in. A batch is
+    sent early once it holds `max_batch_size` calls.
+
+    Args:
+        execute: Sends a document and returns the raw GraphQL response.
+        window_secs: How long the first query of a batch waits for others.
+        max_batch_size: The maximum number of calls merged into one request.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[str, Optional[Mapping[str, Any]]], Mapping[str, Any]],
+        window_secs: float = DEFAULT_BATCH_WINDOW_SECS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        self.execute = execute
+        self.window_secs = window_secs
+        self.max_batch_size = max_batch_size
+        self.batches_sent = 0
+        self.calls_batched = 0
+        self._current: Optional[_Batch] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self, query: str, variables: Optional[Mapping[str, Any]]
+    ) -> Mapping[str, Any]:
+        """Returns the raw GraphQL response of a single query."""
+        future: Future = Future()
+        with self._lock:
+            batch = self._current
+            leader = batch is None
+            if batch is None:
+                batch = self._current = _Batch()
+            batch.add(query, variables, future)
+            full = len(batch.calls) >= self.max_batch_size
+            if full:
+                self._current = None
+
+        if full:
+            self._run(batch)
+        elif leader:
+            # Wakes up early if the batch filled up and was sent by another thread.
+            wait([future], timeout=self.window_secs)
+            with self._lock:
+                if self._current is batch:
+                    self._current = None
+                    full = True
+            if full:
+                self._run(batch)
+        return future.result()
+
+    def _run(self, batch: _Batch) -> None:
+        with deadline_at(batch.deadline):
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: _Batch) -> None:
+        try:
+            if len(batch.calls) == 1:
+                batch.futures[0].set_result(self.execute(*batch.calls[0]))
+                return
+            merged = merge_queries(batch.calls)
+            if merged is None:
+                for call, future in zip(batch.calls, batch.futures):
+                    try:
+                        future.set_result(self.execute(*call))
+                    except Exception as e:  # pylint: disable=broad-except
+                        future.set_exception(e)
+                return
+            document, variables, keys = merged
+            results = split_result(self.execute(document, variables), keys)
+            with self._lock:
+                self.batches_sent += 1
+                self.calls_batched += len(batch.calls)
+            for future, result in zip(batch.futures, results):
+                future.set_result(result)
+        except Exception as e:  # pylint: disable=broad-except
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+
+
+class AsyncQueryBatcher:
+    """The `QueryBatcher` of an event loop.
+
+    A batch is sent by a task of its own once the window elapses, so a caller
+    that is cancelled while waiting only gives up its own result: the batch is
+    still sent to the others.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[
+            [str, Optional[Mapping[str, Any]]], Awaitable[Mapping[str, Any]]
+        ],
+        window_secs: float = DEFAULT_BATCH_WINDOW_SECS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        self.execute = execute
+        self.window_secs = window_secs
+        self.max_batch_size = max_batch_size
+        self.batches_sent = 0
+        self.calls_batched = 0
+        self._current: Optional[_Batch] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Keeps the tasks sending batches alive until they're done.
+        self._tasks: Set[asyncio.Future] = set()
+
+    async def submit(
+        self, query: str, variables: Optional[Mapping[str, Any]]
+    ) -> Mapping[str, Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._current
+        if batch is None:
+            batch = self._current = _Batch()
+            self._timer = loop.call_later(self.window_secs, self._send, batch)
+        batch.add(query, variables, future)
+        if len(batch.calls) >= self.max_batch_size:
+            self._send(batch)
+        return await future
+
+    def _send(self, batch: _Batch) -> None:
+        if self._current is not batch:
+            return
+        self._current = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        with deadline_at(batch.deadline):
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: _Batch) -> None:
+        try:
+            if len(batch.calls) == 1:
+                _resolve(batch.futures[0], await self.execute(*batch.calls[0]))
+                return
+            merged = merge_queries(batch.calls)
+            if merged is None:
+                for call, future in zip(batch.calls, batch.futures):
+                    try:
+                        _resolve(future, await self.execute(*call))
+                    except Exception as e:  # pylint: disable=broad-except
+                        _fail(future, e)
+                return
+            document, variables, keys = merged
+            results = split_result(await self.execute(document, variables), keys)
+            self.batches_sent += 1
+            self.calls_batched += len(batch.calls)
+            for future, result in zip(batch.futures, results):
+                _resolve(future, result)
+        except BaseException as e:  # pylint: disable=broad-except
+            for future in batch.futures:
+                _fail(future, e)
+            if not isinstance(e, Exception):
+                raise
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    # The future of a caller that was cancelled is already done.
+    if not future.done():
+        future.set_result(result)
+
+
+def _fail(future: asyncio.Future, e: BaseException) -> None:
+    if future.done():
+        return
+    if isinstance(e, asyncio.CancelledError):
+        future.cancel()
+    else:
+        future.set_exception(e)
@@ -0,0 +1,258 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""A TTL and LRU cache for the responses of read-only queries.
+
+Responses are cached per operation name for the TTL configured for that
+operation; operations without a TTL (and mutations) are never cached. The TTL of
+`GetEntity` depends on the type of the entity, so that payments polled for their
+status aren't served from the cache while nodes and channels are. Each entry
+is indexed by the entity ids found in its variables and its response, so that
+`invalidate_webhook` can evict everything a webhook says has changed. A response
+fetched while an invalidation happened may already be stale, so it isn't cached.
+
+Cached responses are shared between callers and must not be modified.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from lightspark.requests.encoder import Encoder
+
+if TYPE_CHECKING:
+    from lightspark.webhooks import WebhookEvent
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTLS: Mapping[str, float] = {
+    "GetCurrentAccount": 30,
+    "BitcoinFeeEstimate": 60,
+    # Decoding is deterministic, the TTL only bounds how long entries linger.
+    "DecodedPaymentRequest": 3600,
+}
+ENTITY_OPERATION = "GetEntity"
+DEFAULT_ENTITY_TTLS: Mapping[str, float] = {
+    "LightsparkNodeWithOSK": 30,
+    "LightsparkNodeWithRemoteSigning": 30,
+    "GraphNode": 30,
+    "Channel": 30,
+    "Invoice": 30,
+}
+
+_MUTATION = re.compile(r"\s*mutation\b", re.IGNORECASE)
+
+CacheKey = Tuple[str, str]
+
+
+def call_key(query: str, variables: Optional[Mapping[str, Any]]) -> CacheKey:
+    """Identifies a call by its document and the canonical JSON of its variables."""
+    return query, json.dumps(variables or {}, sort_keys=True, cls=Encoder)
+
+
+def _entity_ids(value: Any, key: Optional[str] = None) -> Iterator[str]:
+    """Yields the ids referenced by a JSON value: strings under `id` or `*_id`
+    keys, walking nested objects and lists."""
+    if isinstance(value, Mapping):
+        for child_key, child in value.items():
+            yield from _entity_ids(child, child_key)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _entity_ids(child, key)
+    elif isinstance(value, str) and key and (key == "id" or key.endswith("_id")):
+        yield value
+
+
+def _size_bytes(value: Mapping[str, Any]) -> int:
+    """The size of a response, as the length of its JSON."""
+    return len(json.dumps(value, separators=(",", ":"), cls=Encoder))
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "entity_ids", "size_bytes")
+
+    def __init__(
+        self,
+        value: Mapping[str, Any],
+        expires_at: float,
+        entity_ids: Set[str],
+        size_bytes: int,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.entity_ids = entity_ids
+        self.size_bytes = size_bytes
+
+
+class ResponseCache:
+    """Caches the parsed responses of queries.
+
+    Args:
+        ttls: The TTL in seconds of each cached operation, by operation name.
+        default_ttl_secs: The TTL of the operations missing from `ttls`. None
+            leaves them uncached.
+        entity_ttls: The TTL of `GetEntity` by the typename of the entity, unless
+            `ttls` has one for `GetEntity`. Entities of other types aren't cached.
+        max_entries: Once the cache holds this many responses, the least
+            recently used ones are evicted.
+        max_bytes: Once the responses take more than this many bytes, counted as
+            the length of their JSON, the least recently used ones are evicted.
+            None only bounds the number of entries, which skips measuring them.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl_secs: Optional[float] = None,
+        entity_ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl_secs = default_ttl_secs
+        self.entity_ttls = dict(
+            DEFAULT_ENTITY_TTLS if entity_ttls is None else entity_ttls
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.generation = 0
+        """Incremented by every invalidation. See `put`."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._by_entity: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_secs(self, query: str, operation_name: Optional[str]) -> Optional[float]:
+        """Returns how long the response of a call may be cached, None if it
+        must not be."""
+        if _MUTATION.match(query):
+            return None
+        if operation_name is None:
+            return self.default_ttl_secs
+        if self._by_entity_type(operation_name):
+            # The longest one: the TTL of the response is only known once it's in.
+            return max(self.entity_ttls.values())
+        return self.ttls.get(operation_name, self.default_ttl_secs)
+
+    def response_ttl_secs(
+        self, operation_name: Optional[str], response: Mapping[str, Any]
+    ) -> Optional[float]:
+        """Returns how long a response may be cached, None if it must not be.
+        Only differs from `ttl_secs` for the `GetEntity` of types without a TTL
+        in `entity_ttls`."""
+        if operation_name is None:
+            return self.default_ttl_secs
+        if not self._by_entity_type(operation_name):
+            return self.ttls.get(operation_name, self.default_ttl_secs)
+        entity = response.get("entity")
+        if not isinstance(entity, Mapping):
+            return None
+        return self.entity_ttls.get(entity.get("__typename", ""))
+
+    def _by_entity_type(self, operation_name: str) -> bool:
+        return (
+            operation_name == ENTITY_OPERATION
+            and operation_name not in self.ttls
+            and bool(self.entity_ttls)
+        )
+
+    @staticmethod
+    def key(query: str, variables: Optional[Mapping[str, Any]]) -> CacheKey:
+        return call_key(query, variables)
+
+    def get(self, key: CacheKey) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: CacheKey,
+        variables: Optional[Mapping[str, Any]],
+        value: Mapping[str, Any],
+        ttl_secs: float,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Caches a response. With the `generation` read before the response was
+        fetched, the response isn't cached if anything was invalidated since."""
+        size_bytes = 0 if self.max_bytes is None else _size_bytes(value)
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            return
+        entity_ids = set(_entity_ids(value))
+        entity_ids.update(v for v in (variables or {}).values() if isinstance(v, str))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(
+                value, time.monotonic() + ttl_secs, entity_ids, size_bytes
+            )
+            self.size_bytes += size_bytes
+            for entity_id in entity_ids:
+                self._by_entity.setdefault(entity_id, set()).add(key)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, entity_id: str) -> int:
+        """Evicts every response referencing `entity_id`. Returns how many were
+        evicted."""
+        with self._lock:
+            self.generation += 1
+            keys = self._by_entity.get(entity_id, set()).copy()
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def invalidate_webhook(self, event: "WebhookEvent") -> int:
+        """Evicts the responses made stale by a webhook event: those referencing
+        its entity, or its wallet if it has one."""
+        evicted = self.invalidate(event.entity_id)
+        if event.wallet_id:
+            evicted += self.invalidate(event.wallet_id)
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._by_entity.clear()
+            self.size_bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size_bytes
+        for entity_id in entry.entity_ids:
+            keys = self._by_entity.get(entity_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_entity[entity_id]
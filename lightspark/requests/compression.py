@@ -0,0 +1,94 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Request body compression for the GraphQL requesters.
+
+Compression contexts are expensive to set up, so each thread keeps its own
+reusable zstd compressor (a `ZstdCompressor` must not be shared between threads
+while compressing).
+
+GraphQL payloads are extremely repetitive across calls, so a zstd dictionary
+trained on the SDK's own documents is shipped with the package (see
+`lightspark/scripts/train_zstd_dictionary.py`). Frames compressed with it can
+only be decoded by a server that has been provisioned with the same dictionary,
+which is why it is opt-in.
+"""
+
+import threading
+import zlib
+from importlib import resources
+from typing import Optional, Tuple
+
+from lightspark.exceptions import LightsparkException
+
+try:
+    from zstandard import ZstdCompressionDict, ZstdCompressor
+except ImportError:
+    ZstdCompressor: None = None
+    ZstdCompressionDict: None = None
+
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_MAX_RATIO = 0.9
+DEFAULT_ZSTD_LEVEL = 3
+DICTIONARY_RESOURCE = "graphql.zdict"
+
+
+def load_default_dictionary() -> "ZstdCompressionDict":
+    """Loads the zstd dictionary trained on the SDK's GraphQL documents."""
+    if ZstdCompressionDict is None:
+        raise LightsparkException(
+            "MISSING_DEPENDENCY", "zstandard is required to use a dictionary"
+        )
+    data = (
+        resources.files("lightspark.requests")
+        .joinpath(DICTIONARY_RESOURCE)
+        .read_bytes()
+    )
+    return ZstdCompressionDict(data)
+
+
+class RequestCompressor:
+    """Compresses request bodies above a size threshold.
+
+    Args:
+        min_size: Bodies smaller than this many bytes are sent uncompressed.
+        max_ratio: The compressed body is only used when it is at most this
+            fraction of the original size; otherwise the original is sent, so we
+            don't make the server decompress something that barely shrank.
+        level: The zstd compression level.
+        dictionary: An optional zstd dictionary. Pass `load_default_dictionary()`
+            to use the one shipped with the SDK. The server must know it too.
+    """
+
+    def __init__(
+        self,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        level: int = DEFAULT_ZSTD_LEVEL,
+        dictionary: Optional["ZstdCompressionDict"] = None,
+    ) -> None:
+        self.min_size = min_size
+        self.max_ratio = max_ratio
+        self.level = level
+        self.dictionary = dictionary
+        self._local = threading.local()
+
+    def _zstd_compressor(self) -> "ZstdCompressor":
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = ZstdCompressor(level=self.level, dict_data=self.dictionary)
+            self._local.compressor = compressor
+        return compressor
+
+    def compress(self, payload: bytes) -> Tuple[bytes, Optional[str]]:
+        """Returns the body to send and its `Content-Encoding` (None if the body
+        was left uncompressed)."""
+        if len(payload) <= self.min_size:
+            return payload, None
+        if ZstdCompressor:
+            compressed = self._zstd_compressor().compress(payload)
+            encoding = "zstd"
+        else:
+            compressed = zlib.compress(payload, level=zlib.Z_BEST_SPEED)
+            encoding = "deflate"
+        if len(compressed) > len(payload) * self.max_ratio:
+            return payload, None
+        return compressed, encoding
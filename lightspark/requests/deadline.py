@@ -0,0 +1,120 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Timeouts and deadlines of the calls to the GraphQL API.
+
+Every request is sent with the connect and read timeouts of its requester. On
+top of that, a deadline bounds everything done within a block, however many
+requests it takes (retries, batches, pages):
+
+    with deadline(5):
+        account = client.get_current_account()
+        transactions = account.get_transactions()
+
+Each request's timeouts are capped by the time left, and once the deadline has
+passed calls fail with a `DEADLINE_EXCEEDED` `LightsparkException` instead of
+being sent. Deadlines nest, the earliest one wins. They are tracked in a
+context variable, so each thread and each asyncio task has its own.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar
+
+from lightspark.exceptions import LightsparkException
+
+DEFAULT_CONNECT_TIMEOUT_SECS = 10.0
+DEFAULT_READ_TIMEOUT_SECS = 60.0
+# Payments can be held by the server for up to their `timeout_secs`.
+PAYMENT_READ_TIMEOUT_MARGIN_SECS = 15.0
+
+T = TypeVar("T")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("lightspark_deadline", default=None)
+_read_timeout: ContextVar[Optional[float]] = ContextVar(
+    "lightspark_read_timeout", default=None
+)
+
+
+@contextmanager
+def deadline(timeout_secs: float) -> Iterator[None]:
+    """Makes the calls within the block fail after `timeout_secs` seconds."""
+    with deadline_at(time.monotonic() + timeout_secs):
+        yield
+
+
+@contextmanager
+def deadline_at(at: Optional[float]) -> Iterator[None]:
+    """Like `deadline`, with an absolute `time.monotonic()` deadline. None
+    leaves the current deadline in place."""
+    current = _deadline.get()
+    if at is None or (current is not None and current <= at):
+        yield
+        return
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def read_timeout(timeout_secs: float) -> Iterator[None]:
+    """Overrides the read timeout of the requests sent within the block, e.g.
+    for calls the server may hold for longer than usual."""
+    token = _read_timeout.set(timeout_secs)
+    try:
+        yield
+    finally:
+        _read_timeout.reset(token)
+
+
+def payment_read_timeout(timeout_secs: float):
+    """The `read_timeout` of a payment mutation taking `timeout_secs`."""
+    return read_timeout(timeout_secs + PAYMENT_READ_TIMEOUT_MARGIN_SECS)
+
+
+def current_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def with_current_deadline(fn: Callable[..., T]) -> Callable[..., T]:
+    """Wraps `fn` to run under the caller's deadline, e.g. on a thread pool."""
+    at = _deadline.get()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        with deadline_at(at):
+            return fn(*args, **kwargs)
+
+    return run
+
+
+def remaining_secs() -> Optional[float]:
+    """The time left before the current deadline, None if there's none."""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def deadline_exceeded() -> LightsparkException:
+    return LightsparkException("DEADLINE_EXCEEDED", "The call's deadline has passed")
+
+
+def request_timeouts(
+    connect_secs: Optional[float], read_secs: Optional[float]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Returns the connect and read timeouts of a request sent now.
+
+    Raises:
+        LightsparkException: If the deadline has passed.
+    """
+    read_override = _read_timeout.get()
+    if read_override is not None:
+        read_secs = read_override
+    remaining = remaining_secs()
+    if remaining is None:
+        return connect_secs, read_secs
+    if remaining <= 0:
+        raise deadline_exceeded()
+    return (
+        remaining if connect_secs is None else min(connect_secs, remaining),
+        remaining if read_secs is None else min(read_secs, remaining),
+    )
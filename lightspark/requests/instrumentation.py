@@ -0,0 +1,287 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Timing instrumentation of the requests sent to the GraphQL API.
+
+Pass `call_listeners` to the client (or call `Requester.add_call_listener`) to
+receive a `CallEvent` after each HTTP request, with the time spent in each
+phase of building and sending it. `HistogramAggregator` is a listener keeping
+latency histograms per operation and phase in memory, e.g. to be scraped by a
+metrics endpoint. Listeners are called on the thread (or event loop) that sent
+the request, so they should be quick.
+
+The client methods and the connections of objects also time the construction of
+the objects returned from the response. Their events are only emitted once the
+method returns, with a `construct` phase on the event of the last request.
+
+Nothing is timed while there are no listeners.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+logger = logging.getLogger("lightspark")
+
+ENCODE = "encode"
+SIGN = "sign"
+COMPRESS = "compress"
+HTTP = "http"
+DECODE = "decode"
+CONSTRUCT = "construct"
+TOTAL = "total"
+
+DEFAULT_LATENCY_BUCKETS_SECS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class CallEvent:
+    """The timings of one HTTP request to the API. Retries, persisted query
+    fallbacks and batched calls each get their own event."""
+
+    operation: Optional[str] = None
+    """The GraphQL operation name, as sent in `X-GraphQL-Operation`."""
+    phases: Dict[str, float] = field(default_factory=dict)
+    """Seconds spent per phase: `encode`, `sign` (signed calls only),
+    `compress`, `http`, `decode` and `construct` (calls made by the client
+    methods and connections only)."""
+    request_bytes: int = 0
+    """The size of the JSON body before compression."""
+    sent_bytes: int = 0
+    """The size of the body sent."""
+    response_bytes: int = 0
+    status: Optional[int] = None
+    """The HTTP status, or None if no response was received."""
+    error: Optional[BaseException] = None
+    duration_secs: float = 0
+    _last: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.sent_bytes / self.request_bytes if self.request_bytes else 1.0
+
+    def mark(self, phase: str) -> None:
+        """Attributes the time since the previous mark to `phase`."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._last
+        self.duration_secs += now - self._last
+        self._last = now
+
+
+class _NoCallEvent(CallEvent):
+    """Stands in for the event of calls without listeners, and records nothing."""
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+NO_CALL_EVENT = _NoCallEvent()
+
+CallListener = Callable[[CallEvent], None]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Construction:
+    """The events held back while a method constructs objects from responses."""
+
+    __slots__ = ("events", "open")
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[Sequence[CallListener], CallEvent]] = []
+        self.open = True
+
+    def finish(self, constructed: bool) -> None:
+        self.open = False
+        if constructed and self.events:
+            self.events[-1][1].mark(CONSTRUCT)
+        for listeners, event in self.events:
+            _emit(listeners, event)
+
+
+_construction: ContextVar[Optional[_Construction]] = ContextVar(
+    "lightspark_construction", default=None
+)
+
+
+def records_construction(method: F) -> F:
+    """Decorates a method that sends requests and returns objects constructed
+    from their responses, so that the time spent constructing them is recorded
+    as the `construct` phase of the last request's event."""
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def records_async(*args: Any, **kwargs: Any) -> Any:
+            construction = _Construction()
+            token = _construction.set(construction)
+            constructed = False
+            try:
+                result = await method(*args, **kwargs)
+                constructed = True
+                return result
+            finally:
+                _construction.reset(token)
+                construction.finish(constructed)
+
+        return cast(F, records_async)
+
+    @functools.wraps(method)
+    def records(*args: Any, **kwargs: Any) -> Any:
+        construction = _Construction()
+        token = _construction.set(construction)
+        constructed = False
+        try:
+            result = method(*args, **kwargs)
+            constructed = True
+            return result
+        finally:
+            _construction.reset(token)
+            construction.finish(constructed)
+
+    return cast(F, records)
+
+
+def emit(listeners: Sequence[CallListener], event: CallEvent) -> None:
+    if event is NO_CALL_EVENT:
+        return
+    construction = _construction.get()
+    # Tasks started by the method, e.g. to send a batch, may outlive it.
+    if construction is not None and construction.open:
+        construction.events.append((listeners, event))
+        return
+    _emit(listeners, event)
+
+
+def _emit(listeners: Sequence[CallListener], event: CallEvent) -> None:
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Call listener %r failed", listener)
+
+
+class Histogram:
+    """A cumulative histogram of observed values."""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Returns the upper bound of the bucket holding the `q` quantile, or
+        infinity if it is past the last bound."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank and seen > 0:
+                return bound
+        return float("inf")
+
+    def to_json(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets: List[Tuple[float, int]] = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class HistogramAggregator:
+    """A call listener keeping, per operation, a latency histogram for each
+    phase and for the whole request, plus response status counts.
+
+    Args:
+        bounds: The upper bounds of the histogram buckets, in seconds.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECS):
+        self.bounds = tuple(bounds)
+        self._histograms: Dict[Tuple[Optional[str], str], Histogram] = {}
+        self._statuses: Dict[Tuple[Optional[str], Optional[int]], int] = {}
+        self._bytes: Dict[Optional[str], List[int]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: CallEvent) -> None:
+        with self._lock:
+            for phase, secs in event.phases.items():
+                self._histogram(event.operation, phase).observe(secs)
+            self._histogram(event.operation, TOTAL).observe(event.duration_secs)
+            status = (event.operation, event.status)
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+            totals = self._bytes.setdefault(event.operation, [0, 0, 0])
+            totals[0] += event.request_bytes
+            totals[1] += event.sent_bytes
+            totals[2] += event.response_bytes
+
+    def histogram(self, operation: Optional[str], phase: str = TOTAL) -> Histogram:
+        with self._lock:
+            return self._histogram(operation, phase)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the aggregated metrics as JSON-compatible values, keyed by
+        operation name."""
+        with self._lock:
+            operations: Dict[str, Any] = {}
+            for (operation, phase), histogram in self._histograms.items():
+                metrics = operations.setdefault(str(operation), {"phases": {}})
+                metrics["phases"][phase] = histogram.to_json()
+            for (operation, status), count in self._statuses.items():
+                statuses = operations[str(operation)].setdefault("statuses", {})
+                statuses[str(status)] = count
+            for operation, (request, sent, response) in self._bytes.items():
+                operations[str(operation)].update(
+                    request_bytes=request, sent_bytes=sent, response_bytes=response
+                )
+            return operations
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._statuses.clear()
+            self._bytes.clear()
+
+    def _histogram(self, operation: Optional[str], phase: str) -> Histogram:
+        histogram = self._histograms.get((operation, phase))
+        if histogram is None:
+            histogram = self._histograms[(operation, phase)] = Histogram(self.bounds)
+        return histogram
@@ -0,0 +1,102 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Pluggable JSON encoding and decoding.
+
+The fastest installed library is picked automatically: orjson, then msgspec,
+then the standard library. All backends decode straight from bytes and produce
+the same request bodies for the values the SDK sends (enums are encoded by name,
+datetimes are sent with their timezone replaced by UTC, like `Encoder`).
+
+Datetimes are deliberately not encoded natively: orjson keeps the offset of
+timezone-aware datetimes and msgspec can't treat naive ones as UTC, so either
+would send a different instant than the standard library for some values. They
+go through `Encoder` instead, which keeps the encoded values byte-identical
+across backends at the cost of a Python call per datetime.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from lightspark.requests.encoder import Encoder
+
+try:
+    import orjson
+except ImportError:
+    orjson: None = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec: None = None
+
+
+class JsonBackend(ABC):
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+
+class StdlibJsonBackend(JsonBackend):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, cls=Encoder).encode("utf8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJsonBackend(JsonBackend):
+    """Enums are serialized natively by orjson: our enums' values are their
+    names, so the output matches `Encoder`. Datetimes are passed to `Encoder`,
+    which replaces their timezone with UTC rather than keeping their offset."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._option = orjson.OPT_PASSTHROUGH_DATETIME
+        self._default = Encoder().default
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self._default, option=self._option)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecJsonBackend(JsonBackend):
+    """Decodes with msgspec. Encoding stays on the standard library, because
+    msgspec can't be told to treat naive datetimes as UTC."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        self._decoder = msgspec.json.Decoder()
+        self._stdlib = StdlibJsonBackend()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._stdlib.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+@lru_cache(maxsize=None)
+def default_json_backend() -> JsonBackend:
+    """Returns the fastest JSON backend available in this environment."""
+    if orjson is not None:
+        return OrjsonJsonBackend()
+    if msgspec is not None:
+        return MsgspecJsonBackend()
+    return StdlibJsonBackend()
@@ -0,0 +1,73 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Support for automatic persisted queries (APQ).
+
+With persisted queries enabled, the requester first sends only the sha256 id of
+the GraphQL document together with the variables. If the server doesn't know the
+document yet, it answers with a `PersistedQueryNotFound` error and the request is
+replayed once with the full document, which the server then stores for later
+calls.
+"""
+
+import importlib
+import pkgutil
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Dict, Mapping
+
+PERSISTED_QUERY_VERSION = 1
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_FOUND_CODE = "PERSISTED_QUERY_NOT_FOUND"
+
+_DOCUMENT_PACKAGES = ("lightspark.scripts", "lightspark.objects")
+_DOCUMENT_SUFFIXES = ("_QUERY", "_MUTATION")
+
+
+@lru_cache(maxsize=1024)
+def document_id(document: str) -> str:
+    """Returns the persisted query id (hex sha256) of a GraphQL document."""
+    return sha256(document.encode("utf8")).hexdigest()
+
+
+def persisted_query_extension(document: str) -> Mapping[str, Any]:
+    return {
+        "persistedQuery": {
+            "version": PERSISTED_QUERY_VERSION,
+            "sha256Hash": document_id(document),
+        }
+    }
+
+
+def is_persisted_query_not_found(result: Mapping[str, Any]) -> bool:
+    """Whether a GraphQL response reports that the persisted query id is unknown."""
+    for error in result.get("errors") or []:
+        if not isinstance(error, Mapping):
+            continue
+        if error.get("message") == PERSISTED_QUERY_NOT_FOUND:
+            return True
+        extensions = error.get("extensions") or {}
+        if extensions.get("code") == PERSISTED_QUERY_NOT_FOUND_CODE:
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def known_documents() -> Mapping[str, str]:
+    """Returns every GraphQL document shipped with the SDK, keyed by its id.
+
+    This covers the `*_QUERY` and `*_MUTATION` constants of `lightspark.scripts`
+    and of the generated object modules, and can be used to pre-register the
+    documents with a server so that even the first call only sends the hash.
+    """
+    documents: Dict[str, str] = {}
+    for package_name in _DOCUMENT_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.iter_modules(package.__path__):
+            try:
+                module = importlib.import_module(f"{package_name}.{module_info.name}")
+            except ImportError:
+                # Development helpers may depend on packages that aren't installed.
+                continue
+            for name, value in vars(module).items():
+                if isinstance(value, str) and name.endswith(_DOCUMENT_SUFFIXES):
+                    documents[document_id(value)] = value
+    return documents
@@ -0,0 +1,415 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Client-side rate and concurrency limits of the calls to the GraphQL API.
+
+A `RateLimiter` paces the requests of each kind of operation (reads, mutations
+and signed mutations) with its own `TokenBucket`, so that fanning out across
+nodes or wallets stays under the API's rate limits instead of running into
+them. When the API answers 429 anyway, the kind of the rejected call is held
+back for the `Retry-After` the response asks for.
+
+An `AdaptiveConcurrencyLimiter` bounds the number of requests in flight, and
+tunes that bound by itself (AIMD): it grows by one for every round of
+successful calls and halves when the API signals overload (429, 503 or a
+timeout). Share one limiter between all the threads, or clients, that use the
+same API token.
+
+Both are opt-in (`rate_limiter=` and `concurrency_limiter=` on the clients),
+and both wait within the current `lightspark.requests.deadline`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import requests
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.deadline import deadline_exceeded, remaining_secs
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp: None = None
+
+READ = "read"
+MUTATION = "mutation"
+SIGNED_MUTATION = "signed_mutation"
+
+RATE_LIMITED_STATUS_CODE = 429
+OVERLOADED_STATUS_CODES = frozenset({RATE_LIMITED_STATUS_CODE, 503})
+
+DEFAULT_INITIAL_CONCURRENCY = 10
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_BACKOFF_RATIO = 0.5
+
+
+def operation_kind(query: str, signed: bool) -> str:
+    """Returns the kind of a GraphQL call: READ, MUTATION or SIGNED_MUTATION."""
+    if signed:
+        return SIGNED_MUTATION
+    return MUTATION if query.lstrip()[:8].lower() == "mutation" else READ
+
+
+def _http_error(error: BaseException) -> Optional[Tuple[int, Mapping[str, str]]]:
+    """Returns the status and headers of the HTTP error response behind an
+    error, if there is one."""
+    if isinstance(error, LightsparkException):
+        error = error.__cause__ or error
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code, error.response.headers
+    if aiohttp is not None and isinstance(error, aiohttp.ClientResponseError):
+        return error.status, error.headers or {}
+    return None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether an error is the API rejecting a call for exceeding its rate
+    limits. Such calls weren't processed, and are safe to send again."""
+    response = _http_error(error)
+    return response is not None and response[0] == RATE_LIMITED_STATUS_CODE
+
+
+def is_overloaded(error: BaseException) -> bool:
+    """Whether an error signals that the API is receiving more than it can
+    handle: a 429, a 503 or a timeout."""
+    response = _http_error(error)
+    if response is not None:
+        return response[0] in OVERLOADED_STATUS_CODES
+    return isinstance(error, (requests.Timeout, asyncio.TimeoutError))
+
+
+def retry_after_secs(error: BaseException) -> Optional[float]:
+    """Returns the delay the `Retry-After` header of an HTTP error response
+    asks for, None if there's no such header."""
+    response = _http_error(error)
+    if response is None:
+        return None
+    value = response[1].get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _check_wait(wait_secs: float) -> None:
+    remaining = remaining_secs()
+    if remaining is not None and wait_secs >= remaining:
+        raise deadline_exceeded()
+
+
+class TokenBucket:
+    """Allows `rate_per_sec` calls per second on average, and bursts of up to
+    `burst` calls.
+
+    Calls reserve their token up front and are told how long to wait for it, so
+    that waiting callers are spaced out evenly instead of all waking up at once.
+
+    Args:
+        rate_per_sec: The sustained rate of calls.
+        burst: The number of calls that can be made at once after a quiet
+            period. Defaults to one second's worth of calls.
+        clock: The monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst if burst is not None else max(1, int(rate_per_sec))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._interval = 1 / rate_per_sec
+        self._tolerance = (self.burst - 1) * self._interval
+        self._clock = clock
+        # The time at which the bucket is full again.
+        self._full_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            full_at = max(self._full_at, now)
+            self._full_at = full_at + self._interval
+            return max(0.0, full_at - self._tolerance - now)
+
+    def cancel(self) -> None:
+        """Gives back the token of a reservation that won't be used."""
+        with self._lock:
+            self._full_at -= self._interval
+
+    def pause(self, secs: float) -> None:
+        """Hands out no token for the next `secs` seconds, and no burst after."""
+        with self._lock:
+            self._full_at = max(self._full_at, self._clock() + secs + self._tolerance)
+
+
+class RateLimiter:
+    """Paces calls per kind of operation. Kinds without a bucket are only held
+    back when the API asks for it with a 429.
+
+    Args:
+        reads: Paces queries.
+        mutations: Paces unsigned mutations.
+        signed_mutations: Paces mutations signed with a node's key, which
+            includes payments.
+        clock: The monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        reads: Optional[TokenBucket] = None,
+        mutations: Optional[TokenBucket] = None,
+        signed_mutations: Optional[TokenBucket] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.buckets: Dict[str, Optional[TokenBucket]] = {
+            READ: reads,
+            MUTATION: mutations,
+            SIGNED_MUTATION: signed_mutations,
+        }
+        self.throttled = 0
+        self._clock = clock
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, kind: str) -> float:
+        bucket = self.buckets[kind]
+        wait_secs = bucket.reserve() if bucket is not None else 0.0
+        paused_secs = self._paused_until.get(kind, 0.0) - self._clock()
+        wait_secs = max(wait_secs, paused_secs)
+        try:
+            _check_wait(wait_secs)
+        except LightsparkException:
+            if bucket is not None:
+                bucket.cancel()
+            raise
+        if wait_secs > 0:
+            with self._lock:
+                self.throttled += 1
+        return wait_secs
+
+    def acquire(self, kind: str) -> None:
+        """Waits until a call of this kind can be sent.
+
+        Raises:
+            LightsparkException: If the wait would overrun the deadline.
+        """
+        wait_secs = self._reserve(kind)
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+
+    async def acquire_async(self, kind: str) -> None:
+        """Awaitable version of `acquire`."""
+        wait_secs = self._reserve(kind)
+        if wait_secs > 0:
+            await asyncio.sleep(wait_secs)
+
+    def observe(self, kind: str, error: BaseException) -> None:
+        """Holds back the calls of this kind for the `Retry-After` of a 429."""
+        if not is_rate_limited(error):
+            return
+        pause_secs = retry_after_secs(error) or 0.0
+        bucket = self.buckets[kind]
+        if bucket is not None:
+            bucket.pause(pause_secs)
+        with self._lock:
+            self._paused_until[kind] = max(
+                self._paused_until.get(kind, 0.0), self._clock() + pause_secs
+            )
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds the number of requests in flight, adapting the bound with
+    additive increase and multiplicative decrease (AIMD).
+
+    Every successful call raises the limit by 1/limit, i.e. by one per round of
+    calls, as long as the limit is being used. A call failing on overload
+    multiplies it by `backoff_ratio`, once per round: calls that were already in
+    flight when the limit was lowered don't lower it again.
+
+    It is thread-safe, and threads and event loops can share one limiter.
+
+    Args:
+        initial_limit: The number of concurrent requests to start with.
+        min_limit: The limit is never lowered below this.
+        max_limit: The limit is never raised above this.
+        backoff_ratio: The factor applied to the limit on overload.
+        clock: The monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._clock = clock
+        self._lowered_at = float("-inf")
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, Any]] = []
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_acquire(self) -> Optional[float]:
+        """Takes a slot if one is free. Must be called with the lock held."""
+        if self._in_flight >= int(self._limit):
+            return None
+        self._in_flight += 1
+        return self._clock()
+
+    def acquire(self) -> float:
+        """Waits for a free slot. Returns the time the call started, to pass to
+        `release`.
+
+        Raises:
+            LightsparkException: If the deadline passes while waiting.
+        """
+        with self._available:
+            while True:
+                started_at = self._try_acquire()
+                if started_at is not None:
+                    return started_at
+                remaining = remaining_secs()
+                if remaining is not None and remaining <= 0:
+                    raise deadline_exceeded()
+                self._available.wait(remaining)
+
+    async def acquire_async(self) -> float:
+        """Awaitable version of `acquire`."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                started_at = self._try_acquire()
+                if started_at is not None:
+                    return started_at
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], remaining_secs())
+            except asyncio.TimeoutError as e:
+                raise deadline_exceeded() from e
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release(self, started_at: float, error: Optional[BaseException]) -> None:
+        """Frees the slot of a call that started at `started_at`, and adapts the
+        limit to how it went: `error` is None for calls that succeeded."""
+        with self._lock:
+            used = self._in_flight >= self._limit / 2
+            self._in_flight -= 1
+            if error is None:
+                if used:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            elif is_overloaded(error) and started_at >= self._lowered_at:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._lowered_at = self._clock()
+            # Every waiter checks again: the limit may have moved either way.
+            self._available.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+
+def _wake(future: Any) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+@contextmanager
+def limited(
+    rate_limiter: Optional[RateLimiter],
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter],
+    kind: str,
+) -> Iterator[None]:
+    """Sends the request made within the block under the given limiters."""
+    if rate_limiter is not None:
+        rate_limiter.acquire(kind)
+    started_at = concurrency_limiter.acquire() if concurrency_limiter else 0.0
+    error: Optional[BaseException] = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        if rate_limiter is not None:
+            rate_limiter.observe(kind, e)
+        raise
+    finally:
+        if concurrency_limiter is not None:
+            concurrency_limiter.release(started_at, error)
+
+
+@asynccontextmanager
+async def limited_async(
+    rate_limiter: Optional[RateLimiter],
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter],
+    kind: str,
+) -> AsyncIterator[None]:
+    """Async version of `limited`."""
+    if rate_limiter is not None:
+        await rate_limiter.acquire_async(kind)
+    started_at = (
+        await concurrency_limiter.acquire_async() if concurrency_limiter else 0.0
+    )
+    error: Optional[BaseException] = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        if rate_limiter is not None:
+            rate_limiter.observe(kind, e)
+        raise
+    finally:
+        if concurrency_limiter is not None:
+            concurrency_limiter.release(started_at, error)
@@ -1,34 +1,81 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 from __future__ import annotations
 
-import json
+import asyncio
+import contextvars
 import logging
 import re
 import secrets
-import zlib
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from platform import python_version, release, system
-from typing import Any, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+import urllib3.exceptions
+from urllib3.connection import HTTPConnection
 from urllib3.connectionpool import ConnectionPool
 
-try:
-    from zstandard import ZstdCompressor
-except ImportError:
-    ZstdCompressor: None = None
-
 import requests
 import requests.adapters
 from requests.auth import HTTPBasicAuth
 from requests.utils import default_user_agent
 
 from lightspark.exceptions import LightsparkException
-from lightspark.requests.encoder import Encoder
+from lightspark.requests.batching import (
+    DEFAULT_MAX_BATCH_SIZE,
+    QueryBatcher,
+    is_batchable,
+)
+from lightspark.requests.cache import CacheKey, ResponseCache, call_key
+from lightspark.requests.compression import RequestCompressor
+from lightspark.requests.deadline import (
+    DEFAULT_CONNECT_TIMEOUT_SECS,
+    DEFAULT_READ_TIMEOUT_SECS,
+    request_timeouts,
+)
+from lightspark.requests.instrumentation import (
+    COMPRESS,
+    DECODE,
+    ENCODE,
+    HTTP,
+    NO_CALL_EVENT,
+    SIGN,
+    CallEvent,
+    CallListener,
+    emit,
+)
+from lightspark.requests.json_backend import JsonBackend, default_json_backend
+from lightspark.requests.persisted_queries import (
+    is_persisted_query_not_found,
+    persisted_query_extension,
+)
+from lightspark.requests.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    limited,
+    operation_kind,
+)
+from lightspark.requests.retry import RetryPolicy
+from lightspark.requests.tracing import (
+    COMPRESS_SPAN,
+    DECODE_SPAN,
+    HTTP_SPAN,
+    NO_SPAN_CONTEXT,
+    SIGN_SPAN,
+    TRACEPARENT_HEADER,
+    Tracer,
+    child_span,
+    operation_span,
+)
+from lightspark.requests.single_flight import SingleFlight, is_query
+from lightspark.utils.interning import InternPool
 from lightspark.utils.signing_key import SigningKey
 from lightspark.version import __version__
 
 DEFAULT_BASE_URL = "https://api.lightspark.com/graphql/server/2023-09-13"
+DEFAULT_POOL_MAXSIZE = 10
 
 logger = logging.getLogger("lightspark")
 
@@ -40,16 +87,134 @@ class Requester:
         api_token_client_secret: str,
         base_url: Optional[str] = None,
         http_host: Optional[str] = None,
+        *,
+        persisted_queries: bool = False,
+        compressor: Optional[RequestCompressor] = None,
+        json_backend: Optional[JsonBackend] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive_idle_secs: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        batch_window_secs: Optional[float] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        cache: Optional[ResponseCache] = None,
+        coalesce_queries: bool = False,
+        call_listeners: Optional[Sequence[CallListener]] = None,
+        tracer: Optional[Tracer] = None,
+        connect_timeout_secs: Optional[float] = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: Optional[float] = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        intern_pool: Optional[InternPool] = None,
     ) -> None:
         self.base_url = base_url or DEFAULT_BASE_URL
+        self.connect_timeout_secs = connect_timeout_secs
+        self.read_timeout_secs = read_timeout_secs
+        self.call_listeners: List[CallListener] = list(call_listeners or ())
+        self.tracer = tracer
+        self.persisted_queries = persisted_queries
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.intern_pool = intern_pool
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce_queries else None
+        self.batcher = (
+            QueryBatcher(self._execute_graphql_raw, batch_window_secs, max_batch_size)
+            if batch_window_secs is not None
+            else None
+        )
+        self.compressor = compressor or RequestCompressor()
+        self.json_backend = json_backend or default_json_backend()
         self.graphql_session = requests.Session()
         self.graphql_session.auth = HTTPBasicAuth(
             api_token_client_id, api_token_client_secret
         )
 
+        adapter_kwargs: Dict[str, Any] = {
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "tcp_keepalive_idle_secs": tcp_keepalive_idle_secs,
+        }
+        self.graphql_session.mount("http://", PooledHTTPAdapter(**adapter_kwargs))
         if http_host:
-            self.graphql_session.mount("https://", HTTPSAdapter(http_host))
+            self.graphql_session.mount(
+                "https://", HTTPSAdapter(http_host, **adapter_kwargs)
+            )
             self.graphql_session.headers.update({"Host": http_host})
+        else:
+            self.graphql_session.mount("https://", PooledHTTPAdapter(**adapter_kwargs))
+        self.pool_maxsize = pool_maxsize
+
+    def warmup(self, connections: int = 1) -> int:
+        """Opens up to `connections` connections (including the TLS handshake) to
+        the API ahead of time and parks them in the pool, so that the first calls
+        don't pay the connection setup latency.
+
+        Returns the number of connections that are ready in the pool. Each
+        connection that can't be opened within `connect_timeout_secs` is left
+        closed.
+        """
+        connections = min(connections, self.pool_maxsize)
+        if connections <= 0:
+            return 0
+        request = requests.Request("POST", self.base_url).prepare()
+        adapter = self.graphql_session.get_adapter(self.base_url)
+        pool = adapter.get_connection_with_tls_context(
+            request, verify=self.graphql_session.verify
+        )
+        # urllib3 has no public way to open pooled connections without sending
+        # a request, so this relies on the pool's internals when it has them.
+        if not hasattr(pool, "_get_conn") or not hasattr(pool, "_put_conn"):
+            return 0
+        connect_secs, _ = request_timeouts(self.connect_timeout_secs, None)
+
+        def connect(conn: HTTPConnection) -> bool:
+            if conn.sock is not None:
+                return True
+            timeout = conn.timeout
+            if connect_secs is not None:
+                conn.timeout = connect_secs
+            try:
+                conn.connect()
+                return True
+            except (OSError, urllib3.exceptions.HTTPError) as e:
+                logger.debug(
+                    "Couldn't warm up a connection to %s: %s", self.base_url, e
+                )
+                conn.close()
+                return False
+            finally:
+                conn.timeout = timeout
+
+        # pylint: disable=protected-access
+        pooled = [pool._get_conn() for _ in range(connections)]
+        try:
+            with ThreadPoolExecutor(max_workers=len(pooled)) as executor:
+                ready = sum(executor.map(connect, pooled))
+        finally:
+            for conn in pooled:
+                pool._put_conn(conn)
+        logger.debug("Warmed up %d connections to %s", ready, self.base_url)
+        return ready
+
+    def add_call_listener(self, listener: CallListener) -> None:
+        """Calls `listener` with a `CallEvent` after each request to the API.
+        See `lightspark.requests.instrumentation`."""
+        self.call_listeners.append(listener)
+
+    def remove_call_listener(self, listener: CallListener) -> None:
+        self.call_listeners.remove(listener)
+
+    def new_call_event(self) -> CallEvent:
+        return CallEvent() if self.call_listeners else NO_CALL_EVENT
+
+    def operation_span(self, query: str):
+        """Returns a context manager tracing a GraphQL operation, if a tracer
+        is set."""
+        if self.tracer is None:
+            return NO_SPAN_CONTEXT
+        return operation_span(self.tracer, self.operation_name(query))
 
     def execute_graphql(
         self,
@@ -57,26 +222,233 @@ class Requester:
         variables: Optional[Mapping[str, Any]],
         signing_key: Optional[SigningKey] = None,
     ) -> Mapping[str, Any]:
-        operation = re.match(r"\s*(?:query|mutation)\s+(\w+)", query, re.IGNORECASE)
-        payload = json.dumps(
-            {
-                "operationName": operation.group(1) if operation else None,
-                "query": query,
-                "variables": variables or {},
-                "nonce": secrets.randbits(64) if signing_key else None,
-                "expires_at": (
-                    (datetime.now(timezone.utc) + timedelta(hours=1))
-                    .replace(tzinfo=timezone.utc)
-                    .isoformat()
-                    if signing_key
-                    else None
-                ),
-            },
-            cls=Encoder,
-        ).encode("utf8")
+        with self.operation_span(query):
+            return self._execute_graphql(query, variables, signing_key)
 
-        signing = signing_key.sign_payload(payload) if signing_key else None
+    def _execute_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        slot = self._cache_slot(query, variables, signing_key)
+        if slot is not None:
+            cached = self.cache.get(slot[0])
+            if cached is not None:
+                return cached
+        if self.single_flight is not None and signing_key is None and is_query(query):
+            # Only the caller sending the request caches its result.
+            return self.single_flight.do(
+                call_key(query, variables),
+                lambda: self._execute_graphql_and_cache(query, variables, slot),
+            )
+        return self._execute_graphql_and_cache(query, variables, slot, signing_key)
 
+    def _execute_graphql_and_cache(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        slot: Optional[Tuple[CacheKey, Optional[str]]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if slot is None:
+            return self._execute_graphql_uncached(query, variables, signing_key)
+        generation = self.cache.generation
+        result = self._execute_graphql_uncached(query, variables, signing_key)
+        self._cache_result(slot, variables, result, generation)
+        return result
+
+    def _cache_slot(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+    ) -> Optional[Tuple[CacheKey, Optional[str]]]:
+        """Returns the cache key and operation name of a cacheable call, None
+        otherwise."""
+        if self.cache is None or signing_key is not None:
+            return None
+        operation_name = self.operation_name(query)
+        if self.cache.ttl_secs(query, operation_name) is None:
+            return None
+        return self.cache.key(query, variables), operation_name
+
+    def _cache_result(
+        self,
+        slot: Tuple[CacheKey, Optional[str]],
+        variables: Optional[Mapping[str, Any]],
+        result: Mapping[str, Any],
+        generation: int,
+    ) -> None:
+        ttl_secs = self.cache.response_ttl_secs(slot[1], result)
+        if ttl_secs is not None:
+            self.cache.put(slot[0], variables, result, ttl_secs, generation)
+
+    def _execute_graphql_uncached(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.batcher is not None and signing_key is None and is_batchable(query):
+            return self.parse_response(self.batcher.submit(query, variables))
+        return self.parse_response(
+            self._execute_graphql_raw(query, variables, signing_key)
+        )
+
+    def _execute_graphql_raw(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        """Sends a call, retrying it per the retry policy, and returns the GraphQL
+        response without checking it for errors."""
+        if self.retry_policy is None:
+            return self._send_graphql(query, variables, signing_key)
+        return self.retry_policy.call(
+            lambda: self._send_graphql(query, variables, signing_key),
+            replayable=RetryPolicy.is_replayable(query, variables),
+        )
+
+    def _send_graphql(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.rate_limiter is None and self.concurrency_limiter is None:
+            return self._send_graphql_now(query, variables, signing_key)
+        with limited(
+            self.rate_limiter,
+            self.concurrency_limiter,
+            operation_kind(query, signing_key is not None),
+        ):
+            return self._send_graphql_now(query, variables, signing_key)
+
+    def _send_graphql_now(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        if self.persisted_queries:
+            event = self.new_call_event()
+            payload, headers = self.build_request(
+                query, variables, signing_key, include_query=False, event=event
+            )
+            result = self._post(payload, headers, event)
+            if not is_persisted_query_not_found(result):
+                return result
+            logger.debug("Persisted query not found, sending the full document.")
+
+        event = self.new_call_event()
+        payload, headers = self.build_request(
+            query, variables, signing_key, event=event
+        )
+        return self._post(payload, headers, event)
+
+    def _post(
+        self,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        event: CallEvent = NO_CALL_EVENT,
+    ) -> Mapping[str, Any]:
+        try:
+            timeout = request_timeouts(
+                self.connect_timeout_secs, self.read_timeout_secs
+            )
+            with child_span(self.tracer, HTTP_SPAN) as span:
+                traceparent = span.traceparent()  # pylint: disable=assignment-from-none
+                if traceparent:
+                    headers = {**headers, TRACEPARENT_HEADER: traceparent}
+                r = self.graphql_session.post(
+                    url=self.base_url,
+                    data=payload,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                span.set_attribute("http.status_code", r.status_code)
+            event.mark(HTTP)
+            event.status = r.status_code
+            event.response_bytes = len(r.content)
+            try:
+                r.raise_for_status()
+                with child_span(self.tracer, DECODE_SPAN):
+                    result = self.json_backend.loads(r.content)
+                event.mark(DECODE)
+                return result
+            except requests.HTTPError as e:
+                logger.error("HTTP request error. Status code: %d", r.status_code)
+                raise LightsparkException("HTTP_ERROR", str(e)) from e
+            except Exception as e:
+                logger.exception(e)
+
+                try:
+                    logger.error(r.text)
+                # TODO pylint is right here... let's make it better.
+                except Exception:  # pylint: disable=broad-except
+                    pass
+                raise e
+        except BaseException as e:
+            if event.status is None:
+                event.mark(HTTP)
+            event.error = e
+            raise
+        finally:
+            emit(self.call_listeners, event)
+
+    async def execute_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+    ) -> Mapping[str, Any]:
+        """Awaitable version of `execute_graphql`.
+
+        The blocking requests session is run on the default executor, so the event
+        loop stays responsive. Use `AsyncRequester` for a natively asynchronous
+        transport.
+        """
+        # Runs in a copy of the caller's context, to keep its deadline.
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, context.run, self.execute_graphql, query, variables, signing_key
+        )
+
+    def build_request(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+        include_query: bool = True,
+        event: CallEvent = NO_CALL_EVENT,
+    ) -> Tuple[bytes, Dict[str, Optional[str]]]:
+        """Builds the (possibly compressed) request body and the headers for a
+        GraphQL call. This is shared by every transport so that signing and
+        compression behave identically.
+
+        When persisted queries are enabled, the body carries the document id and
+        `include_query=False` leaves the document itself out. The time spent in
+        each step is recorded in `event`.
+        """
+        payload = self.encode_payload(query, variables, signing_key, include_query)
+        event.mark(ENCODE)
+        signing = None
+        if signing_key:
+            with child_span(self.tracer, SIGN_SPAN):
+                signing = signing_key.sign_payload(payload)
+            event.mark(SIGN)
+        return self.finish_request(query, payload, signing, event)
+
+    def finish_request(
+        self,
+        query: str,
+        payload: bytes,
+        signing: Optional[str],
+        event: CallEvent = NO_CALL_EVENT,
+    ) -> Tuple[bytes, Dict[str, Optional[str]]]:
+        """Adds the headers to an encoded and signed payload, and compresses it."""
         user_agent = self.user_agent_string()
         logger.debug(
             "Sending request to GraphQL with query = %s, payload = %s}", query, payload
@@ -84,52 +456,108 @@ class Requester:
 
         headers = {
             "Content-Type": "application/json",
-            "X-GraphQL-Operation": operation.group(1) if operation else None,
+            "X-GraphQL-Operation": self.operation_name(query),
             "X-Lightspark-Signing": signing,
             "User-Agent": f"{user_agent} {default_user_agent()}",
             "X-Lightspark-SDK": user_agent,
         }
-        if len(payload) > 1024:
-            if ZstdCompressor:
-                payload = ZstdCompressor().compress(payload)
-                headers["Content-Encoding"] = "zstd"
-            else:
-                payload = zlib.compress(payload, level=zlib.Z_BEST_SPEED)
-                headers["Content-Encoding"] = "deflate"
-
-        r = self.graphql_session.post(
-            url=self.base_url,
-            data=payload,
-            headers=headers,
+        event.operation = headers["X-GraphQL-Operation"]
+        event.request_bytes = len(payload)
+        with child_span(self.tracer, COMPRESS_SPAN):
+            payload, encoding = self.compressor.compress(payload)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        event.sent_bytes = len(payload)
+        event.mark(COMPRESS)
+
+        return payload, headers
+
+    def encode_payload(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+        include_query: bool = True,
+    ) -> bytes:
+        """Serializes the uncompressed JSON body of a GraphQL call."""
+        body: Dict[str, Any] = {"operationName": self.operation_name(query)}
+        if include_query:
+            body["query"] = query
+        body.update(
+            {
+                "variables": variables or {},
+                "nonce": secrets.randbits(64) if signing_key else None,
+                "expires_at": (
+                    (datetime.now(timezone.utc) + timedelta(hours=1))
+                    .replace(tzinfo=timezone.utc)
+                    .isoformat()
+                    if signing_key
+                    else None
+                ),
+            }
         )
-        try:
-            r.raise_for_status()
-            result = r.json()
-            if "errors" in result:
-                errors = result["errors"]
-                raise LightsparkException(
-                    "GRAPHQL_ERROR", f"A GraphQL error occurred: {errors}"
-                )  # TODO better error handling
-            return result["data"]
-        except requests.HTTPError as e:
-            logger.error("HTTP request error. Status code: %d", r.status_code)
-            raise LightsparkException("HTTP_ERROR", str(e)) from e
-        except Exception as e:
-            logger.exception(e)
+        if self.persisted_queries:
+            body["extensions"] = persisted_query_extension(query)
+        return self.json_backend.dumps(body)
 
-            try:
-                logger.error(r.text)
-            # TODO pylint is right here... let's make it better.
-            except Exception:  # pylint: disable=broad-except
-                pass
-            raise e
+    @staticmethod
+    def operation_name(query: str) -> Optional[str]:
+        operation = re.match(r"\s*(?:query|mutation)\s+(\w+)", query, re.IGNORECASE)
+        return operation.group(1) if operation else None
+
+    def parse_response(self, result: Mapping[str, Any]) -> Mapping[str, Any]:
+        if "errors" in result:
+            errors = result["errors"]
+            raise LightsparkException(
+                "GRAPHQL_ERROR", f"A GraphQL error occurred: {errors}"
+            )  # TODO better error handling
+        return result["data"]
 
     def user_agent_string(self) -> str:
         # Will produce something like: 	lightspark-python-sdk/0.5.1 python/3.11.2 Darwin/22.1.0
         return f"lightspark-python-sdk/{__version__} python/{python_version()} {system()}/{release()}"
 
 
-class HTTPSAdapter(requests.adapters.HTTPAdapter):
+def tcp_keepalive_socket_options(idle_secs: int) -> List[Tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive probes after `idle_secs` of
+    inactivity, so that idle pooled connections aren't silently dropped by load
+    balancers or NATs."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle_secs))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle_secs))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append(
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle_secs // 3))
+        )
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+    return options
+
+
+class PooledHTTPAdapter(requests.adapters.HTTPAdapter):
+    """An `HTTPAdapter` that can enable TCP keep-alive on its pooled sockets."""
+
+    def __init__(
+        self, *args, tcp_keepalive_idle_secs: Optional[int] = None, **kwargs
+    ) -> None:
+        self.socket_options = (
+            tcp_keepalive_socket_options(tcp_keepalive_idle_secs)
+            if tcp_keepalive_idle_secs
+            else None
+        )
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
+class HTTPSAdapter(PooledHTTPAdapter):
     def __init__(self, server_hostname: str, *args, **kwargs):
         self.server_hostname = server_hostname
         super().__init__(*args, **kwargs)
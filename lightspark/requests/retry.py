@@ -0,0 +1,210 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Retries of transient failures (429/502/503/504, dropped connections, timeouts).
+
+A single `RetryPolicy` is shared by every call made through a requester. Failed
+attempts are retried with exponential backoff and full jitter, so that clients
+which failed together don't all come back at the same moment. On top of the
+per-call attempt limit, the policy holds a `RetryBudget` shared by all calls:
+each call earns a fraction of a retry and each retry spends a whole one, so
+during an outage retries add a bounded amount of extra load instead of
+multiplying it.
+
+Only calls that are safe to replay are retried: queries, mutations that carry
+an `idempotency_key` (the server returns the original result when a key is
+repeated), and calls the API rejected with a 429, which it didn't process. A
+429 is retried no sooner than its `Retry-After`. Each attempt is signed again
+with a fresh nonce.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Collection, Mapping, Optional, TypeVar
+
+import requests
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.deadline import remaining_secs
+from lightspark.requests.rate_limit import is_rate_limited, retry_after_secs
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp: None = None
+
+logger = logging.getLogger("lightspark")
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_INITIAL_BACKOFF_SECS = 0.1
+DEFAULT_MAX_BACKOFF_SECS = 5.0
+DEFAULT_BUDGET_RATIO = 0.1
+DEFAULT_BUDGET_CAPACITY = 10.0
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENCY_KEY_VARIABLE = "idempotency_key"
+
+
+def _fits_deadline(delay_secs: float) -> bool:
+    remaining = remaining_secs()
+    return remaining is None or remaining > delay_secs
+
+
+class RetryBudget:
+    """A token bucket bounding the share of traffic that retries may add.
+
+    Every call deposits `ratio` tokens and every retry withdraws one, so under a
+    sustained failure at most `ratio` retries are made per call on average.
+    `capacity` tokens are available up front, which covers the occasional blip.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_BUDGET_RATIO,
+        capacity: float = DEFAULT_BUDGET_CAPACITY,
+    ) -> None:
+        self.ratio = ratio
+        self.capacity = capacity
+        self._balance = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes one retry from the budget. Returns False when it is exhausted."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Retries transient failures of replay-safe calls.
+
+    Args:
+        max_attempts: The maximum number of attempts per call, including the
+            first one.
+        initial_backoff_secs: The upper bound of the delay before the first
+            retry. It doubles for every following retry.
+        max_backoff_secs: Caps the upper bound of the delay.
+        retryable_status_codes: The HTTP statuses that are retried.
+        budget: The retry budget shared by every call using this policy.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        initial_backoff_secs: float = DEFAULT_INITIAL_BACKOFF_SECS,
+        max_backoff_secs: float = DEFAULT_MAX_BACKOFF_SECS,
+        retryable_status_codes: Collection[int] = RETRYABLE_STATUS_CODES,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.initial_backoff_secs = initial_backoff_secs
+        self.max_backoff_secs = max_backoff_secs
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.budget = budget or RetryBudget()
+
+    @staticmethod
+    def is_replayable(query: str, variables: Optional[Mapping[str, Any]]) -> bool:
+        """Whether a call can be sent again without risking a duplicate effect."""
+        if not re.match(r"\s*mutation\b", query, re.IGNORECASE):
+            return True
+        return bool(variables and variables.get(IDEMPOTENCY_KEY_VARIABLE))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether an error is transient, i.e. the same call may succeed later."""
+        if isinstance(error, LightsparkException):
+            if error.code != "HTTP_ERROR":
+                return False
+            error = error.__cause__ or error
+        if isinstance(error, requests.HTTPError):
+            return (
+                error.response is not None
+                and error.response.status_code in self.retryable_status_codes
+            )
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if aiohttp is not None:
+            if isinstance(error, aiohttp.ClientResponseError):
+                return error.status in self.retryable_status_codes
+            if isinstance(error, aiohttp.ClientConnectionError):
+                return True
+        return isinstance(error, (ConnectionError, asyncio.TimeoutError))
+
+    def backoff_secs(self, attempt: int) -> float:
+        """Returns the delay before retrying a call whose `attempt`-th attempt
+        failed, drawn uniformly between 0 and the exponential bound."""
+        bound = min(
+            self.max_backoff_secs, self.initial_backoff_secs * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, bound)
+
+    def retry_delay_secs(self, error: BaseException, attempt: int) -> float:
+        """Returns the delay before retrying after `error`: the backoff, or the
+        `Retry-After` of the response when it asks for longer."""
+        return max(self.backoff_secs(attempt), retry_after_secs(error) or 0.0)
+
+    def _should_retry(
+        self, error: BaseException, attempt: int, replayable: bool
+    ) -> bool:
+        if not replayable and not is_rate_limited(error):
+            return False
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return False
+        if not self.budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying: %s", error)
+            return False
+        return True
+
+    def call(self, operation: Callable[[], T], replayable: bool = True) -> T:
+        """Runs `operation`, retrying it on transient failures if `replayable`."""
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return operation()
+            except Exception as e:  # pylint: disable=broad-except
+                if not self._should_retry(e, attempt, replayable):
+                    raise
+                delay = self.retry_delay_secs(e, attempt)
+                if not _fits_deadline(delay):
+                    raise
+                logger.warning(
+                    "Attempt %d failed, retrying in %.2fs: %s", attempt, delay, e
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    async def call_async(
+        self, operation: Callable[[], Awaitable[T]], replayable: bool = True
+    ) -> T:
+        """Awaitable version of `call`."""
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except Exception as e:  # pylint: disable=broad-except
+                if not self._should_retry(e, attempt, replayable):
+                    raise
+                delay = self.retry_delay_secs(e, attempt)
+                if not _fits_deadline(delay):
+                    raise
+                logger.warning(
+                    "Attempt %d failed, retrying in %.2fs: %s", attempt, delay, e
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
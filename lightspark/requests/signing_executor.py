@@ -0,0 +1,110 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Signing of request payloads on a pool of workers.
+
+RSA-PSS signatures are CPU heavy. Passing a `SigningExecutor` to the async
+client lets its event loop keep doing network I/O while payloads are signed,
+and with `processes=True` the signatures run in parallel regardless of the GIL.
+Keys are sent to worker processes as bytes and parsed once per process.
+
+The sync client signs inline: each thread waits for its signature before
+sending the request anyway, so handing it to a pool would only add a thread hop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from lightspark.utils.signing_key import SigningKey
+
+DEFAULT_MAX_WORKERS = 4
+LATENCY_WINDOW = 1024
+
+
+def _sign(signing_key: SigningKey, payload: bytes) -> str:
+    return signing_key.sign_payload(payload)
+
+
+@dataclass
+class SigningMetrics:
+    queue_depth: int
+    """Payloads submitted and not signed yet."""
+    signed: int
+    """Payloads signed since the executor was created."""
+    mean_latency_secs: float
+    """Mean time from submission to signature over the recent signatures."""
+    max_latency_secs: float
+    """Longest time from submission to signature over the recent signatures."""
+
+
+class SigningExecutor:
+    """Signs payloads on a thread or process pool.
+
+    Args:
+        max_workers: The number of workers of the pool.
+        processes: Whether to sign in worker processes instead of threads.
+        executor: An existing executor to use instead of creating a pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if executor is None:
+            executor = (
+                ProcessPoolExecutor(max_workers=max_workers)
+                if processes
+                else ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="lightspark-signing"
+                )
+            )
+        self.executor = executor
+        self._pending = 0
+        self._signed = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def submit(self, signing_key: SigningKey, payload: bytes) -> "Future[str]":
+        """Schedules the signature of a payload and returns its future
+        `X-Lightspark-Signing` header."""
+        started = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+        future = self.executor.submit(_sign, signing_key, payload)
+        future.add_done_callback(lambda _: self._record(started))
+        return future
+
+    def sign(self, signing_key: SigningKey, payload: bytes) -> str:
+        """Blocks the calling thread until the payload is signed, e.g. to sign
+        outside of a client."""
+        return self.submit(signing_key, payload).result()
+
+    async def sign_async(self, signing_key: SigningKey, payload: bytes) -> str:
+        return await asyncio.wrap_future(self.submit(signing_key, payload))
+
+    def metrics(self) -> SigningMetrics:
+        with self._lock:
+            latencies = list(self._latencies)
+            return SigningMetrics(
+                queue_depth=self._pending,
+                signed=self._signed,
+                mean_latency_secs=sum(latencies) / len(latencies) if latencies else 0,
+                max_latency_secs=max(latencies, default=0),
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
+
+    def _record(self, started: float) -> None:
+        latency = time.perf_counter() - started
+        with self._lock:
+            self._pending -= 1
+            self._signed += 1
+            self._latencies.append(latency)
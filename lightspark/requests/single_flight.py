@@ -0,0 +1,113 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Coalescing of identical in-flight queries ("single flight").
+
+When several threads (or coroutines) issue the same query with the same
+variables while a previous identical call is still in flight, they wait for that
+call and share its parsed result (or its error) instead of sending their own
+request. Only unsigned queries are coalesced; mutations always go out.
+
+Shared results must not be modified by the callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional
+
+from lightspark.requests.deadline import deadline_exceeded, remaining_secs
+
+_QUERY = re.compile(r"\s*(?:query\b|\{)", re.IGNORECASE)
+
+
+def is_query(document: str) -> bool:
+    return _QUERY.match(document) is not None
+
+
+def _wait_secs() -> Optional[float]:
+    remaining = remaining_secs()
+    return None if remaining is None else max(remaining, 0)
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, across threads.
+
+    `calls` counts every call made through it and `coalesced` the ones that were
+    answered by another caller's request.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self, key: Hashable, call: Callable[[], Mapping[str, Any]]
+    ) -> Mapping[str, Any]:
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            # Followers wait for the leader's call within their own deadline.
+            try:
+                return future.result(timeout=_wait_secs())
+            except FutureTimeoutError as e:
+                raise deadline_exceeded() from e
+
+        try:
+            result = call()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class AsyncSingleFlight:
+    """The `SingleFlight` of an event loop.
+
+    The call runs in a task of its own that every caller awaits through
+    `asyncio.shield`, so cancelling a caller, even the one that started the
+    call, only detaches that caller.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[Mapping[str, Any]]]
+    ) -> Mapping[str, Any]:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._in_flight[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda done: self._done(key, done))
+            return await asyncio.shield(task)
+
+        self.coalesced += 1
+        # Followers wait for the leader's call within their own deadline.
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), _wait_secs())
+        except asyncio.TimeoutError as e:
+            raise deadline_exceeded() from e
+
+    def _done(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Don't warn about an exception nobody waited for.
+            task.exception()
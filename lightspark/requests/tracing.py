@@ -0,0 +1,109 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Tracing spans for GraphQL operations.
+
+Pass a `Tracer` to the client (`tracer=`) to wrap each `execute_graphql` call
+in a span named after its GraphQL operation, with child spans for signing,
+compression, each HTTP request and response decoding. The `traceparent` of
+the HTTP span is sent with the request, so that the API's own traces can be
+correlated with yours.
+
+`Tracer` is a small protocol, so any tracing library can be plugged in with a
+thin adapter. With OpenTelemetry for instance, `start_span` starts a span in
+the context of `parent` (or the current context when `parent` is None) and
+`Span.traceparent` returns the header `TraceContextTextMapPropagator` injects
+for it.
+
+Without a tracer nothing is created: spans are a shared no-op.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Protocol
+
+SIGN_SPAN = "lightspark.sign"
+COMPRESS_SPAN = "lightspark.compress"
+HTTP_SPAN = "lightspark.http"
+DECODE_SPAN = "lightspark.decode"
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+    def end(self) -> None: ...
+
+    def traceparent(self) -> Optional[str]:
+        """Returns the W3C `traceparent` header identifying this span."""
+        ...
+
+
+class Tracer(Protocol):
+    def start_span(self, name: str, parent: Optional[Span]) -> Span:
+        """Starts a span. `parent` is None for the span of a GraphQL operation,
+        which should then be parented to the caller's current span, if any."""
+        ...
+
+
+class _NoSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def traceparent(self) -> Optional[str]:
+        return None
+
+
+NO_SPAN: Span = _NoSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "lightspark_current_span", default=None
+)
+
+
+@contextmanager
+def _span(tracer: Tracer, name: str, parent: Optional[Span]) -> Iterator[Span]:
+    span = tracer.start_span(name, parent)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+class _NoSpanContext:
+    def __enter__(self) -> Span:
+        return NO_SPAN
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+NO_SPAN_CONTEXT = _NoSpanContext()
+
+
+def operation_span(tracer: Tracer, operation: Optional[str]):
+    """A context manager wrapping a GraphQL operation in a span."""
+    return _span(tracer, operation or "graphql", None)
+
+
+def child_span(tracer: Optional[Tracer], name: str):
+    """A context manager wrapping a step of the current operation in a span.
+    Steps outside of an operation span aren't traced."""
+    if tracer is None:
+        return NO_SPAN_CONTEXT
+    parent = _current_span.get()
+    if parent is None:
+        return NO_SPAN_CONTEXT
+    return _span(tracer, name, parent)
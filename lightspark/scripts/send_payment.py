@@ -9,6 +9,7 @@ mutation SendPayment(
     $amount_msats: Long!
     $timeout_secs: Int!
     $maximum_fees_msats: Long!
+    $idempotency_key: String
 ) {{
     send_payment(input: {{
         node_id: $node_id
@@ -16,6 +17,7 @@ mutation SendPayment(
         amount_msats: $amount_msats
         timeout_secs: $timeout_secs
         maximum_fees_msats: $maximum_fees_msats
+        idempotency_key: $idempotency_key
     }}) {{
         payment {{
             ...OutgoingPaymentFragment
@@ -0,0 +1,44 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Trains the zstd dictionary shipped in `lightspark/requests/graphql.zdict`.
+
+The training corpus is the request body of every GraphQL document the SDK can
+send: the `*_QUERY`/`*_MUTATION` constants and the `GetEntity` query of every
+entity type. Re-run it whenever the generated objects change:
+
+    python -m lightspark.scripts.train_zstd_dictionary
+"""
+
+import argparse
+import zstandard
+
+from lightspark.objects.all_entities import ALL_QUERIES, _get_entity_query
+from lightspark.requests.compression import DICTIONARY_RESOURCE
+from lightspark.requests.persisted_queries import known_documents
+from lightspark.requests.requester import Requester
+
+DEFAULT_DICTIONARY_SIZE = 16 * 1024
+
+
+def training_samples() -> list:
+    requester = Requester("", "")
+    documents = list(known_documents().values())
+    documents += [_get_entity_query(entity_class) for entity_class in ALL_QUERIES]
+    return [requester.encode_payload(document, {}) for document in documents]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=DEFAULT_DICTIONARY_SIZE)
+    parser.add_argument(
+        "--output", default=f"lightspark/requests/{DICTIONARY_RESOURCE}"
+    )
+    args = parser.parse_args()
+
+    dictionary = zstandard.train_dictionary(args.size, training_samples())
+    with open(args.output, "wb") as f:
+        f.write(dictionary.as_bytes())
+    print(f"Wrote {len(dictionary.as_bytes())} bytes (id {dictionary.dict_id()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import traceback
+from datetime import datetime
+
+import pytest
+
+from benchmarks import samples
+from lightspark.objects.AccountToTransactionsConnection import (
+    from_json as AccountToTransactionsConnection_from_json,
+)
+from lightspark.objects.Channel import Channel
+from lightspark.objects.ChannelStatus import ChannelStatus
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.CurrencyUnit import CurrencyUnit
+from lightspark.objects.OutgoingPayment import OutgoingPayment
+from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
+from lightspark.objects.PaymentFailureReason import PaymentFailureReason
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.utils.decoders import CompiledDecoder, compiled_decoder
+from lightspark.utils.lazy import lazy_decoding
+
+
+class TestCompiledDecoders:
+    def test_decodes_all_kinds_of_fields(self) -> None:
+        obj = samples.outgoing_payment(3)
+        obj["outgoing_payment_failure_reason"] = "NO_ROUTE"
+        payment = OutgoingPayment_from_json(None, obj)
+        assert type(payment) is OutgoingPayment
+        assert payment.typename == "OutgoingPayment"
+        assert payment.id == obj["outgoing_payment_id"]
+        assert payment.created_at == datetime.fromisoformat(samples.CREATED_AT)
+        assert payment.status == TransactionStatus.SUCCESS
+        assert payment.failure_reason == PaymentFailureReason.NO_ROUTE
+        assert payment.failure_message is None
+        assert payment.origin_id == samples.NODE_ID
+        assert payment.amount == CurrencyAmount(
+            requester=None,  # type: ignore[arg-type]
+            original_value=3000,
+            original_unit=CurrencyUnit.MILLISATOSHI,
+            preferred_currency_unit=CurrencyUnit.USD,
+            preferred_currency_value_rounded=0,
+            preferred_currency_value_approx=0.1,
+        )
+
+    def test_unknown_enum_values(self) -> None:
+        channel = compiled_decoder(Channel)(None, samples.channel(1, "NEW_STATUS"))
+        assert channel.status == ChannelStatus.___FUTURE_VALUE___
+        assert compiled_decoder(Channel)(None, samples.channel(1, None)).status is None
+
+    def test_decoders_are_compiled_once(self) -> None:
+        decoder = CompiledDecoder(Channel)
+        decoder(None, samples.channel(1))
+        assert decoder._decode is compiled_decoder(Channel)
+
+    def test_connections_decode_their_entities(self) -> None:
+        connection = AccountToTransactionsConnection_from_json(
+            None, samples.transactions_connection(6)
+        )
+        assert connection.count == 60
+        assert connection.page_info.end_cursor == "6"
+        assert connection.profit_loss is None
+        assert [type(e).__name__ for e in connection.entities] == [
+            obj["__typename"] for obj in samples.transactions_page(6)
+        ]
+        with lazy_decoding():
+            connection = AccountToTransactionsConnection_from_json(
+                None, samples.transactions_connection(6)
+            )
+        assert all(hasattr(e, "_lazy_obj") for e in connection.entities)
+
+    def test_tracebacks_show_the_decoder(self) -> None:
+        obj = samples.channel(1)
+        del obj["channel_short_channel_id"]
+        with pytest.raises(KeyError) as excinfo:
+            compiled_decoder(Channel)(None, obj)
+        formatted = "".join(traceback.format_tb(excinfo.value.__traceback__))
+        assert "obj['channel_short_channel_id']" in formatted
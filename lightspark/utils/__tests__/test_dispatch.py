@@ -0,0 +1,39 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from typing import Any, Mapping
+
+import pytest
+
+from benchmarks import samples
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Node import from_json as Node_from_json
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.utils.dispatch import TypenameDispatch
+
+
+class TestTypenameDispatch:
+    def test_dispatches_on_typename(self) -> None:
+        calls = []
+
+        def loaders() -> Mapping[str, Any]:
+            calls.append(1)
+            return {"A": lambda requester, obj: ("A", obj["v"])}
+
+        dispatch: TypenameDispatch[Any] = TypenameDispatch("Letter", loaders)
+        assert not calls
+        assert dispatch(None, {"__typename": "A", "v": 1}) == ("A", 1)
+        assert dispatch(None, {"__typename": "A", "v": 2}) == ("A", 2)
+        assert calls == [1]
+
+    def test_unknown_typename(self) -> None:
+        with pytest.raises(LightsparkException) as excinfo:
+            Node_from_json(None, {"__typename": "Channel"})
+        assert excinfo.value.code == "UNKNOWN_INTERFACE"
+        assert "interface Node" in excinfo.value.message
+        assert "typename=Channel" in excinfo.value.message
+
+    def test_decodes_all_transactions(self) -> None:
+        for obj in samples.transactions_page(6):
+            transaction = Transaction_from_json(None, obj)
+            assert type(transaction).__name__ == obj["__typename"]
+            assert transaction.typename == obj["__typename"]
@@ -0,0 +1,50 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.CurrencyAmount import from_json as CurrencyAmount_from_json
+from lightspark.objects.DailyLiquidityForecast import DailyLiquidityForecast
+from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
+from lightspark.objects.OutgoingPayment import OutgoingPayment
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.utils.field_specs import (
+    DATETIME,
+    ENUM,
+    OBJECT,
+    REFERENCE,
+    SCALAR,
+    alias_prefix,
+    field_specs,
+)
+
+
+class TestFieldSpecs:
+    def test_alias_prefix(self) -> None:
+        assert alias_prefix(OutgoingPayment) == "outgoing_payment"
+        assert alias_prefix(LightsparkNodeWithOSK) == "lightspark_node_with_o_s_k"
+
+    def test_kinds(self) -> None:
+        specs = {spec.name: spec for spec in field_specs(OutgoingPayment)}
+        assert "requester" not in specs and "typename" not in specs
+        assert specs["id"].key == "outgoing_payment_id"
+        assert specs["id"].kind == SCALAR
+        assert specs["created_at"].kind == DATETIME
+        assert specs["resolved_at"].optional
+        assert specs["status"].kind == ENUM
+        assert specs["status"].type is TransactionStatus
+        assert specs["amount"].kind == OBJECT
+        assert specs["amount"].type is CurrencyAmount
+        assert specs["amount"].loader() is CurrencyAmount_from_json
+
+    def test_references(self) -> None:
+        specs = {spec.name: spec for spec in field_specs(OutgoingPayment)}
+        assert specs["origin_id"].kind == REFERENCE
+        assert specs["origin_id"].key == "outgoing_payment_origin"
+        assert specs["destination_id"].optional
+        # Selected as a plain field rather than as another entity's id.
+        client_id = {spec.name: spec for spec in field_specs(ApiToken)}["client_id"]
+        assert client_id.kind == SCALAR
+
+    def test_dates_are_kept_as_strings(self) -> None:
+        date = {spec.name: spec for spec in field_specs(DailyLiquidityForecast)}["date"]
+        assert date.kind == SCALAR
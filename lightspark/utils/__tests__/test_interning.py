@@ -0,0 +1,76 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from unittest.mock import MagicMock
+
+from benchmarks import samples
+from lightspark.objects.ApiToken import ApiToken
+from lightspark.objects.ApiToken import from_json as ApiToken_from_json
+from lightspark.objects.Channel import from_json as Channel_from_json
+from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
+from lightspark.requests.requester import Requester
+from lightspark.utils.interning import InternPool, intern_pool, interning
+
+
+def api_token(i: int) -> dict:
+    return samples.from_field_specs(ApiToken, i)
+
+
+class TestInterning:
+    def test_disabled_by_default(self) -> None:
+        channel = Channel_from_json(None, samples.channel(1))
+        assert channel.local_unsettled_balance == channel.remote_unsettled_balance
+        assert channel.local_unsettled_balance is not channel.remote_unsettled_balance
+
+    def test_shares_equal_amounts_and_ids(self) -> None:
+        with interning() as pool:
+            first = Channel_from_json(None, samples.channel(1))
+            second = Channel_from_json(None, samples.channel(2))
+        assert first.local_unsettled_balance is first.remote_unsettled_balance
+        assert first.capacity is second.capacity
+        assert first.local_node_id is second.local_node_id
+        assert first.local_balance is not first.remote_balance
+        assert pool.lookups > pool.hits > 0
+        assert 0 < pool.dedup_ratio < 1
+        assert Channel_from_json(None, samples.channel(1)) == first
+
+    def test_shares_nodes_and_enum_lists(self) -> None:
+        with interning():
+            first = OutgoingPayment_from_json(None, samples.outgoing_payment(1))
+            second = OutgoingPayment_from_json(None, samples.outgoing_payment(2))
+            tokens = [ApiToken_from_json(None, api_token(i)) for i in range(2)]
+        assert first.payment_request_data is not None
+        assert second.payment_request_data is not None
+        assert (
+            first.payment_request_data.destination  # type: ignore[attr-defined]
+            is second.payment_request_data.destination  # type: ignore[attr-defined]
+        )
+        assert tokens[0].permissions is tokens[1].permissions
+
+    def test_pools_are_per_requester(self) -> None:
+        with interning():
+            first = Channel_from_json(None, samples.channel(1))
+            second = Channel_from_json(MagicMock(), samples.channel(1))
+        assert first.capacity is not second.capacity
+        assert second.capacity.requester is second.requester  # type: ignore[union-attr]
+
+    def test_requester_pool(self) -> None:
+        pool = InternPool()
+        requester = Requester("", "", intern_pool=pool)
+        assert intern_pool(requester) is pool
+        assert intern_pool(Requester("", "")) is None
+        assert intern_pool(MagicMock()) is None
+        first = Channel_from_json(requester, samples.channel(1))
+        second = Channel_from_json(requester, samples.channel(2))
+        assert first.capacity is second.capacity
+        with interning() as block_pool:
+            assert intern_pool(requester) is block_pool
+
+    def test_max_size(self) -> None:
+        pool = InternPool(max_size=2)
+        assert pool.string("a") == "a"
+        pool.string("b")
+        assert len(pool) == 2
+        pool.string("c")
+        assert len(pool) == 1
+        pool.clear()
+        assert len(pool) == 0 and pool.lookups == 0
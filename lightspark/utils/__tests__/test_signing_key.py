@@ -0,0 +1,109 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import pickle
+from base64 import b64decode, b64encode
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from lightspark_crypto import sign_ecdsa
+
+from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.utils.crypto import sign_payload, signing_envelope
+from lightspark.utils import signing_key as signing_key_module
+from lightspark.utils.signing_key import (
+    RSASigningKey,
+    Secp256k1SigningKey,
+    clear_signers,
+    evict_signer,
+)
+
+PAYLOAD = b'{"operationName": "PayInvoice"}'
+
+
+def _rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _der(key: rsa.RSAPrivateKey) -> bytes:
+    return key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _verify(key: rsa.RSAPrivateKey, header: str) -> None:
+    key.public_key().verify(
+        b64decode(json.loads(header)["signature"]),
+        PAYLOAD,
+        padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH,
+        ),
+        hashes.SHA256(),
+    )
+
+
+class TestSigningKey:
+    def test_envelope_matches_json_encoding(self) -> None:
+        signature = bytes(range(64))
+        assert signing_envelope(signature) == json.dumps(
+            {"v": 1, "signature": b64encode(signature).decode("ascii")}
+        )
+
+    def test_rsa_key_is_parsed_once_and_signs(self) -> None:
+        key = _rsa_key()
+        signing_key = RSASigningKey(_der(key))
+        _verify(key, signing_key.sign_payload(PAYLOAD))
+        _verify(key, signing_key.sign_payload(PAYLOAD))
+
+    def test_rsa_key_accepts_base64_der(self) -> None:
+        key = _rsa_key()
+        encoded = b64encode(_der(key))
+        _verify(key, RSASigningKey(encoded).sign_payload(PAYLOAD))
+        _verify(key, sign_payload(PAYLOAD, encoded))
+
+    def test_secp256k1_key_uses_the_same_envelope(self) -> None:
+        signing_key = Secp256k1SigningKey(bytes(32), BitcoinNetwork.REGTEST)
+        header = json.loads(signing_key.sign_payload(PAYLOAD))
+        assert header["v"] == 1
+        assert b64decode(header["signature"])
+
+    def test_secp256k1_signatures_match_lightspark_crypto(self) -> None:
+        signing_key = Secp256k1SigningKey(bytes(32), BitcoinNetwork.REGTEST)
+        payloads = [PAYLOAD, b"", PAYLOAD * 1000]
+        assert signing_key.sign_payloads(payloads) == [
+            signing_envelope(bytes(sign_ecdsa(payload, signing_key.key)))
+            for payload in payloads
+        ]
+        assert signing_key.sign_payload(PAYLOAD) == signing_envelope(
+            bytes(sign_ecdsa(PAYLOAD, signing_key.key))
+        )
+
+    def test_secp256k1_signers_are_cached_until_evicted(self) -> None:
+        clear_signers()
+        seed = bytes(range(32))
+        first = Secp256k1SigningKey(seed, BitcoinNetwork.REGTEST)
+        second = Secp256k1SigningKey(seed, BitcoinNetwork.REGTEST)
+        other_network = Secp256k1SigningKey(seed, BitcoinNetwork.TESTNET)
+        assert first._signer is second._signer
+        assert first._signer is not other_network._signer
+        assert len(signing_key_module._signers) == 2
+
+        evict_signer(seed, BitcoinNetwork.REGTEST)
+        third = Secp256k1SigningKey(seed, BitcoinNetwork.REGTEST)
+        assert third._signer is not first._signer
+        assert third.key == first.key
+        assert first.sign_payload(PAYLOAD) == third.sign_payload(PAYLOAD)
+
+    def test_secp256k1_key_survives_pickling(self) -> None:
+        signing_key = Secp256k1SigningKey(bytes(32), BitcoinNetwork.REGTEST)
+        copy = pickle.loads(pickle.dumps(signing_key))
+        assert copy.key == signing_key.key
+        assert copy.sign_payload(PAYLOAD) == signing_key.sign_payload(PAYLOAD)
+
+    def test_rsa_key_signs_many_payloads(self) -> None:
+        key = _rsa_key()
+        for header in RSASigningKey(_der(key)).sign_payloads([PAYLOAD, PAYLOAD]):
+            _verify(key, header)
@@ -0,0 +1,69 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import copy
+import importlib
+import pickle
+import pkgutil
+from dataclasses import dataclass, fields, is_dataclass, replace
+from typing import Optional
+
+import pytest
+
+import lightspark.objects
+from lightspark.utils.slots import with_slots
+
+
+@with_slots
+@dataclass
+class Interface:
+    id: str
+    typename: str
+
+
+@with_slots
+@dataclass
+class Implementation(Interface):
+    id: str
+    amount: int
+    typename: str
+    note: Optional[str] = None
+
+
+class TestSlots:
+    def test_inherited_fields_are_slotted_once(self) -> None:
+        assert Interface.__slots__ == ("id", "typename")
+        assert Implementation.__slots__ == ("amount", "note")
+        assert [f.name for f in fields(Implementation)] == [
+            "id",
+            "typename",
+            "amount",
+            "note",
+        ]
+
+    def test_instances_have_no_dict(self) -> None:
+        obj = Implementation(id="a", typename="Implementation", amount=1)
+        assert not hasattr(obj, "__dict__")
+        assert obj == Implementation("a", "Implementation", 1, None)
+        with pytest.raises(AttributeError):
+            obj.unknown = 1  # type: ignore[attr-defined]
+
+    def test_dataclass_helpers_still_work(self) -> None:
+        obj = Implementation(id="a", typename="Implementation", amount=1, note="n")
+        assert replace(obj, amount=2).amount == 2
+        assert copy.copy(obj) == obj
+        assert pickle.loads(pickle.dumps(obj)) == obj
+
+    def test_rejects_non_dataclasses(self) -> None:
+        with pytest.raises(TypeError):
+            with_slots(object)
+
+    def test_all_objects_are_slotted(self) -> None:
+        for module in pkgutil.iter_modules(lightspark.objects.__path__):
+            namespace = vars(
+                importlib.import_module(f"lightspark.objects.{module.name}")
+            )
+            for value in namespace.values():
+                if isinstance(value, type) and is_dataclass(value):
+                    assert all(
+                        "__slots__" in cls.__dict__ for cls in value.__mro__[:-1]
+                    ), value
@@ -95,13 +95,35 @@ def decrypt_private_key(
     return plaintext
 
 
-def sign_payload(payload: bytes, signing_key: bytes) -> str:
+SIGNING_ENVELOPE_VERSION = 1
+# The `X-Lightspark-Signing` header is `{"v": 1, "signature": "<base64>"}`. Only
+# the signature changes between requests, so the rest is built once.
+_SIGNING_ENVELOPE_PREFIX = json.dumps({"v": SIGNING_ENVELOPE_VERSION, "signature": ""})[
+    :-2
+]
+_SIGNING_ENVELOPE_SUFFIX = '"}'
+
+
+def signing_envelope(signature: bytes) -> str:
+    """Returns the `X-Lightspark-Signing` header value carrying a signature."""
+    return (
+        _SIGNING_ENVELOPE_PREFIX
+        + b64encode(signature).decode("ascii")
+        + _SIGNING_ENVELOPE_SUFFIX
+    )
+
+
+def load_signing_key(signing_key: bytes) -> RSAPrivateKey:
+    """Parses a DER encoded RSA private key, raw or base64 encoded."""
     if signing_key[0] != 48:
         signing_key = b64decode(signing_key)
     key = serialization.load_der_private_key(signing_key, password=None)
     if not isinstance(key, RSAPrivateKey):
         raise ValueError("Unsupported signing key type")
+    return key
 
+
+def sign_payload_with_key(payload: bytes, key: RSAPrivateKey) -> str:
     signature = key.sign(
         payload,
         asymmetric_padding.PSS(
@@ -110,10 +132,8 @@ def sign_payload(payload: bytes, signing_key: bytes) -> str:
         ),
         hashes.SHA256(),
     )
+    return signing_envelope(signature)
 
-    return json.dumps(
-        {
-            "v": 1,
-            "signature": b64encode(signature).decode("ascii"),
-        }
-    )
+
+def sign_payload(payload: bytes, signing_key: bytes) -> str:
+    return sign_payload_with_key(payload, load_signing_key(signing_key))
@@ -0,0 +1,243 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Decoders compiled from the field specs of the objects in `lightspark.objects`.
+
+`compiled_decoder` turns the field specs of a type into the source of a
+function that decodes that type and nothing else: each JSON key is read once,
+enums are looked up in their member maps, and nested types that aren't
+entities or interfaces are decoded by their own compiled functions. For
+`OutgoingPayment`, it starts with:
+
+    def decode_OutgoingPayment(requester, obj):
+        pool = intern_pool(requester)
+        if pool is None:
+            return cls(
+                requester,
+                obj['outgoing_payment_id'],
+                fromisoformat(obj['outgoing_payment_created_at']),
+                fromisoformat(obj['outgoing_payment_updated_at']),
+                'OutgoingPayment',
+                members_5.get(obj['outgoing_payment_status'], future_5),
+                (fromisoformat(v) if (v := obj['outgoing_payment_resolved_at']) else None),
+                decode_7(requester, obj['outgoing_payment_amount']),
+                ...
+
+The second half of the function decodes the same with the `InternPool` of the
+requester or of the `interning` block. See `lightspark.utils.interning`.
+"""
+
+import linecache
+import threading
+from dataclasses import fields
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from lightspark.objects.Entity import Entity
+from lightspark.utils.dispatch import is_interface
+from lightspark.utils.field_specs import (
+    DATETIME,
+    ENUM,
+    ENUM_LIST,
+    OBJECT_LIST,
+    REFERENCE,
+    SCALAR,
+    FieldSpec,
+    field_specs,
+)
+from lightspark.utils.interning import INTERNED_TYPES, intern_pool
+
+T = TypeVar("T")
+
+Decoder = Callable[[Any, Mapping[str, Any]], Any]
+
+_FUTURE_VALUE = "___FUTURE_VALUE___"
+
+# The decoders of each type: the one checking for a pool, the one decoding
+# without a pool and the one decoding with the pool passed to it.
+_compiled: Dict[type, Tuple[Decoder, Decoder, Callable[..., Any]]] = {}
+_lock = threading.RLock()
+
+
+def _is_value_type(cls: type) -> bool:
+    # Entities and interfaces keep going through their `from_json`, which can
+    # decode them lazily or dispatch on their typename.
+    return not issubclass(cls, Entity) and not is_interface(cls)
+
+
+def _decoding(  # pylint: disable=too-many-return-statements
+    index: int, spec: FieldSpec, namespace: Dict[str, Any], pooled: bool
+) -> Callable[[str], str]:
+    """Returns a function from the expression of a field's non-null JSON value
+    to the expression decoding it, adding the names the decoding refers to to
+    `namespace`. When `pooled`, the values are interned in `pool`."""
+    if spec.kind == SCALAR:
+        return lambda value: value
+    if spec.kind == REFERENCE:
+        if pooled:
+            return lambda value: f"pool.string({value}['id'])"
+        return lambda value: f"{value}['id']"
+    if spec.kind == DATETIME:
+        return lambda value: f"fromisoformat({value})"
+    if spec.kind in (ENUM, ENUM_LIST):
+        assert spec.type is not None
+        members = dict(spec.type.__members__)
+        namespace[f"members_{index}"] = members
+        namespace[f"future_{index}"] = members[_FUTURE_VALUE]
+        parse = f"members_{index}.get({{}}, future_{index})"
+        if spec.kind == ENUM:
+            return parse.format
+        if pooled:
+            return lambda value: (
+                f"pool.enum_list([{parse.format('e')} for e in {value}])"
+            )
+        return lambda value: f"[{parse.format('e')} for e in {value}]"
+    assert spec.type is not None
+    if not _is_value_type(spec.type):
+        namespace[f"decode_{index}"] = spec.loader()
+        call = f"decode_{index}(requester, {{}})"
+    elif pooled:
+        namespace[f"pooled_{index}"] = _compiled_decoders(spec.type)[2]
+        call = f"pooled_{index}(requester, {{}}, pool)"
+    else:
+        namespace[f"decode_{index}"] = _compiled_decoders(spec.type)[1]
+        call = f"decode_{index}(requester, {{}})"
+    if spec.kind == OBJECT_LIST:
+        return lambda value: f"[{call.format('e')} for e in {value}]"
+    return call.format
+
+
+def _construction(cls: type, namespace: Dict[str, Any], pooled: bool) -> List[str]:
+    """Returns the lines constructing an instance of `cls` from `obj`."""
+    specs = {spec.name: spec for spec in field_specs(cls)}
+    lines = ["cls("]
+    for index, field in enumerate(fields(cls)):
+        if field.name == "requester":
+            lines.append("    requester,")
+            continue
+        if field.name == "typename":
+            lines.append(f"    {cls.__name__!r},")
+            continue
+        spec = specs[field.name]
+        decode = _decoding(index, spec, namespace, pooled)
+        value = f"obj[{spec.key!r}]"
+        if spec.optional and spec.kind != SCALAR:
+            lines.append(f"    ({decode('v')} if (v := {value}) else None),")
+        else:
+            lines.append(f"    {decode(value)},")
+    lines.append(")")
+    return lines
+
+
+def _returning(construction: List[str]) -> List[str]:
+    return ["return " + construction[0]] + construction[1:]
+
+
+def _pooled_body(cls: type, namespace: Dict[str, Any]) -> List[str]:
+    construction = _construction(cls, namespace, pooled=True)
+    if cls.__name__ not in INTERNED_TYPES:
+        return _returning(construction)
+    # Equal responses decode to equal objects, so they're pooled by their JSON
+    # values, which skips decoding the ones already pooled.
+    keys = []
+    for spec in field_specs(cls):
+        if spec.kind not in (SCALAR, DATETIME, ENUM):
+            raise TypeError(f"{cls.__name__}.{spec.name} can't be interned")
+        keys.append(f"obj[{spec.key!r}]")
+    return [
+        f"key = (cls, requester, {', '.join(keys)})",
+        "value = pool.get(key)",
+        "if value is None:",
+        "    value = pool.add(",
+        "        key,",
+        *(f"        {line}" for line in construction),
+        "    )",
+        "return value",
+    ]
+
+
+def _source(cls: type, namespace: Dict[str, Any]) -> str:
+    name = cls.__name__
+    plain = _returning(_construction(cls, namespace, pooled=False))
+    pooled = _pooled_body(cls, namespace)
+    lines = [
+        f"def decode_{name}(requester, obj):",
+        "    pool = intern_pool(requester)",
+        "    if pool is None:",
+        *(f"        {line}" for line in plain),
+        *(f"    {line}" for line in pooled),
+        "",
+        f"def plain_{name}(requester, obj):",
+        *(f"    {line}" for line in plain),
+        "",
+        f"def pooled_{name}(requester, obj, pool):",
+        *(f"    {line}" for line in pooled),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _compile(cls: type) -> Tuple[Decoder, Decoder, Callable[..., Any]]:
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "fromisoformat": datetime.fromisoformat,
+        "intern_pool": intern_pool,
+    }
+    source = _source(cls, namespace)
+    filename = f"<decoder {cls.__module__}.{cls.__name__}>"
+    exec(compile(source, filename, "exec"), namespace)  # pylint: disable=exec-used
+    # Shows the decoder's source in tracebacks.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return (
+        namespace[f"decode_{cls.__name__}"],
+        namespace[f"plain_{cls.__name__}"],
+        namespace[f"pooled_{cls.__name__}"],
+    )
+
+
+def _compiled_decoders(cls: type) -> Tuple[Decoder, Decoder, Callable[..., Any]]:
+    decoders = _compiled.get(cls)
+    if decoders is None:
+        with _lock:
+            decoders = _compiled.get(cls)
+            if decoders is None:
+                decoders = _compiled[cls] = _compile(cls)
+    return decoders
+
+
+def compiled_decoder(cls: type) -> Decoder:
+    """Returns the compiled decoder of a type, compiling it the first time."""
+    return _compiled_decoders(cls)[0]
+
+
+class CompiledDecoder(Generic[T]):
+    """Decodes a type with its compiled decoder.
+
+    The decoders of nested types are looked up when a decoder is compiled, and
+    the modules of a type and of its nested types import each other, so the
+    decoder is compiled the first time an object is decoded rather than when
+    the type's module is imported.
+
+    Args:
+        cls: The type to decode.
+    """
+
+    __slots__ = ("cls", "_decode")
+
+    def __init__(self, cls: Type[T]) -> None:
+        self.cls = cls
+        self._decode: Optional[Decoder] = None
+
+    def __call__(self, requester: Any, obj: Mapping[str, Any]) -> T:
+        decode = self._decode
+        if decode is None:
+            decode = self._decode = compiled_decoder(self.cls)
+        return decode(requester, obj)
@@ -0,0 +1,59 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, Set, TypeVar
+
+from lightspark.exceptions import LightsparkException
+
+T = TypeVar("T")
+
+Loader = Callable[[Any, Mapping[str, Any]], Any]
+
+_interfaces: Set[str] = set()
+
+
+def is_interface(cls: type) -> bool:
+    """Whether a type is an interface decoded by a `TypenameDispatch`."""
+    return cls.__name__ in _interfaces
+
+
+class TypenameDispatch(Generic[T]):
+    """Decodes the concrete types of a GraphQL interface with a table from
+    `__typename` to the `from_json` of the type.
+
+    The concrete types import their interfaces, so the table can't be built when
+    the interface's module is imported. It is built by `loaders` the first time
+    an object is decoded, and only looked up afterwards.
+
+    Args:
+        interface: The name of the interface, for errors.
+        loaders: Returns the `from_json` of each concrete type by typename.
+    """
+
+    __slots__ = ("interface", "_build", "_loaders")
+
+    def __init__(
+        self, interface: str, loaders: Callable[[], Mapping[str, Loader]]
+    ) -> None:
+        self.interface = interface
+        _interfaces.add(interface)
+        self._build = loaders
+        self._loaders: Optional[Dict[str, Loader]] = None
+
+    def loaders(self) -> Dict[str, Loader]:
+        loaders = self._loaders
+        if loaders is None:
+            loaders = self._loaders = dict(self._build())
+        return loaders
+
+    def __call__(self, requester: Any, obj: Mapping[str, Any]) -> T:
+        graphql_typename = obj["__typename"]
+        loaders = self._loaders
+        if loaders is None:
+            loaders = self.loaders()
+        loader = loaders.get(graphql_typename)
+        if loader is None:
+            raise LightsparkException(
+                "UNKNOWN_INTERFACE",
+                f"Couldn't find a concrete type for interface {self.interface} corresponding to the typename={graphql_typename}",
+            )
+        return loader(requester, obj)
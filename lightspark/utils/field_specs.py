@@ -0,0 +1,124 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""How each field of the objects in `lightspark.objects` is decoded from JSON.
+
+The generated `from_json` functions follow a few fixed patterns: the JSON key of
+a field is the snake-cased type name followed by the field name (the *alias
+prefix*), and its decoding only depends on the field's type annotation. Fields
+named `*_id` that hold the id of another entity are read from that entity's
+`{id}` selection instead. `field_specs` describes these patterns per type, so
+that decoders can be built from them.
+"""
+
+import re
+import sys
+import typing
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+# The kinds of fields.
+SCALAR = "scalar"
+DATETIME = "datetime"
+ENUM = "enum"
+ENUM_LIST = "enum_list"
+OBJECT = "object"
+OBJECT_LIST = "object_list"
+REFERENCE = "reference"
+
+# GraphQL `Date` fields are annotated as datetimes but kept as ISO strings.
+_DATE_FIELDS = frozenset(
+    {
+        ("DailyLiquidityForecast", "date"),
+        ("LightsparkNodeToDailyLiquidityForecastsConnection", "from_date"),
+        ("LightsparkNodeToDailyLiquidityForecastsConnection", "to_date"),
+    }
+)
+
+_ALIAS = re.compile(r"^\s*(\w+):", re.MULTILINE)
+_UPPERCASE = re.compile(r"(?<!^)([A-Z])")
+_NONE_TYPE = type(None)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Describes the decoding of a field.
+
+    Attributes:
+        name: The name of the field.
+        key: The JSON key the field is read from.
+        kind: How the value is decoded, one of the kinds above.
+        optional: Whether the value can be null.
+        type: The enum type of ENUM and ENUM_LIST fields, the object type of
+            OBJECT and OBJECT_LIST fields.
+    """
+
+    name: str
+    key: str
+    kind: str
+    optional: bool
+    type: Optional[type] = None
+
+    def loader(self) -> Callable[..., Any]:
+        """The `from_json` function of an OBJECT or OBJECT_LIST field's type."""
+        assert self.type is not None
+        return sys.modules[self.type.__module__].from_json  # type: ignore[attr-defined]
+
+
+def alias_prefix(cls: type) -> str:
+    """The prefix of the JSON keys of a type's fields, e.g. `outgoing_payment`."""
+    return _UPPERCASE.sub(r"_\1", cls.__name__).lower()
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not _NONE_TYPE]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _kind(annotation: Any) -> Tuple[str, Optional[type]]:
+    if annotation is datetime:
+        return DATETIME, None
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return ENUM, annotation
+    if isinstance(annotation, type) and is_dataclass(annotation):
+        return OBJECT, annotation
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        item_kind, item_type = _kind(item)
+        if item_kind == ENUM:
+            return ENUM_LIST, item_type
+        if item_kind == OBJECT:
+            return OBJECT_LIST, item_type
+    return SCALAR, None
+
+
+@lru_cache(maxsize=None)
+def field_specs(cls: type) -> Tuple[FieldSpec, ...]:
+    """Returns the specs of a generated type's fields, in declaration order,
+    leaving out `requester` and `typename`."""
+    prefix = alias_prefix(cls)
+    fragment = getattr(sys.modules[cls.__module__], "FRAGMENT", "")
+    aliases = set(_ALIAS.findall(fragment))
+    specs = []
+    for field in fields(cls):
+        if field.name in ("requester", "typename"):
+            continue
+        annotation, optional = _unwrap_optional(field.type)
+        key = f"{prefix}_{field.name}"
+        if (
+            key not in aliases
+            and field.name.endswith("_id")
+            and key[:-3] in aliases
+            and annotation is str
+        ):
+            specs.append(FieldSpec(field.name, key[:-3], REFERENCE, optional))
+            continue
+        if (cls.__name__, field.name) in _DATE_FIELDS:
+            annotation = str
+        kind, field_type = _kind(annotation)
+        specs.append(FieldSpec(field.name, key, kind, optional, field_type))
+    return tuple(specs)
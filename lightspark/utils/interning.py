@@ -0,0 +1,106 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Sharing of the equal values decoded from API responses.
+
+Pages of entities repeat many values: the same zero fees and common amounts,
+the same destination nodes and node ids, the same lists of permissions. With an
+`InternPool`, decoding returns the same `CurrencyAmount` and `GraphNode`
+instance for equal responses, and shares equal entity ids and enum lists,
+instead of making a new object for each. The pool is used either within a
+block, e.g. to decode one response:
+
+    with interning() as pool:
+        transactions = account.get_transactions(first=500).entities
+    print(pool.dedup_ratio)
+
+or for everything a client decodes, with `LightsparkSyncClient(...,
+intern_pool=InternPool())`.
+
+Interned values are shared, so they must be treated as immutable: setting a
+field of an interned `CurrencyAmount` changes it everywhere it was decoded.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# The types of which equal instances are shared.
+INTERNED_TYPES = frozenset({"CurrencyAmount", "GraphNode"})
+
+DEFAULT_MAX_SIZE = 100_000
+
+_pool: ContextVar[Optional["InternPool"]] = ContextVar(
+    "lightspark_intern_pool", default=None
+)
+
+
+class InternPool:
+    """Holds the values shared by the objects decoded with it.
+
+    Args:
+        max_size: The number of values kept. The pool is emptied when it's
+            full, so a pool kept by a client doesn't grow forever.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.lookups = 0
+        self.hits = 0
+        self._values: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The share of the values looked up that were already pooled."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def get(self, key: Any) -> Any:
+        """Returns the value pooled for `key`, or None."""
+        self.lookups += 1
+        value = self._values.get(key)
+        if value is not None:
+            self.hits += 1
+        return value
+
+    def add(self, key: Any, value: Any) -> Any:
+        if len(self._values) >= self.max_size:
+            self._values.clear()
+        self._values[key] = value
+        return value
+
+    def string(self, value: str) -> str:
+        pooled = self.get(value)
+        return self.add(value, value) if pooled is None else pooled
+
+    def enum_list(self, values: List[Any]) -> List[Any]:
+        key = tuple(values)
+        pooled = self.get(key)
+        return self.add(key, values) if pooled is None else pooled
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.lookups = self.hits = 0
+
+
+@contextmanager
+def interning(pool: Optional[InternPool] = None) -> Iterator[InternPool]:
+    """Interns the values decoded within the block in `pool`, or in a new pool
+    if None."""
+    if pool is None:
+        pool = InternPool()
+    token = _pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _pool.reset(token)
+
+
+def intern_pool(requester: Any) -> Optional[InternPool]:
+    """The pool of the current `interning` block, or else the requester's."""
+    pool = _pool.get()
+    if pool is None:
+        pool = getattr(requester, "intern_pool", None)
+        if not isinstance(pool, InternPool):
+            return None
+    return pool
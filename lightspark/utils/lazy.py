@@ -0,0 +1,207 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Lazy, on-access decoding of entities.
+
+Within a `lazy_decoding()` block, the entities decoded from API responses keep
+the raw response and only decode a field (dates, enums, nested objects) the
+first time it is read. This saves most of the decoding work when listing many
+entities and reading few of their fields:
+
+    with lazy_decoding():
+        transactions = account.get_transactions(first=500).entities
+    pending = [t.id for t in transactions if t.status == TransactionStatus.PENDING]
+
+Lazy entities are instances of the entity's class, compare equal to the eagerly
+decoded ones, and can be used after the block. Decoded fields are cached. A
+malformed response only fails when the affected field is read, and reading
+the decoded fields of a lazy entity is slower than reading those of an eager
+one. The responses are kept alive as long as their entities are.
+"""
+
+import importlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple, Type, TypeVar
+
+from lightspark.exceptions import LightsparkException
+from lightspark.utils.enums import (
+    parse_enum,
+    parse_enum_list,
+    parse_enum_optional,
+    parse_optional_list_of_enums,
+)
+from lightspark.utils.field_specs import (
+    DATETIME,
+    ENUM,
+    ENUM_LIST,
+    OBJECT,
+    OBJECT_LIST,
+    REFERENCE,
+    SCALAR,
+    FieldSpec,
+    field_specs,
+)
+
+T = TypeVar("T")
+
+_lazy: ContextVar[bool] = ContextVar("lightspark_lazy_decoding", default=False)
+_typename_classes: Dict[str, type] = {}
+
+# The value of the fields that haven't been decoded yet.
+_PENDING = object()
+
+Decoder = Callable[[Any, Mapping[str, Any]], Any]
+
+
+@contextmanager
+def lazy_decoding(enabled: bool = True) -> Iterator[None]:
+    """Decodes the entities within the block lazily, or eagerly again if
+    `enabled` is False."""
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+def decoding_lazily() -> bool:
+    return _lazy.get()
+
+
+def _decoder(spec: FieldSpec) -> Decoder:  # pylint: disable=too-many-return-statements
+    key = spec.key
+    if spec.kind == SCALAR:
+        return lambda requester, obj: obj[key]
+    if spec.kind == REFERENCE:
+        if spec.optional:
+            return lambda requester, obj: obj[key]["id"] if obj[key] else None
+        return lambda requester, obj: obj[key]["id"]
+    if spec.kind == DATETIME:
+        if spec.optional:
+            return lambda requester, obj: (
+                datetime.fromisoformat(obj[key]) if obj[key] else None
+            )
+        return lambda requester, obj: datetime.fromisoformat(obj[key])
+    enum_type = spec.type
+    if spec.kind == ENUM:
+        parse = parse_enum_optional if spec.optional else parse_enum
+        return lambda requester, obj: parse(enum_type, obj[key])
+    if spec.kind == ENUM_LIST:
+        parse = parse_optional_list_of_enums if spec.optional else parse_enum_list
+        return lambda requester, obj: parse(enum_type, obj[key])
+    loader = spec.loader()
+    if spec.kind == OBJECT:
+        if spec.optional:
+            return lambda requester, obj: (
+                loader(requester, obj[key]) if obj[key] else None
+            )
+        return lambda requester, obj: loader(requester, obj[key])
+    assert spec.kind == OBJECT_LIST
+    if spec.optional:
+        return lambda requester, obj: (
+            [loader(requester, e) for e in obj[key]] if obj[key] else None
+        )
+    return lambda requester, obj: [loader(requester, e) for e in obj[key]]
+
+
+def _slot(cls: type, name: str) -> Any:
+    """Returns the descriptor of the slot holding a field."""
+    for base in cls.__mro__:
+        if name in base.__dict__.get("__slots__", ()):
+            return base.__dict__[name]
+    raise TypeError(f"{cls.__name__}.{name} isn't slotted")
+
+
+class _LazyField:
+    """Decodes a field from the raw response on first read."""
+
+    # pylint: disable=protected-access,unnecessary-dunder-call
+
+    __slots__ = ("slot", "decode")
+
+    def __init__(self, slot: Any, decode: Decoder) -> None:
+        self.slot = slot
+        self.decode = decode
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if value is _PENDING:
+            value = self.decode(instance._lazy_requester, instance._lazy_obj)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+
+@lru_cache(maxsize=None)
+def _lazy_class(cls: type) -> Tuple[type, List[Tuple[Any, str]], List[Any]]:
+    """Returns the lazy subclass of `cls`, the slots to fill from the response
+    with their keys, and the slots of the fields decoded on access."""
+    names = [spec.name for spec in field_specs(cls)]
+    eager: List[Tuple[Any, str]] = []
+    pending: List[Any] = []
+    namespace: Dict[str, Any] = {"__slots__": ("_lazy_requester", "_lazy_obj")}
+    for spec in field_specs(cls):
+        slot = _slot(cls, spec.name)
+        if spec.kind == SCALAR:
+            eager.append((slot, spec.key))
+        else:
+            pending.append(slot)
+            namespace[spec.name] = _LazyField(slot, _decoder(spec))
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+    def __reduce__(self: Any) -> Any:
+        # Pickles and copies are eagerly decoded instances of the entity class.
+        return cls, tuple(getattr(self, field) for field in cls.__dataclass_fields__)
+
+    namespace["__eq__"] = __eq__
+    namespace["__hash__"] = None
+    namespace["__reduce__"] = __reduce__
+    namespace["__module__"] = cls.__module__
+    lazy = type(cls.__name__, (cls,), namespace)
+    lazy.__qualname__ = cls.__qualname__
+    return lazy, eager, pending
+
+
+def _concrete_class(typename: str, interface: type) -> type:
+    cls = _typename_classes.get(typename)
+    if cls is None and typename.isidentifier():
+        try:
+            module = importlib.import_module(f"lightspark.objects.{typename}")
+            cls = _typename_classes[typename] = getattr(module, typename)
+        except (ImportError, AttributeError):
+            pass
+    if cls is None or not issubclass(cls, interface):
+        raise LightsparkException(
+            "UNKNOWN_INTERFACE",
+            f"Couldn't find a concrete type for interface {interface.__name__} corresponding to the typename={typename}",
+        )
+    return cls
+
+
+def decode_lazily(requester: Any, obj: Mapping[str, Any], cls: Type[T]) -> T:
+    """Returns a lazy instance of `cls`, or of the concrete type named by the
+    response's `__typename` when `cls` is an interface."""
+    # pylint: disable=protected-access,unnecessary-dunder-call
+    typename = obj.get("__typename", cls.__name__)
+    if typename != cls.__name__:
+        cls = _concrete_class(typename, cls)
+    lazy, eager, pending = _lazy_class(cls)
+    instance = object.__new__(lazy)
+    instance._lazy_requester = requester
+    instance._lazy_obj = obj
+    cls.requester.__set__(instance, requester)
+    cls.typename.__set__(instance, typename)
+    for slot, key in eager:
+        slot.__set__(instance, obj[key])
+    for slot in pending:
+        slot.__set__(instance, _PENDING)
+    return instance
@@ -0,0 +1,157 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""An encrypted on-disk cache of recovered node signing keys.
+
+Decrypting a node's signing key runs 500,000 PBKDF2 iterations. This cache
+keeps the decrypted keys on disk, encrypted with AES-GCM under a 32 byte secret
+that you provide (e.g. from your secrets manager), so that warm restarts skip
+the KDF entirely.
+
+An entry is only used if the encrypted key and the password it was recovered
+with are unchanged: both are bound to the entry through an HMAC keyed with the
+secret, so the cache files don't leak anything about the passwords.
+"""
+
+import hashlib
+import hmac
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from secrets import token_bytes
+from typing import List, Optional, Sequence
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from lightspark.utils.crypto import IV_LEN, KEY_LEN, decrypt_private_key
+
+DEFAULT_KDF_WORKERS = os.cpu_count() or 1
+
+
+class NodeKeyCache:
+    """Stores recovered node signing keys in `directory`.
+
+    Args:
+        directory: Where the encrypted keys are stored. Created if missing.
+        secret: The 32 byte key encrypting the cache. See `generate_secret`.
+    """
+
+    def __init__(self, directory: str, secret: bytes) -> None:
+        if len(secret) != KEY_LEN:
+            raise ValueError(f"The cache secret must be {KEY_LEN} bytes long")
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.directory = directory
+        self._secret = secret
+        self._aead = AESGCM(secret)
+
+    @staticmethod
+    def generate_secret() -> bytes:
+        return token_bytes(KEY_LEN)
+
+    def get(
+        self, node_id: str, cipher: str, encrypted_value: str, password: str
+    ) -> Optional[bytes]:
+        """Returns the cached key, or None if it isn't cached or was recovered
+        from a different encrypted key or password."""
+        try:
+            with open(self._path(node_id), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            return self._aead.decrypt(
+                data[:IV_LEN],
+                data[IV_LEN:],
+                self._fingerprint(node_id, cipher, encrypted_value, password),
+            )
+        except InvalidTag:
+            return None
+
+    def put(
+        self,
+        node_id: str,
+        cipher: str,
+        encrypted_value: str,
+        password: str,
+        private_key: bytes,
+    ) -> None:
+        nonce = token_bytes(IV_LEN)
+        data = nonce + self._aead.encrypt(
+            nonce,
+            private_key,
+            self._fingerprint(node_id, cipher, encrypted_value, password),
+        )
+        fd, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temporary, self._path(node_id))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def evict(self, node_id: str) -> None:
+        try:
+            os.unlink(self._path(node_id))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, node_id: str) -> str:
+        name = hmac.new(self._secret, node_id.encode("utf8"), hashlib.sha256)
+        return os.path.join(self.directory, name.hexdigest() + ".key")
+
+    def _fingerprint(
+        self, node_id: str, cipher: str, encrypted_value: str, password: str
+    ) -> bytes:
+        message = b"\0".join(
+            value.encode("utf8")
+            for value in (node_id, cipher, encrypted_value, password)
+        )
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+
+@dataclass
+class EncryptedNodeKey:
+    node_id: str
+    cipher: str
+    encrypted_value: str
+    password: str
+
+
+def decrypt_node_keys(
+    keys: Sequence[EncryptedNodeKey],
+    cache: Optional[NodeKeyCache] = None,
+    max_workers: int = DEFAULT_KDF_WORKERS,
+) -> List[bytes]:
+    """Decrypts node signing keys, taking them from `cache` when possible.
+
+    The remaining keys are decrypted in a process pool, so that their KDFs run
+    in parallel and off the calling interpreter. The results are stored in the
+    cache and returned in the order of `keys`.
+    """
+    decrypted: List[Optional[bytes]] = [
+        cache.get(key.node_id, key.cipher, key.encrypted_value, key.password)
+        if cache
+        else None
+        for key in keys
+    ]
+    missing = [i for i, private_key in enumerate(decrypted) if private_key is None]
+    arguments = (
+        [keys[i].cipher for i in missing],
+        [keys[i].encrypted_value for i in missing],
+        [keys[i].password for i in missing],
+    )
+    if len(missing) > 1 and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            results = list(pool.map(decrypt_private_key, *arguments))
+    else:
+        results = list(map(decrypt_private_key, *arguments))
+
+    for i, private_key in zip(missing, results):
+        decrypted[i] = private_key
+        if cache:
+            key = keys[i]
+            cache.put(
+                key.node_id, key.cipher, key.encrypted_value, key.password, private_key
+            )
+    return [private_key for private_key in decrypted if private_key is not None]
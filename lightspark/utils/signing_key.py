@@ -1,11 +1,19 @@
-import json
-from base64 import b64encode
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 
-from lightspark_crypto import sign_ecdsa, LightsparkSigner, Network, Seed
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+from lightspark_crypto import LightsparkSigner, Network, Seed
 
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
-from lightspark.utils.crypto import sign_payload
+from lightspark.utils.crypto import (
+    load_signing_key,
+    sign_payload_with_key,
+    signing_envelope,
+)
 from lightspark.exceptions import LightsparkException
 
 
@@ -16,34 +24,128 @@ class SigningKey(ABC):
     def sign_payload(self, payload: bytes) -> str:
         pass
 
+    def sign_payloads(self, payloads: Sequence[bytes]) -> List[str]:
+        """Returns the `X-Lightspark-Signing` headers of many payloads."""
+        return [self.sign_payload(payload) for payload in payloads]
+
 
 class RSASigningKey(SigningKey):
     def __init__(self, key: bytes) -> None:
         self.key = key
+        # Loading validates the key, which costs far more than signing: do it once.
+        self.private_key = load_signing_key(key)
 
     def sign_payload(self, payload: bytes) -> str:
-        return sign_payload(payload, self.key)
+        return sign_payload_with_key(payload, self.private_key)
+
+    def __reduce__(self):
+        # Parsed keys can't be pickled. Worker processes receive the key bytes
+        # and parse each key only once.
+        return _unpickle_rsa_signing_key, (self.key,)
+
+
+@lru_cache(maxsize=64)
+def _unpickle_rsa_signing_key(key: bytes) -> RSASigningKey:
+    return RSASigningKey(key)
+
+
+SIGNING_DERIVATION_PATH = "m/5"
+MAX_CACHED_SIGNERS = 64
+
+
+class _Signer:
+    def __init__(self, master_seed: bytes, network: Network) -> None:
+        self.master_seed = master_seed
+        self.signer = LightsparkSigner(Seed(master_seed), network)
+        self.key = bytes.fromhex(
+            self.signer.derive_private_key(SIGNING_DERIVATION_PATH)
+        )
+
+
+_signers: "OrderedDict[Tuple[str, BitcoinNetwork], _Signer]" = OrderedDict()
+_signers_lock = threading.Lock()
+
+
+def _signer_cache_key(
+    master_seed: bytes, bitcoin_network: BitcoinNetwork
+) -> Tuple[str, BitcoinNetwork]:
+    return hashlib.sha256(master_seed).hexdigest(), bitcoin_network
+
+
+def _to_network(bitcoin_network: BitcoinNetwork) -> Network:
+    if bitcoin_network == BitcoinNetwork.MAINNET:
+        return Network.BITCOIN
+    if bitcoin_network == BitcoinNetwork.TESTNET:
+        return Network.TESTNET
+    if bitcoin_network == BitcoinNetwork.REGTEST:
+        return Network.REGTEST
+    raise LightsparkException("SIGNING_ERROR", "Invalid bitcoin network")
+
+
+def _get_signer(master_seed: bytes, bitcoin_network: BitcoinNetwork) -> _Signer:
+    # Building a signer and deriving its key is done once per seed and network.
+    cache_key = _signer_cache_key(master_seed, bitcoin_network)
+    with _signers_lock:
+        signer = _signers.get(cache_key)
+        if signer is not None:
+            _signers.move_to_end(cache_key)
+            return signer
+    signer = _Signer(master_seed, _to_network(bitcoin_network))
+    with _signers_lock:
+        _signers[cache_key] = signer
+        while len(_signers) > MAX_CACHED_SIGNERS:
+            _signers.popitem(last=False)
+    return signer
+
+
+def evict_signer(master_seed: bytes, bitcoin_network: BitcoinNetwork) -> None:
+    """Forgets the cached signer of a node master seed, e.g. once the node is
+    removed. Existing `Secp256k1SigningKey` instances keep working."""
+    with _signers_lock:
+        _signers.pop(_signer_cache_key(master_seed, bitcoin_network), None)
+
+
+def clear_signers() -> None:
+    """Forgets all the cached signers."""
+    with _signers_lock:
+        _signers.clear()
 
 
 class Secp256k1SigningKey(SigningKey):
     def __init__(self, master_seed: bytes, bitcoin_network: BitcoinNetwork) -> None:
-        seed = Seed(master_seed)
-        if bitcoin_network == BitcoinNetwork.MAINNET:
-            network = Network.BITCOIN
-        elif bitcoin_network == BitcoinNetwork.TESTNET:
-            network = Network.TESTNET
-        elif bitcoin_network == BitcoinNetwork.REGTEST:
-            network = Network.REGTEST
-        else:
-            raise LightsparkException("SIGNING_ERROR", "Invalid bitcoin network")
-        signer = LightsparkSigner(seed, network)
-        self.key = bytes.fromhex(signer.derive_private_key("m/5"))
+        self._signer = _get_signer(master_seed, bitcoin_network)
+        self._bitcoin_network = bitcoin_network
+        self.key = self._signer.key
 
     def sign_payload(self, payload: bytes) -> str:
-        sig = sign_ecdsa(payload, self.key)
-        return json.dumps(
-            {
-                "v": 1,
-                "signature": b64encode(bytes(sig)).decode("ascii"),
-            }
-        )
+        return self.sign_payloads([payload])[0]
+
+    def sign_payloads(self, payloads: Sequence[bytes]) -> List[str]:
+        # The payloads are hashed here and only their digests are passed to
+        # lightspark_crypto: passing a whole payload costs a Python call per
+        # byte, which dominates the signature itself.
+        signer = self._signer.signer
+        headers = []
+        for payload in payloads:
+            signature = bytes(
+                signer.derive_key_and_sign(
+                    list(hashlib.sha256(payload).digest()),
+                    SIGNING_DERIVATION_PATH,
+                    True,
+                    None,
+                    None,
+                )
+            )
+            headers.append(
+                signing_envelope(
+                    encode_dss_signature(
+                        int.from_bytes(signature[:32], "big"),
+                        int.from_bytes(signature[32:], "big"),
+                    )
+                )
+            )
+        return headers
+
+    def __reduce__(self):
+        # Signers can't be pickled. Worker processes rebuild each one once.
+        return Secp256k1SigningKey, (self._signer.master_seed, self._bitcoin_network)
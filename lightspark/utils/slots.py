@@ -0,0 +1,37 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from dataclasses import fields, is_dataclass
+from typing import Iterator, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _slot_names(cls: type) -> Iterator[str]:
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        yield from (slots,) if isinstance(slots, str) else slots
+
+
+def with_slots(cls: Type[T]) -> Type[T]:
+    """Recreates a dataclass with `__slots__`, so that its instances store their
+    fields in a fixed layout instead of a per-instance `__dict__`.
+
+    Apply it on top of `@dataclass`. Instances only lose their `__dict__` when
+    all the dataclass's bases are slotted too. Unlike `dataclass(slots=True)`,
+    it works on Python 3.9 and doesn't declare the slots of inherited fields
+    again, which would make instances larger.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    inherited = {name for base in cls.__mro__[1:] for name in _slot_names(base)}
+    names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # The defaults are already part of the generated __init__.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
@@ -0,0 +1,136 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+"""Minting of the JWTs authenticating third-party wallets.
+
+`WalletJwtMinter` parses its private key once and hands out the same token for
+a wallet until it gets within `refresh_margin` of its expiry, so fronting many
+wallets costs one Ed448 signature per wallet per token lifetime rather than one
+per request.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+WALLET_JWT_AUDIENCE = "https://api.lightspark.com"
+DEFAULT_WALLET_JWT_DURATION = timedelta(minutes=1)
+DEFAULT_REFRESH_MARGIN = timedelta(seconds=10)
+DEFAULT_MAX_TOKENS = 10000
+
+
+@lru_cache(maxsize=16)
+def load_jwt_key(private_key_pem: str) -> PrivateKeyTypes:
+    """Parses a PEM private key, once per distinct key."""
+    return load_pem_private_key(private_key_pem.encode("ascii"), password=None)
+
+
+def mint_wallet_jwt(
+    private_key_pem: str,
+    third_party_id: str,
+    *,
+    test_mode: bool = False,
+    duration: timedelta = DEFAULT_WALLET_JWT_DURATION,
+    algorithm: str = "EdDSA",
+    now: Optional[float] = None,
+) -> str:
+    issued_at = int(time.time() if now is None else now)
+    payload = {
+        "aud": WALLET_JWT_AUDIENCE,
+        "exp": issued_at + int(duration.total_seconds()),
+        "iat": issued_at,
+        "sub": third_party_id,
+        "test": test_mode,
+    }
+    return jwt.encode(payload, load_jwt_key(private_key_pem), algorithm)
+
+
+class WalletJwtMinter:
+    """Mints and caches wallet JWTs signed with one private key.
+
+    Args:
+        private_key_pem: The PEM private key, e.g. from `generate_jwt_key`.
+        test_mode: Whether the tokens are for test mode wallets.
+        duration: How long each token is valid for.
+        refresh_margin: A cached token is replaced by a new one once it expires
+            within this margin. Must be shorter than `duration`.
+        max_tokens: The number of wallets whose tokens are kept, least recently
+            used first out.
+        algorithm: The JWT signing algorithm.
+        clock: Returns the current UNIX time. Meant for tests.
+    """
+
+    def __init__(
+        self,
+        private_key_pem: str,
+        *,
+        test_mode: bool = False,
+        duration: timedelta = DEFAULT_WALLET_JWT_DURATION,
+        refresh_margin: timedelta = DEFAULT_REFRESH_MARGIN,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        algorithm: str = "EdDSA",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if refresh_margin >= duration:
+            raise ValueError("refresh_margin must be shorter than duration")
+        # Parses and validates the key up front.
+        load_jwt_key(private_key_pem)
+        self.private_key_pem = private_key_pem
+        self.test_mode = test_mode
+        self.duration = duration
+        self.refresh_margin_secs = refresh_margin.total_seconds()
+        self.max_tokens = max_tokens
+        self.algorithm = algorithm
+        self.clock = clock
+        self.minted = 0
+        self.reused = 0
+        self._tokens: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mint(self, third_party_id: str) -> str:
+        """Returns a token for the wallet, minting one only if the cached one is
+        missing or about to expire."""
+        return self.mint_many([third_party_id])[0]
+
+    def mint_many(self, third_party_ids: Iterable[str]) -> List[str]:
+        """Returns a token for each wallet, in the order of `third_party_ids`."""
+        now = self.clock()
+        tokens = []
+        for third_party_id in third_party_ids:
+            with self._lock:
+                cached = self._tokens.get(third_party_id)
+                if cached is not None and cached[1] - self.refresh_margin_secs > now:
+                    self._tokens.move_to_end(third_party_id)
+                    self.reused += 1
+                    tokens.append(cached[0])
+                    continue
+            token = mint_wallet_jwt(
+                self.private_key_pem,
+                third_party_id,
+                test_mode=self.test_mode,
+                duration=self.duration,
+                algorithm=self.algorithm,
+                now=now,
+            )
+            expires_at = int(now) + int(self.duration.total_seconds())
+            with self._lock:
+                self.minted += 1
+                self._tokens[third_party_id] = (token, expires_at)
+                self._tokens.move_to_end(third_party_id)
+                while len(self._tokens) > self.max_tokens:
+                    self._tokens.popitem(last=False)
+            tokens.append(token)
+        return tokens
+
+    def invalidate(self, third_party_id: str) -> None:
+        with self._lock:
+            self._tokens.pop(third_party_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()